@@ -0,0 +1,247 @@
+"""
+Analytic makespan model: a lower bound on the makespan the simulator computes for a workflow and a
+calibration, without simulating. Each task takes at least its compute time (its flops, derived from its
+runtime and avgCPU as the simulator's WfCommons parser does, at the compute hosts' speed, on at most
+coreCount cores), the scheduling and thread startup overheads, and the transfer of its input and
+output bytes through the submit host's disk and the network. The makespan is at least the critical
+path of these, the total compute time over all cores, and the (sequential) scheduling overheads of
+all tasks.
+
+Workflows are DAGs in CSR form (per task, the range of its parents in one index array), with tasks
+sorted by level so that the critical path takes one vectorized step per level, for many candidate
+calibrations at once.
+"""
+import re
+from functools import lru_cache
+from typing import Callable, List
+
+import numpy as np
+
+from WorkflowPack import load_workflow_json
+
+# What the model doesn't capture could make the bound slightly optimistic (e.g., the simulator's
+# parser rounding task flops, or transfers it overlaps): bounds are scaled by a slack before being used
+# to prune, by default this one (tests/test_analytic_model.py checks that scaled bounds stay below the
+# simulator's makespans for the sample workflows). A lower slack prunes less, but more safely
+BOUND_SLACK = 0.9
+
+_unit_prefixes = {"": 1, "k": 1e3, "K": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15}
+_unit_bases = {"": 1, "f": 1, "B": 1, "Bps": 1, "bps": 1 / 8, "s": 1, "ms": 1e-3, "us": 1e-6, "ns": 1e-9}
+
+
+def parse_quantity(raw: str) -> float:
+	# Flops, bytes, bytes (or bits) per second, seconds, with SI prefixes (e.g., "100Mf", "10MBps", "10us")
+	number, unit = re.match(r"\s*([-+0-9.eE]+)\s*([a-zA-Z]*)", raw).groups()
+	if unit in _unit_bases:
+		return float(number) * _unit_bases[unit]
+	return float(number) * _unit_prefixes[unit[0]] * _unit_bases[unit[1:]]
+
+
+class AnalyticWorkflow:
+	__slots__ = ("num_tasks", "level_starts", "parents_indptr", "parents_indices", "runtimes", "cpu_fractions",
+				 "cores", "input_bytes", "output_bytes", "real_makespan", "num_hosts")
+
+	def __init__(self, data: dict):
+		specification = data["workflow"]["specification"]
+		execution = data["workflow"]["execution"]
+		file_sizes = {f["id"]: float(f.get("sizeInBytes", 0)) for f in specification.get("files", [])}
+		executions = {t["id"]: t for t in execution["tasks"]}
+		tasks = specification["tasks"]
+		index = {t["id"]: i for i, t in enumerate(tasks)}
+		parents = [[index[p] for p in t.get("parents", [])] for t in tasks]
+
+		# Levels (longest distance from an entry task), in topological order
+		level = [-1] * len(tasks)
+		children = [[] for _ in tasks]
+		num_parents_left = [len(p) for p in parents]
+		for i, ps in enumerate(parents):
+			for p in ps:
+				children[p].append(i)
+		ready = [i for i in range(len(tasks)) if num_parents_left[i] == 0]
+		for i in ready:
+			level[i] = 0
+		while ready:
+			i = ready.pop()
+			for c in children[i]:
+				level[c] = max(level[c], level[i] + 1)
+				num_parents_left[c] -= 1
+				if num_parents_left[c] == 0:
+					ready.append(c)
+		if min(level, default=0) < 0:
+			raise Exception("The workflow's task graph has a cycle")
+
+		order = sorted(range(len(tasks)), key=lambda i: level[i])
+		position = {i: k for k, i in enumerate(order)}
+		levels = np.array([level[i] for i in order], dtype=np.int64)
+		self.num_tasks = len(tasks)
+		self.level_starts = np.searchsorted(levels, np.arange(levels[-1] + 2 if len(levels) else 1))
+		self.parents_indptr = np.zeros(len(tasks) + 1, dtype=np.int64)
+		self.parents_indptr[1:] = np.cumsum([len(parents[i]) for i in order])
+		self.parents_indices = np.array([position[p] for i in order for p in parents[i]], dtype=np.int64)
+
+		ordered = [tasks[i] for i in order]
+		self.runtimes = np.array([float(executions[t["id"]]["runtimeInSeconds"]) for t in ordered])
+		# The parser's task flops are runtime * reference flops * avgCPU / 100 (when the task has an avgCPU)
+		self.cpu_fractions = np.array([float(executions[t["id"]]["avgCPU"]) / 100
+									   if executions[t["id"]].get("avgCPU") is not None else 1.0 for t in ordered])
+		self.cores = np.array([max(1, int(executions[t["id"]].get("coreCount", 1) or 1)) for t in ordered], dtype=float)
+		self.input_bytes = np.array([sum(file_sizes.get(f, 0) for f in t.get("inputFiles", [])) for t in ordered])
+		self.output_bytes = np.array([sum(file_sizes.get(f, 0) for f in t.get("outputFiles", [])) for t in ordered])
+		self.real_makespan = float(execution["makespanInSeconds"])
+		self.num_hosts = max(1, len(execution.get("machines", [])))
+
+	@property
+	def work(self) -> np.ndarray:
+		# Per task, its flops in units of the reference flops
+		return self.runtimes * self.cpu_fractions
+
+	@property
+	def depth(self) -> int:
+		return len(self.level_starts) - 1
+
+	@property
+	def width(self) -> int:
+		# Number of tasks of the widest level
+		return int(np.diff(self.level_starts).max(initial=0))
+
+	@property
+	def total_bytes(self) -> float:
+		return float(self.input_bytes.sum() + self.output_bytes.sum())
+
+	def critical_path(self, weights: np.ndarray) -> np.ndarray:
+		# weights: per task (rows), for each candidate (columns); returns the longest path of each column
+		finish = np.empty_like(weights)
+		start, end = self.level_starts[0], self.level_starts[1]
+		finish[start:end] = weights[start:end]
+		for start, end in zip(self.level_starts[1:-1], self.level_starts[2:]):
+			# Every task of a level > 0 has parents: no empty segment for reduceat
+			segment_starts = self.parents_indptr[start:end] - self.parents_indptr[start]
+			parent_finish = finish[self.parents_indices[self.parents_indptr[start]:self.parents_indptr[end]]]
+			finish[start:end] = weights[start:end] + np.maximum.reduceat(parent_finish, segment_starts, axis=0)
+		return finish.max(axis=0)
+
+	def critical_path_tasks(self, weights: np.ndarray) -> List[int]:
+		# The tasks of the longest path for one candidate (weights: one per task), found back from its last task
+		finish = np.empty_like(weights)
+		start, end = self.level_starts[0], self.level_starts[1]
+		finish[start:end] = weights[start:end]
+		for k in range(end, self.num_tasks):
+			finish[k] = weights[k] + finish[self.parents_indices[self.parents_indptr[k]:self.parents_indptr[k + 1]]].max()
+		task = int(np.argmax(finish))
+		path = [task]
+		while self.parents_indptr[task + 1] > self.parents_indptr[task]:
+			parents = self.parents_indices[self.parents_indptr[task]:self.parents_indptr[task + 1]]
+			task = int(parents[np.argmax(finish[parents])])
+			path.append(task)
+		return path[::-1]
+
+	def makespan_lower_bound(self, parameters: dict) -> np.ndarray:
+		"""
+		parameters: model parameters (see model_parameters), each a scalar or an array (one value per candidate)
+		"""
+		def column(x):
+			return np.atleast_1d(np.asarray(x, dtype=float))[np.newaxis, :]
+		flops = self.work[:, np.newaxis] * column(parameters["reference_flops"])
+		speed = column(parameters["compute_speed"])
+		transfer = (self.input_bytes[:, np.newaxis] / np.minimum(column(parameters["read_bandwidth"]),
+																column(parameters["network_bandwidth"])) +
+					self.output_bytes[:, np.newaxis] / np.minimum(column(parameters["write_bandwidth"]),
+																 column(parameters["network_bandwidth"])))
+		overhead = column(parameters["scheduling_overhead"]) + column(parameters["thread_startup_overhead"])
+		weights = flops / (speed * self.cores[:, np.newaxis]) + overhead + transfer
+		critical_path = self.critical_path(weights)
+		total_compute = (flops / speed).sum(axis=0) / (self.num_hosts * column(parameters["num_cores"])[0])
+		scheduling = self.num_tasks * column(parameters["scheduling_overhead"])[0]
+		return np.maximum(np.maximum(critical_path, total_compute), scheduling)
+
+
+@lru_cache(maxsize=None)
+def load_analytic_workflow(workflow: str) -> AnalyticWorkflow:
+	return AnalyticWorkflow(load_workflow_json(workflow))
+
+
+# Where the model's parameters are in a simulator JSON input, per scheme (for bandwidths, the
+# network bandwidth is that of the slowest link between the submit host and compute hosts)
+def _parameter_paths(json_input: dict) -> dict[str, List[List[str]]]:
+	cs = json_input["compute_service_scheme"]
+	ss = json_input["storage_service_scheme"]
+	ns = json_input["network_topology_scheme"]
+	compute = ["compute_service_scheme_parameters", cs]
+	storage = ["storage_service_scheme_parameters", ss]
+	network = ["network_topology_scheme_parameters", ns]
+	properties = "properties" if cs == "all_bare_metal" else "bare_metal_properties"
+	network_bandwidths = {
+		"one_link": [network + ["bandwidth"]],
+		"many_links": [network + ["bandwidth_submit_to_compute_host"]],
+		"one_and_then_many_links": [network + ["bandwidth_out_of_submit"], network + ["bandwidth_to_compute_hosts"]],
+	}[ns]
+	return {
+		"reference_flops": [["workflow", "reference_flops"]],
+		"compute_speed": [compute + ["compute_hosts", "speed"]],
+		"num_cores": [compute + ["compute_hosts", "num_cores"]],
+		"thread_startup_overhead": [compute + [properties, "BareMetalComputeServiceProperty::THREAD_STARTUP_OVERHEAD"]],
+		"scheduling_overhead": [["scheduling_overhead"]],
+		"read_bandwidth": [storage + ["bandwidth_submit_disk_read"]],
+		"write_bandwidth": [storage + ["bandwidth_submit_disk_write"]],
+		"network_bandwidth": network_bandwidths,
+	}
+
+
+def _json_value(json_input: dict, path: List[str]) -> str:
+	for item in path:
+		json_input = json_input[item]
+	return json_input
+
+
+def model_parameters(json_input: dict, overrides: dict[tuple, np.ndarray] | None = None) -> dict:
+	"""
+	The model's parameters in a simulator JSON input; overrides maps JSON paths (as tuples) to
+	arrays of values (in the model's units), one per candidate calibration
+	"""
+	overrides = overrides or {}
+	parameters = {}
+	for name, paths in _parameter_paths(json_input).items():
+		values = [overrides[tuple(path)] if tuple(path) in overrides else parse_quantity(str(_json_value(json_input, path)))
+				  for path in paths]
+		parameters[name] = values[0] if len(values) == 1 else np.minimum.reduce([np.asarray(v, dtype=float) for v in values])
+	return parameters
+
+
+def makespan_error_lower_bounds(workflows: List[str], json_inputs: List[dict], slack: float = BOUND_SLACK) -> List[float]:
+	# Relative makespan error the simulator can't do better than, per workflow (0 if the bound is below the real makespan)
+	bounds = []
+	for workflow, json_input in zip(workflows, json_inputs):
+		analytic_workflow = load_analytic_workflow(workflow)
+		lower_bound = float(analytic_workflow.makespan_lower_bound(model_parameters(json_input))[0]) * slack
+		bounds.append(max(0.0, lower_bound - analytic_workflow.real_makespan) / analytic_workflow.real_makespan)
+	return bounds
+
+
+def analytic_optimum(workflows: List[str], base_json_input: dict, parameter_specs: list,
+					 aggregate: Callable, num_candidates: int = 4096, seed: int | None = None) -> List[float]:
+	"""
+	Among random candidate positions (in [0, 1] for each of the parameter specs, see ParameterSpec),
+	the one whose analytic makespans best match the real ones (errors aggregated over workflows)
+	"""
+	rng = np.random.default_rng(seed)
+	positions = rng.random((num_candidates, len(parameter_specs)))
+	overrides = {}
+	for k, parameter_spec in enumerate(parameter_specs):
+		# Value in the model's units, e.g., bits per second parameters are turned into bytes per second
+		unit = parse_quantity(parameter_spec.formatted(1))
+		x = parameter_spec.low + positions[:, k] * (parameter_spec.high - parameter_spec.low)
+		values = 2 ** x if parameter_spec.scale == "exponential" else x
+		if "%d" in parameter_spec.format:
+			values = np.floor(values)
+		overrides[tuple(parameter_spec.path)] = values * unit
+	parameters = model_parameters(base_json_input, overrides)
+	errors = []
+	for workflow in workflows:
+		analytic_workflow = load_analytic_workflow(workflow)
+		makespans = analytic_workflow.makespan_lower_bound(parameters)
+		errors.append(np.abs(makespans - analytic_workflow.real_makespan) / analytic_workflow.real_makespan)
+	if aggregate is max:
+		loss = np.max(errors, axis=0)
+	else:
+		loss = np.mean(errors, axis=0)
+	return list(positions[int(np.argmin(loss))])
@@ -0,0 +1,62 @@
+"""
+Registry of computed calibrations, so that campaigns don't recalibrate training sets that earlier ones
+already calibrated with the same settings (algorithm, loss, schemes, time limit, ...). Calibrations are
+keyed by the order-invariant hash of their training set (WorkflowSetSpec.ivhash) and the settings,
+which include a hash of the training workflows' content (Util.content_hash, so that workflows rewritten
+in place are recalibrated), in a SQLite file that campaigns share by passing it explicitly (e.g., with the
+--registry option of the drivers; there is no default, so that campaigns never silently reuse calibrations).
+Calibrations are stored as JSON of their parameter values by name (WorkflowSimulatorCalibrator.named_values).
+"""
+import json
+import sqlite3
+import time
+
+_schema = """
+CREATE TABLE IF NOT EXISTS named_calibrations (
+	training_hash TEXT NOT NULL,
+	settings TEXT NOT NULL,
+	named_values TEXT NOT NULL,
+	calibration_loss REAL,
+	created REAL NOT NULL,
+	PRIMARY KEY (training_hash, settings)
+);
+"""
+
+
+class CalibrationRegistry:
+	def __init__(self, path: str):
+		self.path = path
+		with self._connect() as connection:
+			connection.executescript(_schema)
+
+	def _connect(self) -> sqlite3.Connection:
+		# One connection per operation: calibrations may be computed (and recorded) by several threads
+		return sqlite3.connect(self.path, timeout=60)
+
+	@staticmethod
+	def settings_key(settings: dict) -> str:
+		return json.dumps(settings, sort_keys=True, separators=(',', ':'))
+
+	def lookup(self, training_hash: str, settings: dict) -> tuple[dict[str, str], float] | None:
+		connection = self._connect()
+		try:
+			row = connection.execute("SELECT named_values, calibration_loss FROM named_calibrations "
+									 "WHERE training_hash = ? AND settings = ?",
+									 (training_hash, self.settings_key(settings))).fetchone()
+		finally:
+			connection.close()
+		if row is None:
+			return None
+		return json.loads(row[0]), row[1]
+
+	def record(self, training_hash: str, settings: dict, named_values: dict[str, str], calibration_loss: float):
+		connection = self._connect()
+		try:
+			with connection:
+				connection.execute("INSERT OR REPLACE INTO named_calibrations "
+								   "(training_hash, settings, named_values, calibration_loss, created) "
+								   "VALUES (?, ?, ?, ?, ?)",
+								   (training_hash, self.settings_key(settings), json.dumps(named_values, sort_keys=True),
+									calibration_loss, time.time()))
+		finally:
+			connection.close()
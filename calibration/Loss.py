@@ -1,3 +1,4 @@
+import numpy as np
 import simcal as sc
 from statistics import mean
 
@@ -9,7 +10,16 @@ def get_loss_function(loss_spec: str,aggregation: str) -> Callable:
 def void(x: dict):
 	return 0
 
+def task_relative_errors(x) -> np.ndarray:
+	# For results that keep per-task durations in arrays (WorkflowResult), no per-task dicts are built
+	real = np.asarray(x.real_durations)
+	sim = np.asarray(x.simulated_durations)
+	return np.abs(real-sim)/real
+
 def average_runtimes(x: dict):
+	if hasattr(x, "real_durations"):
+		errors = task_relative_errors(x)
+		return float(errors.mean()) if len(errors) else float('inf')
 	loss = 0
 	count = 0
 	for task in x['tasks']:
@@ -22,6 +32,9 @@ def average_runtimes(x: dict):
 	return loss/count
 	
 def max_runtimes(x: dict):
+	if hasattr(x, "real_durations"):
+		errors = task_relative_errors(x)
+		return float(errors.max(initial=0)) if len(errors) else float('inf')
 	loss = 0
 	
 	if len(x['tasks']) == 0:
@@ -32,6 +45,9 @@ def max_runtimes(x: dict):
 		loss = max(loss,abs(real-sim)/real)
 	return loss	
 	
+# Per-workflow errors that the simulator computes itself (its error_computation_scheme)
+simulator_error_computation_schemes = ["makespan", "average_runtimes", "max_runtimes"]
+
 class LossHandler:
 	def __init__(self,loss_spec: str,aggregation: str):
 		if aggregation == "average_error":
@@ -49,16 +65,26 @@ class LossHandler:
 			self.loss_spec = max_runtimes
 		else:
 			raise Exception(f"Unknown loss loss_spec name '{loss_spec}'")
+		# The simulator can output this loss's per-workflow error, in which case no per-task durations are needed
+		self.error_computation_scheme = loss_spec if loss_spec in simulator_error_computation_schemes else None
+		self.needs_task_data = self.loss_spec is not void and self.error_computation_scheme is None
 	
+	def workflow_loss(self, x: dict) -> float:
+		real_makespan = float(x["real_makespan"])
+		simulated_makespan = float(x["simulated_makespan"])
+		makespan_loss = abs(real_makespan-simulated_makespan)/real_makespan
+		if self.loss_spec is void:
+			return makespan_loss
+		if self.error_computation_scheme is not None and x.get("error_computation_scheme") == self.error_computation_scheme:
+			# Computed by the simulator
+			return makespan_loss+float(x["error"])
+		return makespan_loss+self.loss_spec(x)
+
 	def __call__(self,output: List[dict]):
 		losses = []
 		#print(output)
 		for x in output:
 			#print(x)
-			real_makespan = float(x["real_makespan"])
-			simulated_makespan = float(x["simulated_makespan"])
-			makespan_loss = abs(real_makespan-simulated_makespan)/real_makespan
-			sub_loss = self.loss_spec(x)
-			losses.append(makespan_loss+sub_loss)
+			losses.append(self.workflow_loss(x))
 			
 		return self.method(losses)	
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Gradient descent whose evaluations run concurrently (the "gradient.parallel" algorithm), over positions
+in [0, 1] of each calibrated parameter's range (see ParameterSpec). Each iteration:
+
+- evaluates the forward finite-difference perturbations of all coordinates at once;
+- meanwhile, with the workers that are left, speculatively evaluates steps along the previous descent
+  direction (which is often close to the new one);
+- then evaluates several step sizes along the new direction at once (a parallel line search).
+
+The best point of the iteration (line search or speculative) becomes the next one if it improves on
+the current one; otherwise the step size shrinks. With as many workers as parameters, an iteration
+takes about as long as two sequential evaluations, rather than #parameters + #step sizes.
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+from typing import Callable, List
+
+import numpy as np
+
+
+class ParallelGradientDescent:
+	def __init__(self, num_threads: int, initial_step: float = 0.1, min_step: float = 1e-3,
+				 perturbation: float = 1e-2):
+		self.num_threads = max(1, num_threads)
+		self.initial_step = initial_step
+		self.min_step = min_step
+		self.perturbation = perturbation
+		self.num_evaluations = 0
+		self.num_iterations = 0
+
+	def step_multipliers(self, count: int) -> List[float]:
+		# 1, 2, 1/2, 4, 1/4, ...
+		multipliers = [1.0]
+		k = 1
+		while len(multipliers) < count:
+			multipliers.append(2.0 ** k)
+			if len(multipliers) < count:
+				multipliers.append(2.0 ** -k)
+			k += 1
+		return multipliers
+
+	def calibrate(self, evaluate: Callable[[List[float]], float], dimension: int, time_limit: float,
+				  start: List[float] | None = None) -> tuple[List[float], float]:
+		"""
+		Minimizes evaluate (which is called concurrently) over [0, 1]^dimension until the step size gets
+		below min_step or the time limit is reached; returns the best position and its loss
+		"""
+		start_time = time()
+		x = np.clip(np.array(start if start is not None else [0.5] * dimension, dtype=float), 0, 1)
+		step = self.initial_step
+		previous_direction = None
+
+		with ThreadPoolExecutor(max_workers=self.num_threads) as pool:
+			def evaluate_all(points: List[np.ndarray]) -> List[float]:
+				futures = [pool.submit(evaluate, list(point)) for point in points]
+				self.num_evaluations += len(points)
+				return [future.result() for future in futures]
+
+			loss = evaluate_all([x])[0]
+			while step >= self.min_step and time() - start_time < time_limit:
+				self.num_iterations += 1
+				# Perturbations (backward at the upper bound), and speculative steps on idle workers
+				perturbations = np.where(x + self.perturbation <= 1, self.perturbation, -self.perturbation)
+				points = [x + np.eye(dimension)[i] * perturbations[i] for i in range(dimension)]
+				num_speculative = max(0, self.num_threads - dimension) if previous_direction is not None else 0
+				speculative_multipliers = self.step_multipliers(num_speculative) if num_speculative else []
+				speculative = [np.clip(x + step * m * previous_direction, 0, 1) for m in speculative_multipliers]
+				losses = evaluate_all(points + speculative)
+				perturbed_losses, speculative_losses = np.array(losses[:dimension]), losses[dimension:]
+
+				gradient = (perturbed_losses - loss) / perturbations
+				# (point, loss, step size that led to it)
+				candidates = [(p, l, step * m) for p, l, m in
+							  zip(speculative, speculative_losses, speculative_multipliers)]
+				if np.all(np.isfinite(gradient)) and np.linalg.norm(gradient) > 0:
+					direction = -gradient / np.linalg.norm(gradient)
+					multipliers = self.step_multipliers(self.num_threads)
+					line_points = [np.clip(x + step * m * direction, 0, 1) for m in multipliers]
+					candidates += [(p, l, step * m) for p, l, m in
+								   zip(line_points, evaluate_all(line_points), multipliers)]
+					previous_direction = direction
+				# The perturbed points are candidates too
+				candidates += [(p, l, step) for p, l in zip(points, perturbed_losses)]
+
+				best_point, best_loss, best_step = min(candidates, key=lambda c: c[1])
+				if best_loss < loss:
+					x, loss = best_point, best_loss
+					# Follow the step size that worked, and try longer ones if it was the longest
+					longest = step * max(self.step_multipliers(self.num_threads))
+					step = min(1.0, 2 * best_step if best_step >= longest else best_step)
+				else:
+					step /= 4
+		sys.stderr.write(f"  Parallel gradient descent: {self.num_iterations} iterations, "
+						 f"{self.num_evaluations} evaluations, final step {step:.3g}\n")
+		return list(x), loss
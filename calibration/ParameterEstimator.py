@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Closed-form estimates of the calibrated parameters from the ground truth, to narrow the ranges that
+calibrations search. Each training workflow's real makespan is regressed on features of its critical
+path (with task weights at the reference speed, see AnalyticModel):
+
+	makespan ~ flops / compute_speed + bytes / bandwidth + num_tasks * overhead
+
+where flops are the path's task flops (see AnalyticWorkflow.work, over their cores), bytes the path's
+input and output file bytes, and num_tasks its length. The regression is solved (non-negatively) for
+many bootstrap resamplings of the workflows at once, which gives each estimate a confidence interval.
+Resamplings that don't determine all three coefficients (too few distinct workflows drawn) are left
+out, and with fewer than MIN_WORKFLOWS distinct workflows nothing is estimated.
+
+The compute speed estimate bounds compute_hosts_speed on both sides. The bandwidth is that of the
+slowest of the disks and links, so it only bounds each bandwidth parameter from below, and the overhead
+is the sum of the per-task overheads and delays, so it only bounds each of them from above.
+"""
+import argparse
+import json
+import math
+import sys
+from glob import glob
+from typing import List
+
+import numpy as np
+
+import AnalyticModel
+import Simulator
+
+FEATURES = ["compute_speed", "bandwidth", "overhead"]
+# Estimate intervals are widened by this factor (on each side) before narrowing parameter ranges
+DEFAULT_MARGIN = 2.0
+# Fewer distinct training workflows don't give meaningful bootstrap intervals
+MIN_WORKFLOWS = 2 * len(FEATURES)
+
+
+def workflow_features(workflow: str, reference_flops: float) -> np.ndarray:
+	# Flops, bytes and number of tasks of the critical path (at the reference speed)
+	analytic_workflow = AnalyticModel.load_analytic_workflow(workflow)
+	path = analytic_workflow.critical_path_tasks(analytic_workflow.work / analytic_workflow.cores)
+	flops = (analytic_workflow.work[path] * reference_flops / analytic_workflow.cores[path]).sum()
+	data = (analytic_workflow.input_bytes[path] + analytic_workflow.output_bytes[path]).sum()
+	return np.array([flops, data, len(path)])
+
+
+def _nonnegative_least_squares(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+	"""
+	x: (samples, rows, features), y: (samples, rows); solves all samples at once, with features that come out
+	negative dropped (and the others solved again) until none does
+	"""
+	num_samples, _, num_features = x.shape
+	active = np.ones((num_samples, num_features), dtype=bool)
+	coefficients = np.zeros((num_samples, num_features))
+	for _ in range(num_features):
+		xa = x * active[:, np.newaxis, :]
+		gram = np.einsum("srf,srg->sfg", xa, xa)
+		# Inactive features get an identity row, so that their coefficient solves to 0
+		gram += np.einsum("sf,fg->sfg", ~active, np.eye(num_features))
+		gram += 1e-9 * np.eye(num_features)
+		coefficients = np.linalg.solve(gram, np.einsum("srf,sr->sf", xa, y)[..., np.newaxis])[..., 0]
+		negative = active & (coefficients < 0)
+		if not negative.any():
+			break
+		active &= ~negative
+	return np.maximum(coefficients, 0) * active
+
+
+def estimate(workflows: List[str], reference_flops: float, num_bootstrap: int = 256,
+			 seed: int | None = None) -> dict[str, dict[str, float] | None]:
+	"""
+	Per feature (compute speed in flops/s, bandwidth in bytes/s, overhead in seconds): the estimate and
+	the bounds of its 90% bootstrap interval (which contains the estimate), or None if the training
+	workflows don't determine it
+	"""
+	features = np.array([workflow_features(workflow, reference_flops) for workflow in workflows])
+	makespans = np.array([AnalyticModel.load_analytic_workflow(workflow).real_makespan for workflow in workflows])
+	if len(np.unique(np.column_stack([features, makespans]), axis=0)) < MIN_WORKFLOWS:
+		return {name: None for name in FEATURES}
+	# Features of very different magnitudes: solve for coefficients relative to the features' scales
+	scales = features.mean(axis=0)
+	scales[scales == 0] = 1
+	x = features / scales
+
+	rng = np.random.default_rng(seed)
+	samples = rng.integers(0, len(workflows), size=(num_bootstrap, len(workflows)))
+	samples[0] = np.arange(len(workflows))
+	# Rank-deficient resamplings (e.g., the same few workflows drawn over and over) give arbitrary coefficients
+	samples = samples[np.linalg.matrix_rank(x[samples]) == len(FEATURES)]
+	if len(samples) == 0 or samples[0].tolist() != list(range(len(workflows))):
+		return {name: None for name in FEATURES}
+	coefficients = _nonnegative_least_squares(x[samples], makespans[samples]) / scales
+
+	# Speed and bandwidth are the inverses of their coefficients
+	values = coefficients.copy()
+	with np.errstate(divide="ignore"):
+		values[:, :2] = 1 / coefficients[:, :2]
+	estimates = {}
+	for k, name in enumerate(FEATURES):
+		# A feature that all workflows share (e.g., no data) can't be told apart from the others
+		determined = np.ptp(features[:, k]) > 0
+		if not determined or not np.isfinite(values[0, k]) or (k < 2 and coefficients[0, k] == 0):
+			estimates[name] = None
+			continue
+		finite = values[:, k][np.isfinite(values[:, k])]
+		low, high = np.percentile(finite, [5, 95])
+		estimate = float(values[0, k])
+		estimates[name] = {"estimate": estimate, "low": min(float(low), estimate), "high": max(float(high), estimate)}
+	return estimates
+
+
+def _feature(parameter_name: str) -> str | None:
+	if parameter_name == "compute_hosts_speed":
+		return "compute_speed"
+	if parameter_name.endswith("_bw"):
+		return "bandwidth"
+	if "overhead" in parameter_name or "delay" in parameter_name:
+		return "overhead"
+	return None
+
+
+def narrowed_parameters(parameter_specs: list, estimates: dict, margin: float = DEFAULT_MARGIN) -> list:
+	"""
+	Copies of the parameter specs (see WorkflowSimulatorCalibrator.ParameterSpec) with ranges narrowed
+	to the estimates' intervals widened by the margin, within their original ranges
+	"""
+	narrowed = []
+	for parameter_spec in parameter_specs:
+		feature = _feature(parameter_spec.name)
+		interval = estimates.get(feature) if feature is not None else None
+		low, high = parameter_spec.low, parameter_spec.high
+		if interval is not None:
+			# In the parameter's units (e.g., bits per second) and scale (exponent for exponential parameters)
+			unit = AnalyticModel.parse_quantity(parameter_spec.formatted(1))
+			interval_low, interval_high = interval["low"] / unit / margin, interval["high"] / unit * margin
+			if parameter_spec.scale == "exponential":
+				interval_low = math.log2(interval_low) if interval_low > 0 else -math.inf
+				interval_high = math.log2(interval_high)
+			if feature in ["compute_speed", "bandwidth"]:
+				low = min(max(low, interval_low), high)
+			if feature in ["compute_speed", "overhead"]:
+				high = max(min(high, interval_high), low)
+		narrowed.append(type(parameter_spec)(parameter_spec.name, parameter_spec.scale, low, high,
+											 parameter_spec.format, parameter_spec.path))
+	return narrowed
+
+
+def start_position(parameter_spec, estimates: dict) -> float:
+	# Position in [0, 1] of the parameter's estimate in its range (the middle if it has none)
+	feature = _feature(parameter_spec.name)
+	interval = estimates.get(feature) if feature is not None else None
+	if interval is None or feature != "compute_speed" or parameter_spec.high == parameter_spec.low:
+		return 0.5
+	x = interval["estimate"] / AnalyticModel.parse_quantity(parameter_spec.formatted(1))
+	if parameter_spec.scale == "exponential":
+		x = math.log2(x)
+	return min(1.0, max(0.0, (x - parameter_spec.low) / (parameter_spec.high - parameter_spec.low)))
+
+
+def main():
+	parser = argparse.ArgumentParser(
+		prog=sys.argv[0],
+		description='Estimate the compute speed, bandwidth and per-task overhead of the ground truth')
+	parser.add_argument('-ts', '--training_set', required=True, type=str, nargs="+",
+						help='The list of json files (or glob patterns) to estimate from')
+	parser.add_argument('-b', '--num_bootstrap', type=int, default=256, help='Number of bootstrap resamplings')
+	parser.add_argument('--seed', type=int, default=None, help='Seed of the resamplings')
+	args = parser.parse_args()
+
+	workflows = []
+	for pattern in args.training_set:
+		workflows += sorted(glob(pattern)) if '*' in pattern else [pattern]
+	reference_flops = AnalyticModel.parse_quantity(Simulator.template_json_input["workflow"]["reference_flops"])
+	print(json.dumps(estimate(workflows, reference_flops, args.num_bootstrap, args.seed), indent=1))
+
+
+if __name__ == "__main__":
+	main()
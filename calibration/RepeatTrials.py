@@ -0,0 +1,105 @@
+"""
+Ground truth has several repeat trials (file name token 7) of each workflow configuration (tokens 0-6).
+Instead of simulating all of them for every candidate calibration, a calibration can use one workflow
+per configuration: a representative one ("median_makespan": the trial with the median makespan,
+"median_tasks": a workflow built from the per-task median runtimes, cached on disk next to the trials),
+or a trial sampled for each candidate ("sample").
+"""
+import hashlib
+import json
+import os
+import random
+from itertools import groupby
+from statistics import median
+from typing import List
+
+from WorkflowPack import load_workflow_json
+
+REPEAT_MODES = ["all", "median_makespan", "median_tasks", "sample"]
+REPRESENTATIVE_DIR = "representatives"
+
+
+def configuration_key(workflow: str) -> str:
+	return '-'.join(os.path.basename(workflow).split('-')[0:7])
+
+
+def split_repeats(workflows: List[str]) -> List[List[str]]:
+	# The repeat trials of each configuration in a (ground truth) group of workflows
+	return [list(trials) for _, trials in groupby(sorted(workflows, key=configuration_key), key=configuration_key)]
+
+
+def get_makespan(workflow: str) -> float:
+	return float(load_workflow_json(workflow)["workflow"]["execution"]["makespanInSeconds"])
+
+
+def median_makespan_trial(trials: List[str]) -> str:
+	makespans = [get_makespan(trial) for trial in trials]
+	median_makespan = median(makespans)
+	return trials[min(range(len(trials)), key=lambda i: abs(makespans[i] - median_makespan))]
+
+
+def _sources_digest(trials: List[str]) -> str:
+	h = hashlib.md5()
+	for trial in sorted(trials):
+		try:
+			stat = os.stat(trial)
+			h.update(f"{os.path.abspath(trial)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+		except FileNotFoundError:
+			# Only in a workflow pack
+			h.update(f"{os.path.abspath(trial)}:packed\n".encode())
+	return h.hexdigest()[:12]
+
+
+def build_median_tasks_workflow(trials: List[str]) -> dict:
+	"""
+	The median makespan trial, with each task's runtime replaced by its median over all trials
+	(tasks are matched by ID; if trials don't have the same tasks, the median makespan trial as is)
+	"""
+	base = load_workflow_json(median_makespan_trial(trials))
+	runtimes = {}
+	for trial in trials:
+		for task in load_workflow_json(trial)["workflow"]["execution"]["tasks"]:
+			runtimes.setdefault(task["id"], []).append(float(task["runtimeInSeconds"]))
+	if any(len(r) != len(trials) for r in runtimes.values()):
+		return base
+	execution = base["workflow"]["execution"]
+	for task in execution["tasks"]:
+		task["runtimeInSeconds"] = median(runtimes[task["id"]])
+		task.pop("syntheticRuntimeInSecond", None)
+	execution["makespanInSeconds"] = median(get_makespan(trial) for trial in trials)
+	return base
+
+
+def representative_workflow(trials: List[str], repeat_mode: str) -> str:
+	"""
+	Path of the workflow that represents the repeat trials of a configuration
+	"""
+	if len(trials) == 1:
+		return trials[0]
+	if repeat_mode == "median_makespan":
+		return median_makespan_trial(trials)
+	if repeat_mode != "median_tasks":
+		raise Exception(f"Repeat mode '{repeat_mode}' has no representative workflow")
+	# Named like the trials (so that the usual file name tokens apply), with the trial number
+	# replaced by the mode and the timestamp by a digest of the trials
+	directory = os.path.join(os.path.dirname(os.path.abspath(trials[0])), REPRESENTATIVE_DIR)
+	path = os.path.join(directory, f"{configuration_key(trials[0])}-{repeat_mode}-{_sources_digest(trials)}.json")
+	if not os.path.isfile(path):
+		os.makedirs(directory, exist_ok=True)
+		tmp_path = f"{path}.{os.getpid()}.tmp"
+		with open(tmp_path, "w") as f:
+			json.dump(build_median_tasks_workflow(trials), f, separators=(',', ':'))
+		os.replace(tmp_path, path)
+	return path
+
+
+def reduce_repeats(ground_truth: List[List[str]], repeat_mode: str) -> List[List[str]]:
+	if repeat_mode in ["all", "sample"]:
+		return ground_truth
+	return [[representative_workflow(trials, repeat_mode) for trials in split_repeats(group)]
+			for group in ground_truth]
+
+
+def sample_repeats(repeat_groups: List[List[List[str]]], rng: random.Random) -> List[List[str]]:
+	# One trial per configuration
+	return [[rng.choice(trials) for trials in group] for group in repeat_groups]
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from glob import glob
+from multiprocessing import Pool
+from typing import List
+
+from Util import *
+
+_schema = """
+CREATE TABLE IF NOT EXISTS files (
+	path TEXT PRIMARY KEY,
+	size INTEGER NOT NULL,
+	mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS experiments (
+	id INTEGER PRIMARY KEY,
+	path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+	xp_index INTEGER NOT NULL,
+	workflow TEXT,
+	architecture TEXT,
+	algorithm TEXT,
+	loss_function TEXT,
+	loss_aggregator TEXT,
+	time_limit INTEGER,
+	num_threads INTEGER,
+	compute_service_scheme TEXT,
+	storage_service_scheme TEXT,
+	network_topology_scheme TEXT,
+	training_hash TEXT,
+	num_training_workflows INTEGER,
+	max_num_tasks INTEGER,
+	max_num_nodes INTEGER,
+	num_cpu_values INTEGER,
+	num_data_values INTEGER,
+	training_set TEXT,
+	calibration TEXT,
+	calibration_loss REAL,
+	evaluation_losses TEXT
+);
+CREATE TABLE IF NOT EXISTS training_values (
+	experiment_id INTEGER NOT NULL REFERENCES experiments(id) ON DELETE CASCADE,
+	characteristic TEXT NOT NULL,
+	value INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS experiments_path ON experiments(path);
+CREATE INDEX IF NOT EXISTS experiments_workflow ON experiments(workflow, algorithm, time_limit);
+CREATE INDEX IF NOT EXISTS experiments_algorithm ON experiments(algorithm);
+CREATE INDEX IF NOT EXISTS experiments_time_limit ON experiments(time_limit);
+CREATE INDEX IF NOT EXISTS experiments_schemes ON experiments(compute_service_scheme,
+	storage_service_scheme, network_topology_scheme);
+CREATE INDEX IF NOT EXISTS experiments_training_hash ON experiments(training_hash);
+CREATE INDEX IF NOT EXISTS training_values_lookup ON training_values(characteristic, value);
+CREATE INDEX IF NOT EXISTS training_values_experiment ON training_values(experiment_id);
+"""
+
+# Training-set characteristics that get one indexed row per value
+_characteristics = ["num_tasks", "num_nodes", "cpu", "data"]
+
+# Columns a query may filter on directly
+_query_columns = ["workflow", "architecture", "algorithm", "loss_function", "loss_aggregator", "time_limit",
+				  "num_threads", "compute_service_scheme", "storage_service_scheme", "network_topology_scheme",
+				  "training_hash", "num_training_workflows", "max_num_tasks", "max_num_nodes", "path"]
+
+
+def _summarize_pickle(path: str):
+	# Runs in a worker process: a file that can't be read gets its error in place of its records
+	try:
+		return _summarize_pickle_or_raise(path)
+	except Exception as error:
+		return path, None, None, f"{type(error).__name__}: {error}"
+
+
+def _summarize_pickle_or_raise(path: str):
+	# Read the header of one result file and flatten it into rows
+	stat = os.stat(path)
+	header = load_experiment_set_header(path)
+	records = []
+	for i, xp in enumerate(header["experiments"]):
+		spec = header_training_set_spec(xp)
+		records.append({
+			"xp_index": i,
+			"workflow": spec.workflow_name,
+			"architecture": spec.architecture,
+			"algorithm": header["algorithm"],
+			"loss_function": header["loss_function"],
+			"loss_aggregator": header["loss_aggregator"],
+			"time_limit": header["time_limit"],
+			"num_threads": header["num_threads"],
+			"compute_service_scheme": header["compute_service_scheme"],
+			"storage_service_scheme": header["storage_service_scheme"],
+			"network_topology_scheme": header["network_topology_scheme"],
+			"training_hash": xp["training_hash"],
+			"num_training_workflows": len(flatten(spec.workflows)),
+			"max_num_tasks": max(spec.num_tasks_values, default=None),
+			"max_num_nodes": max(spec.num_nodes_values, default=None),
+			"num_cpu_values": len(spec.cpu_values),
+			"num_data_values": len(spec.data_values),
+			"training_set": spec.workflows,
+			"calibration": xp["calibration"],
+			"calibration_loss": xp["calibration_loss"],
+			"evaluation_losses": xp["evaluation_losses"],
+			"training_values": {
+				"num_tasks": spec.num_tasks_values,
+				"num_nodes": spec.num_nodes_values,
+				"cpu": spec.cpu_values,
+				"data": spec.data_values,
+			},
+		})
+	return path, stat.st_size, stat.st_mtime_ns, records
+
+
+def find_pickles(paths: List[str]) -> List[str]:
+	found = []
+	for path in paths:
+		if os.path.isdir(path):
+			for root, dirs, files in os.walk(path):
+				for file in files:
+					if file.endswith('.pickled') or file.endswith('.pickle'):
+						found.append(os.path.join(root, file))
+		elif '*' in path:
+			found += glob(path)
+		else:
+			found.append(path)
+	return sorted(set(os.path.abspath(x) for x in found))
+
+
+class ResultsDatabase:
+	def __init__(self, db_path: str):
+		self.db_path = db_path
+		self.connection = sqlite3.connect(db_path)
+		self.connection.row_factory = sqlite3.Row
+		self.connection.execute("PRAGMA foreign_keys = ON")
+		self.connection.executescript(_schema)
+
+	def close(self):
+		self.connection.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def stale_files(self, pickle_files: List[str]) -> List[str]:
+		# A file needs (re)ingestion if we've never seen it or its size/mtime changed
+		known = {row["path"]: (row["size"], row["mtime_ns"])
+				 for row in self.connection.execute("SELECT path, size, mtime_ns FROM files")}
+		stale = []
+		for path in pickle_files:
+			stat = os.stat(path)
+			if known.get(path) != (stat.st_size, stat.st_mtime_ns):
+				stale.append(path)
+		return stale
+
+	def remove_missing_files(self) -> int:
+		# Deleted (or renamed) files: their experiments go with them
+		missing = [row["path"] for row in self.connection.execute("SELECT path FROM files")
+				   if not os.path.isfile(row["path"])]
+		self.connection.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in missing])
+		return len(missing)
+
+	def ingest(self, paths: List[str], num_workers: int = 1) -> int:
+		"""
+		Returns the number of files (re)ingested; files that can't be read are reported and skipped (and
+		retried by the next ingestion)
+		"""
+		num_missing = self.remove_missing_files()
+		pickle_files = find_pickles(paths)
+		stale = self.stale_files(pickle_files)
+		sys.stderr.write(f"{len(pickle_files)} pickled files, {len(stale)} new or changed, "
+						 f"{num_missing} removed...\n")
+		if num_workers > 1 and len(stale) > 1:
+			with Pool(num_workers) as pool:
+				summaries = pool.imap_unordered(_summarize_pickle, stale)
+				num_ingested = self._store_all(summaries)
+		else:
+			num_ingested = self._store_all(map(_summarize_pickle, stale))
+		self.connection.commit()
+		return num_ingested
+
+	def _store_all(self, summaries) -> int:
+		num_stored = 0
+		for path, size, mtime_ns, records in summaries:
+			if size is None:
+				sys.stderr.write(f"Cannot ingest {path}: {records}\n")
+				# Not the experiments of a previous version of the file either
+				self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+				continue
+			self._store(path, size, mtime_ns, records)
+			num_stored += 1
+		return num_stored
+
+	def _store(self, path: str, size: int, mtime_ns: int, records: List[dict]):
+		cursor = self.connection.cursor()
+		# Cascades to the experiments and training values of the previous version of the file
+		cursor.execute("DELETE FROM files WHERE path = ?", (path,))
+		cursor.execute("INSERT INTO files (path, size, mtime_ns) VALUES (?, ?, ?)", (path, size, mtime_ns))
+		for record in records:
+			columns = ["path"] + [k for k in record if k != "training_values"]
+			values = [path]
+			for k in columns[1:]:
+				v = record[k]
+				values.append(json.dumps(v) if isinstance(v, (list, dict)) else v)
+			cursor.execute(f"INSERT INTO experiments ({', '.join(columns)}) "
+						   f"VALUES ({', '.join('?' * len(columns))})", values)
+			experiment_id = cursor.lastrowid
+			cursor.executemany("INSERT INTO training_values (experiment_id, characteristic, value) VALUES (?, ?, ?)",
+							   [(experiment_id, characteristic, value)
+								for characteristic, values in record["training_values"].items()
+								for value in values])
+
+	def query(self, **filters) -> List[dict]:
+		"""
+		Filters are column names (e.g., workflow="montage", time_limit=3600), schemes=(compute, storage, network),
+		or training_<characteristic>=value to select experiments whose training set includes that value
+		(e.g., training_num_nodes=4). A list/tuple value matches any of its elements.
+		"""
+		clauses = []
+		parameters = []
+
+		def add_clause(column, value):
+			if isinstance(value, (list, tuple, set)):
+				clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+				parameters.extend(value)
+			else:
+				clauses.append(f"{column} = ?")
+				parameters.append(value)
+
+		for key, value in filters.items():
+			if value is None:
+				continue
+			if key == "schemes":
+				for column, scheme in zip(["compute_service_scheme", "storage_service_scheme",
+										   "network_topology_scheme"], value):
+					add_clause(column, scheme)
+			elif key.startswith("training_") and key[len("training_"):] in _characteristics:
+				clauses.append("id IN (SELECT experiment_id FROM training_values "
+							   "WHERE characteristic = ? AND value = ?)")
+				parameters += [key[len("training_"):], value]
+			elif key in _query_columns:
+				add_clause(key, value)
+			else:
+				raise Exception(f"Unknown results database filter '{key}'")
+
+		sql = "SELECT * FROM experiments"
+		if clauses:
+			sql += " WHERE " + " AND ".join(clauses)
+		sql += " ORDER BY path, xp_index"
+		results = []
+		for row in self.connection.execute(sql, parameters):
+			result = dict(row)
+			for k in ["training_set", "calibration", "evaluation_losses"]:
+				if result[k] is not None:
+					result[k] = json.loads(result[k])
+			results.append(result)
+		return results
+
+	def group(self, keys: List[str], **filters) -> dict:
+		# Equivalent of the load_and_group_pickles helpers, but driven by a query
+		grouped = {}
+		for result in self.query(**filters):
+			grouped.setdefault(tuple(result[k] for k in keys), []).append(result)
+		return grouped
+
+
+def group_pickles(db_path: str, paths: List[str], keys: List[str]) -> dict:
+	# The experiments of the pickled files, grouped by the keys, after ingesting those that are new or changed
+	with ResultsDatabase(db_path) as db:
+		db.ingest(paths, os.cpu_count())
+		return db.group(keys, path=find_pickles(paths))
+
+
+def parse_pickle_arguments(program_name: str, description: str) -> dict:
+	# Command line of the scripts that process pickled results (through the database)
+	parser = argparse.ArgumentParser(prog=program_name, description=description)
+	parser.add_argument('-db', '--database', type=str, required=True,
+						help='Path to the SQLite results database (created if needed, see ResultsDatabase.py)')
+	parser.add_argument('pickle_files', type=str, nargs="+",
+						help='Pickled files, glob patterns, or directories to scan')
+	return vars(parser.parse_args())
+
+
+def parse_command_line_arguments(program_name: str):
+	parser = argparse.ArgumentParser(
+		prog=program_name,
+		description='Campaign-wide database of calibration/evaluation results')
+	subparsers = parser.add_subparsers(dest="command", required=True)
+
+	ingest_parser = subparsers.add_parser("ingest", help="Ingest new or changed pickled files")
+	ingest_parser.add_argument('database', type=str, help='Path to the SQLite database')
+	ingest_parser.add_argument('paths', type=str, nargs="+",
+							   help='Pickled files, glob patterns, or directories to scan')
+	ingest_parser.add_argument('-j', '--num_workers', type=int, default=os.cpu_count(),
+							   help='Number of worker processes used to unpickle files')
+
+	query_parser = subparsers.add_parser("query", help="Print matching experiments as JSON lines")
+	query_parser.add_argument('database', type=str, help='Path to the SQLite database')
+	query_parser.add_argument('-wn', '--workflow', type=str, nargs="*", default=None)
+	query_parser.add_argument('-al', '--algorithm', type=str, nargs="*", default=None)
+	query_parser.add_argument('-tl', '--time_limit', type=int, nargs="*", default=None)
+	query_parser.add_argument('-cs', '--compute_service_scheme', type=str, default=None)
+	query_parser.add_argument('-ss', '--storage_service_scheme', type=str, default=None)
+	query_parser.add_argument('-ns', '--network_topology_scheme', type=str, default=None)
+	query_parser.add_argument('--training_num_tasks', type=int, default=None)
+	query_parser.add_argument('--training_num_nodes', type=int, default=None)
+	query_parser.add_argument('--training_cpu', type=int, default=None)
+	query_parser.add_argument('--training_data', type=int, default=None)
+	return vars(parser.parse_args())
+
+
+def main():
+	args = parse_command_line_arguments(sys.argv[0])
+	with ResultsDatabase(args["database"]) as db:
+		if args["command"] == "ingest":
+			count = db.ingest(args["paths"], args["num_workers"])
+			sys.stderr.write(f"Ingested {count} pickled files into {args['database']}\n")
+		else:
+			filters = {k: v for k, v in args.items() if k not in ["command", "database"]}
+			for result in db.query(**filters):
+				print(json.dumps(result))
+
+
+if __name__ == "__main__":
+	main()
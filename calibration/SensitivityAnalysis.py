@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Morris (elementary effects) sensitivity analysis of the loss to the calibrated parameters of a
+simulator's schemes, to find parameters that barely matter for a set of workflows. Calibrations
+can then fix those (to their value at the best point the analysis simulated) and search fewer
+dimensions: see fixed_parameters(), and the -sa option of run_single_calibration.py.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from statistics import mean, pstdev
+from typing import List
+
+import Simulator
+from Loss import get_loss_function
+from WorkflowSimulatorCalibrator import CalibrationLossEvaluator, calibration_input, calibration_parameters
+
+
+def morris_trajectories(num_parameters: int, num_trajectories: int, num_levels: int,
+						rng: random.Random) -> List[List[tuple[List[float], int | None]]]:
+	"""
+	Each trajectory is a list of (point, index of the parameter that changed to reach it) in [0, 1]^k,
+	starting from a random grid point and moving each parameter once, by +/- delta, in random order
+	"""
+	delta = num_levels / (2 * (num_levels - 1))
+	grid = [i / (num_levels - 1) for i in range(num_levels)]
+	trajectories = []
+	for _ in range(num_trajectories):
+		point = [rng.choice(grid) for _ in range(num_parameters)]
+		trajectory = [(point, None)]
+		order = list(range(num_parameters))
+		rng.shuffle(order)
+		for i in order:
+			point = list(point)
+			point[i] = point[i] + delta if point[i] + delta <= 1 else point[i] - delta
+			trajectory.append((point, i))
+		trajectories.append(trajectory)
+	return trajectories
+
+
+def analyze(simulator: Simulator.Simulator, workflows: List[List[str]], loss, num_trajectories: int = 10,
+			num_levels: int = 4, num_threads: int = 1, seed: int | None = None) -> dict:
+	parameter_specs = calibration_parameters(simulator)
+	trajectories = morris_trajectories(len(parameter_specs), num_trajectories, num_levels, random.Random(seed))
+	delta = num_levels / (2 * (num_levels - 1))
+
+	# All points are independent simulations (of all workflows): evaluate them concurrently
+	batcher = None
+	if num_threads > 1 and not simulator.uses_in_process():
+		batcher = Simulator.SimulationBatcher(simulator, num_threads)
+	evaluator = CalibrationLossEvaluator(simulator, workflows, loss, batcher)
+	points = [point for trajectory in trajectories for point, _ in trajectory]
+	with ThreadPoolExecutor(max_workers=num_threads) as pool:
+		losses = list(pool.map(lambda point: evaluator(calibration_input(simulator, parameter_specs, point)), points))
+
+	effects = [[] for _ in parameter_specs]
+	n = 0
+	for trajectory in trajectories:
+		for j in range(1, len(trajectory)):
+			previous_point, _ = trajectory[j - 1]
+			point, i = trajectory[j]
+			effect = (losses[n + j] - losses[n + j - 1]) / (point[i] - previous_point[i])
+			if math.isfinite(effect):
+				effects[i].append(effect)
+		n += len(trajectory)
+
+	best = min(range(len(points)), key=lambda k: losses[k])
+	mu_stars = [mean(abs(e) for e in ee) if ee else 0.0 for ee in effects]
+	max_mu_star = max(mu_stars, default=0.0) or 1.0
+	parameters = {}
+	for parameter_spec, ee, mu_star, position in zip(parameter_specs, effects, mu_stars, points[best]):
+		parameters[parameter_spec.name] = {
+			"mu_star": mu_star,
+			"mu": mean(ee) if ee else 0.0,
+			"sigma": pstdev(ee) if ee else 0.0,
+			"importance": mu_star / max_mu_star,
+			"best_value": parameter_spec.formatted(parameter_spec.value_at(position)),
+		}
+	return {
+		"compute_service_scheme": simulator.compute_service_scheme,
+		"storage_service_scheme": simulator.storage_service_scheme,
+		"network_topology_scheme": simulator.network_topology_scheme,
+		"num_trajectories": num_trajectories,
+		"num_levels": num_levels,
+		"delta": delta,
+		"num_simulated_points": len(points),
+		"best_loss": losses[best],
+		"parameters": parameters,
+	}
+
+
+def fixed_parameters(analysis: dict, simulator: Simulator.Simulator,
+					 importance_threshold: float) -> dict[str, tuple[List[str], str]]:
+	"""
+	The parameters whose importance is below the threshold, with their value at the best analyzed point,
+	as Simulator.fix_parameters takes them
+	"""
+	schemes = [simulator.compute_service_scheme, simulator.storage_service_scheme, simulator.network_topology_scheme]
+	if schemes != [analysis["compute_service_scheme"], analysis["storage_service_scheme"],
+				   analysis["network_topology_scheme"]]:
+		raise Exception("The sensitivity analysis was done for other simulator schemes")
+	fixed = {}
+	for parameter_spec in calibration_parameters(simulator):
+		result = analysis["parameters"][parameter_spec.name]
+		if result["importance"] < importance_threshold:
+			fixed[parameter_spec.name] = (parameter_spec.path, result["best_value"])
+	return fixed
+
+
+def parse_command_line_arguments(program_name: str):
+	parser = argparse.ArgumentParser(
+		prog=program_name,
+		description='Sensitivity analysis (Morris method) of the loss to the calibrated simulator parameters')
+	parser.add_argument('-cs', '--compute_service_scheme', type=str,
+						choices=['all_bare_metal', 'htcondor_bare_metal'], required=True,
+						help='The compute service scheme used by the simulator')
+	parser.add_argument('-ss', '--storage_service_scheme', type=str,
+						choices=['submit_only', 'submit_and_compute_hosts'], required=True,
+						help='The storage service scheme used by the simulator')
+	parser.add_argument('-ns', '--network_topology_scheme', type=str,
+						choices=['one_link', 'one_and_then_many_links', 'many_links'], required=True,
+						help='The network topology scheme used by the simulator')
+	parser.add_argument('-lf', '--loss_function', type=str,
+						choices=['makespan', 'average_runtimes', 'max_runtimes'], default="makespan",
+						help='The loss function to evaluate a calibration')
+	parser.add_argument('-la', '--loss_aggregator', type=str,
+						choices=['average_error', 'max_error'], default="average_error",
+						help='The loss aggregator to evaluate a calibration')
+	parser.add_argument('-ts', '--training_set', required=True, type=str, nargs="+",
+						help='The list of json files (or glob patterns) whose loss is analyzed')
+	parser.add_argument('-r', '--num_trajectories', type=int, default=10,
+						help='Number of Morris trajectories (each simulates #parameters + 1 points)')
+	parser.add_argument('-l', '--num_levels', type=int, default=4,
+						help='Number of grid levels per parameter')
+	parser.add_argument('-th', '--num_threads', type=int, default=os.cpu_count(),
+						help='Number of points simulated concurrently')
+	parser.add_argument('--seed', type=int, default=None, help='Seed of the random trajectories')
+	parser.add_argument('-o', '--output', type=str, required=True, help='JSON file to write the analysis to')
+	return vars(parser.parse_args())
+
+
+def main():
+	args = parse_command_line_arguments(sys.argv[0])
+	workflows = []
+	for pattern in args["training_set"]:
+		workflows += sorted(glob(pattern)) if '*' in pattern else [pattern]
+	simulator = Simulator.Simulator(args["compute_service_scheme"],
+									args["storage_service_scheme"],
+									args["network_topology_scheme"])
+	analysis = analyze(simulator, [workflows], get_loss_function(args["loss_function"], args["loss_aggregator"]),
+					   args["num_trajectories"], args["num_levels"], args["num_threads"], args["seed"])
+	analysis["training_set"] = workflows
+	analysis["loss_function"] = args["loss_function"]
+	analysis["loss_aggregator"] = args["loss_aggregator"]
+	with open(args["output"], "w") as f:
+		json.dump(analysis, f, indent=1)
+
+	sys.stderr.write(f"{analysis['num_simulated_points']} points simulated, best loss: {analysis['best_loss']}\n")
+	for name, result in sorted(analysis["parameters"].items(), key=lambda item: -item[1]["importance"]):
+		print(f"{name:40s} importance={result['importance']:.3f} mu*={result['mu_star']:.4g} "
+			  f"sigma={result['sigma']:.4g}")
+
+
+if __name__ == "__main__":
+	main()
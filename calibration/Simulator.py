@@ -1,22 +1,67 @@
 """
 """
+import base64
 import copy
+import hashlib
 import json
+import multiprocessing
 import os
 import sys
+import tempfile
+import threading
 import time
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List
 
+import numpy as np
 import simcal as sc
 
+from WorkflowPack import load_workflow_json, workflow_fingerprint
+
+try:
+	# Optional in-process backend, built with "cmake -DENABLE_PYTHON_MODULE=ON"
+	import workflow_simulator_for_calibration as in_process_simulator
+except ImportError:
+	in_process_simulator = None
+
+# Number of worker processes that run the in-process backend (see in_process_pool)
+IN_PROCESS_WORKERS = int(os.environ.get("IN_PROCESS_WORKERS", os.cpu_count() or 1))
+_in_process_pool: ProcessPoolExecutor | None = None
+_in_process_pool_lock = threading.Lock()
+
+
+def in_process_pool() -> ProcessPoolExecutor:
+	"""
+	The worker processes that simulate with the extension module, shared by all Simulators. They are
+	spawned, so they are single-threaded whatever threads this process runs, and the module can safely
+	fork them for each simulation (SimGrid only runs one simulation per process). Each worker keeps the
+	workflows it has parsed for its later simulations
+	"""
+	global _in_process_pool
+	with _in_process_pool_lock:
+		if _in_process_pool is None:
+			_in_process_pool = ProcessPoolExecutor(IN_PROCESS_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+		return _in_process_pool
+
+
+def _simulate_in_worker(json_input: dict) -> dict | None:
+	# Runs in an in_process_pool worker: one simulation at a time, the pool's size sets the concurrency
+	return in_process_simulator.simulate_batch([json_input], max_processes=1)[0]
+
 template_json_input = {
 	"workflow": {
 		"file": "some file",
 		"reference_flops": "100Mf"
 	},
+	"output_level": "tasks",
 	"error_computation_scheme": "makespan",
 	"error_computation_scheme_parameters": {
 		"makespan": {
+		},
+		"average_runtimes": {
+		},
+		"max_runtimes": {
 		}
 	},
 
@@ -181,23 +226,211 @@ template_json_input = {
 }
 
 
+# Binary task output is written to shared memory when available
+TASK_OUTPUT_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+def workflow_task_ids(workflow: str) -> tuple:
+	# The order of the tasks in binary task output (that of the workflow file); callers keep it per workflow
+	# (see ExperimentSet.task_ids_of)
+	return tuple(task["id"] for task in load_workflow_json(workflow)["workflow"]["execution"]["tasks"])
+
+
+def read_task_output(path: str, num_tasks: int) -> tuple[np.ndarray, np.ndarray]:
+	# Real and simulated task durations, as written by the simulator with the "binary" output level
+	with open(path, "rb") as f:
+		content = f.read()
+	# (checked on the bytes, as a truncated file may not even hold whole float64s)
+	if len(content) != 16 * num_tasks:
+		raise Exception(f"Expected {num_tasks} task durations in {path}, found {len(content) / 16}")
+	durations = np.frombuffer(content, dtype=np.float64)
+	return durations[:num_tasks], durations[num_tasks:]
+
+
+def set_json_input_value(json_input: dict, metadata: List[str], value: str):
+	tmp_object = json_input
+	for item in metadata[0:-1]:
+		if item not in tmp_object.keys():
+			sys.stderr.write(
+				f"Raising an exception for 'cannot set parameter values for {metadata}' but that won't be propagated for now")
+			raise Exception(f"Internal error: cannot set parameter values for {metadata}")
+		tmp_object = tmp_object[item]
+	tmp_object[metadata[-1]] = value
+
+
+class SimulationFailed(Exception):
+	# A simulation that produced no output (e.g., invalid parameter values), see Simulator.parse_output
+	pass
+
+
+class SimulationResultStore:
+	"""
+	Simulator outputs (as run() returns them) by JSON input, shared by the calibrations and evaluations
+	that use the same Simulator, so that a JSON input that comes up again isn't simulated again (e.g.,
+	the candidates of grid calibrations of overlapping training sets). A thread that asks for an input
+	being simulated by another thread waits for its output. With max_bytes, the least recently used
+	outputs are dropped once the stored outputs add up to more than that.
+
+	With a path, outputs are also appended to that file (one JSON line per output), and the outputs
+	already in it are loaded, so that later runs (e.g., incremental calibrations) reuse them. Keys
+	include the workflow file's fingerprint (see Simulator.result_store_key), so outputs of a workflow
+	file that has since been replaced aren't reused. Failed simulations (no output) aren't stored. With
+	max_bytes too, the file is rewritten with the stored outputs only once dropped ones make it more than
+	twice as large (and after loading, if some were dropped), so that it stays bounded.
+	"""
+
+	def __init__(self, path: str | None = None, max_bytes: int | None = None):
+		self.lock = threading.Lock()
+		self.outputs: OrderedDict[str, str] = OrderedDict()
+		self.num_bytes = 0
+		self.max_bytes = max_bytes
+		self.in_flight: dict[str, threading.Event] = {}
+		self.num_hits = 0
+		self.num_misses = 0
+		self.path = path
+		# Size of the file's lines, including those of outputs since dropped or replaced
+		self.file_bytes = 0
+		if path is not None and os.path.isfile(path):
+			num_lines = 0
+			with open(path) as f:
+				for line in f:
+					num_lines += 1
+					try:
+						entry = json.loads(line)
+					except ValueError:
+						# Truncated last line of an interrupted run
+						continue
+					self._add(entry["key"], entry["output"])
+			self.file_bytes = os.path.getsize(path)
+			if len(self.outputs) < num_lines:
+				self._compact()
+
+	@staticmethod
+	def key(json_input: dict) -> str:
+		return hashlib.md5(json.dumps(json_input, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+	def _add(self, key: str, output: str):
+		# With the lock held (or before other threads can use the store)
+		if key in self.outputs:
+			self.num_bytes -= len(self.outputs.pop(key))
+		self.outputs[key] = output
+		self.num_bytes += len(output)
+		while self.max_bytes is not None and self.num_bytes > self.max_bytes and self.outputs:
+			self.num_bytes -= len(self.outputs.popitem(last=False)[1])
+
+	@staticmethod
+	def _line(key: str, output: str) -> str:
+		return json.dumps({"key": key, "output": output}, separators=(',', ':')) + "\n"
+
+	def _compact(self):
+		# With the lock held: rewrite the file with the stored outputs, least recently used first (so
+		# that they are dropped first again when loaded), replacing it atomically
+		tmp_path = f"{self.path}.{os.getpid()}.tmp"
+		with open(tmp_path, "w") as f:
+			for key, output in self.outputs.items():
+				f.write(self._line(key, output))
+		os.replace(tmp_path, self.path)
+		self.file_bytes = os.path.getsize(self.path)
+
+	def hit_rate(self) -> float:
+		num_lookups = self.num_hits + self.num_misses
+		return self.num_hits / num_lookups if num_lookups else 0.0
+
+	def get_or_run(self, key: str, run) -> str:
+		while True:
+			with self.lock:
+				if key in self.outputs:
+					self.num_hits += 1
+					self.outputs.move_to_end(key)
+					return self.outputs[key]
+				event = self.in_flight.get(key)
+				if event is None:
+					event = self.in_flight[key] = threading.Event()
+					self.num_misses += 1
+					break
+			# Simulated by another thread: wait, then look again (it may have failed)
+			event.wait()
+		try:
+			output = run()
+			if not output:
+				return output
+			with self.lock:
+				self._add(key, output)
+				if self.path is not None:
+					line = self._line(key, output)
+					with open(self.path, "a") as f:
+						f.write(line)
+					self.file_bytes += len(line)
+					if self.max_bytes is not None and self.file_bytes > 2 * self.max_bytes:
+						self._compact()
+			return output
+		finally:
+			with self.lock:
+				del self.in_flight[key]
+			event.set()
+
+
 class Simulator(sc.Simulator):
 
 	def __init__(self,
 				 compute_service_scheme: str,
 				 storage_service_scheme: str,
-				 network_topology_scheme: str):
+				 network_topology_scheme: str,
+				 in_process: bool | None = None):
 		super().__init__()
 		self.compute_service_scheme = compute_service_scheme
 		self.storage_service_scheme = storage_service_scheme
 		self.network_topology_scheme = network_topology_scheme
+		# By default, simulations run in-process whenever the extension module is available
+		if in_process and in_process_simulator is None:
+			raise Exception("The workflow_simulator_for_calibration Python module is not available")
+		self.in_process = in_process_simulator is not None if in_process is None else in_process
+		# Parameters that aren't calibrated, by name: where they go in the JSON input, and their value
+		self.fixed_parameters: dict[str, tuple[List[str], str]] = {}
+		# If set, simulations are looked up in (and added to) this store (see SimulationResultStore)
+		self.result_store: SimulationResultStore | None = None
+
+	def uses_in_process(self) -> bool:
+		# Simulators unpickled from older results, or on hosts without the module, use the executable
+		return getattr(self, "in_process", False) and in_process_simulator is not None
+
+	def simulate_in_process(self, workflow: str, calibration: dict[str, sc.parameters.Value],
+							output_options: dict | None = None) -> dict | None:
+		json_input = self.make_json_input(workflow, calibration, output_options)
+		return in_process_pool().submit(_simulate_in_worker, json_input).result()
+
+	def get_fixed_parameters(self) -> dict[str, tuple[List[str], str]]:
+		return getattr(self, "fixed_parameters", {})
+
+	def fix_parameters(self, fixed_parameters: dict[str, tuple[List[str], str]]):
+		self.fixed_parameters = dict(fixed_parameters)
+
+	def get_result_store(self) -> SimulationResultStore | None:
+		return getattr(self, "result_store", None)
+
+	def use_result_store(self, result_store: SimulationResultStore | None):
+		self.result_store = result_store
+
+	def __getstate__(self):
+		# The store (and its locks) only lives for a run
+		state = self.__dict__.copy()
+		state["result_store"] = None
+		return state
+
+	def result_store_key(self, workflow: str, calibration: dict[str, sc.parameters.Value],
+						 output_options: dict | None) -> str | None:
+		# None if outputs can't be shared (binary task output goes to a file of the caller's, see run_binary)
+		if self.get_result_store() is None or "task_output_file" in (output_options or {}):
+			return None
+		json_input = self.make_json_input(workflow, calibration, output_options)
+		json_input["workflow"]["fingerprint"] = workflow_fingerprint(workflow)
+		return SimulationResultStore.key(json_input)
 	def isSimcalCal(self,cal):
 		for key in cal:
 			if isinstance(cal[key],sc.parameter.Base) or isinstance(cal[key],sc.parameter.value.Value):
 				return True
 		return False
-	def run(self, env: sc.Environment, args: tuple[str, dict[str, sc.parameters.Value]]) -> Any:
-		(workflow, calibration) = args
+	def make_json_input(self, workflow: str, calibration: dict[str, sc.parameters.Value], output_options: dict | None = None) -> dict:
 		# Create the input json
 		if self.isSimcalCal(calibration):
 			json_input = copy.deepcopy(template_json_input)
@@ -209,35 +442,187 @@ class Simulator(sc.Simulator):
 			json_input["storage_service_scheme"] = self.storage_service_scheme
 			json_input["network_topology_scheme"] = self.network_topology_scheme
 
-			# override all parameter values
+			# override all parameter values, fixed ones first
+			for metadata, value in self.get_fixed_parameters().values():
+				set_json_input_value(json_input, metadata, value)
 			for parameter in calibration:
 				metadata = calibration[parameter].get_parameter().get_custom_data()
-				tmp_object = json_input
-				for item in metadata[0:-1]:
-					if item not in tmp_object.keys():
-						sys.stderr.write(
-							f"Raising an exception for 'cannot set parameter values for {metadata}' but that won't be propagated for now")
-						raise Exception(f"Internal error: cannot set parameter values for {metadata}")
-					tmp_object = tmp_object[item]
-				tmp_object[metadata[-1]] = str(calibration[parameter])
+				set_json_input_value(json_input, metadata, str(calibration[parameter]))
 		else:
 			json_input = copy.deepcopy(calibration)
 			json_input["workflow"]["file"] = workflow
-		# Create the JSON input string
-		json_string = json.dumps(json_input, separators=(',', ':'))
+		# What the simulator should output, e.g., {"output_level": "makespan", "error_computation_scheme": "max_runtimes"}
+		if output_options:
+			json_input.update(output_options)
+		return json_input
 
-		# Run the simulator
-		cmdargs = ["--wrench-commport-pool-size=10000",f"{json_string}"]
-		#print(cmdargs)
-		std_out, std_err, exit_code = env.bash("workflow-simulator-for-calibration", cmdargs, std_in=None)
+	def _run_simulator(self, env: sc.Environment, cmdargs: List[str], std_in: str | None = None,
+					   batch: bool = False) -> str:
+		std_out, std_err, exit_code = env.bash("workflow-simulator-for-calibration", cmdargs, std_in=std_in)
 		if exit_code:
 			sys.stderr.write(str(cmdargs))
 			sys.stderr.write(f"Simulator has failed with exit code {exit_code}!\n\n{std_err}\n")
 			exit(1)
-		if std_err:
+		if std_err and batch:
+			# What the batch's failed simulations (whose outputs are "null") reported: the others are fine
+			sys.stderr.write(f"Some batched simulations failed:\n{std_err}\n")
+		elif std_err:
 			sys.stderr.write(str(cmdargs))
 			sys.stderr.write("The simulator produced something on stderr. ABORTING\n")
 			sys.stderr.write(std_err)
 			sys.stderr.write(cmdargs[0] + "\n")
 			exit(1)
 		return std_out
+
+	def run(self, env: sc.Environment, args: tuple[str, dict[str, sc.parameters.Value]] | tuple[str, dict[str, sc.parameters.Value], dict]) -> Any:
+		# An optional third element holds output options (see make_json_input)
+		(workflow, calibration) = args[0:2]
+		output_options = args[2] if len(args) > 2 else None
+		if self.uses_in_process():
+			output = self.simulate_in_process(workflow, calibration, output_options)
+			return "" if output is None else json.dumps(output) + "\n"
+		# Create the JSON input string
+		json_string = json.dumps(self.make_json_input(workflow, calibration, output_options), separators=(',', ':'))
+
+		# Run the simulator
+		cmdargs = ["--wrench-commport-pool-size=10000",f"{json_string}"]
+		#print(cmdargs)
+		return self._run_simulator(env, cmdargs)
+
+	@staticmethod
+	def parse_output(workflow: str, std_out: str) -> dict:
+		# A failed simulation (no output) stops the run, as the executable's failures do
+		if not std_out:
+			raise SimulationFailed(f"The simulation of {workflow} failed")
+		return json.loads(std_out)
+
+	def simulate(self, env: sc.Environment, workflow: str, calibration: dict[str, sc.parameters.Value],
+				 output_options: dict | None = None) -> dict:
+		# Like run(), but returns the parsed output
+		key = self.result_store_key(workflow, calibration, output_options)
+		if key is not None:
+			std_out = self.get_result_store().get_or_run(key, lambda: self.run(env, (workflow, calibration, output_options)))
+			return self.parse_output(workflow, std_out)
+		if self.uses_in_process():
+			# Without a round trip through JSON text
+			output = self.simulate_in_process(workflow, calibration, output_options)
+			if output is None:
+				raise SimulationFailed(f"The simulation of {workflow} failed")
+			return output
+		return self.parse_output(workflow, self.run(env, (workflow, calibration, output_options)))
+
+	def run_binary(self, env: sc.Environment, workflow: str, calibration: dict[str, sc.parameters.Value],
+				   output_options: dict | None = None) -> tuple[dict, np.ndarray, np.ndarray]:
+		"""
+		Like run(), but per-task durations are passed back in a file rather than in the JSON output.
+		Returns the (task-less) output, and the real and simulated durations in workflow_task_ids(workflow) order
+		"""
+		output_options = dict(output_options or {}, output_level="binary")
+		key = self.result_store_key(workflow, calibration, output_options)
+		if key is None:
+			return self._run_binary(env, workflow, calibration, output_options)
+
+		def run():
+			output, real_durations, simulated_durations = self._run_binary(env, workflow, calibration, output_options)
+			durations = np.concatenate([real_durations, simulated_durations]).tobytes()
+			return json.dumps({"output": output, "durations": base64.b64encode(durations).decode()})
+		# Stored with the task durations
+		entry = json.loads(self.get_result_store().get_or_run(key, run))
+		durations = np.frombuffer(base64.b64decode(entry["durations"]), dtype=np.float64)
+		num_tasks = len(durations) // 2
+		return entry["output"], durations[:num_tasks], durations[num_tasks:]
+
+	def _run_binary(self, env: sc.Environment, workflow: str, calibration: dict[str, sc.parameters.Value],
+					output_options: dict) -> tuple[dict, np.ndarray, np.ndarray]:
+		fd, task_output_file = tempfile.mkstemp(dir=TASK_OUTPUT_DIR, suffix=".tasks")
+		os.close(fd)
+		try:
+			output = self.simulate(env, workflow, calibration, dict(output_options, task_output_file=task_output_file))
+			real_durations, simulated_durations = read_task_output(task_output_file, output["num_tasks"])
+		finally:
+			os.unlink(task_output_file)
+		return output, real_durations, simulated_durations
+
+	def run_batch(self, env: sc.Environment, workflow: str, calibrations: List[dict[str, sc.parameters.Value]],
+				  output_options: dict | None = None) -> List[str]:
+		"""
+		Simulates one workflow for each of the calibrations with a single simulator invocation (the
+		workflow is read and parsed once), returning one output per calibration, as run() would
+		"""
+		if self.uses_in_process():
+			# Spread over the pool's workers
+			futures = [in_process_pool().submit(_simulate_in_worker, self.make_json_input(workflow, calibration,
+																						  output_options))
+					   for calibration in calibrations]
+			return ["" if output is None else json.dumps(output) + "\n" for output in (f.result() for f in futures)]
+		batch = []
+		for calibration in calibrations:
+			json_input = self.make_json_input(workflow, calibration, output_options)
+			workflow_spec = json_input.pop("workflow")
+			batch.append(json_input)
+		# The batch can be too large for the command line, so it is passed on stdin
+		json_string = json.dumps({"workflow": workflow_spec, "batch": batch}, separators=(',', ':'))
+		std_out = self._run_simulator(env, ["--wrench-commport-pool-size=10000", "-"], std_in=json_string, batch=True)
+		# Failed simulations produce "null", for which run() would have produced no output
+		return ["" if line == "null" else line + "\n" for line in std_out.splitlines()]
+
+
+class _PendingBatch:
+	def __init__(self):
+		self.calibrations = []
+		self.results = None
+		self.full = threading.Event()
+		self.done = threading.Event()
+
+
+class SimulationBatcher:
+	"""
+	Groups the simulations requested concurrently (e.g., by the threads of a calibrator's coordinator,
+	which evaluate different calibrations on the same workflows) into one batch per workflow. The first
+	thread to request a workflow waits up to max_wait seconds for others (or for the batch to be full),
+	runs the batch, and hands out the results.
+	"""
+
+	def __init__(self, simulator: Simulator, max_batch_size: int, max_wait: float = 0.05):
+		self.simulator = simulator
+		self.max_batch_size = max_batch_size
+		self.max_wait = max_wait
+		self.lock = threading.Lock()
+		self.pending: dict[tuple, _PendingBatch] = {}
+
+	def run(self, workflow: str, calibration: dict[str, sc.parameters.Value], output_options: dict | None = None) -> str:
+		store_key = self.simulator.result_store_key(workflow, calibration, output_options)
+		if store_key is not None:
+			return self.simulator.get_result_store().get_or_run(
+				store_key, lambda: self._run_batched(workflow, calibration, output_options))
+		return self._run_batched(workflow, calibration, output_options)
+
+	def _run_batched(self, workflow: str, calibration: dict[str, sc.parameters.Value], output_options: dict | None) -> str:
+		key = (workflow, tuple(sorted((output_options or {}).items())))
+		with self.lock:
+			batch = self.pending.get(key)
+			leader = batch is None
+			if leader:
+				batch = self.pending[key] = _PendingBatch()
+			index = len(batch.calibrations)
+			batch.calibrations.append(calibration)
+			if len(batch.calibrations) >= self.max_batch_size:
+				# Closed: later requests for this workflow start a new batch
+				del self.pending[key]
+				batch.full.set()
+		if not leader:
+			batch.done.wait()
+			if batch.results is None:
+				raise Exception(f"Batched simulation of {workflow} failed")
+			return batch.results[index]
+
+		batch.full.wait(self.max_wait)
+		with self.lock:
+			if self.pending.get(key) is batch:
+				del self.pending[key]
+		try:
+			with sc.Environment() as env:
+				batch.results = self.simulator.run_batch(env, workflow, batch.calibrations, output_options)
+		finally:
+			batch.done.set()
+		return batch.results[index]
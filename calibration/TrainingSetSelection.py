@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Picks a small training set that covers a pool of workflow configurations: each configuration (a
+group of repeat trials) is described by the characteristics in its name (#tasks, #nodes, cpu work,
+data footprint) and cheap features of its DAG (width, depth, total bytes), scaled to [0, 1] over the
+pool. Configurations are picked greedily, each time the one farthest from those already picked
+(k-center), until every configuration of the pool is within the coverage radius of a picked one.
+"""
+import argparse
+import sys
+from glob import glob
+from typing import List
+
+import numpy as np
+
+from AnalyticModel import load_analytic_workflow
+from RepeatTrials import split_repeats
+from Util import WorkflowSetSpec
+
+FEATURE_NAMES = ["num_tasks", "num_nodes", "cpu", "data", "width", "depth", "total_bytes"]
+
+
+def configuration_features(trials: List[str]) -> List[float]:
+	# On a log scale: the characteristics vary by orders of magnitude
+	tokens = trials[0].split('/')[-1].split("-")
+	analytic_workflow = load_analytic_workflow(trials[0])
+	values = [int(tokens[1]), int(tokens[6]), int(tokens[2]), int(tokens[4]),
+			  analytic_workflow.width, analytic_workflow.depth, analytic_workflow.total_bytes]
+	return [float(np.log1p(v)) for v in values]
+
+
+def select_configurations(features: np.ndarray, coverage_radius: float, max_size: int | None = None) -> List[int]:
+	"""
+	Indices of the picked rows of features (scaled to [0, 1]), starting from the row closest to their centroid
+	"""
+	distances_to_centroid = np.linalg.norm(features - features.mean(axis=0), axis=1)
+	selected = [int(np.argmin(distances_to_centroid))]
+	distances = np.linalg.norm(features - features[selected[0]], axis=1)
+	while distances.max() > coverage_radius and (max_size is None or len(selected) < max_size):
+		farthest = int(np.argmax(distances))
+		selected.append(farthest)
+		distances = np.minimum(distances, np.linalg.norm(features - features[farthest], axis=1))
+	return selected
+
+
+def select_training_set(workflows: List[List[str]], coverage_radius: float = 0.25,
+						max_size: int | None = None) -> WorkflowSetSpec:
+	"""
+	workflows: groups of repeat trials (as in WorkflowSetSpec.workflows); returns a spec of the picked groups
+	"""
+	if not workflows:
+		return WorkflowSetSpec()
+	features = np.array([configuration_features(trials) for trials in workflows])
+	span = features.max(axis=0) - features.min(axis=0)
+	span[span == 0] = 1
+	scaled = (features - features.min(axis=0)) / span
+	# Radius relative to the diagonal of the (scaled) feature space
+	selected = select_configurations(scaled, coverage_radius * np.sqrt(len(FEATURE_NAMES)), max_size)
+	spec = WorkflowSetSpec().set_workflows([workflows[i] for i in sorted(selected)])
+	spec.update_fields()
+	return spec
+
+
+def main():
+	parser = argparse.ArgumentParser(
+		prog=sys.argv[0],
+		description='Select a training set that covers the configurations of a pool of workflows')
+	parser.add_argument('-ws', '--workflows', required=True, type=str, nargs="+",
+						help='The list of json files (or glob patterns) to select from')
+	parser.add_argument('-cr', '--coverage_radius', type=float, default=0.25,
+						help='Distance (relative to the feature space diagonal) within which a configuration '
+							 'is covered by a selected one')
+	parser.add_argument('-m', '--max_size', type=int, default=None, help='Maximum number of configurations')
+	args = parser.parse_args()
+
+	workflows = []
+	for pattern in args.workflows:
+		workflows += sorted(glob(pattern)) if '*' in pattern else [pattern]
+	groups = split_repeats(workflows)
+	spec = select_training_set(groups, args.coverage_radius, args.max_size)
+	sys.stderr.write(f"{len(spec.workflows)}/{len(groups)} configurations selected: {spec}\n")
+	for group in spec.workflows:
+		for workflow in group:
+			print(workflow)
+
+
+if __name__ == "__main__":
+	main()
@@ -6,14 +6,24 @@ from typing import List, Callable
 import pickle
 import base64
 import hashlib 
-import ast
 import simcal as sc
 import re
 import json
-
-from Simulator import Simulator
-from WorkflowSimulatorCalibrator import WorkflowSimulatorCalibrator, CalibrationLossEvaluator, get_makespan
+import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from statistics import mean, pstdev
+from functools import lru_cache
+
+import numpy as np
+
+from CalibrationRegistry import CalibrationRegistry
+from Simulator import Simulator, SimulationResultStore, workflow_task_ids
+from WorkflowSimulatorCalibrator import WorkflowSimulatorCalibrator, CalibrationLossEvaluator, get_makespan, \
+	named_values, calibration_from_named_values
 from Loss import *
+from AnalyticModel import BOUND_SLACK
+from WorkflowPack import load_workflow_json, packed_workflows, workflow_fingerprint
 _units={None:1,"":1,
 "s":1,"ms":0.001,"us":0.000001,"ns":0.000000001,
 "f":1,"Kf":1_000, "Mf":1_000_000,"Gf":1_000_000_000,
@@ -26,8 +36,8 @@ def parseDoubleUnited(raw: str):
 	result = re.match(r"(\d+\.?\d*)([a-zA-Z]+)*", raw).groups()
 	return float(result[0])*_units[result[1]]
 def load_json(path):
-	with open(path) as json_file:
-		return json.load(json_file)
+	# Workflow files may have been packed (see WorkflowPack.py); other files are read as-is
+	return load_workflow_json(path)
 def flatten(arr):
 	flat_list = []
 	for item in arr:
@@ -38,16 +48,25 @@ def flatten(arr):
 	return flat_list
 
 
+@lru_cache(maxsize=None)
+def _path_digest(path: str) -> bytes:
+	return hashlib.md5(path.encode()).digest()
+
+
 def orderinvarient_hash(x,l=22):
 	x=flatten(x)
-	acc=bytearray(hashlib.md5(bytes(len(x))).digest())
-	for i in x:
-		tmp=hashlib.md5(i.encode()).digest()
-		
-		for j in range(len(acc)):
-			#acc[j]^=tmp[j]
-			acc[j]=(tmp[j]+acc[j])%256
+	# Byte-wise sum (mod 256) of the MD5 digests of all paths, seeded with the digest of len(x) zero bytes
+	digests=[hashlib.md5(bytes(len(x))).digest()]
+	digests.extend(_path_digest(i) for i in x)
+	acc=bytes(sum(column)%256 for column in zip(*digests))
 	return base64.urlsafe_b64encode(acc)[:l].decode()
+
+
+def content_hash(workflows: List[str]) -> str:
+	# Identifies what the workflows contain (see WorkflowPack.workflow_fingerprint), in any order:
+	# unlike orderinvarient_hash, it changes when a file is rewritten in place (e.g., by normalize_workflows)
+	fingerprints = sorted(f"{path}:{workflow_fingerprint(path)}" for path in flatten(workflows))
+	return hashlib.md5("\n".join(fingerprints).encode()).hexdigest()
 	
 
 
@@ -103,11 +122,21 @@ def compute_calibration(workflows: List[List[str]],
 						simulator: Simulator,
 						loss_spec: str,
 						loss_aggregator: str,
-						time_limit: float, num_threads: int):
+						time_limit: float, num_threads: int,
+						repeat_mode: str = "all",
+						analytic_model: bool = False,
+						estimate_parameters: bool = False,
+						start_calibration: dict[str, sc.parameters.Value] | None = None,
+						analytic_slack: float = BOUND_SLACK):
 	calibrator = WorkflowSimulatorCalibrator(workflows,
 											 algorithm,
 											 simulator,
-											 get_loss_function(loss_spec,loss_aggregator))
+											 get_loss_function(loss_spec,loss_aggregator),
+											 repeat_mode,
+											 analytic_model,
+											 estimate_parameters,
+											 start_calibration,
+											 analytic_slack)
 
 	calibration, loss = calibrator.compute_calibration(time_limit, num_threads)
 	return calibration, loss
@@ -117,14 +146,123 @@ def evaluate_calibration(workflows: List[List[str]],
 						 simulator: Simulator,
 						 calibration: dict[str, sc.parameters.Value],
 						 loss_spec: str,
-						 loss_aggregator: str) -> float:
+						 loss_aggregator: str,
+						 tolerance: float | None = None) -> float:
+	# With a tolerance, an estimate from a sample of the workflows (see sequential_evaluation)
+	if tolerance is not None:
+		return sequential_evaluation(workflows, simulator, calibration, loss_spec, loss_aggregator, tolerance)[0]
 	evaluator = CalibrationLossEvaluator(simulator, workflows, get_loss_function(loss_spec,loss_aggregator))
 	loss = evaluator(calibration)  # TODO Replace with None whenever simcal allows it
 	return loss
 
 
+def stratified_order(workflows: List[str], rng: random.Random) -> List[str]:
+	# Random order that goes round the strata (workflow, #tasks, #nodes), so that any prefix covers them evenly
+	strata = {}
+	for workflow in workflows:
+		tokens = os.path.basename(workflow).split("-")
+		strata.setdefault((tokens[0], tokens[1], tokens[6]) if len(tokens) > 6 else workflow, []).append(workflow)
+	strata = list(strata.values())
+	rng.shuffle(strata)
+	for stratum in strata:
+		rng.shuffle(stratum)
+	return [stratum[i] for i in range(max(map(len, strata), default=0)) for stratum in strata if i < len(stratum)]
+
+
+def bootstrap_interval(losses: List[float], confidence: float, rng: np.random.Generator,
+					   num_resamples: int = 2000) -> tuple[float, float]:
+	samples = np.asarray(losses)
+	means = rng.choice(samples, size=(num_resamples, len(samples))).mean(axis=1)
+	return tuple(float(x) for x in np.percentile(means, [50 * (1 - confidence), 50 * (1 + confidence)]))
+
+
+def sequential_evaluation(workflows: List[List[str]],
+						  simulator: Simulator,
+						  calibration: dict[str, sc.parameters.Value],
+						  loss_spec: str,
+						  loss_aggregator: str,
+						  tolerance: float,
+						  confidence: float = 0.95,
+						  min_samples: int = 10,
+						  seed: int | None = None) -> tuple[float, dict]:
+	"""
+	Simulates the workflows in stratified random order until the bootstrap confidence interval of the
+	mean loss is narrower than the tolerance. Returns the estimate and its interval (with the simulated
+	workflows). Max-aggregated losses have no such estimate: all workflows are simulated.
+	"""
+	loss = get_loss_function(loss_spec, loss_aggregator)
+	output_options = CalibrationLossEvaluator(simulator, [], loss).output_options
+	order = stratified_order(flatten(workflows), random.Random(seed))
+	rng = np.random.default_rng(seed)
+	losses = []
+	low = high = None
+	with sc.Environment() as env:
+		for workflow in order:
+			result = simulator.simulate(env, workflow, calibration, output_options)
+			losses.append(loss.workflow_loss(result))
+			if loss.method is mean and len(losses) >= min_samples and len(losses) < len(order):
+				low, high = bootstrap_interval(losses, confidence, rng)
+				if high - low <= tolerance:
+					break
+	estimate = loss.method(losses)
+	if len(losses) == len(order):
+		# Everything was simulated: the loss is exact
+		low = high = estimate
+	return estimate, {
+		"low": low,
+		"high": high,
+		"confidence": confidence,
+		"num_simulated": len(losses),
+		"num_workflows": len(order),
+		"workflows": order[:len(losses)],
+	}
+
+
+class WorkflowCatalog:
+	# Interns workflow paths, so that specs refer to workflows by integer ID and every
+	# spec/experiment/result shares a single copy of each path string. Each experiment set has its own
+	# (that its specs move to, see ExperimentSet.add_experiment), so that it goes away with the set
+	__slots__ = ("paths", "ids")
+
+	def __init__(self):
+		self.paths: List[str] = []
+		self.ids: dict[str, int] = {}
+
+	def id_of(self, path: str) -> int:
+		workflow_id = self.ids.get(path)
+		if workflow_id is None:
+			workflow_id = len(self.paths)
+			self.paths.append(path)
+			self.ids[path] = workflow_id
+		return workflow_id
+
+	def path_of(self, workflow_id: int) -> str:
+		return self.paths[workflow_id]
+
+	def intern(self, path: str) -> str:
+		return self.paths[self.id_of(path)]
+
+	def __len__(self):
+		return len(self.paths)
+
+
+def _get_slot_state(obj) -> dict:
+	return {k: getattr(obj, k) for k in obj.__slots__ if hasattr(obj, k)}
+
+
+def _set_slot_state(obj, state: dict):
+	# Also accepts the __dict__ of objects pickled before these classes had __slots__
+	for k, v in state.items():
+		if k in obj.__slots__ or k == "workflows":
+			setattr(obj, k, v)
+
+
 class WorkflowSetSpec:
+	__slots__ = ("workflow_dir", "workflow_name", "architecture", "num_tasks_values", "data_values",
+				 "cpu_values", "num_nodes_values", "workflow_ids", "ivhash", "catalog")
+
 	def __init__(self):
+		self.catalog = WorkflowCatalog()
 		self.workflow_dir="."
 		self.workflow_name="custom"
 		self.architecture="custom"
@@ -134,7 +272,34 @@ class WorkflowSetSpec:
 		self.num_nodes_values=[]
 		self.workflows: List[List[str]]=[[]]
 		self.ivhash=orderinvarient_hash(self.workflows)
-		
+
+	@property
+	def workflows(self) -> List[List[str]]:
+		paths = self.catalog.paths
+		return [[paths[i] for i in group] for group in self.workflow_ids]
+
+	@workflows.setter
+	def workflows(self, workflows: List[List[str]]):
+		self.workflow_ids = tuple(tuple(self.catalog.id_of(w) for w in group) for group in workflows)
+
+	def use_catalog(self, catalog: WorkflowCatalog):
+		if catalog is not self.catalog:
+			workflows = self.workflows
+			self.catalog = catalog
+			self.workflows = workflows
+
+	def __getstate__(self):
+		# IDs are only meaningful in the catalog: pickle the (interned, hence memoized once per pickle) paths
+		state = _get_slot_state(self)
+		del state["workflow_ids"]
+		del state["catalog"]
+		state["workflows"] = self.workflows
+		return state
+
+	def __setstate__(self, state: dict):
+		self.catalog = WorkflowCatalog()
+		_set_slot_state(self, state)
+
 	def rehash(self):
 		self.ivhash=orderinvarient_hash(self.workflows)
 	
@@ -189,7 +354,7 @@ class WorkflowSetSpec:
 		self.data_values=data_values
 		self.cpu_values=cpu_values
 		self.num_nodes_values=num_nodes_values
-		self.workflows = []
+		workflows = []
 		for num_tasks_value in num_tasks_values:
 			for data_value in data_values:
 				for cpu_value in cpu_values:
@@ -214,9 +379,10 @@ class WorkflowSetSpec:
 						else:
 							search_string += str(num_nodes_value) + "-"
 						search_string += "*.json"
-						found_workflows = glob(search_string)
+						found_workflows = glob(search_string) or packed_workflows(search_string)
 						if len(found_workflows) > 1:
-							self.workflows.append([os.path.abspath(x) for x in found_workflows])
+							workflows.append([os.path.abspath(x) for x in found_workflows])
+		self.workflows = workflows
 		self.rehash()
 		sys.stderr.write(".")
 		sys.stderr.flush()
@@ -226,7 +392,7 @@ class WorkflowSetSpec:
 		return self.workflows
 
 	def is_empty(self) -> bool:
-		return len(self.workflows) == 0
+		return len(self.workflow_ids) == 0
 
 	def __repr__(self):
 		return f"#tasks: {self.num_tasks_values}, #nodes: {self.num_nodes_values}, " \
@@ -237,24 +403,128 @@ class WorkflowSetSpec:
 			return NotImplemented
 		return other.ivhash==self.ivhash
 
+	def __hash__(self):
+		return hash(self.ivhash)
+
+
+# Simulator outputs (task-level ones can be large) kept for the folds of a cross-validation to share
+CROSS_VALIDATION_STORE_BYTES = 2 ** 30
+
+
+def make_folds(workflows: List[List[str]], num_folds: int, seed: int | None = None) -> List[List[List[str]]]:
+	# Configurations (groups of repeat trials) dealt into folds in random order, so that repeat trials stay together
+	if num_folds < 2 or num_folds > len(workflows):
+		raise Exception(f"Cannot make {num_folds} folds out of {len(workflows)} workflow configurations")
+	groups = sorted(workflows)
+	random.Random(seed).shuffle(groups)
+	return [groups[i::num_folds] for i in range(num_folds)]
+
+
+class WorkflowResult:
+	# One simulator output for one workflow. Per-task durations are kept in typed arrays (in the
+	# workflow's task order) rather than in a dict of dicts keyed by task ID, but the result can still
+	# be indexed like the simulator's JSON output (result["real_makespan"], result["tasks"][id], ...)
+	__slots__ = ("real_makespan", "simulated_makespan", "task_ids", "real_durations", "simulated_durations",
+				 "_tasks")
+
+	def __init__(self, real_makespan: float, simulated_makespan: float, task_ids: tuple = (),
+				 real_durations=(), simulated_durations=()):
+		self.real_makespan = float(real_makespan)
+		self.simulated_makespan = float(simulated_makespan)
+		# The results of an experiment set for the same workflow share one tuple (see ExperimentSet.task_ids_of)
+		self.task_ids = tuple(task_ids)
+		self.real_durations = array('d', real_durations)
+		self.simulated_durations = array('d', simulated_durations)
+
+	@staticmethod
+	def from_output(output: dict):
+		tasks = output.get("tasks", {})
+		return WorkflowResult(output["real_makespan"], output["simulated_makespan"], tasks.keys(),
+							  (float(t["real_duration"]) for t in tasks.values()),
+							  (float(t["simulated_duration"]) for t in tasks.values()))
+
+	@staticmethod
+	def from_arrays(output: dict, task_ids: tuple, real_durations, simulated_durations):
+		# From the simulator's binary task output: the durations are copied as raw bytes
+		result = WorkflowResult(output["real_makespan"], output["simulated_makespan"], task_ids)
+		result.real_durations.frombytes(memoryview(real_durations).cast('B'))
+		result.simulated_durations.frombytes(memoryview(simulated_durations).cast('B'))
+		return result
+
+	def tasks(self) -> dict:
+		# Built on first access (legacy code indexes result["tasks"] once per task), and not pickled
+		if not hasattr(self, "_tasks"):
+			self._tasks = {task_id: {"real_duration": real, "simulated_duration": simulated}
+						   for task_id, real, simulated in zip(self.task_ids, self.real_durations,
+															   self.simulated_durations)}
+		return self._tasks
+
+	def to_dict(self) -> dict:
+		return {"real_makespan": self.real_makespan, "simulated_makespan": self.simulated_makespan,
+				"tasks": self.tasks()}
+
+	def keys(self):
+		return ["real_makespan", "simulated_makespan", "tasks"]
+
+	def __getitem__(self, key: str):
+		if key == "tasks":
+			return self.tasks()
+		if key in ("real_makespan", "simulated_makespan"):
+			return getattr(self, key)
+		raise KeyError(key)
+
+	def __contains__(self, key: str):
+		return key in self.keys()
+
+	def get(self, key: str, default=None):
+		return self[key] if key in self else default
+
+	def __getstate__(self):
+		state = _get_slot_state(self)
+		state.pop("_tasks", None)
+		return state
+
+	def __setstate__(self, state: dict):
+		_set_slot_state(self, state)
+
+	def __repr__(self):
+		return repr(self.to_dict())
+
 
 class Experiment:
+	__slots__ = ("training_set_spec", "evaluation_set_specs", "calibration", "calibration_loss",
+				 "evaluation_losses", "evaluation_makespans", "evaluation_intervals")
+
 	def __init__(self,
 				 training_set_spec: WorkflowSetSpec,
 				 evaluation_set_specs: List[WorkflowSetSpec]):
 
 		self.training_set_spec = training_set_spec
-		# Remove duplicates from the evaluation set specs
-		no_dup_evaluation_set_specs = []
+		# Remove duplicates from the evaluation set specs (keeping the first of each, in order)
+		no_dup_evaluation_set_specs = {}
 		for evaluation_set in evaluation_set_specs:
-			if evaluation_set not in no_dup_evaluation_set_specs:
-				no_dup_evaluation_set_specs.append(evaluation_set)
-		self.evaluation_set_specs = no_dup_evaluation_set_specs
+			no_dup_evaluation_set_specs.setdefault(evaluation_set.ivhash, evaluation_set)
+		self.evaluation_set_specs = list(no_dup_evaluation_set_specs.values())
 
 		self.calibration: dict[str, sc.parameters.Value] | None = None
 		self.calibration_loss: float | None = None
 		self.evaluation_losses: List[float] | None = None
-		self.evaluation_makespans: List[float] | None = None
+		self.evaluation_makespans: List[dict[str, WorkflowResult]] | None = None
+		# Per evaluation set, the confidence interval of a sampled evaluation (None if all workflows were simulated)
+		self.evaluation_intervals: List[dict | None] | None = None
+
+	def __getstate__(self):
+		return _get_slot_state(self)
+
+	def __setstate__(self, state: dict):
+		_set_slot_state(self, state)
+		if not hasattr(self, "evaluation_intervals"):
+			self.evaluation_intervals = None
+		# Results pickled before WorkflowResult existed are plain dicts of dicts
+		if self.evaluation_makespans:
+			self.evaluation_makespans = [{w: r if isinstance(r, WorkflowResult) else WorkflowResult.from_output(r)
+										  for w, r in makespans.items()}
+										 for makespans in self.evaluation_makespans]
 
 	def __eq__(self, other: object):
 		if not isinstance(other, Experiment):
@@ -262,6 +532,10 @@ class Experiment:
 		return (self.training_set_spec == other.training_set_spec) and \
 			(self.evaluation_set_specs == other.evaluation_set_specs)
 
+	def key(self) -> tuple:
+		# Two experiments are equal iff their keys are equal
+		return self.training_set_spec.ivhash, tuple(s.ivhash for s in self.evaluation_set_specs)
+
 	def __repr__(self):
 		eval_str = ""
 		for i in range(0, len(self.evaluation_set_specs)):
@@ -274,14 +548,77 @@ class Experiment:
 	
 
 class ExperimentSet:
-	def __init__(self, simulator: Simulator, algorithm: str, loss_function: str, loss_aggregator: str, time_limit: float, num_threads: int):
+	def __init__(self, simulator: Simulator, algorithm: str, loss_function: str, loss_aggregator: str, time_limit: float, num_threads: int,
+				 repeat_mode: str = "all", analytic_model: bool = False, estimate_parameters: bool = False):
 		self.simulator = simulator
 		self.algorithm = algorithm
 		self.loss_function = loss_function
 		self.loss_aggregator = loss_aggregator
 		self.time_limit = time_limit
 		self.num_threads = num_threads
+		# How calibrations use the repeat trials of their training workflows (see RepeatTrials.py)
+		self.repeat_mode = repeat_mode
+		# Whether calibrations prune candidates with the analytic makespan model (see AnalyticModel.py)
+		self.analytic_model = analytic_model
+		# How much analytic bounds are scaled down before pruning (see AnalyticModel.BOUND_SLACK)
+		self.analytic_slack = BOUND_SLACK
+		# Whether calibrations narrow parameter ranges to estimates from the ground truth (see ParameterEstimator.py)
+		self.estimate_parameters = estimate_parameters
 		self.experiments: List[Experiment] = []
+		self.experiment_index: dict[tuple, Experiment] = {}
+		# Number of calibrations computed concurrently (each with num_threads threads)
+		self.num_parallel_calibrations = 1
+		# Set by add_cross_validation: the folds, then (after running) per-fold and aggregate losses
+		self.cross_validation: dict | None = None
+		# Calibrations already computed (by any campaign) are looked up in, and new ones added to, this
+		# registry (see CalibrationRegistry.py), if set (e.g., with --registry); None to always calibrate
+		self.registry_path: str | None = None
+		# If set, evaluations stop once the confidence interval of the loss is narrower than this
+		# (see sequential_evaluation)
+		self.evaluation_tolerance: float | None = None
+		# The set's interning tables (rebuilt when unpickled): workflow paths, and task IDs by workflow
+		self.catalog = WorkflowCatalog()
+		self.task_id_tuples: dict[str, tuple] = {}
+
+	def __getstate__(self):
+		state = self.__dict__.copy()
+		state.pop("catalog", None)
+		state.pop("task_id_tuples", None)
+		return state
+
+	def __setstate__(self, state: dict):
+		self.__dict__.update(state)
+		self.catalog = WorkflowCatalog()
+		self.task_id_tuples = {}
+		for xp in self.experiments:
+			for spec in [xp.training_set_spec, *xp.evaluation_set_specs]:
+				spec.use_catalog(self.catalog)
+			if xp.evaluation_makespans:
+				xp.evaluation_makespans = [{self.catalog.intern(w): result for w, result in makespans.items()}
+										   for makespans in xp.evaluation_makespans]
+				for makespans in xp.evaluation_makespans:
+					for w, result in makespans.items():
+						result.task_ids = self.task_id_tuples.setdefault(w, result.task_ids)
+
+	def task_ids_of(self, workflow: str) -> tuple:
+		# The task IDs of a workflow (in binary task output order), shared by all of the set's results for it
+		task_ids = self.task_id_tuples.get(workflow)
+		if task_ids is None:
+			task_ids = self.task_id_tuples[workflow] = workflow_task_ids(workflow)
+		return task_ids
+
+	def get_experiment_index(self) -> dict[tuple, Experiment]:
+		# Rebuilt for sets pickled before the index existed, or whose experiments list was changed directly
+		if "experiment_index" not in self.__dict__ or len(self.experiment_index) != len(self.experiments):
+			self.experiment_index = {xp.key(): xp for xp in self.experiments}
+		return self.experiment_index
+
+	def get_training_set_specs(self) -> dict[str, WorkflowSetSpec]:
+		# Unique training set specs, by hash, in experiment order
+		training_set_specs = {}
+		for xp in self.experiments:
+			training_set_specs.setdefault(xp.training_set_spec.ivhash, xp.training_set_spec)
+		return training_set_specs
 
 	def add_experiment(self, training_set_spec: WorkflowSetSpec, evaluation_set_specs: List[WorkflowSetSpec]):
 		if training_set_spec.is_empty():
@@ -297,11 +634,48 @@ class ExperimentSet:
 			#return False
 
 		xp = Experiment(training_set_spec, non_empty_evaluation_set_specs)
-		if xp not in self.experiments:
+		experiment_index = self.get_experiment_index()
+		if xp.key() not in experiment_index:
+			for spec in [xp.training_set_spec, *xp.evaluation_set_specs]:
+				spec.use_catalog(self.catalog)
+			experiment_index[xp.key()] = xp
 			self.experiments.append(xp)
 
 		return True
 
+	def add_cross_validation(self, pool_spec: WorkflowSetSpec, num_folds: int, seed: int | None = None):
+		"""
+		One experiment per fold of the pool's configurations: calibrated on the other folds, evaluated on it.
+		The folds' calibrations run concurrently. Grid calibrations (whose candidates are the same for all
+		folds) share their simulations (see SimulationResultStore)
+		"""
+		folds = make_folds(pool_spec.get_workflow_set(), num_folds, seed)
+		for i, fold in enumerate(folds):
+			training_set_spec = WorkflowSetSpec().set_workflows([g for j, f in enumerate(folds) if j != i for g in f])
+			training_set_spec.update_fields()
+			evaluation_set_spec = WorkflowSetSpec().set_workflows(fold)
+			evaluation_set_spec.update_fields()
+			self.add_experiment(training_set_spec, [evaluation_set_spec])
+		self.num_parallel_calibrations = num_folds
+		self.cross_validation = {
+			"num_folds": num_folds,
+			"seed": seed,
+			"pool_hash": pool_spec.ivhash,
+			"folds": [[w for group in fold for w in group] for fold in folds],
+		}
+
+	def summarize_cross_validation(self):
+		# The experiments of add_cross_validation are the folds, in order
+		folds = self.experiments[-self.cross_validation["num_folds"]:]
+		held_out_losses = [xp.evaluation_losses[0] for xp in folds]
+		self.cross_validation.update({
+			"fold_calibration_losses": [xp.calibration_loss for xp in folds],
+			"fold_losses": held_out_losses,
+			"mean_loss": mean(held_out_losses),
+			"std_loss": pstdev(held_out_losses),
+			"max_loss": max(held_out_losses),
+		})
+
 	def is_empty(self):
 		return len(self.experiments) == 0
 
@@ -333,26 +707,56 @@ class ExperimentSet:
 		else:
 			return self.experiments[0].training_set_spec.architecture
 
+	def calibration_settings(self) -> dict:
+		# Everything but the training set that a calibration depends on (its registry key)
+		return {
+			"algorithm": self.algorithm,
+			"loss_function": self.loss_function,
+			"loss_aggregator": self.loss_aggregator,
+			"time_limit": self.time_limit,
+			"num_threads": self.num_threads,
+			"compute_service_scheme": self.simulator.compute_service_scheme,
+			"storage_service_scheme": self.simulator.storage_service_scheme,
+			"network_topology_scheme": self.simulator.network_topology_scheme,
+			"fixed_parameters": self.simulator.get_fixed_parameters(),
+			"repeat_mode": getattr(self, "repeat_mode", "all"),
+			"analytic_model": getattr(self, "analytic_model", False),
+			"analytic_slack": getattr(self, "analytic_slack", BOUND_SLACK),
+			"estimate_parameters": getattr(self, "estimate_parameters", False),
+		}
+
 	def compute_all_calibrations(self):
 		# Make a set of unique training_set_specs
-		training_set_specs = []
+		training_set_specs = self.get_training_set_specs()
 
 		print("In compute all calibrations")
 
+		registry_path = getattr(self, "registry_path", None)
+		registry = CalibrationRegistry(registry_path) if registry_path else None
+		settings = self.calibration_settings()
+
+		experiments_by_training_set = {}
 		for xp in self.experiments:
-			if xp.training_set_spec not in training_set_specs:
-				training_set_specs.append(xp.training_set_spec)
+			experiments_by_training_set.setdefault(xp.training_set_spec.ivhash, []).append(xp)
 
 		# For each unique training_set_spec: compute the calibration and store it in the experiments
-		count = 1
-		for training_set_spec in training_set_specs:
+		def compute(count: int, training_hash: str, training_set_spec: WorkflowSetSpec):
+			# The same training set, as long as none of its workflows changed since it was calibrated
+			training_settings = {**settings, "training_content": content_hash(training_set_spec.get_workflow_set())} \
+				if registry is not None else settings
+			registered = registry.lookup(training_hash, training_settings) if registry is not None else None
+			if registered is not None:
+				sys.stderr.write(f"  Calibration #{count}/{len(training_set_specs)} found in {registry_path}\n")
+				calibration = calibration_from_named_values(self.simulator, registered[0])
+				for xp in experiments_by_training_set[training_hash]:
+					xp.calibration, xp.calibration_loss = calibration, registered[1]
+				return
 			sys.stderr.write(f"  Computing calibration #{count}/{len(training_set_specs)}  "
 							 f"({len(training_set_spec.get_workflow_set())} "
 							 f"workflows, {self.algorithm}, "
 							 f"{self.time_limit} sec, "
 							 f"{self.num_threads} threads)...\n")
 
-			count += 1
 			calibration, calibration_loss = compute_calibration(
 				training_set_spec.get_workflow_set(),
 				self.algorithm,
@@ -360,15 +764,27 @@ class ExperimentSet:
 				self.loss_function,
 				self.loss_aggregator,
 				self.time_limit,
-				self.num_threads)
+				self.num_threads,
+				getattr(self, "repeat_mode", "all"),
+				getattr(self, "analytic_model", False),
+				getattr(self, "estimate_parameters", False),
+				analytic_slack=getattr(self, "analytic_slack", BOUND_SLACK))
 
 			if calibration is None:
 				raise Exception("Calibration computed is None: perhaps a higher time limit?")
-			# update all relevant experiments (inefficient, but shouldn't be too many xps)
-			for xp in self.experiments:
-				if xp.training_set_spec == training_set_spec:
-					xp.calibration = calibration
-					xp.calibration_loss = calibration_loss
+			if registry is not None:
+				registry.record(training_hash, training_settings, named_values(self.simulator, calibration),
+								calibration_loss)
+			# update all relevant experiments
+			for xp in experiments_by_training_set[training_hash]:
+				xp.calibration = calibration
+				xp.calibration_loss = calibration_loss
+
+		with ThreadPoolExecutor(max_workers=getattr(self, "num_parallel_calibrations", 1)) as pool:
+			futures = [pool.submit(compute, count, training_hash, training_set_spec)
+					   for count, (training_hash, training_set_spec) in enumerate(training_set_specs.items(), start=1)]
+			for future in futures:
+				future.result()
 
 	def compute_all_evaluations(self):
 		# Here we're ok doing possible redundant work since evaluation is cheap
@@ -378,25 +794,39 @@ class ExperimentSet:
 			count += 1
 			xp.evaluation_losses = []
 			xp.evaluation_makespans = []
+			xp.evaluation_intervals = []
+			tolerance = getattr(self, "evaluation_tolerance", None)
 			for evaluation_set_spec in xp.evaluation_set_specs:
-				xp.evaluation_losses.append(evaluate_calibration(
-					evaluation_set_spec.get_workflow_set(),
-					self.simulator,
-					xp.calibration,
-					self.loss_function,
-					self.loss_aggregator))
+				if tolerance is None:
+					xp.evaluation_losses.append(evaluate_calibration(
+						evaluation_set_spec.get_workflow_set(),
+						self.simulator,
+						xp.calibration,
+						self.loss_function,
+						self.loss_aggregator))
+					xp.evaluation_intervals.append(None)
+					evaluated = evaluation_set_spec.get_workflow_set()
+				else:
+					loss, interval = sequential_evaluation(
+						evaluation_set_spec.get_workflow_set(),
+						self.simulator,
+						xp.calibration,
+						self.loss_function,
+						self.loss_aggregator,
+						tolerance)
+					xp.evaluation_losses.append(loss)
+					xp.evaluation_intervals.append(interval)
+					# Only the sampled workflows' results are kept
+					evaluated = [interval["workflows"]]
 				makespans={}
-				for workflow in evaluation_set_spec.get_workflow_set():
+				for workflow in evaluated:
 					for i,w in enumerate(workflow):
 						with sc.Environment() as env:
-							makespans[w]=ast.literal_eval(self.simulator.run(env, (w,xp.calibration)))
+							output, real_durations, simulated_durations = self.simulator.run_binary(env, w, xp.calibration)
+						makespans[w]=WorkflowResult.from_arrays(output, self.task_ids_of(w), real_durations, simulated_durations)
 				xp.evaluation_makespans.append(makespans)
 	def estimate_run_time(self):	
-		training_set_specs = []
-		for xp in self.experiments:
-			if xp.training_set_spec not in training_set_specs:
-				training_set_specs.append(xp.training_set_spec)
-		num_calibrations = len(training_set_specs)
+		num_calibrations = -(-len(self.get_training_set_specs()) // getattr(self, "num_parallel_calibrations", 1))
 		num_evals = sum([len(x.evaluation_set_specs) for x in self.experiments])
 
 		eval_time = 3  # Guess
@@ -406,8 +836,29 @@ class ExperimentSet:
 
 	def run(self):
 		# Computing all needed calibrations (which can be redundant across experiments, so let's not be stupid)
-		self.compute_all_calibrations()
-		self.compute_all_evaluations()
+		cross_validation = getattr(self, "cross_validation", None)
+		if cross_validation is None:
+			self.compute_all_calibrations()
+			self.compute_all_evaluations()
+			return
+		if self.algorithm != "grid":
+			# Other algorithms draw continuous candidates, which practically never come up in two folds
+			self.compute_all_calibrations()
+			self.compute_all_evaluations()
+			self.summarize_cross_validation()
+			return
+		# Folds overlap in their training workflows, and grid calibrations evaluate the same candidates
+		store = SimulationResultStore(max_bytes=CROSS_VALIDATION_STORE_BYTES)
+		self.simulator.use_result_store(store)
+		try:
+			self.compute_all_calibrations()
+			self.compute_all_evaluations()
+		finally:
+			self.simulator.use_result_store(None)
+		cross_validation["num_simulations"] = store.num_misses
+		cross_validation["num_shared_simulations"] = store.num_hits
+		cross_validation["store_hit_rate"] = store.hit_rate()
+		self.summarize_cross_validation()
 
 	def __repr__(self):
 		set_str = ""
@@ -420,3 +871,88 @@ class ExperimentSet:
 
 	def __getitem__(self, item):
 		return self.experiments[item]  # delegate to li.__getitem__
+
+
+# Header files are small JSON summaries written next to each pickled ExperimentSet, so that
+# scanning results doesn't require deserializing the whole object graph (evaluation_makespans, ...)
+HEADER_FORMAT_VERSION = 1
+
+
+def header_file_name(pickle_file_name: str) -> str:
+	return pickle_file_name + ".header.json"
+
+
+def summarize_experiment_set(experiment_set: ExperimentSet) -> dict:
+	experiments = []
+	for xp in experiment_set.experiments:
+		calibration = None
+		if xp.calibration is not None:
+			calibration = named_values(experiment_set.simulator, xp.calibration)
+		experiments.append({
+			"training_set": xp.training_set_spec.workflows,
+			"training_hash": xp.training_set_spec.ivhash,
+			"evaluation_hashes": [s.ivhash for s in xp.evaluation_set_specs],
+			"calibration": calibration,
+			"calibration_loss": xp.calibration_loss,
+			"evaluation_losses": xp.evaluation_losses,
+			"evaluation_intervals": [None if interval is None else {k: v for k, v in interval.items() if k != "workflows"}
+									 for interval in getattr(xp, "evaluation_intervals", None) or []],
+		})
+	return {
+		"version": HEADER_FORMAT_VERSION,
+		"algorithm": experiment_set.algorithm,
+		"loss_function": experiment_set.loss_function,
+		"loss_aggregator": experiment_set.loss_aggregator,
+		"time_limit": experiment_set.time_limit,
+		"num_threads": experiment_set.num_threads,
+		"repeat_mode": getattr(experiment_set, "repeat_mode", "all"),
+		"compute_service_scheme": experiment_set.simulator.compute_service_scheme,
+		"storage_service_scheme": experiment_set.simulator.storage_service_scheme,
+		"network_topology_scheme": experiment_set.simulator.network_topology_scheme,
+		"experiments": experiments,
+		"cross_validation": getattr(experiment_set, "cross_validation", None),
+	}
+
+
+def write_experiment_set_header(experiment_set: ExperimentSet, pickle_file_name: str):
+	header = summarize_experiment_set(experiment_set)
+	# Record which version of the pickle this header describes, so that stale headers are detected
+	stat = os.stat(pickle_file_name)
+	header["source"] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+	tmp_file_name = header_file_name(pickle_file_name) + ".tmp"
+	with open(tmp_file_name, 'w') as f:
+		json.dump(header, f)
+	os.replace(tmp_file_name, header_file_name(pickle_file_name))
+	return header
+
+
+def save_experiment_set(experiment_set: ExperimentSet, pickle_file_name: str):
+	with open(pickle_file_name, 'wb') as f:
+		pickle.dump(experiment_set, f)
+	write_experiment_set_header(experiment_set, pickle_file_name)
+
+
+def load_experiment_set_header(pickle_file_name: str) -> dict:
+	stat = os.stat(pickle_file_name)
+	try:
+		with open(header_file_name(pickle_file_name)) as f:
+			header = json.load(f)
+		if header.get("version") == HEADER_FORMAT_VERSION and \
+				header.get("source") == {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}:
+			return header
+	except (OSError, ValueError):
+		pass
+	# Missing or stale header (e.g., a pickle from before headers existed): fall back to a full load once
+	with open(pickle_file_name, 'rb') as f:
+		experiment_set = pickle.load(f)
+	try:
+		return write_experiment_set_header(experiment_set, pickle_file_name)
+	except OSError:
+		# Read-only result directory: still answer the caller
+		return summarize_experiment_set(experiment_set)
+
+
+def header_training_set_spec(header_experiment: dict) -> WorkflowSetSpec:
+	spec = WorkflowSetSpec().set_workflows(header_experiment["training_set"])
+	spec.update_fields()
+	return spec
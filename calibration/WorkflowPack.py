@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Workflow packs: all the workflows of a directory in one file, stripped down to the fields that the
+simulator (and the calibration scripts) use, optionally zstd-compressed.
+
+A pack is named workflows.wfpack and sits in the workflow directory. Its layout is:
+	WFPACK <version> <index length>\\n
+	<index (JSON)>
+	<members>
+where the index maps each member (a workflow file name) to its offset and length in the members,
+its uncompressed size, the md5 of its (uncompressed) content, and the size/mtime of the JSON file it
+was made from. Identical members are stored once.
+
+Readers (load_workflow_json here, readStringFromFile in the simulator) accept "<pack>.wfpack#member" paths,
+and read a plain path "dir/file.json" from dir/workflows.wfpack if the pack has that member and the
+JSON file, if still there, hasn't changed since it was packed. Otherwise (including when the directory's
+pack is of another version, or corrupt) they read the JSON file; only explicit member paths require a
+valid pack.
+"""
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+from multiprocessing import Pool
+from typing import List
+
+try:
+	import zstandard
+except ImportError:
+	zstandard = None
+
+PACK_NAME = "workflows.wfpack"
+# Written by normalize_workflows.py next to the workflows (not a workflow file)
+INDEX_NAME = "workflow_index.json"
+PACK_VERSION = 1
+
+# Everything else (commands, descriptions, machine details, ...) is dropped
+_kept_fields = {
+	"": ["name", "schemaVersion", "workflow"],
+	"workflow": ["specification", "execution"],
+	"specification": ["tasks", "files"],
+	"specification_task": ["name", "id", "parents", "children", "inputFiles", "outputFiles"],
+	"specification_file": ["id", "sizeInBytes"],
+	"execution": ["makespanInSeconds", "tasks", "machines"],
+	"execution_task": ["id", "runtimeInSeconds", "syntheticRuntimeInSecond", "coreCount", "avgCPU",
+					   "memoryInBytes", "priority", "machine", "machines"],
+	"machine": ["nodeName", "memoryInBytes", "cpu"],
+	"cpu": ["coreCount", "speedInMHz"],
+}
+
+
+def _keep(obj: dict, kind: str) -> dict:
+	return {k: obj[k] for k in _kept_fields[kind] if k in obj}
+
+
+def compact_workflow(data: dict) -> dict:
+	"""
+	Only keeps the fields of a WfFormat workflow that are needed to build and simulate it
+	"""
+	compact = _keep(data, "")
+	if "workflow" not in data:
+		return compact
+	workflow = compact["workflow"] = _keep(data["workflow"], "workflow")
+	if "specification" in workflow:
+		specification = workflow["specification"] = _keep(workflow["specification"], "specification")
+		specification["tasks"] = [_keep(t, "specification_task") for t in specification.get("tasks", [])]
+		specification["files"] = [_keep(f, "specification_file") for f in specification.get("files", [])]
+	if "execution" in workflow:
+		execution = workflow["execution"] = _keep(workflow["execution"], "execution")
+		execution["tasks"] = [_keep(t, "execution_task") for t in execution.get("tasks", [])]
+		machines = []
+		for machine in execution.get("machines", []):
+			machine = _keep(machine, "machine")
+			if "cpu" in machine:
+				machine["cpu"] = _keep(machine["cpu"], "cpu")
+			machines.append(machine)
+		execution["machines"] = machines
+	return compact
+
+
+def _compact_file(path: str):
+	# Runs in a worker process
+	stat = os.stat(path)
+	with open(path) as f:
+		content = json.dumps(compact_workflow(json.load(f)), separators=(',', ':')).encode()
+	return os.path.basename(path), content, stat.st_size, stat.st_mtime_ns
+
+
+def write_pack(workflow_dir: str, pack_path: str | None = None, compression_level: int | None = None,
+			   num_workers: int = 1) -> str:
+	"""
+	Packs all JSON files of a directory (zstd-compressed if compression_level is given)
+	"""
+	if compression_level is not None and zstandard is None:
+		raise Exception("zstd compression requires the zstandard package")
+	pack_path = pack_path or os.path.join(workflow_dir, PACK_NAME)
+	files = sorted(os.path.join(workflow_dir, f) for f in os.listdir(workflow_dir)
+				   if f.endswith(".json") and f != INDEX_NAME)
+	compressor = zstandard.ZstdCompressor(level=compression_level) if compression_level is not None else None
+
+	members = {}
+	blobs = []
+	offsets_by_md5 = {}
+	offset = 0
+	with Pool(num_workers) as pool:
+		for name, content, source_size, source_mtime_ns in pool.imap(_compact_file, files, chunksize=8):
+			md5 = hashlib.md5(content).hexdigest()
+			if md5 not in offsets_by_md5:
+				blob = compressor.compress(content) if compressor else content
+				offsets_by_md5[md5] = (offset, len(blob))
+				blobs.append(blob)
+				offset += len(blob)
+			member_offset, member_length = offsets_by_md5[md5]
+			members[name] = {"offset": member_offset, "length": member_length, "size": len(content), "md5": md5,
+							 "source_size": source_size, "source_mtime_ns": source_mtime_ns}
+
+	index = json.dumps({"compression": "zstd" if compressor else "none", "members": members},
+					   separators=(',', ':')).encode()
+	tmp_path = pack_path + ".tmp"
+	with open(tmp_path, "wb") as f:
+		f.write(f"WFPACK {PACK_VERSION} {len(index)}\n".encode())
+		f.write(index)
+		for blob in blobs:
+			f.write(blob)
+	os.replace(tmp_path, pack_path)
+	return pack_path
+
+
+@lru_cache(maxsize=None)
+def _read_index(pack_path: str, mtime_ns: int) -> tuple[dict, int]:
+	# Cached for as long as the pack doesn't change; returns the index and the offset of the members
+	with open(pack_path, "rb") as f:
+		header = f.readline()
+		tokens = header.split()
+		if len(tokens) != 3 or tokens[0] != b"WFPACK" or int(tokens[1]) != PACK_VERSION:
+			raise Exception(f"{pack_path} is not a version {PACK_VERSION} workflow pack")
+		index = json.loads(f.read(int(tokens[2])))
+	return index, len(header) + int(tokens[2])
+
+
+def read_index(pack_path: str) -> tuple[dict, int]:
+	return _read_index(pack_path, os.stat(pack_path).st_mtime_ns)
+
+
+def read_member(pack_path: str, name: str) -> bytes:
+	index, members_offset = read_index(pack_path)
+	member = index["members"][name]
+	with open(pack_path, "rb") as f:
+		f.seek(members_offset + member["offset"])
+		blob = f.read(member["length"])
+	if index["compression"] == "zstd":
+		if zstandard is None:
+			raise Exception(f"Reading {pack_path} requires the zstandard package")
+		return zstandard.ZstdDecompressor().decompress(blob, max_output_size=member["size"])
+	return blob
+
+
+def find_in_pack(path: str) -> tuple[str, str] | None:
+	"""
+	Returns the (pack, member) a workflow path should be read from, if any
+	"""
+	if ".wfpack#" in path:
+		pack_path, name = path.split(".wfpack#", 1)
+		return pack_path + ".wfpack", name
+	pack_path = os.path.join(os.path.dirname(path), PACK_NAME)
+	if not os.path.isfile(pack_path):
+		return None
+	name = os.path.basename(path)
+	try:
+		member = read_index(pack_path)[0]["members"].get(name)
+	except Exception:
+		# Not a (valid) pack of this version: read the JSON file, as the simulator does
+		return None
+	if member is None:
+		return None
+	try:
+		stat = os.stat(path)
+	except FileNotFoundError:
+		return pack_path, name
+	if (stat.st_size, stat.st_mtime_ns) != (member["source_size"], member["source_mtime_ns"]):
+		# The JSON file has changed since it was packed
+		return None
+	return pack_path, name
+
+
+def workflow_fingerprint(path: str) -> str:
+	"""
+	Identifies the content a workflow path reads as: the md5 of its pack member, or the size and
+	modification time of its JSON file (so that results computed from a replaced file aren't reused)
+	"""
+	found = find_in_pack(path)
+	if found is not None:
+		pack_path, name = found
+		return read_index(pack_path)[0]["members"][name]["md5"]
+	stat = os.stat(path)
+	return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def load_workflow_json(path: str) -> dict:
+	found = find_in_pack(path)
+	if found is None:
+		with open(path) as f:
+			return json.load(f)
+	return json.loads(read_member(*found))
+
+
+def packed_workflows(pattern: str) -> List[str]:
+	"""
+	Paths, in the pattern's directory, of the packed workflows whose name matches the (glob) pattern
+	"""
+	pack_path = os.path.join(os.path.dirname(pattern), PACK_NAME)
+	if not os.path.isfile(pack_path):
+		return []
+	names = fnmatch.filter(read_index(pack_path)[0]["members"].keys(), os.path.basename(pattern))
+	return [os.path.join(os.path.dirname(pattern), name) for name in names]
+
+
+def main():
+	parser = argparse.ArgumentParser(
+		prog=sys.argv[0],
+		description='Pack the WfFormat JSON files of a directory into a compact workflow pack')
+	parser.add_argument('workflow_dir', type=str, help='Directory of workflow JSON files')
+	parser.add_argument('-o', '--output', type=str, default=None,
+						help=f'Pack file (default: <workflow_dir>/{PACK_NAME}, where readers look for it)')
+	parser.add_argument('-z', '--zstd', type=int, nargs='?', const=19, default=None, metavar="LEVEL",
+						help='Compress members with zstd (default level: 19)')
+	parser.add_argument('-j', '--num_workers', type=int, default=os.cpu_count(),
+						help='Number of worker processes')
+	args = parser.parse_args()
+
+	pack_path = write_pack(args.workflow_dir, args.output, args.zstd, args.num_workers)
+	index, members_offset = read_index(pack_path)
+	source_size = sum(m["source_size"] for m in index["members"].values())
+	sys.stderr.write(f"Packed {len(index['members'])} workflows ({source_size} bytes) into {pack_path} "
+					 f"({os.path.getsize(pack_path)} bytes)\n")
+
+
+if __name__ == "__main__":
+	main()
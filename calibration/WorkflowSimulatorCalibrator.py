@@ -1,6 +1,10 @@
+import copy
 import json
+import math
 import os
+import random
 import sys
+import threading
 from pathlib import Path
 from time import time
 from typing import List, Callable, Any
@@ -9,46 +13,392 @@ import simcal
 import simcal as sc
 from sklearn.metrics import mean_squared_error as sklearn_mean_squared_error
 
+import AnalyticModel
+import ParallelGradient
+import ParameterEstimator
+import RepeatTrials
 import Simulator
+from WorkflowPack import load_workflow_json
+
+# Loss reported for a pruned candidate whose analytic bound isn't finite (e.g., with a zero bandwidth)
+PRUNED_LOSS = 1e6
+# Loss reported for a candidate whose simulations failed (a finite one, see CalibrationLossEvaluator.run)
+FAILED_LOSS = 1e6
 
 
 def get_makespan(workflow_file: str) -> float:
-	with open(workflow_file, "r") as f:
-		json_object = json.load(f)
-		return float(json_object["workflow"]["execution"]["makespanInSeconds"])
+	json_object = load_workflow_json(workflow_file)
+	return float(json_object["workflow"]["execution"]["makespanInSeconds"])
+
+
+class ParameterSpec:
+	"""
+	A calibrated simulator parameter: its range ([low, high], or [2^low, 2^high] if exponential),
+	the format of its values, and where they go in the simulator's JSON input
+	"""
+	__slots__ = ("name", "scale", "low", "high", "format", "path")
+
+	def __init__(self, name: str, scale: str, low: float, high: float, format: str, path: List[str]):
+		self.name = name
+		self.scale = scale
+		self.low = low
+		self.high = high
+		self.format = format
+		self.path = path
+
+	def make(self) -> sc.parameter.Base:
+		if self.scale == "exponential":
+			parameter = sc.parameters.Exponential(self.low, self.high)
+		else:
+			parameter = sc.parameters.Linear(self.low, self.high)
+		return parameter.format(self.format).set_custom_data(self.path)
+
+	def value_at(self, position: float) -> float:
+		# Value at a position in [0, 1] along the parameter's (possibly exponential) range
+		x = self.low + position * (self.high - self.low)
+		return 2 ** x if self.scale == "exponential" else x
+
+	def formatted(self, value: float) -> str:
+		return self.format % value
+
+	def position_of(self, value: float) -> float:
+		# Inverse of value_at, clipped to [0, 1]
+		if self.high == self.low:
+			return 0.5
+		x = (math.log2(value) if value > 0 else -math.inf) if self.scale == "exponential" else value
+		return min(1.0, max(0.0, (x - self.low) / (self.high - self.low)))
+
+	def around(self, position: float, radius: float) -> "ParameterSpec":
+		# The part of the range within radius (a fraction of the range) of a position
+		x = self.low + position * (self.high - self.low)
+		half_width = radius * (self.high - self.low)
+		return ParameterSpec(self.name, self.scale, max(self.low, x - half_width), min(self.high, x + half_width),
+							 self.format, self.path)
+
+
+_scheme_parameters = {
+	# COMPUTE SERVICE SCHEME
+	("compute", "all_bare_metal"): [
+		ParameterSpec("compute_hosts_speed", "exponential", 20, 40, "%lff",
+					  ["compute_service_scheme_parameters", "all_bare_metal", "compute_hosts", "speed"]),
+		ParameterSpec("thread_startup_overhead", "linear", 0, 20, "%lfs",
+					  ["compute_service_scheme_parameters", "all_bare_metal", "properties",
+					   "BareMetalComputeServiceProperty::THREAD_STARTUP_OVERHEAD"]),
+	],
+	("compute", "htcondor_bare_metal"): [
+		ParameterSpec("compute_hosts_speed", "exponential", 20, 40, "%lff",
+					  ["compute_service_scheme_parameters", "htcondor_bare_metal", "compute_hosts", "speed"]),
+		ParameterSpec("thread_startup_overhead", "linear", 0, 20, "%lfs",
+					  ["compute_service_scheme_parameters", "htcondor_bare_metal", "bare_metal_properties",
+					   "BareMetalComputeServiceProperty::THREAD_STARTUP_OVERHEAD"]),
+		ParameterSpec("htcondor_negotiator_overhead", "linear", 0, 20, "%lfs",
+					  ["compute_service_scheme_parameters", "htcondor_bare_metal", "htcondor_properties",
+					   "HTCondorComputeServiceProperty::NEGOTIATOR_OVERHEAD"]),
+		ParameterSpec("htcondor_pre_execution_delay", "linear", 0, 20, "%lfs",
+					  ["compute_service_scheme_parameters", "htcondor_bare_metal", "htcondor_properties",
+					   "HTCondorComputeServiceProperty::GRID_PRE_EXECUTION_DELAY"]),
+		ParameterSpec("htcondor_post_execution_delay", "linear", 0, 20, "%lfs",
+					  ["compute_service_scheme_parameters", "htcondor_bare_metal", "htcondor_properties",
+					   "HTCondorComputeServiceProperty::GRID_POST_EXECUTION_DELAY"]),
+	],
+	# STORAGE SERVICE SCHEME
+	("storage", "submit_only"): [
+		ParameterSpec("disk_read_bw", "exponential", 10, 40, "%lfbps",
+					  ["storage_service_scheme_parameters", "submit_only", "bandwidth_submit_disk_read"]),
+		ParameterSpec("disk_write_bw", "exponential", 10, 40, "%lfbps",
+					  ["storage_service_scheme_parameters", "submit_only", "bandwidth_submit_disk_write"]),
+		ParameterSpec("max_num_data_connections", "linear", 1, 100, "%d",
+					  ["storage_service_scheme_parameters", "submit_only", "submit_properties",
+					   "SimpleStorageServiceProperty::MAX_NUM_CONCURRENT_DATA_CONNECTIONS"]),
+	],
+	("storage", "submit_and_compute_hosts"): [
+		ParameterSpec("submit_disk_read_bw", "exponential", 20, 40, "%lfbps",
+					  ["storage_service_scheme_parameters", "submit_and_compute_hosts", "bandwidth_submit_disk_read"]),
+		ParameterSpec("submit_disk_write_bw", "exponential", 20, 40, "%lfbps",
+					  ["storage_service_scheme_parameters", "submit_and_compute_hosts", "bandwidth_submit_disk_write"]),
+		ParameterSpec("submit_max_num_data_connections", "linear", 1, 100, "%d",
+					  ["storage_service_scheme_parameters", "submit_and_compute_hosts", "submit_properties",
+					   "SimpleStorageServiceProperty::MAX_NUM_CONCURRENT_DATA_CONNECTIONS"]),
+		ParameterSpec("compute_host_disk_read_bw", "exponential", 20, 40, "%lfbps",
+					  ["storage_service_scheme_parameters", "submit_and_compute_hosts",
+					   "bandwidth_compute_host_disk_read"]),
+		ParameterSpec("compute_host_disk_write_bw", "exponential", 20, 40, "%lfbps",
+					  ["storage_service_scheme_parameters", "submit_and_compute_hosts", "bandwidth_compute_host_write"]),
+		ParameterSpec("compute_host_max_num_data_connections", "linear", 1, 100, "%d",
+					  ["storage_service_scheme_parameters", "submit_and_compute_hosts", "compute_host_properties",
+					   "SimpleStorageServiceProperty::MAX_NUM_CONCURRENT_DATA_CONNECTIONS"]),
+	],
+	# NETWORK TOPOLOGY SCHEME
+	("network", "one_link"): [
+		ParameterSpec("link_bw", "exponential", 10, 40, "%lfbps",
+					  ["network_topology_scheme_parameters", "one_link", "bandwidth"]),
+		ParameterSpec("link_lat", "linear", 0, 0.01, "%lfs",
+					  ["network_topology_scheme_parameters", "one_link", "latency"]),
+	],
+	("network", "many_links"): [
+		ParameterSpec("link_bw", "exponential", 10, 40, "%lfbps",
+					  ["network_topology_scheme_parameters", "many_links", "bandwidth_submit_to_compute_host"]),
+		ParameterSpec("link_lat", "linear", 0, 0.01, "%lfs",
+					  ["network_topology_scheme_parameters", "many_links", "latency_submit_to_compute_host"]),
+	],
+	("network", "one_and_then_many_links"): [
+		ParameterSpec("first_link_bw", "exponential", 10, 40, "%lfbps",
+					  ["network_topology_scheme_parameters", "one_and_then_many_links", "bandwidth_out_of_submit"]),
+		ParameterSpec("first_link_lat", "linear", 0, 0.01, "%lfs",
+					  ["network_topology_scheme_parameters", "one_and_then_many_links", "latency_out_of_submit"]),
+		ParameterSpec("second_link_bw", "exponential", 10, 40, "%lfbps",
+					  ["network_topology_scheme_parameters", "one_and_then_many_links", "bandwidth_to_compute_hosts"]),
+		ParameterSpec("second_link_lat", "linear", 0, 0.01, "%lfs",
+					  ["network_topology_scheme_parameters", "one_and_then_many_links",
+					   "latency_submit_to_compute_host"]),
+	],
+}
+
+
+def calibration_parameters(simulator: Simulator) -> List[ParameterSpec]:
+	parameters = []
+	for kind, scheme in [("compute", simulator.compute_service_scheme),
+						 ("storage", simulator.storage_service_scheme),
+						 ("network", simulator.network_topology_scheme)]:
+		if (kind, scheme) not in _scheme_parameters:
+			name = {"compute": "Compute service", "storage": "Storage service", "network": "Network topology"}[kind]
+			raise Exception(f"{name} scheme '{scheme}' not implemented yet")
+		parameters += _scheme_parameters[(kind, scheme)]
+	return parameters
+
+
+def named_values(simulator: Simulator, calibration: dict) -> dict[str, str]:
+	"""
+	The values of a calibration's (non-fixed) parameters by name, as strings, whether it is a simcal
+	calibration or a complete JSON input (e.g., from the parallel gradient descent, or a seed)
+	"""
+	if not calibration or simulator.isSimcalCal(calibration):
+		return {name: str(value) for name, value in calibration.items()}
+	fixed_parameters = simulator.get_fixed_parameters()
+	values = {}
+	for parameter_spec in calibration_parameters(simulator):
+		if parameter_spec.name in fixed_parameters:
+			continue
+		value = calibration
+		for item in parameter_spec.path:
+			value = value[item]
+		values[parameter_spec.name] = str(value)
+	return values
+
+
+def calibration_input(simulator: Simulator, parameter_specs: List[ParameterSpec], point: List[float]) -> dict:
+	"""
+	A complete JSON input (without workflow, as Simulator.make_json_input takes them), with the simulator's
+	fixed parameters and the parameters of the specs at a position in [0, 1] of their ranges
+	"""
+	json_input = copy.deepcopy(Simulator.template_json_input)
+	json_input["compute_service_scheme"] = simulator.compute_service_scheme
+	json_input["storage_service_scheme"] = simulator.storage_service_scheme
+	json_input["network_topology_scheme"] = simulator.network_topology_scheme
+	for metadata, value in simulator.get_fixed_parameters().values():
+		Simulator.set_json_input_value(json_input, metadata, value)
+	for parameter_spec, position in zip(parameter_specs, point):
+		Simulator.set_json_input_value(json_input, parameter_spec.path,
+									   parameter_spec.formatted(parameter_spec.value_at(position)))
+	return json_input
+
+
+def calibration_from_named_values(simulator: Simulator, values: dict[str, str]) -> dict:
+	# The complete JSON input of a calibration given as named values (the inverse of named_values)
+	json_input = calibration_input(simulator, [], [])
+	for parameter_spec in calibration_parameters(simulator):
+		if parameter_spec.name in values:
+			Simulator.set_json_input_value(json_input, parameter_spec.path, values[parameter_spec.name])
+	return json_input
 
 
 class CalibrationLossEvaluator(sc.Simulator):
-	def __init__(self, simulator: Simulator, ground_truth: List[List[str]], loss: Callable):
+	def __init__(self, simulator: Simulator, ground_truth: List[List[str]], loss: Callable,
+				 batcher: Simulator.SimulationBatcher | None = None, repeat_mode: str = "all"):
 		super().__init__()
 		self.simulator: Simulator = simulator
-		self.ground_truth: List[List[str]] = ground_truth
+		# Repeat trials of the same configuration are simulated as is, replaced by a representative, or sampled
+		self.repeat_mode = repeat_mode
+		self.ground_truth: List[List[str]] = RepeatTrials.reduce_repeats(ground_truth, repeat_mode)
+		if repeat_mode == "sample":
+			self.repeat_groups = [RepeatTrials.split_repeats(group) for group in ground_truth]
+			self.rng = random.Random()
 		# print("IN CONS:", ground_truth)
 		self.loss_function: Callable = loss
+		# If set, concurrent evaluations share simulator invocations (one per workflow)
+		self.batcher = batcher
+		# Only ask the simulator for per-task durations if the loss uses them, and have it compute
+		# the per-workflow error itself when it can
+		self.output_options = {"output_level": "tasks" if getattr(loss, "needs_task_data", True) else "makespan"}
+		if getattr(loss, "error_computation_scheme", None):
+			self.output_options["error_computation_scheme"] = loss.error_computation_scheme
+		# With the analytic model, calibrations whose loss is bound to be above the best loss so far
+		# (the incumbent) aren't simulated (see AnalyticModel.py)
+		self.analytic_pruning = False
+		self.analytic_slack = AnalyticModel.BOUND_SLACK
+		self.incumbent = float('inf')
+		# The best calibration that was actually simulated (pruned ones never are), and its loss
+		self.best_calibration: dict | None = None
+		self.best_loss = float('inf')
+		self.num_evaluations = 0
+		self.num_pruned = 0
+		self.num_failed = 0
+		self.lock = threading.Lock()
+
+	def enable_analytic_pruning(self, incumbent: float = float('inf'), slack: float = AnalyticModel.BOUND_SLACK):
+		self.analytic_pruning = True
+		self.analytic_slack = slack
+		self.incumbent = incumbent
+
+	def loss_lower_bound(self, workflows: List[str], calibration: dict[str, sc.parameters.Value]) -> float:
+		# Each workflow's loss is at least its makespan error, which the analytic bound bounds from below
+		json_inputs = [self.simulator.make_json_input(workflow, calibration) for workflow in workflows]
+		error_bounds = AnalyticModel.makespan_error_lower_bounds(workflows, json_inputs, self.analytic_slack)
+		aggregate = getattr(self.loss_function, "method", max)
+		return aggregate(error_bounds)
 
 	def run(self, env: sc.Environment, calibration: dict[str, sc.parameters.Value]):
 		results = []
+		ground_truth = self.ground_truth
+		if self.repeat_mode == "sample":
+			ground_truth = RepeatTrials.sample_repeats(self.repeat_groups, self.rng)
+		with self.lock:
+			self.num_evaluations += 1
+		if self.analytic_pruning:
+			lower_bound = self.loss_lower_bound([workflow for group in ground_truth for workflow in group], calibration)
+			if lower_bound > self.incumbent:
+				with self.lock:
+					self.num_pruned += 1
+				# Not its loss, which is unknown, but a finite value that calibrators (and their surrogate
+				# models, or finite differences) can use: it is above the best loss, so it is never taken
+				# for the best calibration, which only simulated ones can be (see best_calibration)
+				return lower_bound if math.isfinite(lower_bound) else PRUNED_LOSS
 		# Run simulator for all known ground truth points
-		for group in self.ground_truth:
-			for workflow in group:
-				result = self.simulator.run(env, (workflow, calibration))
-				results.append(json.loads(result))
+		try:
+			for group in ground_truth:
+				for workflow in group:
+					if self.batcher is not None:
+						results.append(Simulator.Simulator.parse_output(
+							workflow, self.batcher.run(workflow, calibration, self.output_options)))
+					else:
+						results.append(self.simulator.simulate(env, workflow, calibration, self.output_options))
+		except Simulator.SimulationFailed as error:
+			# Only this candidate fails (not the others it was batched with), and it is never the best one
+			sys.stderr.write(f"{error}: candidate calibration skipped\n")
+			with self.lock:
+				self.num_failed += 1
+			return FAILED_LOSS
 
-		return self.loss_function(results)
+		loss = self.loss_function(results)
+		with self.lock:
+			self.incumbent = min(self.incumbent, loss)
+			if loss < self.best_loss:
+				self.best_calibration, self.best_loss = calibration, loss
+		return loss
 
 
 class WorkflowSimulatorCalibrator:
 	def __init__(self, workflows: List[List[str]],
 				 algorithm: str,
 				 simulator: Simulator,
-				 loss: Callable):
+				 loss: Callable,
+				 repeat_mode: str = "all",
+				 analytic_model: bool = False,
+				 estimate_parameters: bool = False,
+				 start_calibration: dict[str, sc.parameters.Value] | None = None,
+				 analytic_slack: float = AnalyticModel.BOUND_SLACK):
 		self.workflows: List[List[str]] = workflows
 		self.algorithm: str = algorithm
 		self.simulator: Simulator = simulator
 		self.loss: Callable = loss
+		self.repeat_mode: str = repeat_mode
+		# Prune candidates with the analytic model, starting from an incumbent at the analytic optimum
+		self.analytic_model: bool = analytic_model
+		self.analytic_slack: float = analytic_slack
+		self.analytic_seed: dict | None = None
+		self.analytic_seed_loss: float | None = None
+		self.analytic_seed_position: List[float] | None = None
+		# Narrow parameter ranges to closed-form estimates from the ground truth (see ParameterEstimator.py),
+		# and start from the estimated point
+		self.estimate_parameters: bool = estimate_parameters
+		self.parameter_estimates: dict | None = None
+		self.estimated_start: dict | None = None
+		self.estimated_start_position: List[float] | None = None
+		self.estimated_start_loss: float | None = None
+		# Refine a previous calibration: search within start_radius (a fraction of each parameter's range)
+		# of its values, and keep it if no candidate beats it
+		self.start_calibration = start_calibration
+		self.start_values = None if start_calibration is None else named_values(simulator, start_calibration)
+		self.start_radius: float = 0.25
+		self.start_loss: float | None = None
+		# Loss with all repeat trials minus the loss the calibrator saw, when it didn't see all of them
+		self.approximation_error: float | None = None
 		self.gradientDescentStep=0.001
 		self.gradientDescentFlat=0.01
 
+	def parameter_specs(self) -> List[ParameterSpec]:
+		# Parameters of the simulator's schemes, except those fixed in the simulator (see SensitivityAnalysis.py),
+		# with ranges narrowed to the estimates if any
+		fixed_parameters = self.simulator.get_fixed_parameters()
+		parameter_specs = [p for p in calibration_parameters(self.simulator) if p.name not in fixed_parameters]
+		if self.parameter_estimates is not None:
+			parameter_specs = ParameterEstimator.narrowed_parameters(parameter_specs, self.parameter_estimates)
+		if self.start_calibration is not None:
+			parameter_specs = [p.around(p.position_of(self.start_value(p)), self.start_radius)
+							   if p.name in self.start_values else p for p in parameter_specs]
+		return parameter_specs
+
+	def start_value(self, parameter_spec: ParameterSpec) -> float:
+		# The start calibration's value for a parameter, in the parameter's units
+		return AnalyticModel.parse_quantity(self.start_values[parameter_spec.name]) / \
+			AnalyticModel.parse_quantity(parameter_spec.formatted(1))
+
+	def estimate_parameter_ranges(self):
+		workflows = [workflow for group in RepeatTrials.reduce_repeats(self.workflows, self.repeat_mode)
+					 for workflow in group]
+		reference_flops = AnalyticModel.parse_quantity(Simulator.template_json_input["workflow"]["reference_flops"])
+		self.parameter_estimates = ParameterEstimator.estimate(workflows, reference_flops)
+		for parameter_spec in self.parameter_specs():
+			sys.stderr.write(f"  Estimated range of {parameter_spec.name}: [{parameter_spec.low:.4g}, "
+							 f"{parameter_spec.high:.4g}]\n")
+
+	def seed_estimated_start(self, evaluator: CalibrationLossEvaluator):
+		# simcal's calibrators don't take a start point: simulate the estimated point first instead, so that
+		# it's the incumbent that analytic pruning starts from
+		parameter_specs = self.parameter_specs()
+		position = [ParameterEstimator.start_position(p, self.parameter_estimates) for p in parameter_specs]
+		self.estimated_start_position = position
+		self.estimated_start = calibration_input(self.simulator, parameter_specs, position)
+		self.estimated_start_loss = evaluator(self.estimated_start)
+
+	def seed_analytic_incumbent(self, evaluator: CalibrationLossEvaluator):
+		# Simulate the calibration whose analytic makespans best match the ground truth: its loss is
+		# the first incumbent that candidates are pruned against
+		parameter_specs = self.parameter_specs()
+		base_json_input = calibration_input(self.simulator, [], [])
+		workflows = [workflow for group in evaluator.ground_truth for workflow in group]
+		position = AnalyticModel.analytic_optimum(workflows, base_json_input, parameter_specs,
+												  getattr(self.loss, "method", max))
+		self.analytic_seed_position = list(position)
+		self.analytic_seed = calibration_input(self.simulator, parameter_specs, position)
+		self.analytic_seed_loss = evaluator(self.analytic_seed)
+		evaluator.enable_analytic_pruning(min(self.analytic_seed_loss, evaluator.incumbent), self.analytic_slack)
+
+	def parallel_gradient_descent(self, evaluator: CalibrationLossEvaluator, time_limit: float,
+								  num_threads: int) -> tuple[dict, float]:
+		# simcal's GradientDescent evaluates one point at a time: this one evaluates the finite differences
+		# and line search steps concurrently (see ParallelGradient.py), from the best seeded point if any
+		parameter_specs = self.parameter_specs()
+		seeds = [(loss, position) for loss, position in
+				 [(self.estimated_start_loss, self.estimated_start_position),
+				  (self.analytic_seed_loss, self.analytic_seed_position)] if position is not None]
+		start = min(seeds, key=lambda seed: seed[0])[1] if seeds else None
+		engine = ParallelGradient.ParallelGradientDescent(num_threads)
+		position, loss = engine.calibrate(
+			lambda point: evaluator(calibration_input(self.simulator, parameter_specs, point)),
+			len(parameter_specs), time_limit, start)
+		return calibration_input(self.simulator, parameter_specs, position), loss
+
 	def compute_calibration(self, time_limit: float, num_threads: int):
 
 		if self.algorithm == "grid":
@@ -57,6 +407,8 @@ class WorkflowSimulatorCalibrator:
 			calibrator = sc.calibrators.Random()
 		elif self.algorithm == "gradient":
 			calibrator = sc.calibrators.GradientDescent(self.gradientDescentStep, self.gradientDescentFlat)
+		elif self.algorithm == "gradient.parallel":
+			calibrator = None
 		elif self.algorithm == "skopt.gp":
 			calibrator = sc.calibrators.ScikitOptimizer(1000,"GP",0)
 		elif self.algorithm == "skopt.et":
@@ -68,147 +420,60 @@ class WorkflowSimulatorCalibrator:
 		else:
 			raise Exception(f"Unknown calibration algorithm {self.algorithm}")
 
-		# COMPUTE SERVICE SCHEME
-		if self.simulator.compute_service_scheme == "all_bare_metal":
-			calibrator.add_param("compute_hosts_speed", sc.parameters.Exponential(20, 40).
-								 format("%lff").set_custom_data(["compute_service_scheme_parameters",
-																 "all_bare_metal",
-																 "compute_hosts",
-																 "speed"]))
-
-			calibrator.add_param("thread_startup_overhead", sc.parameters.Linear(0, 20).
-								 format("%lfs").set_custom_data(["compute_service_scheme_parameters",
-																 "all_bare_metal",
-																 "properties",
-																 "BareMetalComputeServiceProperty::THREAD_STARTUP_OVERHEAD"]))
-
-		elif self.simulator.compute_service_scheme == "htcondor_bare_metal":
-			calibrator.add_param("compute_hosts_speed", sc.parameters.Exponential(20, 40).
-								 format("%lff").set_custom_data(["compute_service_scheme_parameters",
-																 "htcondor_bare_metal",
-																 "compute_hosts",
-																 "speed"]))
-
-			calibrator.add_param("thread_startup_overhead", sc.parameters.Linear(0, 20).
-								 format("%lfs").set_custom_data(["compute_service_scheme_parameters",
-																 "htcondor_bare_metal",
-																 "bare_metal_properties",
-																 "BareMetalComputeServiceProperty::THREAD_STARTUP_OVERHEAD"]))
-
-			calibrator.add_param("htcondor_negotiator_overhead", sc.parameters.Linear(0, 20).
-								 format("%lfs").set_custom_data(["compute_service_scheme_parameters",
-																 "htcondor_bare_metal",
-																 "htcondor_properties",
-																 "HTCondorComputeServiceProperty::NEGOTIATOR_OVERHEAD"]))
-
-			calibrator.add_param("htcondor_pre_execution_delay", sc.parameters.Linear(0, 20).
-								 format("%lfs").set_custom_data(["compute_service_scheme_parameters",
-																 "htcondor_bare_metal",
-																 "htcondor_properties",
-																 "HTCondorComputeServiceProperty::GRID_PRE_EXECUTION_DELAY"]))
-
-			calibrator.add_param("htcondor_post_execution_delay", sc.parameters.Linear(0, 20).
-								 format("%lfs").set_custom_data(["compute_service_scheme_parameters",
-																 "htcondor_bare_metal",
-																 "htcondor_properties",
-																 "HTCondorComputeServiceProperty::GRID_POST_EXECUTION_DELAY"]))
+		self.parameter_estimates = None
+		self.estimated_start_position = None
+		self.analytic_seed_position = None
+		if self.estimate_parameters:
+			self.estimate_parameter_ranges()
+		if calibrator is not None:
+			for parameter_spec in self.parameter_specs():
+				calibrator.add_param(parameter_spec.name, parameter_spec.make())
 
-		else:
-			raise Exception(f"Compute service scheme '{self.simulator.compute_service_scheme}' not implemented yet")
-
-		# STORAGE SERVICE SCHEME
-		if self.simulator.storage_service_scheme == "submit_only":
-			calibrator.add_param("disk_read_bw", sc.parameters.Exponential(10, 40).
-								 format("%lfbps").set_custom_data(["storage_service_scheme_parameters",
-																   "submit_only",
-																   "bandwidth_submit_disk_read"]))
-			calibrator.add_param("disk_write_bw", sc.parameters.Exponential(10, 40).
-								 format("%lfbps").set_custom_data(["storage_service_scheme_parameters",
-																   "submit_only",
-																   "bandwidth_submit_disk_write"]))
-			calibrator.add_param("max_num_data_connections", sc.parameters.Linear(1, 100).
-								 format("%d").set_custom_data(["storage_service_scheme_parameters",
-															   "submit_only",
-															   "submit_properties",
-															   "SimpleStorageServiceProperty::MAX_NUM_CONCURRENT_DATA_CONNECTIONS"]))
-
-		elif self.simulator.storage_service_scheme == "submit_and_compute_hosts":
-			calibrator.add_param("submit_disk_read_bw", sc.parameters.Exponential(20, 40).
-								 format("%lfbps").set_custom_data(["storage_service_scheme_parameters",
-																   "submit_and_compute_hosts",
-																   "bandwidth_submit_disk_read"]))
-			calibrator.add_param("submit_disk_write_bw", sc.parameters.Exponential(20, 40).
-								 format("%lfbps").set_custom_data(["storage_service_scheme_parameters",
-																   "submit_and_compute_hosts",
-																   "bandwidth_submit_disk_write"]))
-			calibrator.add_param("submit_max_num_data_connections", sc.parameters.Linear(1, 100).
-								 format("%d").set_custom_data(["storage_service_scheme_parameters",
-															   "submit_and_compute_hosts",
-															   "submit_properties",
-															   "SimpleStorageServiceProperty::MAX_NUM_CONCURRENT_DATA_CONNECTIONS"]))
-
-			calibrator.add_param("compute_host_disk_read_bw", sc.parameters.Exponential(20, 40).
-								 format("%lfbps").set_custom_data(["storage_service_scheme_parameters",
-																   "submit_and_compute_hosts",
-																   "bandwidth_compute_host_disk_read"]))
-			calibrator.add_param("compute_host_disk_write_bw", sc.parameters.Exponential(20, 40).
-								 format("%lfbps").set_custom_data(["storage_service_scheme_parameters",
-																   "submit_and_compute_hosts",
-																   "bandwidth_compute_host_write"]))
-			calibrator.add_param("compute_host_max_num_data_connections", sc.parameters.Linear(1, 100).
-								 format("%d").set_custom_data(["storage_service_scheme_parameters",
-															   "submit_and_compute_hosts",
-															   "compute_host_properties",
-															   "SimpleStorageServiceProperty::MAX_NUM_CONCURRENT_DATA_CONNECTIONS"]))
-		else:
-			raise Exception(f"Storage service scheme '{self.simulator.storage_service_scheme}' not implemented yet")
-
-		# NETWORK TOPOLOGY SCHEME
-		if self.simulator.network_topology_scheme == "one_link":
-			calibrator.add_param("link_bw", sc.parameters.Exponential(10, 40).
-								 format("%lfbps").set_custom_data(["network_topology_scheme_parameters",
-																   "one_link",
-																   "bandwidth"]))
-			calibrator.add_param("link_lat", sc.parameters.Linear(0, 0.01).
-								 format("%lfs").set_custom_data(["network_topology_scheme_parameters",
-																 "one_link",
-																 "latency"]))
-
-		elif self.simulator.network_topology_scheme == "many_links":
-			calibrator.add_param("link_bw", sc.parameters.Exponential(10, 40).
-								 format("%lfbps").set_custom_data(["network_topology_scheme_parameters",
-																   "many_links",
-																   "bandwidth_submit_to_compute_host"]))
-			calibrator.add_param("link_lat", sc.parameters.Linear(0, 0.01).
-								 format("%lfs").set_custom_data(["network_topology_scheme_parameters",
-																 "many_links",
-																 "latency_submit_to_compute_host"]))
-
-		elif self.simulator.network_topology_scheme == "one_and_then_many_links":
-			calibrator.add_param("first_link_bw", sc.parameters.Exponential(10, 40).
-								 format("%lfbps").set_custom_data(["network_topology_scheme_parameters",
-																   "one_and_then_many_links",
-																   "bandwidth_out_of_submit"]))
-			calibrator.add_param("first_link_lat", sc.parameters.Linear(0, 0.01).
-								 format("%lfs").set_custom_data(["network_topology_scheme_parameters",
-																 "one_and_then_many_links",
-																 "latency_out_of_submit"]))
-			calibrator.add_param("second_link_bw", sc.parameters.Exponential(10, 40).
-								 format("%lfbps").set_custom_data(["network_topology_scheme_parameters",
-																   "one_and_then_many_links",
-																   "bandwidth_to_compute_hosts"]))
-			calibrator.add_param("second_link_lat", sc.parameters.Linear(0, 0.01).
-								 format("%lfs").set_custom_data(["network_topology_scheme_parameters",
-																 "one_and_then_many_links",
-																 "latency_submit_to_compute_host"]))
+		coordinator = sc.coordinators.ThreadPool(pool_size=num_threads)
+
+		# With several threads, the calibrations they evaluate concurrently are simulated in batches
+		# (unless simulations run in-process, where there's no simulator invocation to save)
+		batcher = None
+		if num_threads > 1 and not self.simulator.uses_in_process():
+			batcher = Simulator.SimulationBatcher(self.simulator, num_threads)
+		evaluator = CalibrationLossEvaluator(self.simulator, self.workflows, self.loss, batcher, self.repeat_mode)
+		if self.start_calibration is not None:
+			self.start_loss = evaluator(self.start_calibration)
+		if self.estimate_parameters:
+			self.seed_estimated_start(evaluator)
+		if self.analytic_model:
+			self.seed_analytic_incumbent(evaluator)
 
+		if calibrator is None:
+			calibration, loss = self.parallel_gradient_descent(evaluator, time_limit, num_threads)
 		else:
-			raise Exception(f"Network topology scheme '{self.simulator.network_topology_scheme}' not implemented yet")
+			calibration, loss = calibrator.calibrate(evaluator, timelimit=time_limit, coordinator=coordinator)
 
-		coordinator = sc.coordinators.ThreadPool(pool_size=num_threads)
+		if self.start_calibration is not None:
+			sys.stderr.write(f"  Start calibration loss: {self.start_loss}, calibrated loss: {loss}\n")
+		# The start calibration and seeds are simulated before the calibrator runs: keep the best of them if
+		# the calibrator didn't beat it
+		if evaluator.best_calibration is not None and (calibration is None or evaluator.best_loss <= loss):
+			calibration, loss = evaluator.best_calibration, evaluator.best_loss
+		elif evaluator.best_calibration is None:
+			# No candidate was successfully simulated: the calibrator's best is a failed (or pruned) one
+			calibration, loss = None, None
+		if evaluator.num_failed:
+			sys.stderr.write(f"  {evaluator.num_failed}/{evaluator.num_evaluations} candidates failed to simulate\n")
+
+		if self.estimate_parameters:
+			sys.stderr.write(f"  Estimated start loss: {self.estimated_start_loss}, calibrated loss: {loss}\n")
 
-		evaluator = CalibrationLossEvaluator(self.simulator, self.workflows, self.loss)
+		if self.analytic_model:
+			sys.stderr.write(f"  Analytic model: {evaluator.num_pruned}/{evaluator.num_evaluations} candidates "
+							 f"pruned, analytic optimum loss: {self.analytic_seed_loss}, calibrated loss: {loss}\n")
 
-		calibration, loss = calibrator.calibrate(evaluator, timelimit=time_limit, coordinator=coordinator)
+		if self.repeat_mode != "all" and calibration is not None:
+			# Report (and return) the loss over all trials, so that it compares with that of other modes
+			full_loss = CalibrationLossEvaluator(self.simulator, self.workflows, self.loss)(calibration)
+			self.approximation_error = full_loss - loss
+			sys.stderr.write(f"  Loss with repeat mode '{self.repeat_mode}': {loss}, with all trials: {full_loss} "
+							 f"(approximation error: {self.approximation_error:+})\n")
+			loss = full_loss
 
 		return calibration, loss
@@ -1,4 +1,8 @@
+import hashlib
+import os
+
 from single_workflow_heatmap import *
+import heatmapdata
 
 data={
 	'single_workflow':{
@@ -10,7 +14,7 @@ data={
 		7200:"../../../koa-rsync/workflow/single-workflow-fast/pickles7200/*-koa.pickled",
 		18000:"../../../koa-rsync/workflow/single-workflow-fast/pickles18000/*-koa.pickled",
 		86400:"../../../koa-rsync/workflow/single-workflow/pickles/*-koa.pickled"
-	},	
+	},
 	'single_sample':{
 		60:"../../../koa-rsync/workflow/single-sample-fast/pickles60/*-koa.pickled",
 		300:"../../../koa-rsync/workflow/single-sample-fast/pickles300/*-koa.pickled",
@@ -33,7 +37,7 @@ data47={
 		7200:"../../../koa-rsync/workflow/single-workflow-fast/pickles7200/*47-koa.pickled",
 		18000:"../../../koa-rsync/workflow/single-workflow-fast/pickles18000/*47-koa.pickled",
 		86400:"../../../koa-rsync/workflow/single-workflow/pickles/*47-koa.pickled"
-	},	
+	},
 	'single_sample':{
 		60:"../../../koa-rsync/workflow/single-sample-fast/pickles60/*47-koa.pickled",
 		300:"../../../koa-rsync/workflow/single-sample-fast/pickles300/*47-koa.pickled",
@@ -45,31 +49,51 @@ data47={
 		86400:"../../../koa-rsync/workflow/single-sample/pickles/*47-koa.pickled"
 	}
 }
-for sub in data:
-	for key in data[sub]:
-		each=data[sub][key]
-		#print(each)
-		pickle_files=glob(each)
-		datat=load_and_group_pickles(pickle_files)
-		dv={}
-		for group in datat.values():
-				a,b=process_experiment_group(group)
-				dv[a]=b
-		data[sub][key]=dv
-	
-for sub in data47:
-	for key in data47[sub]:
-		each=data47[sub][key]
-		#print(each)
-		pickle_files=glob(each)
-		datat=load_and_group_pickles(pickle_files)
-		dv={}
-		for group in datat.values():
-				a,b=process_experiment_group(group)
-				dv[a]=b
-		data47[sub][key]=dv
 
-print("data=")
-print(data)
-print("data47=")
-print(data47)
\ No newline at end of file
+
+def fingerprint(pickle_files):
+	# Any added, removed, or rewritten pickle changes the fingerprint of its time limit bucket
+	h = hashlib.md5()
+	for pickle_file in sorted(pickle_files):
+		stat = os.stat(pickle_file)
+		h.update(f"{os.path.abspath(pickle_file)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+	return h.hexdigest()
+
+
+def build_bucket(pickle_files, db_path):
+	datat=load_and_group_pickles(pickle_files, db_path)
+	dv={}
+	for group in datat.values():
+			a,b=process_experiment_group(group)
+			dv[a]=b
+	return dv
+
+
+def main():
+	parser = argparse.ArgumentParser(prog=sys.argv[0], description='Rebuild the heatmap data of changed pickles')
+	parser.add_argument('-db', '--database', type=str, required=True,
+						help='Path to the SQLite results database (created if needed, see ResultsDatabase.py)')
+	args = vars(parser.parse_args())
+	artifact = heatmapdata.read_artifact()
+	datasets = artifact["datasets"]
+	fingerprints = artifact["fingerprints"]
+	rebuilt = 0
+	for name, sources in [("data", data), ("data47", data47)]:
+		dataset = datasets.setdefault(name, {})
+		for sub in sources:
+			for key in sources[sub]:
+				pickle_files=glob(sources[sub][key])
+				bucket = f"{name}/{sub}/{key}"
+				current = fingerprint(pickle_files)
+				if fingerprints.get(bucket) == current and key in dataset.get(sub, {}):
+					continue
+				sys.stderr.write(f"Rebuilding {bucket} from {len(pickle_files)} pickled files...\n")
+				dataset.setdefault(sub, {})[key] = build_bucket(pickle_files, args["database"])
+				fingerprints[bucket] = current
+				rebuilt += 1
+	heatmapdata.write_artifact(artifact)
+	sys.stderr.write(f"Rebuilt {rebuilt} time limit buckets, wrote {heatmapdata.DATA_FILE}\n")
+
+
+if __name__ == "__main__":
+	main()
@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 
-import pickle
 import json
 import argparse
 
-import pickle
-import json
 import os
 import re
+
+from Util import load_experiment_set_header
+
 _units={None:1,"":1,
 "s":1,"ms":0.001,"us":0.000001,"ns":0.000000001,
 "f":1,"Kf":1_000, "Mf":1_000_000,"Gf":1_000_000_000,
@@ -47,19 +47,18 @@ def shrink(param):
 	else:
 		return f"{round(value,2)}{result[1]}"
 def calibration_from_pickle(pickle_path,human):
-	# Load data from the pickle file
-	with open(pickle_path, 'rb') as f:
-		data = pickle.load(f)
+	# Load the header of the pickle file (calibration values are already strings there)
+	data = load_experiment_set_header(pickle_path)
 	
 	# Convert the data to JSON-compatible format
 	json_data = []
-	for exp in data.experiments:
-		calibration=exp.calibration
+	for exp in data["experiments"]:
+		calibration=exp["calibration"]
 		if human:
 			for key in calibration:
 				calibration[key]=shrink(calibration[key])
 		json_data.append(calibration)
-	if len(data.experiments)==1:
+	if len(data["experiments"])==1:
 		json_data=json_data[0]
 	return json_data
 
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Evaluates many calibrations on every workflow of a set, into a dense matrix of per-workflow errors
+(one row per distinct calibration, one column per workflow). Calibrations come from pickled results
+(every experiment's calibration, with the result's simulator schemes) or from JSON files (complete
+simulator inputs, as just_eval.py takes them). Identical calibrations (same complete simulator input)
+are evaluated once. Each workflow is simulated for batches of calibrations with one simulator
+invocation (see Simulator.run_batch), on a pool of threads.
+
+Completed cells are appended to <output>.cells.jsonl as they come, so that an interrupted run resumes
+where it stopped. The matrix is written to <output>.npy, and its rows (calibration keys, with the
+labels of all the calibrations that share them) and columns (workflows) to <output>.json.
+"""
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from Util import *
+
+
+def load_calibrations(paths: List[str]) -> List[tuple[str, Simulator, dict]]:
+	# (label, simulator, calibration) for each calibration of the pickled results and JSON files
+	calibrations = []
+	for path in paths:
+		if path.endswith(".json"):
+			json_input = load_json(path)
+			simulator = Simulator(json_input["compute_service_scheme"],
+								  json_input["storage_service_scheme"],
+								  json_input["network_topology_scheme"])
+			calibrations.append((path, simulator, json_input))
+			continue
+		with open(path, 'rb') as f:
+			experiment_set = pickle.load(f)
+		for i, xp in enumerate(experiment_set.experiments):
+			if xp.calibration is not None:
+				calibrations.append((f"{path}#{i}", experiment_set.simulator, xp.calibration))
+	return calibrations
+
+
+def calibration_key(simulator: Simulator, calibration: dict) -> str:
+	return SimulationResultStore.key(simulator.make_json_input("", calibration))
+
+
+class EvaluationMatrix:
+	def __init__(self, calibrations: List[tuple[str, Simulator, dict]], workflows: List[str], loss_function: str,
+				 output: str):
+		self.workflows = workflows
+		self.loss = get_loss_function(loss_function, "average_error")
+		self.output_options = {"output_level": "tasks" if self.loss.needs_task_data else "makespan"}
+		if self.loss.error_computation_scheme:
+			self.output_options["error_computation_scheme"] = self.loss.error_computation_scheme
+		self.output = output
+
+		# Distinct calibrations, in order of first appearance
+		self.keys: List[str] = []
+		self.labels: dict[str, List[str]] = {}
+		self.calibrations: dict[str, tuple[Simulator, dict]] = {}
+		for label, simulator, calibration in calibrations:
+			key = calibration_key(simulator, calibration)
+			if key not in self.calibrations:
+				self.keys.append(key)
+				self.labels[key] = []
+				self.calibrations[key] = (simulator, calibration)
+			self.labels[key].append(label)
+
+		self.matrix = np.full((len(self.keys), len(workflows)), np.nan)
+		self.row = {key: i for i, key in enumerate(self.keys)}
+		self.column = {workflow: j for j, workflow in enumerate(workflows)}
+		self.lock = threading.Lock()
+		self.resume()
+
+	def cells_file_name(self) -> str:
+		return self.output + ".cells.jsonl"
+
+	def resume(self) -> int:
+		# Cells of an earlier run (of any set of calibrations and workflows) that are in this matrix
+		if not os.path.isfile(self.cells_file_name()):
+			return 0
+		num_resumed = 0
+		with open(self.cells_file_name()) as f:
+			for line in f:
+				try:
+					cell = json.loads(line)
+				except ValueError:
+					# Truncated last line of an interrupted run
+					continue
+				if cell["key"] in self.row and cell["workflow"] in self.column:
+					self.matrix[self.row[cell["key"]], self.column[cell["workflow"]]] = cell["error"]
+					num_resumed += 1
+		return num_resumed
+
+	def pending_batches(self, batch_size: int) -> List[tuple[str, Simulator, List[str]]]:
+		# (workflow, simulator, calibration keys): calibrations whose JSON inputs the same simulator makes
+		batches = []
+		for workflow, j in self.column.items():
+			by_simulator = {}
+			for key in self.keys:
+				if np.isnan(self.matrix[self.row[key], j]):
+					simulator, _ = self.calibrations[key]
+					simulator_key = (simulator.compute_service_scheme, simulator.storage_service_scheme,
+									 simulator.network_topology_scheme,
+									 json.dumps(simulator.get_fixed_parameters(), sort_keys=True))
+					by_simulator.setdefault(simulator_key, (simulator, []))[1].append(key)
+			for simulator, keys in by_simulator.values():
+				for start in range(0, len(keys), batch_size):
+					batches.append((workflow, simulator, keys[start:start + batch_size]))
+		return batches
+
+	def evaluate_batch(self, workflow: str, simulator: Simulator, keys: List[str]):
+		with sc.Environment() as env:
+			outputs = simulator.run_batch(env, workflow, [self.calibrations[key][1] for key in keys],
+										  self.output_options)
+		cells = []
+		for key, output in zip(keys, outputs):
+			error = self.loss.workflow_loss(json.loads(output)) if output else float('inf')
+			cells.append({"key": key, "workflow": workflow, "error": error})
+		with self.lock:
+			with open(self.cells_file_name(), "a") as f:
+				for cell in cells:
+					self.matrix[self.row[cell["key"]], self.column[workflow]] = cell["error"]
+					f.write(json.dumps(cell) + "\n")
+
+	def run(self, num_threads: int, batch_size: int):
+		batches = self.pending_batches(batch_size)
+		sys.stderr.write(f"{len(self.keys)} distinct calibrations x {len(self.workflows)} workflows, "
+						 f"{int(np.isnan(self.matrix).sum())} cells to evaluate in {len(batches)} batches\n")
+		with ThreadPoolExecutor(max_workers=num_threads) as pool:
+			futures = [pool.submit(self.evaluate_batch, *batch) for batch in batches]
+			for count, future in enumerate(futures, start=1):
+				future.result()
+				if count % 100 == 0:
+					sys.stderr.write(f"  {count}/{len(batches)} batches done\n")
+		self.save()
+
+	def save(self):
+		np.save(self.output + ".npy", self.matrix)
+		with open(self.output + ".json", "w") as f:
+			json.dump({"rows": [{"key": key, "labels": self.labels[key]} for key in self.keys],
+					   "columns": self.workflows}, f, indent=1)
+
+
+def main():
+	parser = argparse.ArgumentParser(
+		prog=sys.argv[0],
+		description='Evaluate many calibrations on every workflow of a set')
+	parser.add_argument('-c', '--calibrations', required=True, type=str, nargs="+",
+						help='Pickled results and/or JSON simulator inputs (or glob patterns)')
+	parser.add_argument('-ws', '--workflows', required=True, type=str, nargs="+",
+						help='The list of json files (or glob patterns) to evaluate on')
+	parser.add_argument('-lf', '--loss_function', type=str,
+						choices=['makespan', 'average_runtimes', 'max_runtimes'], default="makespan",
+						help='The per-workflow error')
+	parser.add_argument('-th', '--num_threads', type=int, default=os.cpu_count(),
+						help='Number of batches simulated concurrently')
+	parser.add_argument('-bs', '--batch_size', type=int, default=32,
+						help='Maximum number of calibrations simulated per simulator invocation')
+	parser.add_argument('-o', '--output', type=str, required=True,
+						help='Output prefix (.npy matrix, .json rows/columns, .cells.jsonl checkpoint)')
+	args = parser.parse_args()
+
+	calibration_files = []
+	for pattern in args.calibrations:
+		calibration_files += sorted(glob(pattern)) if '*' in pattern else [pattern]
+	# E.g., the rows/columns file of a previous run, with a pattern like *.json
+	calibration_files = [f for f in calibration_files if os.path.abspath(f) != os.path.abspath(args.output + ".json")]
+	workflows = []
+	for pattern in args.workflows:
+		workflows += sorted(glob(pattern) or packed_workflows(pattern)) if '*' in pattern else [pattern]
+
+	matrix = EvaluationMatrix(load_calibrations(calibration_files), [os.path.abspath(w) for w in workflows],
+							  args.loss_function, args.output)
+	matrix.run(args.num_threads, args.batch_size)
+	sys.stderr.write(f"Matrix written to {args.output}.npy\n")
+
+
+if __name__ == "__main__":
+	main()
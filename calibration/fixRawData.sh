@@ -1,5 +1,3 @@
 rm $1/._*
-git clone https://github.com/wfcommons/WfFormat.git
-python WfFormat/tools/wfcommons-migrate-instance.py $1
-find $1/ -type f -exec sed -i 's/"coreCount": 0$/"coreCount": 1/g' {} \;
-find $1/ -type f -exec sed -i 's/"coreCount": 0,/"coreCount": 1/g' {} \;
+# Schema migration and coreCount fixups, in parallel (see normalize_workflows.py)
+python "$(dirname "$0")"/normalize_workflows.py $1
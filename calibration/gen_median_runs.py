@@ -45,9 +45,8 @@ def parse_command_line_arguments(program_name: str):
 def get_makespan(json_file):
     """Extract the 'makespan' value from the given JSON file."""
     try:
-        with open(json_file, 'r') as f:
-            data = json.load(f)
-            return float(data["workflow"]["execution"]["makespanInSeconds"])
+        data = load_json(json_file)
+        return float(data["workflow"]["execution"]["makespanInSeconds"])
     except (json.JSONDecodeError, KeyError):
         sys.stderr.write(f"Error: Could not read or find 'makespan' in {json_file}\n")
         return None
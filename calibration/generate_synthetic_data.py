@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import argparse
+import tempfile
 import time
 from glob import glob
 from datetime import timedelta
 from Util import *
+from Simulator import TASK_OUTPUT_DIR, read_task_output
 from itertools import groupby
 
 import json
@@ -50,18 +52,26 @@ def main():
 	
 	
 	sim_args=json.loads(args["simulator_args"])
-	cmdargs = ["--wrench-commport-pool-size=10000",f"{args["simulator_args"]}"]
-	std_out, std_err, exit_code = sc.bash("workflow-simulator-for-calibration", cmdargs, std_in=None)
-	if std_err:
-		print(std_err)
-	
-	result=json.loads(std_out)
+	# Task durations come back as arrays, in the order of the tasks in the workflow file
+	fd, task_output_file = tempfile.mkstemp(dir=TASK_OUTPUT_DIR, suffix=".tasks")
+	os.close(fd)
+	sim_args["output_level"]="binary"
+	sim_args["task_output_file"]=task_output_file
+	cmdargs = ["--wrench-commport-pool-size=10000",json.dumps(sim_args)]
+	try:
+		std_out, std_err, exit_code = sc.bash("workflow-simulator-for-calibration", cmdargs, std_in=None)
+		if std_err:
+			print(std_err)
+
+		result=json.loads(std_out)
+		real_durations, simulated_durations = read_task_output(task_output_file, result["num_tasks"])
+	finally:
+		os.unlink(task_output_file)
 	with open(sim_args["workflow"]["file"], 'r') as source_json:
 		data = json.load(source_json)
 		data["workflow"]["execution"]["makespanInSeconds"]=result["simulated_makespan"]
-		for task in range(len(data["workflow"]["execution"]["tasks"])):
-
-			data["workflow"]["execution"]["tasks"][task]["syntheticRuntimeInSeconds"]=result["tasks"][data["workflow"]["execution"]["tasks"][task]["id"]]["simulated_duration"]
+		for task, simulated_duration in zip(data["workflow"]["execution"]["tasks"], simulated_durations):
+			task["syntheticRuntimeInSeconds"]=float(simulated_duration)
 	with open(args["output"], 'w') as output_json:
 		json.dump(data, output_json, indent=4)
 
@@ -1,580 +1,45 @@
-data={
-	'single_workflow':{
-		60:{
-			'epigenomics':{
-				1: {129: {'training_loss': 1.5267673083290276, 'evaluation_losses': [3.6391918465132873], 'machine_time': 414502.0}, 64: {'training_loss': 1.5250068582998655, 'evaluation_losses': [3.6391918465132873], 'machine_time': 200270.0}, 86: {'training_loss': 1.52678620608825, 'evaluation_losses': [3.6391918465132873], 'machine_time': 303904.0}, 43: {'training_loss': 1.4849134012661305, 'evaluation_losses': [3.6391918465132873], 'machine_time': 99610.0}}, 2: {43: {'training_loss': 1.4736606548095819, 'evaluation_losses': [3.6391918465132873], 'machine_time': 249274.0}, 86: {'training_loss': 1.5201939507406144, 'evaluation_losses': [3.6391918465132873], 'machine_time': 754654.0}, 64: {'training_loss': 1.5071599369228847, 'evaluation_losses': [3.6391918465132873], 'machine_time': 501377.0}}, 6: {43: {'training_loss': 1.3435306515803378, 'evaluation_losses': [3.6391918465132873], 'machine_time': 930821.0}}, 4: {43: {'training_loss': 1.4732850591923703, 'evaluation_losses': [3.6391918465132873], 'machine_time': 498179.0}, 64: {'training_loss': 1.4973536816187927, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1004117.0}}
-			},
-		},
-		300:{
-			'seismology':{
-				4: {154: {'training_loss': 2.281628738690002, 'evaluation_losses': [9.052505573689901], 'machine_time': 443578.0}, 103: {'training_loss': 2.303029225817966, 'evaluation_losses': [9.052505573689901], 'machine_time': 207265.0}, 206: {'training_loss': 4.99563062551747, 'evaluation_losses': [9.052505573689901], 'machine_time': 825996.0}}, 2: {154: {'training_loss': 2.008168290713861, 'evaluation_losses': [9.052505573689901], 'machine_time': 259263.0}, 206: {'training_loss': 4.459854380395284, 'evaluation_losses': [9.052505573689901], 'machine_time': 488291.0}, 103: {'training_loss': 2.029545793324182, 'evaluation_losses': [9.052505573689901], 'machine_time': 120125.0}}, 1: {103: {'training_loss': 1.1301308553804883, 'evaluation_losses': [6.597169775837247], 'machine_time': 54416.0}, 309: {'training_loss': 4.459584982443911, 'evaluation_losses': [9.052505573689901], 'machine_time': 383970.0}, 206: {'training_loss': 3.8689849972948, 'evaluation_losses': [9.052505573689901], 'machine_time': 235076.0}, 154: {'training_loss': 1.7704543845603071, 'evaluation_losses': [9.052505573689901], 'machine_time': 122028.0}, 515: {'training_loss': 4.384855592517674, 'evaluation_losses': [9.052505573689901], 'machine_time': 612920.0}}, 6: {103: {'training_loss': 2.3325438514062284, 'evaluation_losses': [9.052505573689901], 'machine_time': 339061.0}}
-			},
-			'epigenomics':{
-				4: {86: {'training_loss': 1.5122606490878956, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1508019.0}, 43: {'training_loss': 0.7675842233000031, 'evaluation_losses': [2.903491817711163], 'machine_time': 498179.0}, 129: {'training_loss': 1.5230822588661228, 'evaluation_losses': [3.6391918465132873], 'machine_time': 2015144.0}, 64: {'training_loss': 1.4973536816187927, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1004117.0}}, 2: {43: {'training_loss': 0.768655894886797, 'evaluation_losses': [2.903491817711163], 'machine_time': 249274.0}, 86: {'training_loss': 1.5201939507406144, 'evaluation_losses': [3.6391918465132873], 'machine_time': 754654.0}, 64: {'training_loss': 1.5071599369228847, 'evaluation_losses': [3.6391918465132873], 'machine_time': 501377.0}, 129: {'training_loss': 1.5292889320469563, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1014544.0}}, 1: {215: {'training_loss': 2.200478221304042, 'evaluation_losses': [3.6391918465132873], 'machine_time': 601092.0}, 86: {'training_loss': 1.52678620608825, 'evaluation_losses': [3.6391918465132873], 'machine_time': 303904.0}, 129: {'training_loss': 1.5267673083290276, 'evaluation_losses': [3.6391918465132873], 'machine_time': 414502.0}, 64: {'training_loss': 0.8112793975317494, 'evaluation_losses': [2.903491817711163], 'machine_time': 200270.0}, 43: {'training_loss': 0.7777157947702122, 'evaluation_losses': [2.903491817711163], 'machine_time': 99610.0}}, 6: {43: {'training_loss': 1.3435306515803378, 'evaluation_losses': [3.6391918465132873], 'machine_time': 930821.0}}
-			},
-			'montage':{
-				2: {90: {'training_loss': 2.9141979554254664, 'evaluation_losses': [7.201887014949963], 'machine_time': 365324.0}, 60: {'training_loss': 1.658825142412081, 'evaluation_losses': [5.414774446144072], 'machine_time': 184830.0}, 180: {'training_loss': 2.9762947983164287, 'evaluation_losses': [7.201887014949963], 'machine_time': 763428.0}, 120: {'training_loss': 3.007377247826633, 'evaluation_losses': [7.201887014949963], 'machine_time': 548921.0}}, 4: {90: {'training_loss': 2.6049725654264524, 'evaluation_losses': [7.201887014949963], 'machine_time': 795329.0}, 180: {'training_loss': 2.7255105838133415, 'evaluation_losses': [7.201887014949963], 'machine_time': 1603583.0}, 120: {'training_loss': 2.7227226392167005, 'evaluation_losses': [7.1994842596706174], 'machine_time': 1180806.0}, 60: {'training_loss': 2.451558023003019, 'evaluation_losses': [7.201887014949963], 'machine_time': 408765.0}}, 1: {90: {'training_loss': 2.1952559976761714, 'evaluation_losses': [5.414774446144072], 'machine_time': 128120.0}, 300: {'training_loss': 5.398619334917133, 'evaluation_losses': [7.201887014949963], 'machine_time': 442968.0}, 120: {'training_loss': 3.5781365622136456, 'evaluation_losses': [7.201887014949963], 'machine_time': 196706.0}, 60: {'training_loss': 2.1488836123650854, 'evaluation_losses': [5.414774446144072], 'machine_time': 62748.0}, 180: {'training_loss': 3.4855597478540905, 'evaluation_losses': [7.201887014949963], 'machine_time': 283026.0}}, 6: {60: {'training_loss': 2.2714863791023876, 'evaluation_losses': [7.201887014949963], 'machine_time': 730912.0}}
-			},
-			'soykb':{
-				2: {196: {'training_loss': 6.077850572175291, 'evaluation_losses': [9.237322712793187], 'machine_time': 788344.0}, 294: {'training_loss': 7.161276170012323, 'evaluation_losses': [9.237322712793187], 'machine_time': 1197703.0}, 98: {'training_loss': 2.8683026520433006, 'evaluation_losses': [9.237327930258465], 'machine_time': 216178.0}, 147: {'training_loss': 2.973840327187709, 'evaluation_losses': [9.237322712793187], 'machine_time': 443460.0}}, 1: {147: {'training_loss': 2.9352968954549983, 'evaluation_losses': [9.237322712793187], 'machine_time': 184770.0}, 98: {'training_loss': 1.7407239280547988, 'evaluation_losses': [7.029878560215385], 'machine_time': 88684.0}, 294: {'training_loss': 6.696601821040748, 'evaluation_losses': [9.237322712793187], 'machine_time': 525082.0}, 196: {'training_loss': 5.819665389317206, 'evaluation_losses': [9.237322712793187], 'machine_time': 335050.0}, 490: {'training_loss': 6.835393683475736, 'evaluation_losses': [9.237322712793187], 'machine_time': 772492.0}}, 4: {196: {'training_loss': 5.912588275748208, 'evaluation_losses': [9.237322712793187], 'machine_time': 1614009.0}, 147: {'training_loss': 2.7315668131300006, 'evaluation_losses': [9.237322712793187], 'machine_time': 953325.0}, 98: {'training_loss': 2.576358666022556, 'evaluation_losses': [9.237322712793187], 'machine_time': 481668.0}}, 6: {98: {'training_loss': 2.3040189421206527, 'evaluation_losses': [9.237322712793187], 'machine_time': 916032.0}}
-			},
-			'forkjoin':{
-				1: {10: {'training_loss': 0.20179944600710206, 'evaluation_losses': [0.3449408915458408], 'machine_time': 28286.0}, 25: {'training_loss': 1.0581652426769617, 'evaluation_losses': [1.8693583670569063], 'machine_time': 77966.0}, 50: {'training_loss': 1.3181083652859473, 'evaluation_losses': [1.8693583670569063], 'machine_time': 131312.0}}, 6: {10: {'training_loss': 0.22973668503197958, 'evaluation_losses': [1.8693583670569063], 'machine_time': 189478.0}}, 2: {25: {'training_loss': 1.0730414883453605, 'evaluation_losses': [1.8693583670569063], 'machine_time': 189971.0}, 10: {'training_loss': 0.20144635830029026, 'evaluation_losses': [0.3449408915458408], 'machine_time': 70604.0}}
-			},
-			'genome':{
-				1: {54: {'training_loss': 1.98677799343134, 'evaluation_losses': [4.619892359606285], 'machine_time': 41674.0}, 81: {'training_loss': 1.7874085079142916, 'evaluation_losses': [4.619892359606285], 'machine_time': 93762.0}, 108: {'training_loss': 2.5482588894750258, 'evaluation_losses': [5.927826482284326], 'machine_time': 154748.0}, 162: {'training_loss': 2.298521912304539, 'evaluation_losses': [5.927826482284326], 'machine_time': 232600.0}, 270: {'training_loss': 3.2689193250895894, 'evaluation_losses': [5.927826482284326], 'machine_time': 388978.0}}, 4: {108: {'training_loss': 2.602222522860723, 'evaluation_losses': [5.927826482284326], 'machine_time': 677035.0}, 81: {'training_loss': 2.7564613129198543, 'evaluation_losses': [5.927826482284326], 'machine_time': 428610.0}, 54: {'training_loss': 2.9590312061397803, 'evaluation_losses': [5.927826482284326], 'machine_time': 198406.0}, 162: {'training_loss': 2.3966961112030596, 'evaluation_losses': [5.927826482284326], 'machine_time': 983713.0}}, 2: {81: {'training_loss': 2.708245206962834, 'evaluation_losses': [5.927826482284326], 'machine_time': 227100.0}, 54: {'training_loss': 1.8559518000600357, 'evaluation_losses': [4.619892359606285], 'machine_time': 102901.0}, 108: {'training_loss': 2.5139840846136328, 'evaluation_losses': [5.927892495931291], 'machine_time': 366680.0}, 162: {'training_loss': 2.2862188843048017, 'evaluation_losses': [5.927826482284326], 'machine_time': 542083.0}}, 6: {54: {'training_loss': 2.9187799103421503, 'evaluation_losses': [5.927892495931291], 'machine_time': 337706.0}}
-			},
-			'chain':{
-				1: {10: {'training_loss': 0.1063989426543291, 'evaluation_losses': [0.12787283264986246], 'machine_time': 89986.0}, 50: {'training_loss': 0.12250436015097911, 'evaluation_losses': [0.12787283264986246], 'machine_time': 1062402.0}}
-			},
-		},
-		600:{
-			'genome':{
-				1: {162: {'training_loss': 2.298521912304539, 'evaluation_losses': [5.927826482284326], 'machine_time': 232600.0}, 54: {'training_loss': 0.516136577512436, 'evaluation_losses': [1.3708274530394229], 'machine_time': 41674.0}, 108: {'training_loss': 1.6336570404391817, 'evaluation_losses': [4.619892359606285], 'machine_time': 154748.0}, 81: {'training_loss': 1.7874085079142916, 'evaluation_losses': [4.619892359606285], 'machine_time': 93762.0}, 270: {'training_loss': 3.2689193250895894, 'evaluation_losses': [5.927826482284326], 'machine_time': 388978.0}}, 4: {54: {'training_loss': 1.8576021644233687, 'evaluation_losses': [4.619892359606285], 'machine_time': 198406.0}, 162: {'training_loss': 2.3966961112030596, 'evaluation_losses': [5.927826482284326], 'machine_time': 983713.0}, 81: {'training_loss': 2.7564613129198543, 'evaluation_losses': [5.927826482284326], 'machine_time': 428610.0}, 108: {'training_loss': 2.602222522860723, 'evaluation_losses': [5.927826482284326], 'machine_time': 677035.0}}, 2: {162: {'training_loss': 2.2862188843048017, 'evaluation_losses': [5.927826482284326], 'machine_time': 542083.0}, 54: {'training_loss': 1.8559518000600357, 'evaluation_losses': [4.619892359606285], 'machine_time': 102901.0}, 81: {'training_loss': 1.7111150823620238, 'evaluation_losses': [4.619892359606285], 'machine_time': 227100.0}, 108: {'training_loss': 2.5139840846136328, 'evaluation_losses': [5.927892495931291], 'machine_time': 366680.0}}, 6: {54: {'training_loss': 1.824363754461514, 'evaluation_losses': [4.619892359606285], 'machine_time': 337706.0}}
-			},
-			'epigenomics':{
-				1: {129: {'training_loss': 0.83476007919288, 'evaluation_losses': [2.903491817711163], 'machine_time': 414502.0}, 64: {'training_loss': 0.8112793975317494, 'evaluation_losses': [2.903491817711163], 'machine_time': 200270.0}, 215: {'training_loss': 2.200478221304042, 'evaluation_losses': [3.6391918465132873], 'machine_time': 601092.0}, 86: {'training_loss': 0.8240805228003392, 'evaluation_losses': [2.903491817711163], 'machine_time': 303904.0}, 43: {'training_loss': 0.09070107756132832, 'evaluation_losses': [0.37433281973660515], 'machine_time': 99610.0}}, 4: {129: {'training_loss': 1.5230822588661228, 'evaluation_losses': [3.6391918465132873], 'machine_time': 2015144.0}, 43: {'training_loss': 0.7675842233000031, 'evaluation_losses': [2.903491817711163], 'machine_time': 498179.0}, 64: {'training_loss': 1.4973536816187927, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1004117.0}, 86: {'training_loss': 1.5122606490878956, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1508019.0}}, 6: {43: {'training_loss': 0.6888309579757449, 'evaluation_losses': [2.903491817711163], 'machine_time': 930821.0}}, 2: {43: {'training_loss': 0.768655894886797, 'evaluation_losses': [2.903491817711163], 'machine_time': 249274.0}, 86: {'training_loss': 1.5201939507406144, 'evaluation_losses': [3.6391918465132873], 'machine_time': 754654.0}, 129: {'training_loss': 1.5292889320469563, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1014544.0}, 64: {'training_loss': 0.7974742131594289, 'evaluation_losses': [2.903491817711163], 'machine_time': 501377.0}}
-			},
-			'soykb':{
-				1: {98: {'training_loss': 1.7407239280547988, 'evaluation_losses': [7.029878560215385], 'machine_time': 88684.0}, 294: {'training_loss': 6.696601821040748, 'evaluation_losses': [9.237322712793187], 'machine_time': 525082.0}, 490: {'training_loss': 6.835393683475736, 'evaluation_losses': [9.237322712793187], 'machine_time': 772492.0}, 147: {'training_loss': 1.7665871312364174, 'evaluation_losses': [7.029878560215385], 'machine_time': 184770.0}, 196: {'training_loss': 5.819665389317206, 'evaluation_losses': [9.237322712793187], 'machine_time': 335050.0}}, 2: {147: {'training_loss': 2.973840327187709, 'evaluation_losses': [9.237322712793187], 'machine_time': 443460.0}, 294: {'training_loss': 7.161276170012323, 'evaluation_losses': [9.237322712793187], 'machine_time': 1197703.0}, 196: {'training_loss': 6.077850572175291, 'evaluation_losses': [9.237322712793187], 'machine_time': 788344.0}, 98: {'training_loss': 1.7256813613630866, 'evaluation_losses': [7.029878560215385], 'machine_time': 216178.0}}, 4: {98: {'training_loss': 1.5258421586314674, 'evaluation_losses': [7.029878560215385], 'machine_time': 481668.0}, 147: {'training_loss': 2.7315668131300006, 'evaluation_losses': [9.237322712793187], 'machine_time': 953325.0}, 294: {'training_loss': 7.156889205512735, 'evaluation_losses': [9.237322712793187], 'machine_time': 2359713.0}, 196: {'training_loss': 5.912588275748208, 'evaluation_losses': [9.237322712793187], 'machine_time': 1614009.0}}, 6: {98: {'training_loss': 2.3040189421206527, 'evaluation_losses': [9.237322712793187], 'machine_time': 916032.0}}
-			},
-			'seismology':{
-				6: {103: {'training_loss': 2.3325438514062284, 'evaluation_losses': [9.052505573689901], 'machine_time': 339061.0}}, 1: {309: {'training_loss': 4.459584982443911, 'evaluation_losses': [9.052505573689901], 'machine_time': 383970.0}, 103: {'training_loss': 1.1301308553804883, 'evaluation_losses': [6.597169775837247], 'machine_time': 54416.0}, 154: {'training_loss': 1.059155183603651, 'evaluation_losses': [6.597169775837247], 'machine_time': 122028.0}, 515: {'training_loss': 4.384865410743535, 'evaluation_losses': [9.052573169867182], 'machine_time': 612920.0}, 206: {'training_loss': 3.8689849972948, 'evaluation_losses': [9.052505573689901], 'machine_time': 235076.0}}, 4: {154: {'training_loss': 2.281628738690002, 'evaluation_losses': [9.052505573689901], 'machine_time': 443578.0}, 309: {'training_loss': 5.960550324315226, 'evaluation_losses': [9.052573169867182], 'machine_time': 1285568.0}, 206: {'training_loss': 4.99563062551747, 'evaluation_losses': [9.052505573689901], 'machine_time': 825996.0}, 103: {'training_loss': 2.303029225817966, 'evaluation_losses': [9.052505573689901], 'machine_time': 207265.0}}, 2: {103: {'training_loss': 1.2038917108831781, 'evaluation_losses': [6.597169775837247], 'machine_time': 120125.0}, 309: {'training_loss': 5.216529894054617, 'evaluation_losses': [9.052505573689901], 'machine_time': 780993.0}, 206: {'training_loss': 4.459854380395284, 'evaluation_losses': [9.052505573689901], 'machine_time': 488291.0}, 154: {'training_loss': 2.008168290713861, 'evaluation_losses': [9.052505573689901], 'machine_time': 259263.0}}
-			},
-			'forkjoin':{
-				1: {25: {'training_loss': 0.24157399530429208, 'evaluation_losses': [0.3449408915458408], 'machine_time': 77966.0}, 10: {'training_loss': 0.11717911880876876, 'evaluation_losses': [0.30710241338435634], 'machine_time': 28286.0}, 50: {'training_loss': 1.3181083652859473, 'evaluation_losses': [1.8693583670569063], 'machine_time': 131312.0}}, 2: {10: {'training_loss': 0.20144635830029026, 'evaluation_losses': [0.3449408915458408], 'machine_time': 70604.0}, 25: {'training_loss': 1.0730414883453605, 'evaluation_losses': [1.8693583670569063], 'machine_time': 189971.0}}, 6: {10: {'training_loss': 0.22973668503197958, 'evaluation_losses': [1.8693583670569063], 'machine_time': 189478.0}}
-			},
-			'montage':{
-				1: {90: {'training_loss': 2.1952559976761714, 'evaluation_losses': [5.414774446144072], 'machine_time': 128120.0}, 300: {'training_loss': 5.398619334917133, 'evaluation_losses': [7.201887014949963], 'machine_time': 442968.0}, 60: {'training_loss': 0.6000605820804854, 'evaluation_losses': [1.7072781305772544], 'machine_time': 62748.0}, 180: {'training_loss': 3.4855597478540905, 'evaluation_losses': [7.201887014949963], 'machine_time': 283026.0}, 120: {'training_loss': 2.2096346827746096, 'evaluation_losses': [5.414774446144072], 'machine_time': 196706.0}}, 2: {180: {'training_loss': 2.9762947983164287, 'evaluation_losses': [7.201887014949963], 'machine_time': 763428.0}, 90: {'training_loss': 2.9141979554254664, 'evaluation_losses': [7.201887014949963], 'machine_time': 365324.0}, 60: {'training_loss': 1.658825142412081, 'evaluation_losses': [5.414774446144072], 'machine_time': 184830.0}, 120: {'training_loss': 3.007377247826633, 'evaluation_losses': [7.201887014949963], 'machine_time': 548921.0}}, 4: {90: {'training_loss': 2.6049725654264524, 'evaluation_losses': [7.201887014949963], 'machine_time': 795329.0}, 180: {'training_loss': 2.7255105838133415, 'evaluation_losses': [7.201887014949963], 'machine_time': 1603583.0}, 120: {'training_loss': 2.72279058790062, 'evaluation_losses': [7.201887014949963], 'machine_time': 1180806.0}, 60: {'training_loss': 1.4533514285057632, 'evaluation_losses': [5.414774446144072], 'machine_time': 408765.0}}, 6: {60: {'training_loss': 1.3347091026436984, 'evaluation_losses': [5.414774446144072], 'machine_time': 730912.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.12250436015097911, 'evaluation_losses': [0.12787283264986246], 'machine_time': 1062402.0}, 10: {'training_loss': 0.1063989426543291, 'evaluation_losses': [0.12787283264986246], 'machine_time': 89986.0}}
-			},
-		},
-		1800:{
-			'epigenomics':{
-				1: {215: {'training_loss': 1.5363259885183076, 'evaluation_losses': [2.903491817711163], 'machine_time': 601092.0}, 43: {'training_loss': 0.09070107756132814, 'evaluation_losses': [0.37432687118151414], 'machine_time': 99610.0}, 64: {'training_loss': 0.10234377805478471, 'evaluation_losses': [0.37432687118151414], 'machine_time': 200270.0}, 129: {'training_loss': 0.27856651738488697, 'evaluation_losses': [0.6540479037130905], 'machine_time': 414502.0}, 86: {'training_loss': 0.1018671424258764, 'evaluation_losses': [0.37432687118151414], 'machine_time': 303904.0}}, 4: {64: {'training_loss': 0.7882320532744297, 'evaluation_losses': [2.903491817711163], 'machine_time': 1004117.0}, 86: {'training_loss': 0.8037318455887588, 'evaluation_losses': [2.903491817711163], 'machine_time': 1508019.0}, 129: {'training_loss': 0.8177874518550345, 'evaluation_losses': [2.903491817711163], 'machine_time': 2015144.0}, 43: {'training_loss': 0.0943927312705394, 'evaluation_losses': [0.37432687118151414], 'machine_time': 498179.0}}, 2: {43: {'training_loss': 0.09733428674887573, 'evaluation_losses': [0.37432687118151414], 'machine_time': 249274.0}, 86: {'training_loss': 0.8136585537067469, 'evaluation_losses': [2.903491817711163], 'machine_time': 754654.0}, 64: {'training_loss': 0.261092393465345, 'evaluation_losses': [0.6540479037130905], 'machine_time': 501377.0}, 129: {'training_loss': 0.8279250838850211, 'evaluation_losses': [2.903491817711163], 'machine_time': 1014544.0}}, 6: {43: {'training_loss': 0.1253376419498577, 'evaluation_losses': [0.37432687118151414], 'machine_time': 930821.0}}
-			},
-			'montage':{
-				2: {120: {'training_loss': 1.8066911054920216, 'evaluation_losses': [5.414798868395872], 'machine_time': 548921.0}, 180: {'training_loss': 2.9762947983164287, 'evaluation_losses': [7.201887014949963], 'machine_time': 763428.0}, 60: {'training_loss': 0.2894636163244288, 'evaluation_losses': [0.2784291538734018], 'machine_time': 184830.0}, 90: {'training_loss': 0.4726515669637226, 'evaluation_losses': [1.7072781305772544], 'machine_time': 365324.0}}, 1: {180: {'training_loss': 2.1518316688580432, 'evaluation_losses': [5.414774446144072], 'machine_time': 283026.0}, 90: {'training_loss': 0.6288408483278919, 'evaluation_losses': [1.7072781305772544], 'machine_time': 128120.0}, 120: {'training_loss': 0.6634655602313984, 'evaluation_losses': [1.7072781305772544], 'machine_time': 196706.0}, 300: {'training_loss': 5.398619334917133, 'evaluation_losses': [7.201887014949963], 'machine_time': 442968.0}, 60: {'training_loss': 0.31996839979499153, 'evaluation_losses': [0.2784291538734018], 'machine_time': 62748.0}}, 4: {180: {'training_loss': 2.7255105838133415, 'evaluation_losses': [7.201887014949963], 'machine_time': 1603583.0}, 60: {'training_loss': 0.3936941495109207, 'evaluation_losses': [1.7072781305772544], 'machine_time': 408765.0}, 120: {'training_loss': 1.609287863052562, 'evaluation_losses': [5.414774446144072], 'machine_time': 1180806.0}, 90: {'training_loss': 1.553062593500038, 'evaluation_losses': [5.414774446144072], 'machine_time': 795329.0}}, 6: {60: {'training_loss': 0.3676255525523643, 'evaluation_losses': [1.7072781305772544], 'machine_time': 730912.0}}
-			},
-			'seismology':{
-				6: {103: {'training_loss': 1.3637887673672908, 'evaluation_losses': [6.597169775837247], 'machine_time': 339061.0}}, 1: {309: {'training_loss': 4.459584982443911, 'evaluation_losses': [9.052505573689901], 'machine_time': 383970.0}, 206: {'training_loss': 2.762018658529812, 'evaluation_losses': [6.597169775837247], 'machine_time': 235076.0}, 515: {'training_loss': 4.384855592517674, 'evaluation_losses': [9.052505573689901], 'machine_time': 612920.0}, 154: {'training_loss': 1.059155183603651, 'evaluation_losses': [6.597169775837247], 'machine_time': 122028.0}, 103: {'training_loss': 0.39480093810073896, 'evaluation_losses': [2.3472953072047367], 'machine_time': 54416.0}}, 4: {309: {'training_loss': 5.960561404767856, 'evaluation_losses': [9.052505573689901], 'machine_time': 1285568.0}, 154: {'training_loss': 1.3490957855439218, 'evaluation_losses': [6.597169775837247], 'machine_time': 443578.0}, 103: {'training_loss': 1.3665011430659908, 'evaluation_losses': [6.597169775837247], 'machine_time': 207265.0}, 206: {'training_loss': 4.99563062551747, 'evaluation_losses': [9.052505573689901], 'machine_time': 825996.0}}, 2: {103: {'training_loss': 0.43109311083690743, 'evaluation_losses': [2.0287021256987243], 'machine_time': 120125.0}, 154: {'training_loss': 1.1938835557072651, 'evaluation_losses': [6.597169775837247], 'machine_time': 259263.0}, 206: {'training_loss': 4.459854380395284, 'evaluation_losses': [9.052505573689901], 'machine_time': 488291.0}, 309: {'training_loss': 5.216529894054617, 'evaluation_losses': [9.052505573689901], 'machine_time': 780993.0}}
-			},
-			'soykb':{
-				2: {98: {'training_loss': 0.4807457544490619, 'evaluation_losses': [2.203548286383589], 'machine_time': 216178.0}, 196: {'training_loss': 6.077850572175291, 'evaluation_losses': [9.237322712793187], 'machine_time': 788344.0}, 294: {'training_loss': 7.161276170012323, 'evaluation_losses': [9.237322712793187], 'machine_time': 1197703.0}, 147: {'training_loss': 1.7777531254304573, 'evaluation_losses': [7.029878560215385], 'machine_time': 443460.0}}, 6: {98: {'training_loss': 1.343181994205189, 'evaluation_losses': [7.029878560215385], 'machine_time': 916032.0}}, 4: {196: {'training_loss': 5.912588275748208, 'evaluation_losses': [9.237322712793187], 'machine_time': 1614009.0}, 294: {'training_loss': 7.156889205512735, 'evaluation_losses': [9.237322712793187], 'machine_time': 2359713.0}, 98: {'training_loss': 1.5258421586314674, 'evaluation_losses': [7.029878560215385], 'machine_time': 481668.0}, 147: {'training_loss': 1.6108308008964156, 'evaluation_losses': [7.029878560215385], 'machine_time': 953325.0}}, 1: {490: {'training_loss': 6.835393683475736, 'evaluation_losses': [9.237322712793187], 'machine_time': 772492.0}, 147: {'training_loss': 0.5182304662631694, 'evaluation_losses': [2.2035474090677716], 'machine_time': 184770.0}, 98: {'training_loss': 0.1721972585585166, 'evaluation_losses': [0.2156423835600479], 'machine_time': 88684.0}, 196: {'training_loss': 4.162546510565848, 'evaluation_losses': [7.029878560215385], 'machine_time': 335050.0}, 294: {'training_loss': 4.900428497680094, 'evaluation_losses': [7.029878560215385], 'machine_time': 525082.0}}
-			},
-			'forkjoin':{
-				1: {10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.3032385379977294], 'machine_time': 28286.0}, 50: {'training_loss': 0.263995997603169, 'evaluation_losses': [0.3449408915458408], 'machine_time': 131312.0}, 25: {'training_loss': 0.17349423654781707, 'evaluation_losses': [0.21595850171371658], 'machine_time': 77966.0}}, 2: {10: {'training_loss': 0.09079351984462354, 'evaluation_losses': [0.30344786845893384], 'machine_time': 70604.0}, 25: {'training_loss': 0.2399801647364413, 'evaluation_losses': [0.3449408915458408], 'machine_time': 189971.0}}, 6: {10: {'training_loss': 0.1655385950633993, 'evaluation_losses': [0.30710241338435634], 'machine_time': 189478.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.12250436015097911, 'evaluation_losses': [0.12787283264986246], 'machine_time': 1062402.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-			'genome':{
-				4: {108: {'training_loss': 1.637259071754633, 'evaluation_losses': [4.619892359606285], 'machine_time': 677035.0}, 54: {'training_loss': 0.2781015816035668, 'evaluation_losses': [0.533818116305899], 'machine_time': 198406.0}, 162: {'training_loss': 2.3966961112030596, 'evaluation_losses': [5.927826482284326], 'machine_time': 983713.0}, 81: {'training_loss': 1.7306621615676008, 'evaluation_losses': [4.619892359606285], 'machine_time': 428610.0}}, 6: {54: {'training_loss': 0.48578683498620895, 'evaluation_losses': [1.3708274530394229], 'machine_time': 337706.0}}, 1: {81: {'training_loss': 0.2805746804710752, 'evaluation_losses': [0.533818116305899], 'machine_time': 93762.0}, 270: {'training_loss': 2.3915986090477666, 'evaluation_losses': [4.619892359606285], 'machine_time': 388978.0}, 54: {'training_loss': 0.2739323700059631, 'evaluation_losses': [0.533818116305899], 'machine_time': 41674.0}, 162: {'training_loss': 1.46651424936865, 'evaluation_losses': [4.619892359606285], 'machine_time': 232600.0}, 108: {'training_loss': 0.4997697719357975, 'evaluation_losses': [1.3708274530394229], 'machine_time': 154748.0}}, 2: {81: {'training_loss': 0.487263705381732, 'evaluation_losses': [1.3708274530394229], 'machine_time': 227100.0}, 108: {'training_loss': 1.592773677621055, 'evaluation_losses': [4.619892359606285], 'machine_time': 366680.0}, 162: {'training_loss': 1.4435851598255767, 'evaluation_losses': [4.619892359606285], 'machine_time': 542083.0}, 54: {'training_loss': 0.2904645168790523, 'evaluation_losses': [0.533818116305899], 'machine_time': 102901.0}}
-			},
-		},
-		3600:{
-			'epigenomics':{
-				1: {43: {'training_loss': 0.09070107756132814, 'evaluation_losses': [0.37432687118151414], 'machine_time': 99610.0}, 64: {'training_loss': 0.10234377805478471, 'evaluation_losses': [0.37432687118151414], 'machine_time': 200270.0}, 215: {'training_loss': 0.412195771025939, 'evaluation_losses': [0.6540479037130905], 'machine_time': 601092.0}, 86: {'training_loss': 0.1018671424258764, 'evaluation_losses': [0.37432687118151414], 'machine_time': 303904.0}, 129: {'training_loss': 0.11156303517820577, 'evaluation_losses': [0.37432687118151414], 'machine_time': 414502.0}}, 2: {129: {'training_loss': 0.8279250838850211, 'evaluation_losses': [2.903491817711163], 'machine_time': 1014544.0}, 64: {'training_loss': 0.11017055941247338, 'evaluation_losses': [0.37432687118151414], 'machine_time': 501377.0}, 86: {'training_loss': 0.1121147346564732, 'evaluation_losses': [0.37432687118151414], 'machine_time': 754654.0}, 43: {'training_loss': 0.09733428674887573, 'evaluation_losses': [0.37432687118151414], 'machine_time': 249274.0}}, 4: {86: {'training_loss': 0.26449167055684286, 'evaluation_losses': [0.6540479037130905], 'machine_time': 1508019.0}, 43: {'training_loss': 0.0943927312705394, 'evaluation_losses': [0.37432687118151414], 'machine_time': 498179.0}, 64: {'training_loss': 0.10423326331399534, 'evaluation_losses': [0.37432687118151414], 'machine_time': 1004117.0}, 129: {'training_loss': 0.8177874518550345, 'evaluation_losses': [2.903491817711163], 'machine_time': 2015144.0}}, 6: {43: {'training_loss': 0.1253376419498577, 'evaluation_losses': [0.37432687118151414], 'machine_time': 930821.0}}
-			},
-			'genome':{
-				1: {162: {'training_loss': 0.3798094208632043, 'evaluation_losses': [0.9638633227510849], 'machine_time': 232600.0}, 54: {'training_loss': 0.22372334033422042, 'evaluation_losses': [0.1933399712578048], 'machine_time': 41674.0}, 81: {'training_loss': 0.2805746804710752, 'evaluation_losses': [0.533818116305899], 'machine_time': 93762.0}, 270: {'training_loss': 2.3915986090477666, 'evaluation_losses': [4.619892359606285], 'machine_time': 388978.0}, 108: {'training_loss': 0.29383375120496824, 'evaluation_losses': [0.533818116305899], 'machine_time': 154748.0}}, 2: {162: {'training_loss': 1.4435851598255767, 'evaluation_losses': [4.619892359606285], 'machine_time': 542083.0}, 81: {'training_loss': 0.31319049490715517, 'evaluation_losses': [0.533818116305899], 'machine_time': 227100.0}, 108: {'training_loss': 0.4821425942012118, 'evaluation_losses': [1.3708274530394229], 'machine_time': 366680.0}, 54: {'training_loss': 0.2904645168790523, 'evaluation_losses': [0.533818116305899], 'machine_time': 102901.0}}, 6: {54: {'training_loss': 0.27634267665815904, 'evaluation_losses': [0.533818116305899], 'machine_time': 337706.0}}, 4: {108: {'training_loss': 1.637259071754633, 'evaluation_losses': [4.619892359606285], 'machine_time': 677035.0}, 54: {'training_loss': 0.2781015816035668, 'evaluation_losses': [0.533818116305899], 'machine_time': 198406.0}, 162: {'training_loss': 1.501775008895619, 'evaluation_losses': [4.619892359606285], 'machine_time': 983713.0}, 81: {'training_loss': 0.4867457926395789, 'evaluation_losses': [1.3708274530394229], 'machine_time': 428610.0}}
-			},
-			'montage':{
-				4: {180: {'training_loss': 1.6130073923738353, 'evaluation_losses': [5.414774446144072], 'machine_time': 1603583.0}, 120: {'training_loss': 1.609287863052562, 'evaluation_losses': [5.414774446144072], 'machine_time': 1180806.0}, 60: {'training_loss': 0.2872905572190888, 'evaluation_losses': [0.2784291538734018], 'machine_time': 408765.0}, 90: {'training_loss': 0.4157697868999801, 'evaluation_losses': [1.7072781305772544], 'machine_time': 795329.0}}, 2: {60: {'training_loss': 0.2894636163244288, 'evaluation_losses': [0.2784291538734018], 'machine_time': 184830.0}, 120: {'training_loss': 0.5034631632847626, 'evaluation_losses': [1.7072781305772544], 'machine_time': 548921.0}, 90: {'training_loss': 0.4726515669637226, 'evaluation_losses': [1.7072781305772544], 'machine_time': 365324.0}, 180: {'training_loss': 1.7904321891321167, 'evaluation_losses': [5.414774446144072], 'machine_time': 763428.0}}, 1: {60: {'training_loss': 0.23588365879177292, 'evaluation_losses': [0.2703325034561008], 'machine_time': 62748.0}, 120: {'training_loss': 0.34838454243525924, 'evaluation_losses': [0.2784291538734018], 'machine_time': 196706.0}, 300: {'training_loss': 3.8118825219296943, 'evaluation_losses': [5.414774446144072], 'machine_time': 442968.0}, 180: {'training_loss': 0.6502164455110008, 'evaluation_losses': [1.7072781305772544], 'machine_time': 283026.0}, 90: {'training_loss': 0.3803707950158989, 'evaluation_losses': [0.2784291538734018], 'machine_time': 128120.0}}, 6: {60: {'training_loss': 0.28844910579108474, 'evaluation_losses': [0.2784291538734018], 'machine_time': 730912.0}}
-			},
-			'forkjoin':{
-				1: {50: {'training_loss': 0.20323593369948184, 'evaluation_losses': [0.2160796067110578], 'machine_time': 131312.0}, 25: {'training_loss': 0.17349423654781707, 'evaluation_losses': [0.21595850171371658], 'machine_time': 77966.0}, 10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.3032385379977294], 'machine_time': 28286.0}}, 2: {10: {'training_loss': 0.09079351984462354, 'evaluation_losses': [0.3032385379977294], 'machine_time': 70604.0}, 25: {'training_loss': 0.16226256165511616, 'evaluation_losses': [0.21595850171371658], 'machine_time': 189971.0}}, 6: {10: {'training_loss': 0.13676219697830647, 'evaluation_losses': [0.3032385379977294], 'machine_time': 189478.0}}
-			},
-			'soykb':{
-				4: {98: {'training_loss': 0.18902420131429887, 'evaluation_losses': [0.2156423835600479], 'machine_time': 481668.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.11927703205339604, 'evaluation_losses': [0.11332763231830498], 'machine_time': 1062402.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-		},
-		7200:{
-			'soykb':{
-				1: {294: {'training_loss': 1.5173523235707251, 'evaluation_losses': [2.203548286383589], 'machine_time': 525082.0}, 147: {'training_loss': 0.21977195110175715, 'evaluation_losses': [0.21563135164991404], 'machine_time': 184770.0}, 196: {'training_loss': 0.22646629110980648, 'evaluation_losses': [0.2156423835600479], 'machine_time': 335050.0}, 98: {'training_loss': 0.1721972585585166, 'evaluation_losses': [0.2156423835600479], 'machine_time': 88684.0}, 490: {'training_loss': 5.061100920877333, 'evaluation_losses': [7.029878560215385], 'machine_time': 772492.0}}, 2: {147: {'training_loss': 0.20713496711163126, 'evaluation_losses': [0.2156423835600479], 'machine_time': 443460.0}, 98: {'training_loss': 0.18374281753891716, 'evaluation_losses': [0.21563135164991404], 'machine_time': 216178.0}, 294: {'training_loss': 5.2579790264627615, 'evaluation_losses': [7.029878560215385], 'machine_time': 1197703.0}, 196: {'training_loss': 1.3362763138144527, 'evaluation_losses': [2.203548286383589], 'machine_time': 788344.0}}, 4: {294: {'training_loss': 5.248751180014235, 'evaluation_losses': [7.029878560215385], 'machine_time': 2359713.0}, 98: {'training_loss': 0.18902420131429887, 'evaluation_losses': [0.2156423835600479], 'machine_time': 481668.0}, 147: {'training_loss': 0.4488015854510364, 'evaluation_losses': [2.203548286383589], 'machine_time': 953325.0}, 196: {'training_loss': 4.223725175327907, 'evaluation_losses': [7.0298785450814965], 'machine_time': 1614009.0}}, 6: {98: {'training_loss': 0.21521010458157006, 'evaluation_losses': [0.2156423835600479], 'machine_time': 916032.0}}
-			},
-			'genome':{
-				6: {54: {'training_loss': 0.27634267665815904, 'evaluation_losses': [0.533818116305899], 'machine_time': 337706.0}}, 1: {108: {'training_loss': 0.29383375120496824, 'evaluation_losses': [0.533818116305899], 'machine_time': 154748.0}, 81: {'training_loss': 0.2805746804710752, 'evaluation_losses': [0.533818116305899], 'machine_time': 93762.0}, 162: {'training_loss': 0.3270497698388297, 'evaluation_losses': [0.533818116305899], 'machine_time': 232600.0}, 270: {'training_loss': 0.37062323936263464, 'evaluation_losses': [0.533818116305899], 'machine_time': 388978.0}, 54: {'training_loss': 0.18545387913804934, 'evaluation_losses': [0.34487200477974417], 'machine_time': 41674.0}}, 2: {162: {'training_loss': 0.38372573682419336, 'evaluation_losses': [0.9638633227510849], 'machine_time': 542083.0}, 54: {'training_loss': 0.1866376291533146, 'evaluation_losses': [0.1933399712578048], 'machine_time': 102901.0}, 108: {'training_loss': 0.3245461637804393, 'evaluation_losses': [0.533818116305899], 'machine_time': 366680.0}, 81: {'training_loss': 0.31319049490715517, 'evaluation_losses': [0.533818116305899], 'machine_time': 227100.0}}, 4: {162: {'training_loss': 1.501775008895619, 'evaluation_losses': [4.619892359606285], 'machine_time': 983713.0}, 108: {'training_loss': 0.4787957813976012, 'evaluation_losses': [1.3708274530394229], 'machine_time': 677035.0}, 81: {'training_loss': 0.29771980478532883, 'evaluation_losses': [0.533818116305899], 'machine_time': 428610.0}, 54: {'training_loss': 0.2781015816035668, 'evaluation_losses': [0.533818116305899], 'machine_time': 198406.0}}
-			},
-			'epigenomics':{
-				2: {43: {'training_loss': 0.09733428674887579, 'evaluation_losses': [0.37433281973660515], 'machine_time': 249274.0}, 129: {'training_loss': 0.12572091263299326, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1014544.0}, 64: {'training_loss': 0.11017055941247325, 'evaluation_losses': [0.37433281973660515], 'machine_time': 501377.0}, 86: {'training_loss': 0.1121147346564729, 'evaluation_losses': [0.37433281973660515], 'machine_time': 754654.0}}, 6: {43: {'training_loss': 0.12533764194985783, 'evaluation_losses': [0.37433281973660515], 'machine_time': 930821.0}}, 1: {215: {'training_loss': 0.18378616911716, 'evaluation_losses': [0.37433281973660515], 'machine_time': 601092.0}, 129: {'training_loss': 0.11155866016156704, 'evaluation_losses': [0.37433281973660515], 'machine_time': 414502.0}, 43: {'training_loss': 0.09070107756132832, 'evaluation_losses': [0.37433281973660515], 'machine_time': 99610.0}, 64: {'training_loss': 0.1023437780547848, 'evaluation_losses': [0.37433281973660515], 'machine_time': 200270.0}, 86: {'training_loss': 0.10186714242587672, 'evaluation_losses': [0.37433281973660515], 'machine_time': 303904.0}}, 4: {64: {'training_loss': 0.10423326331399542, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1004117.0}, 86: {'training_loss': 0.1067628127742381, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1508019.0}, 43: {'training_loss': 0.0943927312705396, 'evaluation_losses': [0.37433281973660515], 'machine_time': 498179.0}, 129: {'training_loss': 0.26847557312475545, 'evaluation_losses': [0.6540479037130905], 'machine_time': 2015144.0}}
-			},
-			'seismology':{
-				1: {103: {'training_loss': 0.21947615636403595, 'evaluation_losses': [0.4003447606068435], 'machine_time': 54416.0}, 206: {'training_loss': 0.5251880503353576, 'evaluation_losses': [1.2676584785729241], 'machine_time': 235076.0}}, 4: {309: {'training_loss': 4.310332316282969, 'evaluation_losses': [6.597169775837247], 'machine_time': 1285568.0}}, 2: {103: {'training_loss': 0.23665514798964848, 'evaluation_losses': [1.1216875274177607], 'machine_time': 120125.0}, 309: {'training_loss': 3.789840604612529, 'evaluation_losses': [6.597169775837247], 'machine_time': 780993.0}}
-			},
-			'forkjoin':{
-				1: {10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.3032385379977294], 'machine_time': 28286.0}, 25: {'training_loss': 0.17349423654781707, 'evaluation_losses': [0.21595850171371658], 'machine_time': 77966.0}, 50: {'training_loss': 0.20323669621654689, 'evaluation_losses': [0.21595850171371658], 'machine_time': 131312.0}}, 2: {25: {'training_loss': 0.16226256165511616, 'evaluation_losses': [0.21595850171371658], 'machine_time': 189971.0}, 10: {'training_loss': 0.09079351984462354, 'evaluation_losses': [0.30344786845893384], 'machine_time': 70604.0}}, 6: {10: {'training_loss': 0.13676219697830647, 'evaluation_losses': [0.3032385379977294], 'machine_time': 189478.0}}
-			},
-			'montage':{
-				2: {180: {'training_loss': 0.5033093451955057, 'evaluation_losses': [1.7072781305772544], 'machine_time': 763428.0}, 120: {'training_loss': 0.30163823494216374, 'evaluation_losses': [0.2784291538734018], 'machine_time': 548921.0}, 60: {'training_loss': 0.2894636163244288, 'evaluation_losses': [0.2784291538734018], 'machine_time': 184830.0}, 90: {'training_loss': 0.31618030043251044, 'evaluation_losses': [0.2784291538734018], 'machine_time': 365324.0}}, 1: {120: {'training_loss': 0.34838454243525924, 'evaluation_losses': [0.2784291538734018], 'machine_time': 196706.0}, 60: {'training_loss': 0.18706981652778182, 'evaluation_losses': [0.4252478170845952], 'machine_time': 62748.0}, 90: {'training_loss': 0.3285647943261169, 'evaluation_losses': [1.0450946295533132], 'machine_time': 128120.0}, 180: {'training_loss': 0.3379996283359481, 'evaluation_losses': [0.2784291538734018], 'machine_time': 283026.0}, 300: {'training_loss': 1.1887256926912653, 'evaluation_losses': [1.7072781305772544], 'machine_time': 442968.0}}, 4: {120: {'training_loss': 0.44673738827839155, 'evaluation_losses': [1.708158544584661], 'machine_time': 1180806.0}, 90: {'training_loss': 0.30567893770161497, 'evaluation_losses': [0.2784291538734018], 'machine_time': 795329.0}, 60: {'training_loss': 0.2872905572190888, 'evaluation_losses': [0.2783862050226061], 'machine_time': 408765.0}, 180: {'training_loss': 1.5054862467779877, 'evaluation_losses': [5.870366781740062], 'machine_time': 1603583.0}}, 6: {60: {'training_loss': 0.28844910579108474, 'evaluation_losses': [0.2784291538734018], 'machine_time': 730912.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.11927703205339604, 'evaluation_losses': [0.11332763231830498], 'machine_time': 1062402.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-		},
-		18000:{
-			'genome':{
-				1: {81: {'training_loss': 0.19680771834701297, 'evaluation_losses': [0.1933399712578048], 'machine_time': 93762.0}, 54: {'training_loss': 0.18545387913804934, 'evaluation_losses': [0.34487200477974417], 'machine_time': 41674.0}, 270: {'training_loss': 0.37062323936263464, 'evaluation_losses': [0.533818116305899], 'machine_time': 388978.0}, 108: {'training_loss': 0.1977129553832234, 'evaluation_losses': [0.1933399712578048], 'machine_time': 154748.0}, 162: {'training_loss': 0.3270497698388297, 'evaluation_losses': [0.533818116305899], 'machine_time': 232600.0}}, 4: {108: {'training_loss': 0.3269505081359034, 'evaluation_losses': [0.533818116305899], 'machine_time': 677035.0}, 81: {'training_loss': 0.25237776691902014, 'evaluation_losses': [0.4946564527995079], 'machine_time': 428610.0}, 54: {'training_loss': 0.17646542800403295, 'evaluation_losses': [0.1933399712578048], 'machine_time': 198406.0}, 162: {'training_loss': 0.3589025134792263, 'evaluation_losses': [0.533818116305899], 'machine_time': 983713.0}}, 2: {108: {'training_loss': 0.3245461637804393, 'evaluation_losses': [0.533818116305899], 'machine_time': 366680.0}, 54: {'training_loss': 0.18403248572933448, 'evaluation_losses': [0.34487200477974417], 'machine_time': 102901.0}, 162: {'training_loss': 0.2979021043274925, 'evaluation_losses': [0.591569005517995], 'machine_time': 542083.0}, 81: {'training_loss': 0.17529271189813989, 'evaluation_losses': [0.1933399712578048], 'machine_time': 227100.0}}, 6: {54: {'training_loss': 0.16434959240759522, 'evaluation_losses': [0.1933399712578048], 'machine_time': 337706.0}}
-			},
-			'epigenomics':{
-				1: {129: {'training_loss': 0.11155866016156704, 'evaluation_losses': [0.37433281973660515], 'machine_time': 414502.0}, 86: {'training_loss': 0.10186714242587672, 'evaluation_losses': [0.37433281973660515], 'machine_time': 303904.0}, 43: {'training_loss': 0.09070107756132832, 'evaluation_losses': [0.37433281973660515], 'machine_time': 99610.0}, 215: {'training_loss': 0.18378616911716, 'evaluation_losses': [0.37433281973660515], 'machine_time': 601092.0}, 64: {'training_loss': 0.1023437780547848, 'evaluation_losses': [0.37433281973660515], 'machine_time': 200270.0}}, 2: {129: {'training_loss': 0.12572091263299326, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1014544.0}, 86: {'training_loss': 0.1121147346564729, 'evaluation_losses': [0.37433281973660515], 'machine_time': 754654.0}, 43: {'training_loss': 0.09733428674887579, 'evaluation_losses': [0.37433281973660515], 'machine_time': 249274.0}, 64: {'training_loss': 0.11017055941247325, 'evaluation_losses': [0.37433281973660515], 'machine_time': 501377.0}}, 4: {129: {'training_loss': 0.1186702588997195, 'evaluation_losses': [0.37433281973660515], 'machine_time': 2015144.0}, 64: {'training_loss': 0.10423326331399542, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1004117.0}, 43: {'training_loss': 0.0943927312705396, 'evaluation_losses': [0.37433281973660515], 'machine_time': 498179.0}, 86: {'training_loss': 0.1067628127742381, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1508019.0}}, 6: {43: {'training_loss': 0.12533764194985783, 'evaluation_losses': [0.37433281973660515], 'machine_time': 930821.0}}
-			},
-			'seismology':{
-				2: {154: {'training_loss': 0.25216403631188467, 'evaluation_losses': [1.1216875274177607], 'machine_time': 259263.0}, 309: {'training_loss': 1.208650761020668, 'evaluation_losses': [2.0287021256987243], 'machine_time': 780993.0}, 103: {'training_loss': 0.19989570764545914, 'evaluation_losses': [0.4003447606068435], 'machine_time': 120125.0}, 206: {'training_loss': 0.4706316947852101, 'evaluation_losses': [0.9054330333700394], 'machine_time': 488291.0}}, 4: {154: {'training_loss': 0.29723894758078917, 'evaluation_losses': [1.1216875274177607], 'machine_time': 443578.0}, 309: {'training_loss': 4.310332316282969, 'evaluation_losses': [6.597169775837247], 'machine_time': 1285568.0}, 103: {'training_loss': 0.1940518402694311, 'evaluation_losses': [0.4003447606068435], 'machine_time': 207265.0}, 206: {'training_loss': 0.6740759176117889, 'evaluation_losses': [1.2676584785729241], 'machine_time': 825996.0}}, 1: {206: {'training_loss': 0.3817472201830115, 'evaluation_losses': [0.9054330333700394], 'machine_time': 235076.0}, 515: {'training_loss': 3.213442329796609, 'evaluation_losses': [6.597169775837247], 'machine_time': 612920.0}, 309: {'training_loss': 0.4968092840570918, 'evaluation_losses': [1.2676584785729241], 'machine_time': 383970.0}, 154: {'training_loss': 0.22131269958248218, 'evaluation_losses': [0.4003447606068435], 'machine_time': 122028.0}, 103: {'training_loss': 0.21947615636403595, 'evaluation_losses': [0.4003447606068435], 'machine_time': 54416.0}}, 6: {103: {'training_loss': 0.2505879894941957, 'evaluation_losses': [1.073989636443577], 'machine_time': 339061.0}}
-			},
-			'soykb':{
-				1: {294: {'training_loss': 0.21252837491435972, 'evaluation_losses': [0.2156423835600479], 'machine_time': 525082.0}, 196: {'training_loss': 0.22646629110980648, 'evaluation_losses': [0.2156423835600479], 'machine_time': 335050.0}, 490: {'training_loss': 1.5661858639390072, 'evaluation_losses': [2.203548286383589], 'machine_time': 772492.0}, 147: {'training_loss': 0.21135887963188604, 'evaluation_losses': [0.24915039896814256], 'machine_time': 184770.0}, 98: {'training_loss': 0.1721972585585166, 'evaluation_losses': [0.2156423835600479], 'machine_time': 88684.0}}, 4: {196: {'training_loss': 0.20899194986201472, 'evaluation_losses': [0.2156423835600479], 'machine_time': 1614009.0}, 98: {'training_loss': 0.18902420131429887, 'evaluation_losses': [0.2156423835600479], 'machine_time': 481668.0}, 147: {'training_loss': 0.19977743220876037, 'evaluation_losses': [0.21563135164991404], 'machine_time': 953325.0}, 294: {'training_loss': 5.248751180014235, 'evaluation_losses': [7.029878560215385], 'machine_time': 2359713.0}}, 2: {196: {'training_loss': 0.21600742966320083, 'evaluation_losses': [0.2156423835600479], 'machine_time': 788344.0}, 294: {'training_loss': 0.2022707623973996, 'evaluation_losses': [0.2156423835600479], 'machine_time': 1197703.0}, 98: {'training_loss': 0.18374281753891716, 'evaluation_losses': [0.2156423835600479], 'machine_time': 216178.0}, 147: {'training_loss': 0.20713496711163126, 'evaluation_losses': [0.2156423835600479], 'machine_time': 443460.0}}, 6: {98: {'training_loss': 0.21521010458157006, 'evaluation_losses': [0.2156423835600479], 'machine_time': 916032.0}}
-			},
-			'montage':{
-				2: {90: {'training_loss': 0.2609060326375415, 'evaluation_losses': [0.27057602221763405], 'machine_time': 365324.0}, 120: {'training_loss': 0.30163823494216374, 'evaluation_losses': [0.2784291538734018], 'machine_time': 548921.0}, 60: {'training_loss': 0.2725699697749276, 'evaluation_losses': [0.27057602221763405], 'machine_time': 184830.0}, 180: {'training_loss': 0.299797246096318, 'evaluation_losses': [0.2784291538734018], 'machine_time': 763428.0}}, 1: {60: {'training_loss': 0.18706981652778182, 'evaluation_losses': [0.4252478170845952], 'machine_time': 62748.0}, 90: {'training_loss': 0.1930968398275448, 'evaluation_losses': [0.4252478170845952], 'machine_time': 128120.0}, 300: {'training_loss': 0.3189813131906243, 'evaluation_losses': [0.2784291538734018], 'machine_time': 442968.0}, 180: {'training_loss': 0.3379996283359481, 'evaluation_losses': [0.2784291538734018], 'machine_time': 283026.0}, 120: {'training_loss': 0.25674511919666315, 'evaluation_losses': [0.27057602221763405], 'machine_time': 196706.0}}, 6: {60: {'training_loss': 0.27197109707481965, 'evaluation_losses': [0.24241642178503517], 'machine_time': 730912.0}}, 4: {60: {'training_loss': 0.2725968098844544, 'evaluation_losses': [0.31734657191964083], 'machine_time': 408765.0}, 120: {'training_loss': 0.29514831238543554, 'evaluation_losses': [0.2784291538734018], 'machine_time': 1180806.0}, 90: {'training_loss': 0.30567893770161497, 'evaluation_losses': [0.2784291538734018], 'machine_time': 795329.0}, 180: {'training_loss': 0.29194838798637346, 'evaluation_losses': [0.2784291538734018], 'machine_time': 1603583.0}}
-			},
-			'forkjoin':{
-				6: {10: {'training_loss': 0.13676219697830647, 'evaluation_losses': [0.3032385379977294], 'machine_time': 189478.0}}, 2: {25: {'training_loss': 0.16226256165511616, 'evaluation_losses': [0.21595850171371658], 'machine_time': 189971.0}, 10: {'training_loss': 0.09079351984462354, 'evaluation_losses': [0.3032385379977294], 'machine_time': 70604.0}}, 1: {25: {'training_loss': 0.15249751861106212, 'evaluation_losses': [0.16835946446608238], 'machine_time': 77966.0}, 50: {'training_loss': 0.20323669621654689, 'evaluation_losses': [0.21595850171371658], 'machine_time': 131312.0}, 10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.3032385379977294], 'machine_time': 28286.0}}
-			},
-			'chain':{
-				1: {10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}, 50: {'training_loss': 0.09601403766796651, 'evaluation_losses': [0.09358715059655524], 'machine_time': 1062402.0}}
-			},
-		},
-		86400:{
-			'genome':{
-				4: {162: {'training_loss': 0.1782259948596065, 'evaluation_losses': [0.1933299956688224], 'machine_time': 983713.0}, 54: {'training_loss': 0.1765259854969281, 'evaluation_losses': [0.1933299956688224], 'machine_time': 198406.0}, 108: {'training_loss': 0.1619661289961098, 'evaluation_losses': [0.1933299956688224], 'machine_time': 677035.0}, 81: {'training_loss': 0.1634555634809887, 'evaluation_losses': [0.1933299956688224], 'machine_time': 428610.0}}, 2: {162: {'training_loss': 0.20094238192250483, 'evaluation_losses': [0.1933299956688224], 'machine_time': 542083.0}, 108: {'training_loss': 0.17565940239672617, 'evaluation_losses': [0.1933299956688224], 'machine_time': 366680.0}, 54: {'training_loss': 0.1840324582176792, 'evaluation_losses': [0.34485363712672873], 'machine_time': 102901.0}, 81: {'training_loss': 0.17534650962966827, 'evaluation_losses': [0.1933299956688224], 'machine_time': 227100.0}}, 1: {270: {'training_loss': 0.27552974916233486, 'evaluation_losses': [0.1933299956688224], 'machine_time': 388978.0}, 54: {'training_loss': 0.08581710415460117, 'evaluation_losses': [0.25444853956998686], 'machine_time': 41674.0}, 108: {'training_loss': 0.19771764027116734, 'evaluation_losses': [0.1933299956688224], 'machine_time': 154748.0}, 81: {'training_loss': 0.14618302251059662, 'evaluation_losses': [0.1454485823777167], 'machine_time': 93762.0}, 162: {'training_loss': 0.1889524655346547, 'evaluation_losses': [0.1669351284490803], 'machine_time': 232600.0}}, 6: {54: {'training_loss': 0.16439500813054134, 'evaluation_losses': [0.1933299956688224], 'machine_time': 337706.0}}
-			},
-			'seismology':{
-				2: {309: {'training_loss': 0.4851525743358091, 'evaluation_losses': [0.9054040034356088], 'machine_time': 780993.0}, 206: {'training_loss': 0.21239267737813683, 'evaluation_losses': [0.4004098738947475], 'machine_time': 488291.0}, 103: {'training_loss': 0.140915202332279, 'evaluation_losses': [0.8099438326342585], 'machine_time': 120125.0}, 154: {'training_loss': 0.17470464644339478, 'evaluation_losses': [0.6251485492761444], 'machine_time': 259263.0}}, 1: {103: {'training_loss': 0.09890921261017083, 'evaluation_losses': [0.9198553695881477], 'machine_time': 54416.0}, 309: {'training_loss': 0.24412427799315142, 'evaluation_losses': [0.4004098738947475], 'machine_time': 383970.0}, 515: {'training_loss': 0.3569668938430186, 'evaluation_losses': [0.9054040034356088], 'machine_time': 612920.0}, 206: {'training_loss': 0.23364331974919914, 'evaluation_losses': [0.4004098738947475], 'machine_time': 235076.0}, 154: {'training_loss': 0.16551469830414714, 'evaluation_losses': [1.4248735436488504], 'machine_time': 122028.0}}, 4: {103: {'training_loss': 0.19407950622163123, 'evaluation_losses': [0.4004098738947475], 'machine_time': 207265.0}, 309: {'training_loss': 0.5763076171146403, 'evaluation_losses': [0.9054040034356088], 'machine_time': 1285568.0}, 206: {'training_loss': 0.2131207344065794, 'evaluation_losses': [0.4004098738947475], 'machine_time': 825996.0}, 154: {'training_loss': 0.20379684068049597, 'evaluation_losses': [0.4004098738947475], 'machine_time': 443578.0}}, 6: {103: {'training_loss': 0.17424176341843164, 'evaluation_losses': [0.4004098738947475], 'machine_time': 339061.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.09601403766796651, 'evaluation_losses': [0.09358715059655524], 'machine_time': 1062402.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-			'epigenomics':{
-				1: {129: {'training_loss': 0.11176062965607392, 'evaluation_losses': [0.37429587458909264], 'machine_time': 414502.0}, 215: {'training_loss': 0.17326021870193214, 'evaluation_losses': [0.17075020877309222], 'machine_time': 601092.0}, 64: {'training_loss': 0.10234377805478471, 'evaluation_losses': [0.37429587458909264], 'machine_time': 200270.0}, 86: {'training_loss': 0.10213369088726021, 'evaluation_losses': [0.37429587458909264], 'machine_time': 303904.0}, 43: {'training_loss': 0.09070107756132814, 'evaluation_losses': [0.37429587458909264], 'machine_time': 99610.0}}, 4: {64: {'training_loss': 0.10423326331399534, 'evaluation_losses': [0.37429587458909264], 'machine_time': 1004117.0}, 86: {'training_loss': 0.10684379958781631, 'evaluation_losses': [0.37429587458909264], 'machine_time': 1508019.0}, 129: {'training_loss': 0.11871667169218188, 'evaluation_losses': [0.37429587458909264], 'machine_time': 2015144.0}, 43: {'training_loss': 0.0943927312705394, 'evaluation_losses': [0.37429587458909264], 'machine_time': 498179.0}}, 2: {129: {'training_loss': 0.1257906892660974, 'evaluation_losses': [0.37429587458909264], 'machine_time': 1014544.0}, 64: {'training_loss': 0.11017055941247338, 'evaluation_losses': [0.37429587458909264], 'machine_time': 501377.0}, 43: {'training_loss': 0.09733428674887573, 'evaluation_losses': [0.37429587458909264], 'machine_time': 249274.0}, 86: {'training_loss': 0.11223621487684075, 'evaluation_losses': [0.37429587458909264], 'machine_time': 754654.0}}, 6: {43: {'training_loss': 0.1253376419498577, 'evaluation_losses': [0.37429587458909264], 'machine_time': 930821.0}}
-			},
-			'forkjoin':{
-				6: {10: {'training_loss': 0.07942271935004905, 'evaluation_losses': [0.26843267696384915], 'machine_time': 189478.0}}, 2: {25: {'training_loss': 0.07628206904122362, 'evaluation_losses': [0.1817217103136134], 'machine_time': 189971.0}, 10: {'training_loss': 0.04333439222579552, 'evaluation_losses': [0.21780579495286903], 'machine_time': 70604.0}}, 1: {10: {'training_loss': 0.032812891521889924, 'evaluation_losses': [0.38764076745550224], 'machine_time': 28286.0}, 25: {'training_loss': 0.07111249415156569, 'evaluation_losses': [0.18536147550415458], 'machine_time': 77966.0}, 50: {'training_loss': 0.07359130408612254, 'evaluation_losses': [0.26429079298392627], 'machine_time': 131312.0}}
-			},
-			'soykb':{
-				1: {98: {'training_loss': 0.17219723839082293, 'evaluation_losses': [0.21554373486610073], 'machine_time': 88684.0}, 294: {'training_loss': 0.21261397368612991, 'evaluation_losses': [0.21554373486610073], 'machine_time': 525082.0}, 147: {'training_loss': 0.21135887963141572, 'evaluation_losses': [0.2491084246555327], 'machine_time': 184770.0}, 490: {'training_loss': 0.23317696955218728, 'evaluation_losses': [0.21554373486610073], 'machine_time': 772492.0}, 196: {'training_loss': 0.21231079696488575, 'evaluation_losses': [0.2491084246555327], 'machine_time': 335050.0}}, 4: {196: {'training_loss': 0.20898504261742568, 'evaluation_losses': [0.21554373486610073], 'machine_time': 1614009.0}, 147: {'training_loss': 0.1997679539599801, 'evaluation_losses': [0.21554373486610073], 'machine_time': 953325.0}, 294: {'training_loss': 0.19444033072117564, 'evaluation_losses': [0.21554373486610073], 'machine_time': 2359713.0}, 98: {'training_loss': 0.18902428865732349, 'evaluation_losses': [0.21554373486610073], 'machine_time': 481668.0}}, 2: {98: {'training_loss': 0.18374280126939577, 'evaluation_losses': [0.21554373486610073], 'machine_time': 216178.0}, 294: {'training_loss': 0.20228523111733296, 'evaluation_losses': [0.21554373486610073], 'machine_time': 1197703.0}, 147: {'training_loss': 0.20712068395262187, 'evaluation_losses': [0.21554373486610073], 'machine_time': 443460.0}, 196: {'training_loss': 0.21602166713674148, 'evaluation_losses': [0.2155366022345454], 'machine_time': 788344.0}}, 6: {98: {'training_loss': 0.21521018753330165, 'evaluation_losses': [0.21554373486610073], 'machine_time': 916032.0}}
-			},
-			'montage':{
-				2: {180: {'training_loss': 0.25385489867981675, 'evaluation_losses': [0.2704901612351894], 'machine_time': 763428.0}, 60: {'training_loss': 0.27121808314072815, 'evaluation_losses': [0.28001337249482283], 'machine_time': 184830.0}, 90: {'training_loss': 0.25920772229841266, 'evaluation_losses': [0.26287803585147146], 'machine_time': 365324.0}, 120: {'training_loss': 0.2562101647208349, 'evaluation_losses': [0.2704901612351894], 'machine_time': 548921.0}}, 4: {120: {'training_loss': 0.27598472545658326, 'evaluation_losses': [0.2704901612351894], 'machine_time': 1180806.0}, 60: {'training_loss': 0.25376088041770173, 'evaluation_losses': [0.47004661626974753], 'machine_time': 408765.0}, 90: {'training_loss': 0.2809498865746308, 'evaluation_losses': [0.3172858908857931], 'machine_time': 795329.0}, 180: {'training_loss': 0.2696257148699608, 'evaluation_losses': [0.2704901612351894], 'machine_time': 1603583.0}}, 1: {300: {'training_loss': 0.2500554666794729, 'evaluation_losses': [0.2704901612351894], 'machine_time': 442968.0}, 60: {'training_loss': 0.18077905695997182, 'evaluation_losses': [0.43112372746558786], 'machine_time': 62748.0}, 180: {'training_loss': 0.21011202195378914, 'evaluation_losses': [0.4253560426884297], 'machine_time': 283026.0}, 90: {'training_loss': 0.17945847635531906, 'evaluation_losses': [0.30845728776694525], 'machine_time': 128120.0}, 120: {'training_loss': 0.19625084143378074, 'evaluation_losses': [0.4253560426884297], 'machine_time': 196706.0}}, 6: {60: {'training_loss': 0.25393967254636435, 'evaluation_losses': [0.18881828256717786], 'machine_time': 730912.0}}
-			},
-		},
-	},
-	'single_sample':{
-		60:{
-			'epigenomics':{
-				4: {64: {'training_loss': 1.4829484740632706, 'evaluation_losses': [3.6391917989789535], 'machine_time': 253835.0}, 129: {'training_loss': 1.5534935126704494, 'evaluation_losses': [3.6391917989789535], 'machine_time': 247235.0}, 86: {'training_loss': 1.5336997953261566, 'evaluation_losses': [3.6391917989789535], 'machine_time': 250625.0}, 43: {'training_loss': 1.472533867957947, 'evaluation_losses': [3.6391917989789535], 'machine_time': 248905.0}}, 2: {43: {'training_loss': 1.4624079083530332, 'evaluation_losses': [3.6391917989789535], 'machine_time': 149664.0}, 64: {'training_loss': 1.5162181227387745, 'evaluation_losses': [3.6391917989789535], 'machine_time': 151443.0}, 129: {'training_loss': 1.5864370389264766, 'evaluation_losses': [3.6391917989789535], 'machine_time': 149292.0}, 86: {'training_loss': 1.5621809923049212, 'evaluation_losses': [3.6391917989789535], 'machine_time': 149643.0}}, 1: {86: {'training_loss': 1.5303516946850406, 'evaluation_losses': [3.6391917989789535], 'machine_time': 103634.0}, 129: {'training_loss': 1.526710547758987, 'evaluation_losses': [3.6391917989789535], 'machine_time': 110598.0}, 64: {'training_loss': 1.5651003153336007, 'evaluation_losses': [3.6391917989789535], 'machine_time': 100660.0}, 43: {'training_loss': 1.4849134012661305, 'evaluation_losses': [3.6391917989789535], 'machine_time': 99610.0}, 215: {'training_loss': 4.221550398431407, 'evaluation_losses': [3.6391917989789535], 'machine_time': 186590.0}}, 6: {43: {'training_loss': 0.9542674287442403, 'evaluation_losses': [3.6391917989789535], 'machine_time': 432642.0}}
-			},
-		},
-		300:{
-			'genome':{
-				4: {81: {'training_loss': 1.6786097468074752, 'evaluation_losses': [4.619764233253137], 'machine_time': 106005.0}, 54: {'training_loss': 1.8609028931500347, 'evaluation_losses': [4.619764233253137], 'machine_time': 95505.0}, 162: {'training_loss': 2.1361653743017155, 'evaluation_losses': [5.928034407063035], 'machine_time': 131275.0}, 108: {'training_loss': 1.6391770564468024, 'evaluation_losses': [4.619764233253137], 'machine_time': 108845.0}}, 2: {54: {'training_loss': 1.7251255829557475, 'evaluation_losses': [4.619764233253137], 'machine_time': 61227.0}, 81: {'training_loss': 1.544258222000264, 'evaluation_losses': [4.619644503457402], 'machine_time': 72111.0}, 108: {'training_loss': 1.3860416871060683, 'evaluation_losses': [4.619764233253137], 'machine_time': 78594.0}, 162: {'training_loss': 1.654723077292264, 'evaluation_losses': [5.928034407063035], 'machine_time': 97551.0}}, 1: {162: {'training_loss': 1.5491351588792872, 'evaluation_losses': [5.928034407063035], 'machine_time': 77852.0}, 54: {'training_loss': 1.9867779900904579, 'evaluation_losses': [4.619764233253137], 'machine_time': 41674.0}, 81: {'training_loss': 1.5880390145648309, 'evaluation_losses': [4.619764233253137], 'machine_time': 52088.0}, 108: {'training_loss': 1.3261554908193298, 'evaluation_losses': [4.619764233253137], 'machine_time': 60986.0}, 270: {'training_loss': 6.180168779197503, 'evaluation_losses': [5.928034407063035], 'machine_time': 156378.0}}, 6: {54: {'training_loss': 1.724648528950341, 'evaluation_losses': [4.619764233253137], 'machine_time': 139300.0}}
-			},
-			'seismology':{
-				4: {154: {'training_loss': 1.6273204834941164, 'evaluation_losses': [6.597169780812517], 'machine_time': 97175.0}, 309: {'training_loss': 10.902997889695497, 'evaluation_losses': [9.05248615005327], 'machine_time': 166870.0}, 206: {'training_loss': 10.925082044074479, 'evaluation_losses': [9.05248615005327], 'machine_time': 153390.0}, 103: {'training_loss': 1.6917200074834406, 'evaluation_losses': [6.597169780812517], 'machine_time': 87140.0}}, 2: {309: {'training_loss': 8.28068661160581, 'evaluation_losses': [9.05248615005327], 'machine_time': 143808.0}, 206: {'training_loss': 9.258014218290112, 'evaluation_losses': [9.05248615005327], 'machine_time': 115980.0}, 103: {'training_loss': 1.2776525636120921, 'evaluation_losses': [6.597169780812517], 'machine_time': 65709.0}, 154: {'training_loss': 2.3160529895961397, 'evaluation_losses': [9.05248615005327], 'machine_time': 71526.0}}, 1: {309: {'training_loss': 5.936058601246375, 'evaluation_losses': [9.05248615005327], 'machine_time': 148894.0}, 206: {'training_loss': 7.016781175573216, 'evaluation_losses': [9.05248615005327], 'machine_time': 113048.0}, 154: {'training_loss': 1.657544843275653, 'evaluation_losses': [9.05248615005327], 'machine_time': 67612.0}, 103: {'training_loss': 1.1301308548116094, 'evaluation_losses': [6.597169780812517], 'machine_time': 54416.0}, 515: {'training_loss': 4.123289284614861, 'evaluation_losses': [9.05248615005327], 'machine_time': 228950.0}}, 6: {103: {'training_loss': 1.3556516419890579, 'evaluation_losses': [6.597169780812517], 'machine_time': 131796.0}}
-			},
-			'epigenomics':{
-				6: {43: {'training_loss': 0.3436043933872046, 'evaluation_losses': [0.6540478855243073], 'machine_time': 432642.0}}, 1: {43: {'training_loss': 0.2526685338317398, 'evaluation_losses': [0.6540478855243073], 'machine_time': 99610.0}, 129: {'training_loss': 0.8667987463446328, 'evaluation_losses': [2.9034922609282945], 'machine_time': 110598.0}, 86: {'training_loss': 0.8496827952283704, 'evaluation_losses': [2.9034922609282945], 'machine_time': 103634.0}, 215: {'training_loss': 4.221550398431407, 'evaluation_losses': [3.6391917989789535], 'machine_time': 186590.0}, 64: {'training_loss': 0.8448430002932866, 'evaluation_losses': [2.9034922609282945], 'machine_time': 100660.0}}, 2: {86: {'training_loss': 0.842371725670535, 'evaluation_losses': [2.9034922609282945], 'machine_time': 149643.0}, 64: {'training_loss': 0.807742062570835, 'evaluation_losses': [2.9034922609282945], 'machine_time': 151443.0}, 43: {'training_loss': 0.24532152225034123, 'evaluation_losses': [0.6540478855243073], 'machine_time': 149664.0}, 129: {'training_loss': 0.8746506003452068, 'evaluation_losses': [2.9034922609282945], 'machine_time': 149292.0}}, 4: {43: {'training_loss': 0.7654408801264155, 'evaluation_losses': [2.9034922609282945], 'machine_time': 248905.0}, 129: {'training_loss': 0.8384134631218996, 'evaluation_losses': [2.9034922609282945], 'machine_time': 247235.0}, 86: {'training_loss': 0.8121398210494848, 'evaluation_losses': [2.9034922609282945], 'machine_time': 250625.0}, 64: {'training_loss': 0.7740545868824471, 'evaluation_losses': [2.9034922609282945], 'machine_time': 253835.0}}
-			},
-			'montage':{
-				4: {60: {'training_loss': 1.042404000693127, 'evaluation_losses': [5.414914009217057], 'machine_time': 223935.0}, 120: {'training_loss': 1.3928587436817232, 'evaluation_losses': [5.414914009217057], 'machine_time': 201880.0}, 90: {'training_loss': 1.2057640353289842, 'evaluation_losses': [5.414914009217057], 'machine_time': 206070.0}, 180: {'training_loss': 1.389912864721937, 'evaluation_losses': [5.4146911281884025], 'machine_time': 208270.0}}, 2: {90: {'training_loss': 1.5100159409782183, 'evaluation_losses': [5.414914009217057], 'machine_time': 115122.0}, 60: {'training_loss': 1.16876830980846, 'evaluation_losses': [5.414914009217057], 'machine_time': 122082.0}, 180: {'training_loss': 2.5581855193586365, 'evaluation_losses': [7.2004381314558765], 'machine_time': 128187.0}, 120: {'training_loss': 1.5339393285429974, 'evaluation_losses': [5.414914009217057], 'machine_time': 115011.0}}, 1: {90: {'training_loss': 2.2361189220024227, 'evaluation_losses': [5.414914009217057], 'machine_time': 65372.0}, 300: {'training_loss': 11.135932385413405, 'evaluation_losses': [7.2004381314558765], 'machine_time': 159942.0}, 180: {'training_loss': 3.21062176499013, 'evaluation_losses': [7.2004381314558765], 'machine_time': 86320.0}, 60: {'training_loss': 2.1489828358190954, 'evaluation_losses': [5.414914009217057], 'machine_time': 62748.0}, 120: {'training_loss': 2.237736752429197, 'evaluation_losses': [5.414914009217057], 'machine_time': 68586.0}}, 6: {60: {'training_loss': 0.9787821250575043, 'evaluation_losses': [5.414914009217057], 'machine_time': 322147.0}}
-			},
-			'forkjoin':{
-				2: {25: {'training_loss': 0.5250523709558291, 'evaluation_losses': [0.589911600321206], 'machine_time': 69687.0}, 10: {'training_loss': 0.20109327059347842, 'evaluation_losses': [0.34481609351168746], 'machine_time': 42318.0}}, 1: {10: {'training_loss': 0.20179944600710206, 'evaluation_losses': [0.34478562369860893], 'machine_time': 28286.0}, 50: {'training_loss': 1.751346902967587, 'evaluation_losses': [1.8693583670569063], 'machine_time': 53346.0}, 25: {'training_loss': 0.5350494236613352, 'evaluation_losses': [0.589911600321206], 'machine_time': 49680.0}}, 6: {10: {'training_loss': 0.21698338517036947, 'evaluation_losses': [1.8693583670569063], 'machine_time': 118874.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.133597711329716, 'evaluation_losses': [0.12787283264986246], 'machine_time': 625694.0}, 10: {'training_loss': 0.1063989426543291, 'evaluation_losses': [0.12787283264986246], 'machine_time': 89986.0}}
-			},
-			'soykb':{
-				2: {294: {'training_loss': 10.850594245166539, 'evaluation_losses': [9.237366668855547], 'machine_time': 219327.0}, 196: {'training_loss': 11.32155768436896, 'evaluation_losses': [9.237366668855547], 'machine_time': 194604.0}, 147: {'training_loss': 3.1484138207067147, 'evaluation_losses': [9.237366668855547], 'machine_time': 131196.0}, 98: {'training_loss': 1.7106387946713744, 'evaluation_losses': [7.0298754271680695], 'machine_time': 127494.0}}, 1: {490: {'training_loss': 7.321279094053725, 'evaluation_losses': [9.237366668855547], 'machine_time': 247410.0}, 294: {'training_loss': 8.889141377901383, 'evaluation_losses': [9.237366668855547], 'machine_time': 190032.0}, 98: {'training_loss': 1.7407239280547988, 'evaluation_losses': [7.0298754271680695], 'machine_time': 88684.0}, 196: {'training_loss': 10.1490861519834, 'evaluation_losses': [9.237366668855547], 'machine_time': 150280.0}, 147: {'training_loss': 1.7924503344180358, 'evaluation_losses': [7.02987317405312], 'machine_time': 96086.0}}, 4: {294: {'training_loss': 11.063244260562355, 'evaluation_losses': [9.237366668855547], 'machine_time': 336345.0}, 196: {'training_loss': 10.58462952971323, 'evaluation_losses': [9.237366668855547], 'machine_time': 315800.0}, 147: {'training_loss': 1.4278085482296001, 'evaluation_losses': [7.02987317405312], 'machine_time': 244375.0}, 98: {'training_loss': 1.1261637531682291, 'evaluation_losses': [7.0298754271680695], 'machine_time': 265490.0}}, 6: {98: {'training_loss': 0.7952015009263536, 'evaluation_losses': [7.0298754271680695], 'machine_time': 434364.0}}
-			},
-		},
-		600:{
-			'montage':{
-				6: {60: {'training_loss': 0.2894197616766949, 'evaluation_losses': [1.7074221362177266], 'machine_time': 322147.0}}, 2: {90: {'training_loss': 1.3579745955297458, 'evaluation_losses': [5.870513475800328], 'machine_time': 115122.0}, 180: {'training_loss': 1.5034543436924426, 'evaluation_losses': [5.414914009217057], 'machine_time': 128187.0}, 120: {'training_loss': 1.5339393285429974, 'evaluation_losses': [5.414914009217057], 'machine_time': 115011.0}, 60: {'training_loss': 0.2647397829702818, 'evaluation_losses': [1.7074221362177266], 'machine_time': 122082.0}}, 4: {90: {'training_loss': 1.082923567433281, 'evaluation_losses': [5.870513475800328], 'machine_time': 206070.0}, 180: {'training_loss': 1.3914424527980487, 'evaluation_losses': [5.414914009217057], 'machine_time': 208270.0}, 120: {'training_loss': 1.3928587436817232, 'evaluation_losses': [5.414914009217057], 'machine_time': 201880.0}, 60: {'training_loss': 0.20178260129532444, 'evaluation_losses': [1.0688679942821198], 'machine_time': 223935.0}}, 1: {300: {'training_loss': 11.135932385413405, 'evaluation_losses': [7.2004381314558765], 'machine_time': 159942.0}, 120: {'training_loss': 2.237736752429197, 'evaluation_losses': [5.414914009217057], 'machine_time': 68586.0}, 60: {'training_loss': 0.5994910785901307, 'evaluation_losses': [1.7074221362177266], 'machine_time': 62748.0}, 180: {'training_loss': 1.979805362828562, 'evaluation_losses': [5.414914009217057], 'machine_time': 86320.0}, 90: {'training_loss': 0.6571636334062232, 'evaluation_losses': [1.7074221362177266], 'machine_time': 65372.0}}
-			},
-			'epigenomics':{
-				4: {86: {'training_loss': 0.26379248598653143, 'evaluation_losses': [0.6540478855243073], 'machine_time': 250625.0}, 43: {'training_loss': 0.08850962031386672, 'evaluation_losses': [0.37433170167504987], 'machine_time': 248905.0}, 64: {'training_loss': 0.0962077219202118, 'evaluation_losses': [0.37433170167504987], 'machine_time': 253835.0}, 129: {'training_loss': 0.274967813150593, 'evaluation_losses': [0.6540478855243073], 'machine_time': 247235.0}}, 1: {43: {'training_loss': 0.09070107756132814, 'evaluation_losses': [0.37433170167504987], 'machine_time': 99610.0}, 64: {'training_loss': 0.11398647854824129, 'evaluation_losses': [0.37433170167504987], 'machine_time': 100660.0}, 86: {'training_loss': 0.10095110438826074, 'evaluation_losses': [0.37433170167504987], 'machine_time': 103634.0}, 215: {'training_loss': 3.6410237169902127, 'evaluation_losses': [2.9034922609282945], 'machine_time': 186590.0}, 129: {'training_loss': 0.8667987463446328, 'evaluation_losses': [2.9034922609282945], 'machine_time': 110598.0}}, 6: {43: {'training_loss': 0.2181723739878126, 'evaluation_losses': [0.37433170167504987], 'machine_time': 432642.0}}, 2: {129: {'training_loss': 0.26397660157505776, 'evaluation_losses': [0.6540478855243073], 'machine_time': 149292.0}, 43: {'training_loss': 0.10396749593642332, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149664.0}, 64: {'training_loss': 0.13202718560390075, 'evaluation_losses': [0.37433170167504987], 'machine_time': 151443.0}, 86: {'training_loss': 0.274491748103871, 'evaluation_losses': [0.6540478855243073], 'machine_time': 149643.0}}
-			},
-			'genome':{
-				1: {162: {'training_loss': 0.9653500918306256, 'evaluation_losses': [4.619764233253137], 'machine_time': 77852.0}, 54: {'training_loss': 0.5161381956789873, 'evaluation_losses': [1.370886816415533], 'machine_time': 41674.0}, 270: {'training_loss': 5.166853190948136, 'evaluation_losses': [4.619764233253137], 'machine_time': 156378.0}, 81: {'training_loss': 0.49472262615907486, 'evaluation_losses': [1.370886816415533], 'machine_time': 52088.0}, 108: {'training_loss': 0.48865982867996194, 'evaluation_losses': [1.370886816415533], 'machine_time': 60986.0}}, 4: {162: {'training_loss': 1.293904122907115, 'evaluation_losses': [4.619644503457402], 'machine_time': 131275.0}, 54: {'training_loss': 0.43853289510812027, 'evaluation_losses': [0.9638833796538521], 'machine_time': 95505.0}, 108: {'training_loss': 0.4448685944843424, 'evaluation_losses': [1.3709112687931369], 'machine_time': 108845.0}, 81: {'training_loss': 0.4818951956628756, 'evaluation_losses': [1.370886816415533], 'machine_time': 106005.0}}, 2: {108: {'training_loss': 1.3860416871060683, 'evaluation_losses': [4.619764233253137], 'machine_time': 78594.0}, 162: {'training_loss': 1.0271011736224565, 'evaluation_losses': [4.619764233253137], 'machine_time': 97551.0}, 54: {'training_loss': 0.3091950013931578, 'evaluation_losses': [0.5332440098984288], 'machine_time': 61227.0}, 81: {'training_loss': 0.47413203693951345, 'evaluation_losses': [1.370886816415533], 'machine_time': 72111.0}}, 6: {54: {'training_loss': 0.37844053211034184, 'evaluation_losses': [0.9638833796538521], 'machine_time': 139300.0}}
-			},
-			'seismology':{
-				1: {515: {'training_loss': 4.123289284614861, 'evaluation_losses': [9.05248615005327], 'machine_time': 228950.0}, 309: {'training_loss': 5.936058601246375, 'evaluation_losses': [9.05248615005327], 'machine_time': 148894.0}, 103: {'training_loss': 1.1301308548116094, 'evaluation_losses': [6.597169780812517], 'machine_time': 54416.0}, 206: {'training_loss': 7.016781175573216, 'evaluation_losses': [9.05248615005327], 'machine_time': 113048.0}, 154: {'training_loss': 0.9881795108224266, 'evaluation_losses': [6.597169780812517], 'machine_time': 67612.0}}, 2: {206: {'training_loss': 9.258014218290112, 'evaluation_losses': [9.05248615005327], 'machine_time': 115980.0}, 309: {'training_loss': 8.28068661160581, 'evaluation_losses': [9.05248615005327], 'machine_time': 143808.0}, 154: {'training_loss': 1.379571273955493, 'evaluation_losses': [6.597169780812517], 'machine_time': 71526.0}, 103: {'training_loss': 1.2776525636120921, 'evaluation_losses': [6.597169780812517], 'machine_time': 65709.0}}, 4: {103: {'training_loss': 0.46309193465161486, 'evaluation_losses': [2.028645944571615], 'machine_time': 87140.0}, 206: {'training_loss': 10.925082044074479, 'evaluation_losses': [9.05248615005327], 'machine_time': 153390.0}, 309: {'training_loss': 10.902997889695497, 'evaluation_losses': [9.05248615005327], 'machine_time': 166870.0}, 154: {'training_loss': 1.6273204834941164, 'evaluation_losses': [6.597169780812517], 'machine_time': 97175.0}}, 6: {103: {'training_loss': 1.3556516419890579, 'evaluation_losses': [6.597169780812517], 'machine_time': 131796.0}}
-			},
-			'forkjoin':{
-				1: {25: {'training_loss': 0.2680827695381478, 'evaluation_losses': [0.34478562369860893], 'machine_time': 49680.0}, 50: {'training_loss': 0.3013496943389528, 'evaluation_losses': [0.34478562369860893], 'machine_time': 53346.0}, 10: {'training_loss': 0.11717911880876876, 'evaluation_losses': [0.30710368074163846], 'machine_time': 28286.0}}, 2: {10: {'training_loss': 0.11374212548333186, 'evaluation_losses': [0.30710368074163846], 'machine_time': 42318.0}, 25: {'training_loss': 0.26324511322726646, 'evaluation_losses': [0.34478562369860893], 'machine_time': 69687.0}}, 6: {10: {'training_loss': 0.09879769202198133, 'evaluation_losses': [0.2731125966534577], 'machine_time': 118874.0}}
-			},
-			'soykb':{
-				1: {490: {'training_loss': 7.321279094053725, 'evaluation_losses': [9.237366668855547], 'machine_time': 247410.0}, 196: {'training_loss': 7.7564855214231665, 'evaluation_losses': [7.0298754271680695], 'machine_time': 150280.0}, 294: {'training_loss': 8.889141377901383, 'evaluation_losses': [9.237366668855547], 'machine_time': 190032.0}, 147: {'training_loss': 1.7924503344180358, 'evaluation_losses': [7.0298754271680695], 'machine_time': 96086.0}, 98: {'training_loss': 0.49495378347769, 'evaluation_losses': [2.203704253012487], 'machine_time': 88684.0}}, 4: {196: {'training_loss': 8.01438753102088, 'evaluation_losses': [7.02987317405312], 'machine_time': 315800.0}, 98: {'training_loss': 1.1261637531682291, 'evaluation_losses': [7.0298754271680695], 'machine_time': 265490.0}, 147: {'training_loss': 1.4278085482296001, 'evaluation_losses': [7.02987317405312], 'machine_time': 244375.0}, 294: {'training_loss': 11.063244260562355, 'evaluation_losses': [9.237366668855547], 'machine_time': 336345.0}}, 2: {147: {'training_loss': 1.8671994445776197, 'evaluation_losses': [7.0298754271680695], 'machine_time': 131196.0}, 98: {'training_loss': 1.7106387946713744, 'evaluation_losses': [7.0298754271680695], 'machine_time': 127494.0}, 294: {'training_loss': 10.850594245166539, 'evaluation_losses': [9.237366668855547], 'machine_time': 219327.0}, 196: {'training_loss': 8.65831472477575, 'evaluation_losses': [7.0298754271680695], 'machine_time': 194604.0}}, 6: {98: {'training_loss': 0.7952015009263536, 'evaluation_losses': [7.0298754271680695], 'machine_time': 434364.0}}
-			},
-			'chain':{
-				1: {10: {'training_loss': 0.1063989426543291, 'evaluation_losses': [0.12787283264986246], 'machine_time': 89986.0}, 50: {'training_loss': 0.133597711329716, 'evaluation_losses': [0.12787283264986246], 'machine_time': 625694.0}}
-			},
-		},
-		1800:{
-			'epigenomics':{
-				2: {64: {'training_loss': 0.13202718560390075, 'evaluation_losses': [0.37433170167504987], 'machine_time': 151443.0}, 43: {'training_loss': 0.10396749593642332, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149664.0}, 86: {'training_loss': 0.1313070093391717, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149643.0}, 129: {'training_loss': 0.19244171588215986, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149292.0}}, 1: {43: {'training_loss': 0.09070107756132814, 'evaluation_losses': [0.37433170167504987], 'machine_time': 99610.0}, 64: {'training_loss': 0.11398647854824129, 'evaluation_losses': [0.37433170167504987], 'machine_time': 100660.0}, 215: {'training_loss': 0.40083278685074675, 'evaluation_losses': [0.37433170167504987], 'machine_time': 186590.0}, 129: {'training_loss': 0.1406526432013121, 'evaluation_losses': [0.37433170167504987], 'machine_time': 110598.0}, 86: {'training_loss': 0.10095110438826074, 'evaluation_losses': [0.37433170167504987], 'machine_time': 103634.0}}, 4: {129: {'training_loss': 0.13009763914810105, 'evaluation_losses': [0.37433170167504987], 'machine_time': 247235.0}, 43: {'training_loss': 0.08850962031386672, 'evaluation_losses': [0.37433170167504987], 'machine_time': 248905.0}, 86: {'training_loss': 0.10345956479522381, 'evaluation_losses': [0.37433170167504987], 'machine_time': 250625.0}, 64: {'training_loss': 0.0962077219202118, 'evaluation_losses': [0.37433170167504987], 'machine_time': 253835.0}}, 6: {43: {'training_loss': 0.13622797903937153, 'evaluation_losses': [0.5638938095262929], 'machine_time': 432642.0}}
-			},
-			'soykb':{
-				1: {147: {'training_loss': 0.2672895454283326, 'evaluation_losses': [0.21556294799611517], 'machine_time': 96086.0}, 196: {'training_loss': 7.7564855214231665, 'evaluation_losses': [7.0298754271680695], 'machine_time': 150280.0}, 490: {'training_loss': 7.321279094053725, 'evaluation_losses': [9.237366668855547], 'machine_time': 247410.0}, 294: {'training_loss': 6.74515301232141, 'evaluation_losses': [7.0298754271680695], 'machine_time': 190032.0}, 98: {'training_loss': 0.1721972585585166, 'evaluation_losses': [0.21556294799611517], 'machine_time': 88684.0}}, 2: {147: {'training_loss': 0.19370758972369304, 'evaluation_losses': [0.21556294799611517], 'machine_time': 131196.0}, 196: {'training_loss': 2.7243356686384086, 'evaluation_losses': [2.203704253012487], 'machine_time': 194604.0}, 294: {'training_loss': 8.312611159210958, 'evaluation_losses': [7.02987317405312], 'machine_time': 219327.0}, 98: {'training_loss': 0.1952883765193177, 'evaluation_losses': [0.21556294799611517], 'machine_time': 127494.0}}, 4: {294: {'training_loss': 8.376180790747572, 'evaluation_losses': [7.0298754271680695], 'machine_time': 336345.0}, 98: {'training_loss': 0.19958696886506228, 'evaluation_losses': [0.21556294799611517], 'machine_time': 265490.0}, 196: {'training_loss': 8.014387559136129, 'evaluation_losses': [7.0298754271680695], 'machine_time': 315800.0}, 147: {'training_loss': 0.17053765577728455, 'evaluation_losses': [0.21556294799611517], 'machine_time': 244375.0}}, 6: {98: {'training_loss': 0.1274220251953605, 'evaluation_losses': [1.4039708671428581], 'machine_time': 434364.0}}
-			},
-			'montage':{
-				2: {120: {'training_loss': 0.2613207540547299, 'evaluation_losses': [0.2783170233271332], 'machine_time': 115011.0}, 180: {'training_loss': 0.39703977326389567, 'evaluation_losses': [1.7074221362177266], 'machine_time': 128187.0}, 90: {'training_loss': 0.24502073162177715, 'evaluation_losses': [0.2783170233271332], 'machine_time': 115122.0}, 60: {'training_loss': 0.258933596725073, 'evaluation_losses': [0.2782234085883534], 'machine_time': 122082.0}}, 1: {120: {'training_loss': 0.28402064461132176, 'evaluation_losses': [0.2783170233271332], 'machine_time': 68586.0}, 60: {'training_loss': 0.3195483283942305, 'evaluation_losses': [0.2783170233271332], 'machine_time': 62748.0}, 90: {'training_loss': 0.44078161236083735, 'evaluation_losses': [0.2783170233271332], 'machine_time': 65372.0}, 300: {'training_loss': 8.79185468853161, 'evaluation_losses': [5.414914009217057], 'machine_time': 159942.0}, 180: {'training_loss': 0.30680755623456213, 'evaluation_losses': [0.2783170233271332], 'machine_time': 86320.0}}, 4: {120: {'training_loss': 0.2772165098836582, 'evaluation_losses': [0.2783170233271332], 'machine_time': 201880.0}, 60: {'training_loss': 0.20178260129532444, 'evaluation_losses': [1.0688679942821198], 'machine_time': 223935.0}, 180: {'training_loss': 0.3597512419380046, 'evaluation_losses': [1.7074221362177266], 'machine_time': 208270.0}, 90: {'training_loss': 0.28640798547123925, 'evaluation_losses': [0.2783170233271332], 'machine_time': 206070.0}}, 6: {60: {'training_loss': 0.16704792511453173, 'evaluation_losses': [1.0688679942821198], 'machine_time': 322147.0}}
-			},
-			'genome':{
-				2: {54: {'training_loss': 0.3070269841370887, 'evaluation_losses': [0.533254017511746], 'machine_time': 61227.0}, 81: {'training_loss': 0.26897851794472294, 'evaluation_losses': [0.591587506000315], 'machine_time': 72111.0}, 108: {'training_loss': 0.24563741558669364, 'evaluation_losses': [0.591587506000315], 'machine_time': 78594.0}, 162: {'training_loss': 0.28514111965703215, 'evaluation_losses': [0.9638833796538521], 'machine_time': 97551.0}}, 4: {81: {'training_loss': 0.28018113803075645, 'evaluation_losses': [0.533254017511746], 'machine_time': 106005.0}, 54: {'training_loss': 0.2533757110525959, 'evaluation_losses': [0.533254017511746], 'machine_time': 95505.0}, 108: {'training_loss': 0.31757744988765413, 'evaluation_losses': [0.591587506000315], 'machine_time': 108845.0}, 162: {'training_loss': 0.38678119428896773, 'evaluation_losses': [1.370886816415533], 'machine_time': 131275.0}}, 1: {81: {'training_loss': 0.2872131611701952, 'evaluation_losses': [0.533254017511746], 'machine_time': 52088.0}, 270: {'training_loss': 5.166853190948136, 'evaluation_losses': [4.619764233253137], 'machine_time': 156378.0}, 108: {'training_loss': 0.2702474562031247, 'evaluation_losses': [0.591587506000315], 'machine_time': 60986.0}, 162: {'training_loss': 0.29331319803970796, 'evaluation_losses': [0.9638833796538521], 'machine_time': 77852.0}, 54: {'training_loss': 0.27378105866390506, 'evaluation_losses': [0.533254017511746], 'machine_time': 41674.0}}, 6: {54: {'training_loss': 0.2710659618219356, 'evaluation_losses': [0.533254017511746], 'machine_time': 139300.0}}
-			},
-			'seismology':{
-				2: {154: {'training_loss': 0.40339985561742314, 'evaluation_losses': [2.028701669605716], 'machine_time': 71526.0}, 103: {'training_loss': 0.2416811489082056, 'evaluation_losses': [1.121688130273891], 'machine_time': 65709.0}, 309: {'training_loss': 6.194446347370215, 'evaluation_losses': [6.597169780812517], 'machine_time': 143808.0}, 206: {'training_loss': 2.1238790658099487, 'evaluation_losses': [2.028701669605716], 'machine_time': 115980.0}}, 6: {103: {'training_loss': 0.3945326967495242, 'evaluation_losses': [2.028701669605716], 'machine_time': 131796.0}}, 1: {206: {'training_loss': 1.710553996755657, 'evaluation_losses': [2.028645944571615], 'machine_time': 113048.0}, 515: {'training_loss': 4.123289284614861, 'evaluation_losses': [9.05248615005327], 'machine_time': 228950.0}, 309: {'training_loss': 4.485505309935095, 'evaluation_losses': [6.597169780812517], 'machine_time': 148894.0}, 154: {'training_loss': 0.4292811918258869, 'evaluation_losses': [2.028701669605716], 'machine_time': 67612.0}, 103: {'training_loss': 0.2316287745767216, 'evaluation_losses': [1.121688130273891], 'machine_time': 54416.0}}, 4: {154: {'training_loss': 0.43748112361761177, 'evaluation_losses': [2.028701669605716], 'machine_time': 97175.0}, 206: {'training_loss': 2.489448467614675, 'evaluation_losses': [2.028701669605716], 'machine_time': 153390.0}, 103: {'training_loss': 0.3758553415408114, 'evaluation_losses': [1.121688130273891], 'machine_time': 87140.0}, 309: {'training_loss': 8.077854319358789, 'evaluation_losses': [6.597169780812517], 'machine_time': 166870.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.11005274249534278, 'evaluation_losses': [0.11332763231830498], 'machine_time': 625694.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-			'forkjoin':{
-				6: {10: {'training_loss': 0.08230592742476078, 'evaluation_losses': [0.3799001883633034], 'machine_time': 118874.0}}, 2: {25: {'training_loss': 0.17068787166327345, 'evaluation_losses': [0.2158668540303725], 'machine_time': 69687.0}, 10: {'training_loss': 0.08946267972762108, 'evaluation_losses': [0.30320290671009], 'machine_time': 42318.0}}, 1: {50: {'training_loss': 0.252806602119299, 'evaluation_losses': [0.2158668540303725], 'machine_time': 53346.0}, 25: {'training_loss': 0.20596709130712665, 'evaluation_losses': [0.2158668540303725], 'machine_time': 49680.0}, 10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.30320290671009], 'machine_time': 28286.0}}
-			},
-		},
-		3600:{
-			'epigenomics':{
-				2: {64: {'training_loss': 0.13202718560390075, 'evaluation_losses': [0.37433170167504987], 'machine_time': 151443.0}, 86: {'training_loss': 0.1313070093391717, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149643.0}, 43: {'training_loss': 0.10396749593642332, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149664.0}, 129: {'training_loss': 0.19244171588215986, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149292.0}}, 4: {129: {'training_loss': 0.13009763914810105, 'evaluation_losses': [0.37433170167504987], 'machine_time': 247235.0}, 43: {'training_loss': 0.08850962031386672, 'evaluation_losses': [0.37433170167504987], 'machine_time': 248905.0}, 64: {'training_loss': 0.0962077219202118, 'evaluation_losses': [0.37433170167504987], 'machine_time': 253835.0}, 86: {'training_loss': 0.10345956479522381, 'evaluation_losses': [0.37433170167504987], 'machine_time': 250625.0}}, 1: {43: {'training_loss': 0.09070107756132814, 'evaluation_losses': [0.37433170167504987], 'machine_time': 99610.0}, 64: {'training_loss': 0.11398647854824129, 'evaluation_losses': [0.37433170167504987], 'machine_time': 100660.0}, 86: {'training_loss': 0.10095110438826074, 'evaluation_losses': [0.37433170167504987], 'machine_time': 103634.0}, 129: {'training_loss': 0.1406526432013121, 'evaluation_losses': [0.37433170167504987], 'machine_time': 110598.0}, 215: {'training_loss': 0.3821382921109415, 'evaluation_losses': [0.3642371107632171], 'machine_time': 186590.0}}, 6: {43: {'training_loss': 0.13622797903937153, 'evaluation_losses': [0.5638938095262929], 'machine_time': 432642.0}}
-			},
-			'genome':{
-				2: {54: {'training_loss': 0.14973431098506967, 'evaluation_losses': [0.1933353012882317], 'machine_time': 61227.0}, 81: {'training_loss': 0.2485146901692154, 'evaluation_losses': [0.49460787499841596], 'machine_time': 72111.0}, 108: {'training_loss': 0.24563741558669364, 'evaluation_losses': [0.591587506000315], 'machine_time': 78594.0}, 162: {'training_loss': 0.19072152168258688, 'evaluation_losses': [0.591587506000315], 'machine_time': 97551.0}}, 1: {108: {'training_loss': 0.2702474562031247, 'evaluation_losses': [0.591587506000315], 'machine_time': 60986.0}, 162: {'training_loss': 0.21848485352117486, 'evaluation_losses': [0.5916028429648097], 'machine_time': 77852.0}, 81: {'training_loss': 0.2872131611701952, 'evaluation_losses': [0.533254017511746], 'machine_time': 52088.0}, 270: {'training_loss': 0.5011924980278081, 'evaluation_losses': [0.533254017511746], 'machine_time': 156378.0}, 54: {'training_loss': 0.2237226273771125, 'evaluation_losses': [0.1933353012882317], 'machine_time': 41674.0}}, 4: {81: {'training_loss': 0.12322658366759329, 'evaluation_losses': [0.1933353012882317], 'machine_time': 106005.0}, 108: {'training_loss': 0.31757744988765413, 'evaluation_losses': [0.591587506000315], 'machine_time': 108845.0}, 54: {'training_loss': 0.15612102353360527, 'evaluation_losses': [0.1933353012882317], 'machine_time': 95505.0}, 162: {'training_loss': 0.19631203683545498, 'evaluation_losses': [0.591587506000315], 'machine_time': 131275.0}}, 6: {54: {'training_loss': 0.1280020856182821, 'evaluation_losses': [0.1933353012882317], 'machine_time': 139300.0}}
-			},
-			'montage':{
-				2: {90: {'training_loss': 0.24502073162177715, 'evaluation_losses': [0.2783170233271332], 'machine_time': 115122.0}, 120: {'training_loss': 0.2613207540547299, 'evaluation_losses': [0.2783170233271332], 'machine_time': 115011.0}, 60: {'training_loss': 0.1715305285820744, 'evaluation_losses': [0.2421718046329597], 'machine_time': 122082.0}, 180: {'training_loss': 0.28131233541738376, 'evaluation_losses': [0.2783170233271332], 'machine_time': 128187.0}}, 1: {90: {'training_loss': 0.33757074558559874, 'evaluation_losses': [1.0448115800294646], 'machine_time': 65372.0}, 300: {'training_loss': 2.799766007925986, 'evaluation_losses': [1.7074221362177266], 'machine_time': 159942.0}, 180: {'training_loss': 0.30680755623456213, 'evaluation_losses': [0.2783170233271332], 'machine_time': 86320.0}, 60: {'training_loss': 0.3187295715290656, 'evaluation_losses': [1.0448115800294646], 'machine_time': 62748.0}, 120: {'training_loss': 0.28402064461132176, 'evaluation_losses': [0.2783170233271332], 'machine_time': 68586.0}}, 6: {60: {'training_loss': 0.16662643548774878, 'evaluation_losses': [0.2421718046329597], 'machine_time': 322147.0}}, 4: {180: {'training_loss': 0.2585575459284437, 'evaluation_losses': [0.2783170233271332], 'machine_time': 208270.0}, 60: {'training_loss': 0.18579408046796805, 'evaluation_losses': [0.6855457193853068], 'machine_time': 223935.0}, 120: {'training_loss': 0.2772172265476111, 'evaluation_losses': [0.2782234085883534], 'machine_time': 201880.0}, 90: {'training_loss': 0.2323612179639661, 'evaluation_losses': [0.6855457193853068], 'machine_time': 206070.0}}
-			},
-			'soykb':{
-				1: {490: {'training_loss': 5.623368767684925, 'evaluation_losses': [7.02987317405312], 'machine_time': 247410.0}}, 4: {147: {'training_loss': 0.17053765577728455, 'evaluation_losses': [0.21556294799611517], 'machine_time': 244375.0}}, 2: {294: {'training_loss': 1.6176996890774773, 'evaluation_losses': [1.4039708671428581], 'machine_time': 219327.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.10755990205138898, 'evaluation_losses': [0.11915672801048384], 'machine_time': 625694.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-			'forkjoin':{
-				1: {50: {'training_loss': 0.25110853357773705, 'evaluation_losses': [0.2038533576810249], 'machine_time': 53346.0}, 25: {'training_loss': 0.20596709130712665, 'evaluation_losses': [0.2158668540303725], 'machine_time': 49680.0}, 10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.30320290671009], 'machine_time': 28286.0}}, 6: {10: {'training_loss': 0.08230592742476078, 'evaluation_losses': [0.37990784407022576], 'machine_time': 118874.0}}, 2: {25: {'training_loss': 0.17068787166327345, 'evaluation_losses': [0.2158668540303725], 'machine_time': 69687.0}, 10: {'training_loss': 0.08946267972762108, 'evaluation_losses': [0.30320290671009], 'machine_time': 42318.0}}
-			},
-		},
-		7200:{
-		},
-		18000:{
-		},
-		86400:{
-			'seismology':{
-				1: {103: {'training_loss': 0.10540439379326705, 'evaluation_losses': [0.7567774575145696], 'machine_time': 54416.0}, 515: {'training_loss': 0.2955214460305575, 'evaluation_losses': [0.9054028965559352], 'machine_time': 228950.0}, 309: {'training_loss': 0.2703339648160626, 'evaluation_losses': [0.40042278552300903], 'machine_time': 148894.0}, 206: {'training_loss': 0.25208336590921415, 'evaluation_losses': [0.40042278552300903], 'machine_time': 113048.0}, 154: {'training_loss': 0.1770172418242743, 'evaluation_losses': [0.5902106997144231], 'machine_time': 67612.0}}, 2: {103: {'training_loss': 0.15676931703364808, 'evaluation_losses': [0.5742710023275728], 'machine_time': 65709.0}, 206: {'training_loss': 0.19983410449360697, 'evaluation_losses': [0.40042278552300903], 'machine_time': 115980.0}, 309: {'training_loss': 0.25815557366220976, 'evaluation_losses': [0.40042278552300903], 'machine_time': 143808.0}, 154: {'training_loss': 0.1397555560642769, 'evaluation_losses': [0.7143337404164323], 'machine_time': 71526.0}}, 4: {309: {'training_loss': 0.20455262459867282, 'evaluation_losses': [0.24615189400874235], 'machine_time': 166870.0}, 103: {'training_loss': 0.15671328986519606, 'evaluation_losses': [0.8618906062279377], 'machine_time': 87140.0}, 206: {'training_loss': 0.2295700076013099, 'evaluation_losses': [0.40042278552300903], 'machine_time': 153390.0}, 154: {'training_loss': 0.1987053731750589, 'evaluation_losses': [0.4425630364609997], 'machine_time': 97175.0}}, 6: {103: {'training_loss': 0.11472811563616817, 'evaluation_losses': [0.40042278552300903], 'machine_time': 131796.0}}
-			},
-			'epigenomics':{
-				1: {129: {'training_loss': 0.14062478266588518, 'evaluation_losses': [0.3742653567136348], 'machine_time': 110598.0}, 215: {'training_loss': 0.1363101502588614, 'evaluation_losses': [0.13291844003851372], 'machine_time': 186590.0}, 43: {'training_loss': 0.09070107756132832, 'evaluation_losses': [0.3742653567136348], 'machine_time': 99610.0}, 64: {'training_loss': 0.11398647854824127, 'evaluation_losses': [0.3742653567136348], 'machine_time': 100660.0}, 86: {'training_loss': 0.10171351655221077, 'evaluation_losses': [0.3742653567136348], 'machine_time': 103634.0}}, 4: {64: {'training_loss': 0.09620772192021226, 'evaluation_losses': [0.3742653567136348], 'machine_time': 253835.0}, 86: {'training_loss': 0.10345956479522599, 'evaluation_losses': [0.3742653567136348], 'machine_time': 250625.0}, 129: {'training_loss': 0.11212023645007584, 'evaluation_losses': [0.13942989194542413], 'machine_time': 247235.0}, 43: {'training_loss': 0.08850962031386722, 'evaluation_losses': [0.3742653567136348], 'machine_time': 248905.0}}, 2: {86: {'training_loss': 0.10617910044732254, 'evaluation_losses': [0.2217967110552641], 'machine_time': 149643.0}, 129: {'training_loss': 0.14397880286188183, 'evaluation_losses': [0.17075074723278288], 'machine_time': 149292.0}, 64: {'training_loss': 0.13202718560390014, 'evaluation_losses': [0.3742653567136348], 'machine_time': 151443.0}, 43: {'training_loss': 0.10396749593642324, 'evaluation_losses': [0.3742653567136348], 'machine_time': 149664.0}}, 6: {43: {'training_loss': 0.10713490662189729, 'evaluation_losses': [0.3987793983139432], 'machine_time': 432642.0}}
-			},
-			'genome':{
-				1: {108: {'training_loss': 0.1737103304909149, 'evaluation_losses': [0.21060720984353043], 'machine_time': 60986.0}, 270: {'training_loss': 0.19613779299745124, 'evaluation_losses': [0.3217051833462672], 'machine_time': 156378.0}, 162: {'training_loss': 0.10071911726683813, 'evaluation_losses': [0.5353909646006934], 'machine_time': 77852.0}, 54: {'training_loss': 0.18545383616885042, 'evaluation_losses': [0.3448052909936255], 'machine_time': 41674.0}, 81: {'training_loss': 0.13692519773187978, 'evaluation_losses': [0.2581458093680142], 'machine_time': 52088.0}}, 6: {54: {'training_loss': 0.12800186938542363, 'evaluation_losses': [0.19315245158043767], 'machine_time': 139300.0}}, 4: {108: {'training_loss': 0.10808947030207221, 'evaluation_losses': [0.14115802854678597], 'machine_time': 108845.0}, 81: {'training_loss': 0.1231470884702346, 'evaluation_losses': [0.19315245158043767], 'machine_time': 106005.0}, 54: {'training_loss': 0.15114457161509512, 'evaluation_losses': [0.17706472687189997], 'machine_time': 95505.0}, 162: {'training_loss': 0.11484333910764884, 'evaluation_losses': [0.21093614076558276], 'machine_time': 131275.0}}, 2: {162: {'training_loss': 0.10835026174748218, 'evaluation_losses': [0.2301559166528914], 'machine_time': 97551.0}, 54: {'training_loss': 0.14973102285926648, 'evaluation_losses': [0.19315245158043767], 'machine_time': 61227.0}, 108: {'training_loss': 0.09323553267186016, 'evaluation_losses': [0.14545251285179955], 'machine_time': 78594.0}, 81: {'training_loss': 0.12970139689446736, 'evaluation_losses': [0.13495271546743812], 'machine_time': 72111.0}}
-			},
-			'montage':{
-				4: {180: {'training_loss': 0.10359732190296267, 'evaluation_losses': [0.1938733798101265], 'machine_time': 208270.0}, 60: {'training_loss': 0.13850444637425524, 'evaluation_losses': [0.2113625949895496], 'machine_time': 223935.0}, 90: {'training_loss': 0.16229724480572982, 'evaluation_losses': [0.3654581804207108], 'machine_time': 206070.0}, 120: {'training_loss': 0.19727528698392907, 'evaluation_losses': [0.31756900647451697], 'machine_time': 201880.0}}, 2: {60: {'training_loss': 0.14129637629509495, 'evaluation_losses': [0.275402461654421], 'machine_time': 122082.0}, 180: {'training_loss': 0.17560527542556423, 'evaluation_losses': [0.1555065143466527], 'machine_time': 128187.0}, 90: {'training_loss': 0.20476138131756474, 'evaluation_losses': [0.21140431412673866], 'machine_time': 115122.0}, 120: {'training_loss': 0.17934628906132627, 'evaluation_losses': [0.20857720518004502], 'machine_time': 115011.0}}, 6: {60: {'training_loss': 0.15002700821260795, 'evaluation_losses': [0.8243069332036415], 'machine_time': 322147.0}}, 1: {300: {'training_loss': 0.23203210284365197, 'evaluation_losses': [0.27051029551682093], 'machine_time': 159942.0}, 120: {'training_loss': 0.18845639777736733, 'evaluation_losses': [0.3448220421127484], 'machine_time': 68586.0}, 180: {'training_loss': 0.251729965554466, 'evaluation_losses': [0.425321246104643], 'machine_time': 86320.0}, 90: {'training_loss': 0.19911779588615855, 'evaluation_losses': [0.425321246104643], 'machine_time': 65372.0}, 60: {'training_loss': 0.1543881209730893, 'evaluation_losses': [0.3355440966058819], 'machine_time': 62748.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.0711550791810043, 'evaluation_losses': [0.07664420422961352], 'machine_time': 625694.0}, 10: {'training_loss': 0.0816681114086735, 'evaluation_losses': [0.12936948569274817], 'machine_time': 89986.0}}
-			},
-			'soykb':{
-				2: {147: {'training_loss': 0.19370633422170094, 'evaluation_losses': [0.21558374739008238], 'machine_time': 131196.0}, 196: {'training_loss': 0.19512216176026578, 'evaluation_losses': [0.15300556472382457], 'machine_time': 194604.0}, 98: {'training_loss': 0.1952883641479686, 'evaluation_losses': [0.21558374739008238], 'machine_time': 127494.0}, 294: {'training_loss': 0.15799736653079313, 'evaluation_losses': [0.21558374739008238], 'machine_time': 219327.0}}, 4: {98: {'training_loss': 0.1605925672150573, 'evaluation_losses': [0.3344482116007857], 'machine_time': 265490.0}, 294: {'training_loss': 0.13806036341959507, 'evaluation_losses': [0.21558374739008238], 'machine_time': 336345.0}, 147: {'training_loss': 0.17053784054987878, 'evaluation_losses': [0.21558374739008238], 'machine_time': 244375.0}, 196: {'training_loss': 0.18463446602844805, 'evaluation_losses': [0.2424138079051269], 'machine_time': 315800.0}}, 1: {294: {'training_loss': 0.17830872423505095, 'evaluation_losses': [0.21558374739008238], 'machine_time': 190032.0}, 147: {'training_loss': 0.2195971172447061, 'evaluation_losses': [0.24911682874604343], 'machine_time': 96086.0}, 98: {'training_loss': 0.17219723839082293, 'evaluation_losses': [0.21558374739008238], 'machine_time': 88684.0}, 196: {'training_loss': 0.21374367294164162, 'evaluation_losses': [0.24911682874604343], 'machine_time': 150280.0}, 490: {'training_loss': 0.2974492585052919, 'evaluation_losses': [0.24911682874604343], 'machine_time': 247410.0}}, 6: {98: {'training_loss': 0.12078869704212065, 'evaluation_losses': [0.6004280443090525], 'machine_time': 434364.0}}
-			},
-			'forkjoin':{
-				6: {10: {'training_loss': 0.07878155656107085, 'evaluation_losses': [0.566645428317833], 'machine_time': 118874.0}}, 2: {25: {'training_loss': 0.09754979325139003, 'evaluation_losses': [0.06289495546855133], 'machine_time': 69687.0}, 10: {'training_loss': 0.08665845585812648, 'evaluation_losses': [0.4380798465215638], 'machine_time': 42318.0}}, 1: {10: {'training_loss': 0.052045091527041905, 'evaluation_losses': [0.20080998787435955], 'machine_time': 28286.0}, 25: {'training_loss': 0.17004063474953324, 'evaluation_losses': [0.17060884261166656], 'machine_time': 49680.0}, 50: {'training_loss': 0.15292465980958356, 'evaluation_losses': [0.11952512367267634], 'machine_time': 53346.0}}
-			},
-		},
-	},
-}
-data47={
-	'single_workflow':{
-		60:{
-			'epigenomics':{
-				1: {129: {'training_loss': 1.5267673083290276, 'evaluation_losses': [3.6391918465132873], 'machine_time': 414502.0}, 64: {'training_loss': 1.5250068582998655, 'evaluation_losses': [3.6391918465132873], 'machine_time': 200270.0}, 86: {'training_loss': 1.52678620608825, 'evaluation_losses': [3.6391918465132873], 'machine_time': 303904.0}}, 2: {43: {'training_loss': 1.4736606548095819, 'evaluation_losses': [3.6391918465132873], 'machine_time': 249274.0}, 86: {'training_loss': 1.5201939507406144, 'evaluation_losses': [3.6391918465132873], 'machine_time': 754654.0}, 64: {'training_loss': 1.5071599369228847, 'evaluation_losses': [3.6391918465132873], 'machine_time': 501377.0}}, 4: {43: {'training_loss': 1.4732850591923703, 'evaluation_losses': [3.6391918465132873], 'machine_time': 498179.0}, 64: {'training_loss': 1.4973536816187927, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1004117.0}}
-			},
-		},
-		300:{
-			'seismology':{
-				4: {154: {'training_loss': 2.281628738690002, 'evaluation_losses': [9.052505573689901], 'machine_time': 443578.0}, 103: {'training_loss': 2.303029225817966, 'evaluation_losses': [9.052505573689901], 'machine_time': 207265.0}, 206: {'training_loss': 4.99563062551747, 'evaluation_losses': [9.052505573689901], 'machine_time': 825996.0}}, 2: {154: {'training_loss': 2.008168290713861, 'evaluation_losses': [9.052505573689901], 'machine_time': 259263.0}, 206: {'training_loss': 4.459854380395284, 'evaluation_losses': [9.052505573689901], 'machine_time': 488291.0}, 103: {'training_loss': 2.029545793324182, 'evaluation_losses': [9.052505573689901], 'machine_time': 120125.0}}, 1: {103: {'training_loss': 1.1301308553804883, 'evaluation_losses': [6.597169775837247], 'machine_time': 54416.0}, 309: {'training_loss': 4.459584982443911, 'evaluation_losses': [9.052505573689901], 'machine_time': 383970.0}, 206: {'training_loss': 3.8689849972948, 'evaluation_losses': [9.052505573689901], 'machine_time': 235076.0}, 154: {'training_loss': 1.7704543845603071, 'evaluation_losses': [9.052505573689901], 'machine_time': 122028.0}, 515: {'training_loss': 4.384855592517674, 'evaluation_losses': [9.052505573689901], 'machine_time': 612920.0}}, 6: {103: {'training_loss': 2.3325438514062284, 'evaluation_losses': [9.052505573689901], 'machine_time': 339061.0}}
-			},
-			'epigenomics':{
-				4: {86: {'training_loss': 1.5122606490878956, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1508019.0}, 43: {'training_loss': 0.7675842233000031, 'evaluation_losses': [2.903491817711163], 'machine_time': 498179.0}, 129: {'training_loss': 1.5230822588661228, 'evaluation_losses': [3.6391918465132873], 'machine_time': 2015144.0}, 64: {'training_loss': 1.4973536816187927, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1004117.0}}, 2: {43: {'training_loss': 0.768655894886797, 'evaluation_losses': [2.903491817711163], 'machine_time': 249274.0}, 86: {'training_loss': 1.5201939507406144, 'evaluation_losses': [3.6391918465132873], 'machine_time': 754654.0}, 64: {'training_loss': 1.5071599369228847, 'evaluation_losses': [3.6391918465132873], 'machine_time': 501377.0}, 129: {'training_loss': 1.5292889320469563, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1014544.0}}, 1: {86: {'training_loss': 1.52678620608825, 'evaluation_losses': [3.6391918465132873], 'machine_time': 303904.0}, 129: {'training_loss': 1.5267673083290276, 'evaluation_losses': [3.6391918465132873], 'machine_time': 414502.0}, 43: {'training_loss': 0.7777157947702122, 'evaluation_losses': [2.903491817711163], 'machine_time': 99610.0}}, 6: {43: {'training_loss': 1.3435306515803378, 'evaluation_losses': [3.6391918465132873], 'machine_time': 930821.0}}
-			},
-			'montage':{
-				2: {90: {'training_loss': 2.9141979554254664, 'evaluation_losses': [7.201887014949963], 'machine_time': 365324.0}, 60: {'training_loss': 1.658825142412081, 'evaluation_losses': [5.414774446144072], 'machine_time': 184830.0}, 180: {'training_loss': 2.9762947983164287, 'evaluation_losses': [7.201887014949963], 'machine_time': 763428.0}}, 4: {90: {'training_loss': 2.6049725654264524, 'evaluation_losses': [7.201887014949963], 'machine_time': 795329.0}, 180: {'training_loss': 2.7255105838133415, 'evaluation_losses': [7.201887014949963], 'machine_time': 1603583.0}, 60: {'training_loss': 2.451558023003019, 'evaluation_losses': [7.201887014949963], 'machine_time': 408765.0}}, 1: {90: {'training_loss': 2.1952559976761714, 'evaluation_losses': [5.414774446144072], 'machine_time': 128120.0}, 300: {'training_loss': 5.398619334917133, 'evaluation_losses': [7.201887014949963], 'machine_time': 442968.0}, 120: {'training_loss': 3.5781365622136456, 'evaluation_losses': [7.201887014949963], 'machine_time': 196706.0}, 60: {'training_loss': 2.1488836123650854, 'evaluation_losses': [5.414774446144072], 'machine_time': 62748.0}, 180: {'training_loss': 3.4855597478540905, 'evaluation_losses': [7.201887014949963], 'machine_time': 283026.0}}, 6: {60: {'training_loss': 2.2714863791023876, 'evaluation_losses': [7.201887014949963], 'machine_time': 730912.0}}
-			},
-			'soykb':{
-				2: {196: {'training_loss': 6.077850572175291, 'evaluation_losses': [9.237322712793187], 'machine_time': 788344.0}, 294: {'training_loss': 7.161276170012323, 'evaluation_losses': [9.237322712793187], 'machine_time': 1197703.0}, 147: {'training_loss': 2.973840327187709, 'evaluation_losses': [9.237322712793187], 'machine_time': 443460.0}}, 1: {147: {'training_loss': 2.9352968954549983, 'evaluation_losses': [9.237322712793187], 'machine_time': 184770.0}, 98: {'training_loss': 1.7407239280547988, 'evaluation_losses': [7.029878560215385], 'machine_time': 88684.0}, 294: {'training_loss': 6.696601821040748, 'evaluation_losses': [9.237322712793187], 'machine_time': 525082.0}, 196: {'training_loss': 5.819665389317206, 'evaluation_losses': [9.237322712793187], 'machine_time': 335050.0}, 490: {'training_loss': 6.835393683475736, 'evaluation_losses': [9.237322712793187], 'machine_time': 772492.0}}, 4: {196: {'training_loss': 5.912588275748208, 'evaluation_losses': [9.237322712793187], 'machine_time': 1614009.0}, 147: {'training_loss': 2.7315668131300006, 'evaluation_losses': [9.237322712793187], 'machine_time': 953325.0}, 98: {'training_loss': 2.576358666022556, 'evaluation_losses': [9.237322712793187], 'machine_time': 481668.0}}, 6: {98: {'training_loss': 2.3040189421206527, 'evaluation_losses': [9.237322712793187], 'machine_time': 916032.0}}
-			},
-			'forkjoin':{
-				1: {10: {'training_loss': 0.20179944600710206, 'evaluation_losses': [0.3449408915458408], 'machine_time': 28286.0}, 25: {'training_loss': 1.0581652426769617, 'evaluation_losses': [1.8693583670569063], 'machine_time': 77966.0}}, 2: {10: {'training_loss': 0.20144635830029026, 'evaluation_losses': [0.3449408915458408], 'machine_time': 70604.0}}
-			},
-			'genome':{
-				1: {54: {'training_loss': 1.98677799343134, 'evaluation_losses': [4.619892359606285], 'machine_time': 41674.0}, 81: {'training_loss': 1.7874085079142916, 'evaluation_losses': [4.619892359606285], 'machine_time': 93762.0}, 108: {'training_loss': 2.5482588894750258, 'evaluation_losses': [5.927826482284326], 'machine_time': 154748.0}, 162: {'training_loss': 2.298521912304539, 'evaluation_losses': [5.927826482284326], 'machine_time': 232600.0}, 270: {'training_loss': 3.2689193250895894, 'evaluation_losses': [5.927826482284326], 'machine_time': 388978.0}}, 4: {108: {'training_loss': 2.602222522860723, 'evaluation_losses': [5.927826482284326], 'machine_time': 677035.0}, 81: {'training_loss': 2.7564613129198543, 'evaluation_losses': [5.927826482284326], 'machine_time': 428610.0}, 54: {'training_loss': 2.9590312061397803, 'evaluation_losses': [5.927826482284326], 'machine_time': 198406.0}, 162: {'training_loss': 2.3966961112030596, 'evaluation_losses': [5.927826482284326], 'machine_time': 983713.0}}, 2: {81: {'training_loss': 2.708245206962834, 'evaluation_losses': [5.927826482284326], 'machine_time': 227100.0}, 54: {'training_loss': 1.8559518000600357, 'evaluation_losses': [4.619892359606285], 'machine_time': 102901.0}, 162: {'training_loss': 2.2862188843048017, 'evaluation_losses': [5.927826482284326], 'machine_time': 542083.0}}
-			},
-			'chain':{
-				1: {10: {'training_loss': 0.1063989426543291, 'evaluation_losses': [0.12787283264986246], 'machine_time': 89986.0}, 50: {'training_loss': 0.12250436015097911, 'evaluation_losses': [0.12787283264986246], 'machine_time': 1062402.0}}
-			},
-		},
-		600:{
-			'genome':{
-				1: {162: {'training_loss': 2.298521912304539, 'evaluation_losses': [5.927826482284326], 'machine_time': 232600.0}, 54: {'training_loss': 0.516136577512436, 'evaluation_losses': [1.3708274530394229], 'machine_time': 41674.0}, 108: {'training_loss': 1.6336570404391817, 'evaluation_losses': [4.619892359606285], 'machine_time': 154748.0}, 81: {'training_loss': 1.7874085079142916, 'evaluation_losses': [4.619892359606285], 'machine_time': 93762.0}, 270: {'training_loss': 3.2689193250895894, 'evaluation_losses': [5.927826482284326], 'machine_time': 388978.0}}, 4: {54: {'training_loss': 1.8576021644233687, 'evaluation_losses': [4.619892359606285], 'machine_time': 198406.0}, 162: {'training_loss': 2.3966961112030596, 'evaluation_losses': [5.927826482284326], 'machine_time': 983713.0}, 81: {'training_loss': 2.7564613129198543, 'evaluation_losses': [5.927826482284326], 'machine_time': 428610.0}, 108: {'training_loss': 2.602222522860723, 'evaluation_losses': [5.927826482284326], 'machine_time': 677035.0}}, 2: {162: {'training_loss': 2.2862188843048017, 'evaluation_losses': [5.927826482284326], 'machine_time': 542083.0}, 54: {'training_loss': 1.8559518000600357, 'evaluation_losses': [4.619892359606285], 'machine_time': 102901.0}, 81: {'training_loss': 1.7111150823620238, 'evaluation_losses': [4.619892359606285], 'machine_time': 227100.0}}, 6: {54: {'training_loss': 1.824363754461514, 'evaluation_losses': [4.619892359606285], 'machine_time': 337706.0}}
-			},
-			'epigenomics':{
-				1: {129: {'training_loss': 0.83476007919288, 'evaluation_losses': [2.903491817711163], 'machine_time': 414502.0}, 64: {'training_loss': 0.8112793975317494, 'evaluation_losses': [2.903491817711163], 'machine_time': 200270.0}, 215: {'training_loss': 2.200478221304042, 'evaluation_losses': [3.6391918465132873], 'machine_time': 601092.0}, 86: {'training_loss': 0.8240805228003392, 'evaluation_losses': [2.903491817711163], 'machine_time': 303904.0}, 43: {'training_loss': 0.09070107756132832, 'evaluation_losses': [0.37433281973660515], 'machine_time': 99610.0}}, 4: {129: {'training_loss': 1.5230822588661228, 'evaluation_losses': [3.6391918465132873], 'machine_time': 2015144.0}, 43: {'training_loss': 0.7675842233000031, 'evaluation_losses': [2.903491817711163], 'machine_time': 498179.0}, 64: {'training_loss': 1.4973536816187927, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1004117.0}, 86: {'training_loss': 1.5122606490878956, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1508019.0}}, 6: {43: {'training_loss': 0.6888309579757449, 'evaluation_losses': [2.903491817711163], 'machine_time': 930821.0}}, 2: {43: {'training_loss': 0.768655894886797, 'evaluation_losses': [2.903491817711163], 'machine_time': 249274.0}, 86: {'training_loss': 1.5201939507406144, 'evaluation_losses': [3.6391918465132873], 'machine_time': 754654.0}, 129: {'training_loss': 1.5292889320469563, 'evaluation_losses': [3.6391918465132873], 'machine_time': 1014544.0}, 64: {'training_loss': 0.7974742131594289, 'evaluation_losses': [2.903491817711163], 'machine_time': 501377.0}}
-			},
-			'soykb':{
-				1: {98: {'training_loss': 1.7407239280547988, 'evaluation_losses': [7.029878560215385], 'machine_time': 88684.0}, 294: {'training_loss': 6.696601821040748, 'evaluation_losses': [9.237322712793187], 'machine_time': 525082.0}, 490: {'training_loss': 6.835393683475736, 'evaluation_losses': [9.237322712793187], 'machine_time': 772492.0}, 147: {'training_loss': 1.7665871312364174, 'evaluation_losses': [7.029878560215385], 'machine_time': 184770.0}, 196: {'training_loss': 5.819665389317206, 'evaluation_losses': [9.237322712793187], 'machine_time': 335050.0}}, 2: {147: {'training_loss': 2.973840327187709, 'evaluation_losses': [9.237322712793187], 'machine_time': 443460.0}, 294: {'training_loss': 7.161276170012323, 'evaluation_losses': [9.237322712793187], 'machine_time': 1197703.0}, 196: {'training_loss': 6.077850572175291, 'evaluation_losses': [9.237322712793187], 'machine_time': 788344.0}, 98: {'training_loss': 1.7256813613630866, 'evaluation_losses': [7.029878560215385], 'machine_time': 216178.0}}, 4: {98: {'training_loss': 1.5258421586314674, 'evaluation_losses': [7.029878560215385], 'machine_time': 481668.0}, 147: {'training_loss': 2.7315668131300006, 'evaluation_losses': [9.237322712793187], 'machine_time': 953325.0}, 294: {'training_loss': 7.156889205512735, 'evaluation_losses': [9.237322712793187], 'machine_time': 2359713.0}, 196: {'training_loss': 5.912588275748208, 'evaluation_losses': [9.237322712793187], 'machine_time': 1614009.0}}, 6: {98: {'training_loss': 2.3040189421206527, 'evaluation_losses': [9.237322712793187], 'machine_time': 916032.0}}
-			},
-			'seismology':{
-				6: {103: {'training_loss': 2.3325438514062284, 'evaluation_losses': [9.052505573689901], 'machine_time': 339061.0}}, 1: {309: {'training_loss': 4.459584982443911, 'evaluation_losses': [9.052505573689901], 'machine_time': 383970.0}, 103: {'training_loss': 1.1301308553804883, 'evaluation_losses': [6.597169775837247], 'machine_time': 54416.0}, 154: {'training_loss': 1.059155183603651, 'evaluation_losses': [6.597169775837247], 'machine_time': 122028.0}, 206: {'training_loss': 3.8689849972948, 'evaluation_losses': [9.052505573689901], 'machine_time': 235076.0}}, 4: {154: {'training_loss': 2.281628738690002, 'evaluation_losses': [9.052505573689901], 'machine_time': 443578.0}, 206: {'training_loss': 4.99563062551747, 'evaluation_losses': [9.052505573689901], 'machine_time': 825996.0}, 103: {'training_loss': 2.303029225817966, 'evaluation_losses': [9.052505573689901], 'machine_time': 207265.0}}, 2: {103: {'training_loss': 1.2038917108831781, 'evaluation_losses': [6.597169775837247], 'machine_time': 120125.0}, 309: {'training_loss': 5.216529894054617, 'evaluation_losses': [9.052505573689901], 'machine_time': 780993.0}, 206: {'training_loss': 4.459854380395284, 'evaluation_losses': [9.052505573689901], 'machine_time': 488291.0}, 154: {'training_loss': 2.008168290713861, 'evaluation_losses': [9.052505573689901], 'machine_time': 259263.0}}
-			},
-			'montage':{
-				1: {90: {'training_loss': 2.1952559976761714, 'evaluation_losses': [5.414774446144072], 'machine_time': 128120.0}, 300: {'training_loss': 5.398619334917133, 'evaluation_losses': [7.201887014949963], 'machine_time': 442968.0}, 60: {'training_loss': 0.6000605820804854, 'evaluation_losses': [1.7072781305772544], 'machine_time': 62748.0}, 180: {'training_loss': 3.4855597478540905, 'evaluation_losses': [7.201887014949963], 'machine_time': 283026.0}}, 2: {180: {'training_loss': 2.9762947983164287, 'evaluation_losses': [7.201887014949963], 'machine_time': 763428.0}, 90: {'training_loss': 2.9141979554254664, 'evaluation_losses': [7.201887014949963], 'machine_time': 365324.0}, 60: {'training_loss': 1.658825142412081, 'evaluation_losses': [5.414774446144072], 'machine_time': 184830.0}, 120: {'training_loss': 3.007377247826633, 'evaluation_losses': [7.201887014949963], 'machine_time': 548921.0}}, 4: {90: {'training_loss': 2.6049725654264524, 'evaluation_losses': [7.201887014949963], 'machine_time': 795329.0}, 180: {'training_loss': 2.7255105838133415, 'evaluation_losses': [7.201887014949963], 'machine_time': 1603583.0}, 120: {'training_loss': 2.72279058790062, 'evaluation_losses': [7.201887014949963], 'machine_time': 1180806.0}, 60: {'training_loss': 1.4533514285057632, 'evaluation_losses': [5.414774446144072], 'machine_time': 408765.0}}
-			},
-			'forkjoin':{
-				1: {10: {'training_loss': 0.11717911880876876, 'evaluation_losses': [0.30710241338435634], 'machine_time': 28286.0}, 50: {'training_loss': 1.3181083652859473, 'evaluation_losses': [1.8693583670569063], 'machine_time': 131312.0}}, 2: {10: {'training_loss': 0.20144635830029026, 'evaluation_losses': [0.3449408915458408], 'machine_time': 70604.0}}, 6: {10: {'training_loss': 0.22973668503197958, 'evaluation_losses': [1.8693583670569063], 'machine_time': 189478.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.12250436015097911, 'evaluation_losses': [0.12787283264986246], 'machine_time': 1062402.0}, 10: {'training_loss': 0.1063989426543291, 'evaluation_losses': [0.12787283264986246], 'machine_time': 89986.0}}
-			},
-		},
-		1800:{
-			'epigenomics':{
-				1: {215: {'training_loss': 1.5363259885183076, 'evaluation_losses': [2.903491817711163], 'machine_time': 601092.0}, 64: {'training_loss': 0.10234377805478471, 'evaluation_losses': [0.37432687118151414], 'machine_time': 200270.0}, 129: {'training_loss': 0.27856651738488697, 'evaluation_losses': [0.6540479037130905], 'machine_time': 414502.0}, 86: {'training_loss': 0.1018671424258764, 'evaluation_losses': [0.37432687118151414], 'machine_time': 303904.0}}, 2: {43: {'training_loss': 0.09733428674887573, 'evaluation_losses': [0.37432687118151414], 'machine_time': 249274.0}, 86: {'training_loss': 0.8136585537067469, 'evaluation_losses': [2.903491817711163], 'machine_time': 754654.0}, 64: {'training_loss': 0.261092393465345, 'evaluation_losses': [0.6540479037130905], 'machine_time': 501377.0}, 129: {'training_loss': 0.8279250838850211, 'evaluation_losses': [2.903491817711163], 'machine_time': 1014544.0}}, 4: {129: {'training_loss': 0.8177874518550345, 'evaluation_losses': [2.903491817711163], 'machine_time': 2015144.0}}, 6: {43: {'training_loss': 0.1253376419498577, 'evaluation_losses': [0.37432687118151414], 'machine_time': 930821.0}}
-			},
-			'seismology':{
-				6: {103: {'training_loss': 1.3637887673672908, 'evaluation_losses': [6.597169775837247], 'machine_time': 339061.0}}, 1: {309: {'training_loss': 4.459584982443911, 'evaluation_losses': [9.052505573689901], 'machine_time': 383970.0}, 206: {'training_loss': 2.762018658529812, 'evaluation_losses': [6.597169775837247], 'machine_time': 235076.0}, 515: {'training_loss': 4.384855592517674, 'evaluation_losses': [9.052505573689901], 'machine_time': 612920.0}, 154: {'training_loss': 1.059155183603651, 'evaluation_losses': [6.597169775837247], 'machine_time': 122028.0}, 103: {'training_loss': 0.39480093810073896, 'evaluation_losses': [2.3472953072047367], 'machine_time': 54416.0}}, 4: {309: {'training_loss': 5.960561404767856, 'evaluation_losses': [9.052505573689901], 'machine_time': 1285568.0}, 154: {'training_loss': 1.3490957855439218, 'evaluation_losses': [6.597169775837247], 'machine_time': 443578.0}, 103: {'training_loss': 1.3665011430659908, 'evaluation_losses': [6.597169775837247], 'machine_time': 207265.0}, 206: {'training_loss': 4.99563062551747, 'evaluation_losses': [9.052505573689901], 'machine_time': 825996.0}}, 2: {103: {'training_loss': 0.43109311083690743, 'evaluation_losses': [2.0287021256987243], 'machine_time': 120125.0}, 154: {'training_loss': 1.1938835557072651, 'evaluation_losses': [6.597169775837247], 'machine_time': 259263.0}, 206: {'training_loss': 4.459854380395284, 'evaluation_losses': [9.052505573689901], 'machine_time': 488291.0}, 309: {'training_loss': 5.216529894054617, 'evaluation_losses': [9.052505573689901], 'machine_time': 780993.0}}
-			},
-			'soykb':{
-				2: {98: {'training_loss': 0.4807457544490619, 'evaluation_losses': [2.203548286383589], 'machine_time': 216178.0}, 196: {'training_loss': 6.077850572175291, 'evaluation_losses': [9.237322712793187], 'machine_time': 788344.0}, 294: {'training_loss': 7.161276170012323, 'evaluation_losses': [9.237322712793187], 'machine_time': 1197703.0}, 147: {'training_loss': 1.7777531254304573, 'evaluation_losses': [7.029878560215385], 'machine_time': 443460.0}}, 6: {98: {'training_loss': 1.343181994205189, 'evaluation_losses': [7.029878560215385], 'machine_time': 916032.0}}, 4: {196: {'training_loss': 5.912588275748208, 'evaluation_losses': [9.237322712793187], 'machine_time': 1614009.0}, 294: {'training_loss': 7.156889205512735, 'evaluation_losses': [9.237322712793187], 'machine_time': 2359713.0}, 98: {'training_loss': 1.5258421586314674, 'evaluation_losses': [7.029878560215385], 'machine_time': 481668.0}, 147: {'training_loss': 1.6108308008964156, 'evaluation_losses': [7.029878560215385], 'machine_time': 953325.0}}, 1: {490: {'training_loss': 6.835393683475736, 'evaluation_losses': [9.237322712793187], 'machine_time': 772492.0}, 98: {'training_loss': 0.1721972585585166, 'evaluation_losses': [0.2156423835600479], 'machine_time': 88684.0}, 196: {'training_loss': 4.162546510565848, 'evaluation_losses': [7.029878560215385], 'machine_time': 335050.0}, 294: {'training_loss': 4.900428497680094, 'evaluation_losses': [7.029878560215385], 'machine_time': 525082.0}}
-			},
-			'forkjoin':{
-				1: {10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.3032385379977294], 'machine_time': 28286.0}, 50: {'training_loss': 0.263995997603169, 'evaluation_losses': [0.3449408915458408], 'machine_time': 131312.0}, 25: {'training_loss': 0.17349423654781707, 'evaluation_losses': [0.21595850171371658], 'machine_time': 77966.0}}, 6: {10: {'training_loss': 0.1655385950633993, 'evaluation_losses': [0.30710241338435634], 'machine_time': 189478.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.12250436015097911, 'evaluation_losses': [0.12787283264986246], 'machine_time': 1062402.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-			'genome':{
-				4: {108: {'training_loss': 1.637259071754633, 'evaluation_losses': [4.619892359606285], 'machine_time': 677035.0}, 54: {'training_loss': 0.2781015816035668, 'evaluation_losses': [0.533818116305899], 'machine_time': 198406.0}, 162: {'training_loss': 2.3966961112030596, 'evaluation_losses': [5.927826482284326], 'machine_time': 983713.0}, 81: {'training_loss': 1.7306621615676008, 'evaluation_losses': [4.619892359606285], 'machine_time': 428610.0}}, 6: {54: {'training_loss': 0.48578683498620895, 'evaluation_losses': [1.3708274530394229], 'machine_time': 337706.0}}, 1: {81: {'training_loss': 0.2805746804710752, 'evaluation_losses': [0.533818116305899], 'machine_time': 93762.0}, 270: {'training_loss': 2.3915986090477666, 'evaluation_losses': [4.619892359606285], 'machine_time': 388978.0}, 54: {'training_loss': 0.2739323700059631, 'evaluation_losses': [0.533818116305899], 'machine_time': 41674.0}, 162: {'training_loss': 1.46651424936865, 'evaluation_losses': [4.619892359606285], 'machine_time': 232600.0}, 108: {'training_loss': 0.4997697719357975, 'evaluation_losses': [1.3708274530394229], 'machine_time': 154748.0}}, 2: {81: {'training_loss': 0.487263705381732, 'evaluation_losses': [1.3708274530394229], 'machine_time': 227100.0}, 108: {'training_loss': 1.592773677621055, 'evaluation_losses': [4.619892359606285], 'machine_time': 366680.0}, 162: {'training_loss': 1.4435851598255767, 'evaluation_losses': [4.619892359606285], 'machine_time': 542083.0}, 54: {'training_loss': 0.2904645168790523, 'evaluation_losses': [0.533818116305899], 'machine_time': 102901.0}}
-			},
-			'montage':{
-				1: {180: {'training_loss': 2.1518316688580432, 'evaluation_losses': [5.414774446144072], 'machine_time': 283026.0}, 90: {'training_loss': 0.6288408483278919, 'evaluation_losses': [1.7072781305772544], 'machine_time': 128120.0}, 120: {'training_loss': 0.6634655602313984, 'evaluation_losses': [1.7072781305772544], 'machine_time': 196706.0}, 300: {'training_loss': 5.398619334917133, 'evaluation_losses': [7.201887014949963], 'machine_time': 442968.0}, 60: {'training_loss': 0.31996839979499153, 'evaluation_losses': [0.2784291538734018], 'machine_time': 62748.0}}, 4: {180: {'training_loss': 2.7255105838133415, 'evaluation_losses': [7.201887014949963], 'machine_time': 1603583.0}, 120: {'training_loss': 1.609287863052562, 'evaluation_losses': [5.414774446144072], 'machine_time': 1180806.0}, 90: {'training_loss': 1.553062593500038, 'evaluation_losses': [5.414774446144072], 'machine_time': 795329.0}}, 2: {180: {'training_loss': 2.9762947983164287, 'evaluation_losses': [7.201887014949963], 'machine_time': 763428.0}, 90: {'training_loss': 0.4726515669637226, 'evaluation_losses': [1.7072781305772544], 'machine_time': 365324.0}}, 6: {60: {'training_loss': 0.3676255525523643, 'evaluation_losses': [1.7072781305772544], 'machine_time': 730912.0}}
-			},
-		},
-		3600:{
-			'epigenomics':{
-				2: {86: {'training_loss': 0.1121147346564729, 'evaluation_losses': [0.37433281973660515], 'machine_time': 754654.0}, 64: {'training_loss': 0.11017055941247325, 'evaluation_losses': [0.37433281973660515], 'machine_time': 501377.0}, 129: {'training_loss': 0.8279250838850211, 'evaluation_losses': [2.903491817711163], 'machine_time': 1014544.0}, 43: {'training_loss': 0.09733428674887579, 'evaluation_losses': [0.37433281973660515], 'machine_time': 249274.0}}, 1: {86: {'training_loss': 0.10186714242587672, 'evaluation_losses': [0.37433281973660515], 'machine_time': 303904.0}, 64: {'training_loss': 0.1023437780547848, 'evaluation_losses': [0.37433281973660515], 'machine_time': 200270.0}, 43: {'training_loss': 0.09070107756132832, 'evaluation_losses': [0.37433281973660515], 'machine_time': 99610.0}, 129: {'training_loss': 0.11155866016156704, 'evaluation_losses': [0.37433281973660515], 'machine_time': 414502.0}}, 6: {43: {'training_loss': 0.12533764194985783, 'evaluation_losses': [0.37433281973660515], 'machine_time': 930821.0}}, 4: {64: {'training_loss': 0.10423326331399542, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1004117.0}, 86: {'training_loss': 0.26449167055684286, 'evaluation_losses': [0.6540479037130905], 'machine_time': 1508019.0}, 129: {'training_loss': 0.8177874518550345, 'evaluation_losses': [2.903491817711163], 'machine_time': 2015144.0}, 43: {'training_loss': 0.0943927312705396, 'evaluation_losses': [0.37433281973660515], 'machine_time': 498179.0}}
-			},
-			'genome':{
-				2: {162: {'training_loss': 1.4435851598255767, 'evaluation_losses': [4.619892359606285], 'machine_time': 542083.0}, 54: {'training_loss': 0.2904645168790523, 'evaluation_losses': [0.533818116305899], 'machine_time': 102901.0}}, 6: {54: {'training_loss': 0.27634267665815904, 'evaluation_losses': [0.533818116305899], 'machine_time': 337706.0}}, 1: {54: {'training_loss': 0.22372334033422042, 'evaluation_losses': [0.1933399712578048], 'machine_time': 41674.0}, 81: {'training_loss': 0.2805746804710752, 'evaluation_losses': [0.533818116305899], 'machine_time': 93762.0}, 270: {'training_loss': 2.3915986090477666, 'evaluation_losses': [4.619892359606285], 'machine_time': 388978.0}, 108: {'training_loss': 0.29383375120496824, 'evaluation_losses': [0.533818116305899], 'machine_time': 154748.0}}, 4: {108: {'training_loss': 1.637259071754633, 'evaluation_losses': [4.619892359606285], 'machine_time': 677035.0}, 54: {'training_loss': 0.2781015816035668, 'evaluation_losses': [0.533818116305899], 'machine_time': 198406.0}, 81: {'training_loss': 0.4867457926395789, 'evaluation_losses': [1.3708274530394229], 'machine_time': 428610.0}}
-			},
-			'montage':{
-				4: {180: {'training_loss': 1.6130073923738353, 'evaluation_losses': [5.414774446144072], 'machine_time': 1603583.0}, 120: {'training_loss': 1.609287863052562, 'evaluation_losses': [5.414774446144072], 'machine_time': 1180806.0}, 60: {'training_loss': 0.2872905572190888, 'evaluation_losses': [0.2784291538734018], 'machine_time': 408765.0}, 90: {'training_loss': 0.4157697868999801, 'evaluation_losses': [1.7072781305772544], 'machine_time': 795329.0}}, 2: {60: {'training_loss': 0.2894636163244288, 'evaluation_losses': [0.2784291538734018], 'machine_time': 184830.0}, 120: {'training_loss': 0.5034631632847626, 'evaluation_losses': [1.7072781305772544], 'machine_time': 548921.0}, 90: {'training_loss': 0.4726515669637226, 'evaluation_losses': [1.7072781305772544], 'machine_time': 365324.0}, 180: {'training_loss': 1.7904321891321167, 'evaluation_losses': [5.414774446144072], 'machine_time': 763428.0}}, 1: {120: {'training_loss': 0.34838454243525924, 'evaluation_losses': [0.2784291538734018], 'machine_time': 196706.0}, 180: {'training_loss': 0.6502164455110008, 'evaluation_losses': [1.7072781305772544], 'machine_time': 283026.0}}, 6: {60: {'training_loss': 0.28844910579108474, 'evaluation_losses': [0.2784291538734018], 'machine_time': 730912.0}}
-			},
-			'forkjoin':{
-				2: {10: {'training_loss': 0.09079351984462354, 'evaluation_losses': [0.3032385379977294], 'machine_time': 70604.0}, 25: {'training_loss': 0.16226256165511616, 'evaluation_losses': [0.21595850171371658], 'machine_time': 189971.0}}, 1: {25: {'training_loss': 0.17349423654781707, 'evaluation_losses': [0.21595850171371658], 'machine_time': 77966.0}, 10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.3032385379977294], 'machine_time': 28286.0}}
-			},
-			'soykb':{
-				4: {98: {'training_loss': 0.18902420131429887, 'evaluation_losses': [0.2156423835600479], 'machine_time': 481668.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.11927703205339604, 'evaluation_losses': [0.11332763231830498], 'machine_time': 1062402.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-		},
-		7200:{
-			'soykb':{
-				1: {294: {'training_loss': 1.5173523235707251, 'evaluation_losses': [2.203548286383589], 'machine_time': 525082.0}, 196: {'training_loss': 0.22646629110980648, 'evaluation_losses': [0.2156423835600479], 'machine_time': 335050.0}, 98: {'training_loss': 0.1721972585585166, 'evaluation_losses': [0.2156423835600479], 'machine_time': 88684.0}, 490: {'training_loss': 5.061100920877333, 'evaluation_losses': [7.029878560215385], 'machine_time': 772492.0}}, 2: {147: {'training_loss': 0.20713496711163126, 'evaluation_losses': [0.2156423835600479], 'machine_time': 443460.0}, 294: {'training_loss': 5.2579790264627615, 'evaluation_losses': [7.029878560215385], 'machine_time': 1197703.0}, 196: {'training_loss': 1.3362763138144527, 'evaluation_losses': [2.203548286383589], 'machine_time': 788344.0}}, 4: {294: {'training_loss': 5.248751180014235, 'evaluation_losses': [7.029878560215385], 'machine_time': 2359713.0}, 98: {'training_loss': 0.18902420131429887, 'evaluation_losses': [0.2156423835600479], 'machine_time': 481668.0}, 147: {'training_loss': 0.4488015854510364, 'evaluation_losses': [2.203548286383589], 'machine_time': 953325.0}}, 6: {98: {'training_loss': 0.21521010458157006, 'evaluation_losses': [0.2156423835600479], 'machine_time': 916032.0}}
-			},
-			'genome':{
-				6: {54: {'training_loss': 0.27634267665815904, 'evaluation_losses': [0.533818116305899], 'machine_time': 337706.0}}, 1: {108: {'training_loss': 0.29383375120496824, 'evaluation_losses': [0.533818116305899], 'machine_time': 154748.0}, 81: {'training_loss': 0.2805746804710752, 'evaluation_losses': [0.533818116305899], 'machine_time': 93762.0}, 162: {'training_loss': 0.3270497698388297, 'evaluation_losses': [0.533818116305899], 'machine_time': 232600.0}, 270: {'training_loss': 0.37062323936263464, 'evaluation_losses': [0.533818116305899], 'machine_time': 388978.0}}, 2: {162: {'training_loss': 0.38372573682419336, 'evaluation_losses': [0.9638633227510849], 'machine_time': 542083.0}, 54: {'training_loss': 0.1866376291533146, 'evaluation_losses': [0.1933399712578048], 'machine_time': 102901.0}, 108: {'training_loss': 0.3245461637804393, 'evaluation_losses': [0.533818116305899], 'machine_time': 366680.0}, 81: {'training_loss': 0.31319049490715517, 'evaluation_losses': [0.533818116305899], 'machine_time': 227100.0}}, 4: {162: {'training_loss': 1.501775008895619, 'evaluation_losses': [4.619892359606285], 'machine_time': 983713.0}, 108: {'training_loss': 0.4787957813976012, 'evaluation_losses': [1.3708274530394229], 'machine_time': 677035.0}, 81: {'training_loss': 0.29771980478532883, 'evaluation_losses': [0.533818116305899], 'machine_time': 428610.0}, 54: {'training_loss': 0.2781015816035668, 'evaluation_losses': [0.533818116305899], 'machine_time': 198406.0}}
-			},
-			'seismology':{
-				1: {103: {'training_loss': 0.21947615636403595, 'evaluation_losses': [0.4003447606068435], 'machine_time': 54416.0}, 206: {'training_loss': 0.5251880503353576, 'evaluation_losses': [1.2676584785729241], 'machine_time': 235076.0}}, 4: {309: {'training_loss': 4.310332316282969, 'evaluation_losses': [6.597169775837247], 'machine_time': 1285568.0}}, 2: {103: {'training_loss': 0.23665514798964848, 'evaluation_losses': [1.1216875274177607], 'machine_time': 120125.0}, 309: {'training_loss': 3.789840604612529, 'evaluation_losses': [6.597169775837247], 'machine_time': 780993.0}}
-			},
-			'epigenomics':{
-				6: {43: {'training_loss': 0.12533764194985783, 'evaluation_losses': [0.37433281973660515], 'machine_time': 930821.0}}, 1: {215: {'training_loss': 0.18378616911716, 'evaluation_losses': [0.37433281973660515], 'machine_time': 601092.0}, 129: {'training_loss': 0.11155866016156704, 'evaluation_losses': [0.37433281973660515], 'machine_time': 414502.0}, 43: {'training_loss': 0.09070107756132832, 'evaluation_losses': [0.37433281973660515], 'machine_time': 99610.0}, 64: {'training_loss': 0.1023437780547848, 'evaluation_losses': [0.37433281973660515], 'machine_time': 200270.0}, 86: {'training_loss': 0.10186714242587672, 'evaluation_losses': [0.37433281973660515], 'machine_time': 303904.0}}, 2: {129: {'training_loss': 0.12572091263299326, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1014544.0}}, 4: {64: {'training_loss': 0.10423326331399542, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1004117.0}, 86: {'training_loss': 0.1067628127742381, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1508019.0}, 43: {'training_loss': 0.0943927312705396, 'evaluation_losses': [0.37433281973660515], 'machine_time': 498179.0}, 129: {'training_loss': 0.26847557312475545, 'evaluation_losses': [0.6540479037130905], 'machine_time': 2015144.0}}
-			},
-			'forkjoin':{
-				1: {10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.3032385379977294], 'machine_time': 28286.0}, 25: {'training_loss': 0.17349423654781707, 'evaluation_losses': [0.21595850171371658], 'machine_time': 77966.0}, 50: {'training_loss': 0.20323669621654689, 'evaluation_losses': [0.21595850171371658], 'machine_time': 131312.0}}, 6: {10: {'training_loss': 0.13676219697830647, 'evaluation_losses': [0.3032385379977294], 'machine_time': 189478.0}}
-			},
-			'montage':{
-				2: {180: {'training_loss': 0.5033093451955057, 'evaluation_losses': [1.7072781305772544], 'machine_time': 763428.0}, 60: {'training_loss': 0.2894636163244288, 'evaluation_losses': [0.2784291538734018], 'machine_time': 184830.0}, 90: {'training_loss': 0.31618030043251044, 'evaluation_losses': [0.2784291538734018], 'machine_time': 365324.0}}, 1: {120: {'training_loss': 0.34838454243525924, 'evaluation_losses': [0.2784291538734018], 'machine_time': 196706.0}, 60: {'training_loss': 0.18706981652778182, 'evaluation_losses': [0.4252478170845952], 'machine_time': 62748.0}, 90: {'training_loss': 0.3285647943261169, 'evaluation_losses': [1.0450946295533132], 'machine_time': 128120.0}, 180: {'training_loss': 0.3379996283359481, 'evaluation_losses': [0.2784291538734018], 'machine_time': 283026.0}, 300: {'training_loss': 1.1887256926912653, 'evaluation_losses': [1.7072781305772544], 'machine_time': 442968.0}}, 4: {90: {'training_loss': 0.30567893770161497, 'evaluation_losses': [0.2784291538734018], 'machine_time': 795329.0}, 180: {'training_loss': 1.5054862467779877, 'evaluation_losses': [5.870366781740062], 'machine_time': 1603583.0}}, 6: {60: {'training_loss': 0.28844910579108474, 'evaluation_losses': [0.2784291538734018], 'machine_time': 730912.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.11927703205339604, 'evaluation_losses': [0.11332763231830498], 'machine_time': 1062402.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-		},
-		18000:{
-			'epigenomics':{
-				1: {86: {'training_loss': 0.10186714242587672, 'evaluation_losses': [0.37433281973660515], 'machine_time': 303904.0}, 43: {'training_loss': 0.09070107756132832, 'evaluation_losses': [0.37433281973660515], 'machine_time': 99610.0}, 215: {'training_loss': 0.18378616911716, 'evaluation_losses': [0.37433281973660515], 'machine_time': 601092.0}, 64: {'training_loss': 0.1023437780547848, 'evaluation_losses': [0.37433281973660515], 'machine_time': 200270.0}}, 2: {129: {'training_loss': 0.12572091263299326, 'evaluation_losses': [0.37433281973660515], 'machine_time': 1014544.0}, 86: {'training_loss': 0.1121147346564729, 'evaluation_losses': [0.37433281973660515], 'machine_time': 754654.0}, 43: {'training_loss': 0.09733428674887579, 'evaluation_losses': [0.37433281973660515], 'machine_time': 249274.0}, 64: {'training_loss': 0.11017055941247325, 'evaluation_losses': [0.37433281973660515], 'machine_time': 501377.0}}, 4: {129: {'training_loss': 0.1186702588997195, 'evaluation_losses': [0.37433281973660515], 'machine_time': 2015144.0}, 43: {'training_loss': 0.0943927312705396, 'evaluation_losses': [0.37433281973660515], 'machine_time': 498179.0}}, 6: {43: {'training_loss': 0.12533764194985783, 'evaluation_losses': [0.37433281973660515], 'machine_time': 930821.0}}
-			},
-			'seismology':{
-				2: {154: {'training_loss': 0.25216403631188467, 'evaluation_losses': [1.1216875274177607], 'machine_time': 259263.0}, 309: {'training_loss': 1.208650761020668, 'evaluation_losses': [2.0287021256987243], 'machine_time': 780993.0}, 103: {'training_loss': 0.19989570764545914, 'evaluation_losses': [0.4003447606068435], 'machine_time': 120125.0}, 206: {'training_loss': 0.4706316947852101, 'evaluation_losses': [0.9054330333700394], 'machine_time': 488291.0}}, 4: {154: {'training_loss': 0.29723894758078917, 'evaluation_losses': [1.1216875274177607], 'machine_time': 443578.0}, 309: {'training_loss': 4.310332316282969, 'evaluation_losses': [6.597169775837247], 'machine_time': 1285568.0}, 103: {'training_loss': 0.1940518402694311, 'evaluation_losses': [0.4003447606068435], 'machine_time': 207265.0}, 206: {'training_loss': 0.6740759176117889, 'evaluation_losses': [1.2676584785729241], 'machine_time': 825996.0}}, 1: {206: {'training_loss': 0.3817472201830115, 'evaluation_losses': [0.9054330333700394], 'machine_time': 235076.0}, 515: {'training_loss': 3.213442329796609, 'evaluation_losses': [6.597169775837247], 'machine_time': 612920.0}, 309: {'training_loss': 0.4968092840570918, 'evaluation_losses': [1.2676584785729241], 'machine_time': 383970.0}, 154: {'training_loss': 0.22131269958248218, 'evaluation_losses': [0.4003447606068435], 'machine_time': 122028.0}, 103: {'training_loss': 0.21947615636403595, 'evaluation_losses': [0.4003447606068435], 'machine_time': 54416.0}}, 6: {103: {'training_loss': 0.2505879894941957, 'evaluation_losses': [1.073989636443577], 'machine_time': 339061.0}}
-			},
-			'soykb':{
-				1: {294: {'training_loss': 0.21252837491435972, 'evaluation_losses': [0.2156423835600479], 'machine_time': 525082.0}, 196: {'training_loss': 0.22646629110980648, 'evaluation_losses': [0.2156423835600479], 'machine_time': 335050.0}, 490: {'training_loss': 1.5661858639390072, 'evaluation_losses': [2.203548286383589], 'machine_time': 772492.0}, 147: {'training_loss': 0.21135887963188604, 'evaluation_losses': [0.24915039896814256], 'machine_time': 184770.0}, 98: {'training_loss': 0.1721972585585166, 'evaluation_losses': [0.2156423835600479], 'machine_time': 88684.0}}, 4: {196: {'training_loss': 0.20899194986201472, 'evaluation_losses': [0.2156423835600479], 'machine_time': 1614009.0}, 98: {'training_loss': 0.18902420131429887, 'evaluation_losses': [0.2156423835600479], 'machine_time': 481668.0}, 294: {'training_loss': 5.248751180014235, 'evaluation_losses': [7.029878560215385], 'machine_time': 2359713.0}}, 2: {196: {'training_loss': 0.21600742966320083, 'evaluation_losses': [0.2156423835600479], 'machine_time': 788344.0}, 294: {'training_loss': 0.2022707623973996, 'evaluation_losses': [0.2156423835600479], 'machine_time': 1197703.0}, 98: {'training_loss': 0.18374281753891716, 'evaluation_losses': [0.2156423835600479], 'machine_time': 216178.0}, 147: {'training_loss': 0.20713496711163126, 'evaluation_losses': [0.2156423835600479], 'machine_time': 443460.0}}, 6: {98: {'training_loss': 0.21521010458157006, 'evaluation_losses': [0.2156423835600479], 'machine_time': 916032.0}}
-			},
-			'genome':{
-				4: {108: {'training_loss': 0.3269505081359034, 'evaluation_losses': [0.533818116305899], 'machine_time': 677035.0}, 81: {'training_loss': 0.25237776691902014, 'evaluation_losses': [0.4946564527995079], 'machine_time': 428610.0}, 54: {'training_loss': 0.17646542800403295, 'evaluation_losses': [0.1933399712578048], 'machine_time': 198406.0}, 162: {'training_loss': 0.3589025134792263, 'evaluation_losses': [0.533818116305899], 'machine_time': 983713.0}}, 1: {54: {'training_loss': 0.18545387913804934, 'evaluation_losses': [0.34487200477974417], 'machine_time': 41674.0}, 270: {'training_loss': 0.37062323936263464, 'evaluation_losses': [0.533818116305899], 'machine_time': 388978.0}, 108: {'training_loss': 0.1977129553832234, 'evaluation_losses': [0.1933399712578048], 'machine_time': 154748.0}, 162: {'training_loss': 0.3270497698388297, 'evaluation_losses': [0.533818116305899], 'machine_time': 232600.0}}, 2: {54: {'training_loss': 0.18403248572933448, 'evaluation_losses': [0.34487200477974417], 'machine_time': 102901.0}, 162: {'training_loss': 0.2979021043274925, 'evaluation_losses': [0.591569005517995], 'machine_time': 542083.0}, 81: {'training_loss': 0.17529271189813989, 'evaluation_losses': [0.1933399712578048], 'machine_time': 227100.0}}, 6: {54: {'training_loss': 0.16434959240759522, 'evaluation_losses': [0.1933399712578048], 'machine_time': 337706.0}}
-			},
-			'montage':{
-				2: {90: {'training_loss': 0.2609060326375415, 'evaluation_losses': [0.27057602221763405], 'machine_time': 365324.0}, 120: {'training_loss': 0.30163823494216374, 'evaluation_losses': [0.2784291538734018], 'machine_time': 548921.0}, 60: {'training_loss': 0.2725699697749276, 'evaluation_losses': [0.27057602221763405], 'machine_time': 184830.0}, 180: {'training_loss': 0.299797246096318, 'evaluation_losses': [0.2784291538734018], 'machine_time': 763428.0}}, 1: {60: {'training_loss': 0.18706981652778182, 'evaluation_losses': [0.4252478170845952], 'machine_time': 62748.0}, 90: {'training_loss': 0.1930968398275448, 'evaluation_losses': [0.4252478170845952], 'machine_time': 128120.0}, 300: {'training_loss': 0.3189813131906243, 'evaluation_losses': [0.2784291538734018], 'machine_time': 442968.0}, 180: {'training_loss': 0.3379996283359481, 'evaluation_losses': [0.2784291538734018], 'machine_time': 283026.0}, 120: {'training_loss': 0.25674511919666315, 'evaluation_losses': [0.27057602221763405], 'machine_time': 196706.0}}, 6: {60: {'training_loss': 0.27197109707481965, 'evaluation_losses': [0.24241642178503517], 'machine_time': 730912.0}}, 4: {60: {'training_loss': 0.2725968098844544, 'evaluation_losses': [0.31734657191964083], 'machine_time': 408765.0}, 120: {'training_loss': 0.29514831238543554, 'evaluation_losses': [0.2784291538734018], 'machine_time': 1180806.0}, 90: {'training_loss': 0.30567893770161497, 'evaluation_losses': [0.2784291538734018], 'machine_time': 795329.0}, 180: {'training_loss': 0.29194838798637346, 'evaluation_losses': [0.2784291538734018], 'machine_time': 1603583.0}}
-			},
-			'forkjoin':{
-				6: {10: {'training_loss': 0.13676219697830647, 'evaluation_losses': [0.3032385379977294], 'machine_time': 189478.0}}, 2: {25: {'training_loss': 0.16226256165511616, 'evaluation_losses': [0.21595850171371658], 'machine_time': 189971.0}, 10: {'training_loss': 0.09079351984462354, 'evaluation_losses': [0.3032385379977294], 'machine_time': 70604.0}}, 1: {25: {'training_loss': 0.15249751861106212, 'evaluation_losses': [0.16835946446608238], 'machine_time': 77966.0}, 50: {'training_loss': 0.20323669621654689, 'evaluation_losses': [0.21595850171371658], 'machine_time': 131312.0}, 10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.3032385379977294], 'machine_time': 28286.0}}
-			},
-			'chain':{
-				1: {10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}, 50: {'training_loss': 0.09601403766796651, 'evaluation_losses': [0.09358715059655524], 'machine_time': 1062402.0}}
-			},
-		},
-		86400:{
-			'genome':{
-				4: {162: {'training_loss': 0.1782259948596065, 'evaluation_losses': [0.1933299956688224], 'machine_time': 983713.0}, 54: {'training_loss': 0.1765259854969281, 'evaluation_losses': [0.1933299956688224], 'machine_time': 198406.0}, 108: {'training_loss': 0.1619661289961098, 'evaluation_losses': [0.1933299956688224], 'machine_time': 677035.0}, 81: {'training_loss': 0.1634555634809887, 'evaluation_losses': [0.1933299956688224], 'machine_time': 428610.0}}, 2: {162: {'training_loss': 0.20094238192250483, 'evaluation_losses': [0.1933299956688224], 'machine_time': 542083.0}, 108: {'training_loss': 0.17565940239672617, 'evaluation_losses': [0.1933299956688224], 'machine_time': 366680.0}, 54: {'training_loss': 0.1840324582176792, 'evaluation_losses': [0.34485363712672873], 'machine_time': 102901.0}, 81: {'training_loss': 0.17534650962966827, 'evaluation_losses': [0.1933299956688224], 'machine_time': 227100.0}}, 1: {270: {'training_loss': 0.27552974916233486, 'evaluation_losses': [0.1933299956688224], 'machine_time': 388978.0}, 54: {'training_loss': 0.08581710415460117, 'evaluation_losses': [0.25444853956998686], 'machine_time': 41674.0}, 108: {'training_loss': 0.19771764027116734, 'evaluation_losses': [0.1933299956688224], 'machine_time': 154748.0}, 162: {'training_loss': 0.1889524655346547, 'evaluation_losses': [0.1669351284490803], 'machine_time': 232600.0}}, 6: {54: {'training_loss': 0.16439500813054134, 'evaluation_losses': [0.1933299956688224], 'machine_time': 337706.0}}
-			},
-			'seismology':{
-				2: {309: {'training_loss': 0.4851525743358091, 'evaluation_losses': [0.9054040034356088], 'machine_time': 780993.0}, 206: {'training_loss': 0.21239267737813683, 'evaluation_losses': [0.4004098738947475], 'machine_time': 488291.0}, 103: {'training_loss': 0.140915202332279, 'evaluation_losses': [0.8099438326342585], 'machine_time': 120125.0}, 154: {'training_loss': 0.17470464644339478, 'evaluation_losses': [0.6251485492761444], 'machine_time': 259263.0}}, 1: {103: {'training_loss': 0.09890921261017083, 'evaluation_losses': [0.9198553695881477], 'machine_time': 54416.0}, 309: {'training_loss': 0.24412427799315142, 'evaluation_losses': [0.4004098738947475], 'machine_time': 383970.0}, 515: {'training_loss': 0.3569668938430186, 'evaluation_losses': [0.9054040034356088], 'machine_time': 612920.0}, 206: {'training_loss': 0.23364331974919914, 'evaluation_losses': [0.4004098738947475], 'machine_time': 235076.0}, 154: {'training_loss': 0.16551469830414714, 'evaluation_losses': [1.4248735436488504], 'machine_time': 122028.0}}, 4: {103: {'training_loss': 0.19407950622163123, 'evaluation_losses': [0.4004098738947475], 'machine_time': 207265.0}, 309: {'training_loss': 0.5763076171146403, 'evaluation_losses': [0.9054040034356088], 'machine_time': 1285568.0}, 206: {'training_loss': 0.2131207344065794, 'evaluation_losses': [0.4004098738947475], 'machine_time': 825996.0}, 154: {'training_loss': 0.20379684068049597, 'evaluation_losses': [0.4004098738947475], 'machine_time': 443578.0}}, 6: {103: {'training_loss': 0.17424176341843164, 'evaluation_losses': [0.4004098738947475], 'machine_time': 339061.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.09601403766796651, 'evaluation_losses': [0.09358715059655524], 'machine_time': 1062402.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-			'epigenomics':{
-				1: {129: {'training_loss': 0.11176062965607392, 'evaluation_losses': [0.37429587458909264], 'machine_time': 414502.0}, 215: {'training_loss': 0.17326021870193214, 'evaluation_losses': [0.17075020877309222], 'machine_time': 601092.0}, 43: {'training_loss': 0.09070107756132814, 'evaluation_losses': [0.37429587458909264], 'machine_time': 99610.0}}, 2: {64: {'training_loss': 0.11017055941247338, 'evaluation_losses': [0.37429587458909264], 'machine_time': 501377.0}, 43: {'training_loss': 0.09733428674887573, 'evaluation_losses': [0.37429587458909264], 'machine_time': 249274.0}, 86: {'training_loss': 0.11223621487684075, 'evaluation_losses': [0.37429587458909264], 'machine_time': 754654.0}}, 6: {43: {'training_loss': 0.1253376419498577, 'evaluation_losses': [0.37429587458909264], 'machine_time': 930821.0}}, 4: {86: {'training_loss': 0.10684379958781631, 'evaluation_losses': [0.37429587458909264], 'machine_time': 1508019.0}, 129: {'training_loss': 0.11871667169218188, 'evaluation_losses': [0.37429587458909264], 'machine_time': 2015144.0}, 43: {'training_loss': 0.0943927312705394, 'evaluation_losses': [0.37429587458909264], 'machine_time': 498179.0}}
-			},
-			'soykb':{
-				1: {98: {'training_loss': 0.17219723839082293, 'evaluation_losses': [0.21554373486610073], 'machine_time': 88684.0}, 294: {'training_loss': 0.21261397368612991, 'evaluation_losses': [0.21554373486610073], 'machine_time': 525082.0}, 147: {'training_loss': 0.21135887963141572, 'evaluation_losses': [0.2491084246555327], 'machine_time': 184770.0}, 490: {'training_loss': 0.23317696955218728, 'evaluation_losses': [0.21554373486610073], 'machine_time': 772492.0}, 196: {'training_loss': 0.21231079696488575, 'evaluation_losses': [0.2491084246555327], 'machine_time': 335050.0}}, 2: {98: {'training_loss': 0.18374280126939577, 'evaluation_losses': [0.21554373486610073], 'machine_time': 216178.0}, 294: {'training_loss': 0.20228523111733296, 'evaluation_losses': [0.21554373486610073], 'machine_time': 1197703.0}}, 4: {147: {'training_loss': 0.1997679539599801, 'evaluation_losses': [0.21554373486610073], 'machine_time': 953325.0}, 294: {'training_loss': 0.19444033072117564, 'evaluation_losses': [0.21554373486610073], 'machine_time': 2359713.0}, 98: {'training_loss': 0.18902428865732349, 'evaluation_losses': [0.21554373486610073], 'machine_time': 481668.0}}, 6: {98: {'training_loss': 0.21521018753330165, 'evaluation_losses': [0.21554373486610073], 'machine_time': 916032.0}}
-			},
-			'montage':{
-				2: {180: {'training_loss': 0.25385489867981675, 'evaluation_losses': [0.2704901612351894], 'machine_time': 763428.0}, 60: {'training_loss': 0.27121808314072815, 'evaluation_losses': [0.28001337249482283], 'machine_time': 184830.0}, 90: {'training_loss': 0.25920772229841266, 'evaluation_losses': [0.26287803585147146], 'machine_time': 365324.0}, 120: {'training_loss': 0.2562101647208349, 'evaluation_losses': [0.2704901612351894], 'machine_time': 548921.0}}, 4: {120: {'training_loss': 0.27598472545658326, 'evaluation_losses': [0.2704901612351894], 'machine_time': 1180806.0}, 60: {'training_loss': 0.25376088041770173, 'evaluation_losses': [0.47004661626974753], 'machine_time': 408765.0}, 90: {'training_loss': 0.2809498865746308, 'evaluation_losses': [0.3172858908857931], 'machine_time': 795329.0}, 180: {'training_loss': 0.2696257148699608, 'evaluation_losses': [0.2704901612351894], 'machine_time': 1603583.0}}, 1: {300: {'training_loss': 0.2500554666794729, 'evaluation_losses': [0.2704901612351894], 'machine_time': 442968.0}, 60: {'training_loss': 0.18077905695997182, 'evaluation_losses': [0.43112372746558786], 'machine_time': 62748.0}, 180: {'training_loss': 0.21011202195378914, 'evaluation_losses': [0.4253560426884297], 'machine_time': 283026.0}, 90: {'training_loss': 0.17945847635531906, 'evaluation_losses': [0.30845728776694525], 'machine_time': 128120.0}, 120: {'training_loss': 0.19625084143378074, 'evaluation_losses': [0.4253560426884297], 'machine_time': 196706.0}}, 6: {60: {'training_loss': 0.25393967254636435, 'evaluation_losses': [0.18881828256717786], 'machine_time': 730912.0}}
-			},
-			'forkjoin':{
-				6: {10: {'training_loss': 0.13676219697830647, 'evaluation_losses': [0.3032041966821829], 'machine_time': 189478.0}}, 2: {25: {'training_loss': 0.16224180137321426, 'evaluation_losses': [0.21593302033594247], 'machine_time': 189971.0}}, 1: {10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.3032041966821829], 'machine_time': 28286.0}, 50: {'training_loss': 0.2032104232847454, 'evaluation_losses': [0.21593302033594247], 'machine_time': 131312.0}}
-			},
-		},
-	},
-	'single_sample':{
-		60:{
-			'epigenomics':{
-				4: {64: {'training_loss': 1.4829484740632706, 'evaluation_losses': [3.6391917989789535], 'machine_time': 253835.0}, 129: {'training_loss': 1.5534935126704494, 'evaluation_losses': [3.6391917989789535], 'machine_time': 247235.0}, 86: {'training_loss': 1.5336997953261566, 'evaluation_losses': [3.6391917989789535], 'machine_time': 250625.0}, 43: {'training_loss': 1.472533867957947, 'evaluation_losses': [3.6391917989789535], 'machine_time': 248905.0}}, 1: {86: {'training_loss': 1.5303516946850406, 'evaluation_losses': [3.6391917989789535], 'machine_time': 103634.0}, 129: {'training_loss': 1.526710547758987, 'evaluation_losses': [3.6391917989789535], 'machine_time': 110598.0}, 64: {'training_loss': 1.5651003153336007, 'evaluation_losses': [3.6391917989789535], 'machine_time': 100660.0}, 43: {'training_loss': 1.4849134012661305, 'evaluation_losses': [3.6391917989789535], 'machine_time': 99610.0}, 215: {'training_loss': 4.221550398431407, 'evaluation_losses': [3.6391917989789535], 'machine_time': 186590.0}}, 6: {43: {'training_loss': 0.9542674287442403, 'evaluation_losses': [3.6391917989789535], 'machine_time': 432642.0}}
-			},
-		},
-		300:{
-			'genome':{
-				4: {81: {'training_loss': 1.6786097468074752, 'evaluation_losses': [4.619764233253137], 'machine_time': 106005.0}, 54: {'training_loss': 1.8609028931500347, 'evaluation_losses': [4.619764233253137], 'machine_time': 95505.0}, 162: {'training_loss': 2.1361653743017155, 'evaluation_losses': [5.928034407063035], 'machine_time': 131275.0}, 108: {'training_loss': 1.6391770564468024, 'evaluation_losses': [4.619764233253137], 'machine_time': 108845.0}}, 2: {54: {'training_loss': 1.7251255829557475, 'evaluation_losses': [4.619764233253137], 'machine_time': 61227.0}, 108: {'training_loss': 1.3860416871060683, 'evaluation_losses': [4.619764233253137], 'machine_time': 78594.0}, 162: {'training_loss': 1.654723077292264, 'evaluation_losses': [5.928034407063035], 'machine_time': 97551.0}}, 1: {162: {'training_loss': 1.5491351588792872, 'evaluation_losses': [5.928034407063035], 'machine_time': 77852.0}, 54: {'training_loss': 1.9867779900904579, 'evaluation_losses': [4.619764233253137], 'machine_time': 41674.0}, 81: {'training_loss': 1.5880390145648309, 'evaluation_losses': [4.619764233253137], 'machine_time': 52088.0}, 108: {'training_loss': 1.3261554908193298, 'evaluation_losses': [4.619764233253137], 'machine_time': 60986.0}, 270: {'training_loss': 6.180168779197503, 'evaluation_losses': [5.928034407063035], 'machine_time': 156378.0}}, 6: {54: {'training_loss': 1.724648528950341, 'evaluation_losses': [4.619764233253137], 'machine_time': 139300.0}}
-			},
-			'seismology':{
-				4: {154: {'training_loss': 1.6273204834941164, 'evaluation_losses': [6.597169780812517], 'machine_time': 97175.0}, 309: {'training_loss': 10.902997889695497, 'evaluation_losses': [9.05248615005327], 'machine_time': 166870.0}, 103: {'training_loss': 1.6917200074834406, 'evaluation_losses': [6.597169780812517], 'machine_time': 87140.0}}, 2: {309: {'training_loss': 8.28068661160581, 'evaluation_losses': [9.05248615005327], 'machine_time': 143808.0}, 206: {'training_loss': 9.258014218290112, 'evaluation_losses': [9.05248615005327], 'machine_time': 115980.0}, 103: {'training_loss': 1.2776525636120921, 'evaluation_losses': [6.597169780812517], 'machine_time': 65709.0}, 154: {'training_loss': 2.3160529895961397, 'evaluation_losses': [9.05248615005327], 'machine_time': 71526.0}}, 1: {309: {'training_loss': 5.936058601246375, 'evaluation_losses': [9.05248615005327], 'machine_time': 148894.0}, 206: {'training_loss': 7.016781175573216, 'evaluation_losses': [9.05248615005327], 'machine_time': 113048.0}, 103: {'training_loss': 1.1301308548116094, 'evaluation_losses': [6.597169780812517], 'machine_time': 54416.0}, 515: {'training_loss': 4.123289284614861, 'evaluation_losses': [9.05248615005327], 'machine_time': 228950.0}}, 6: {103: {'training_loss': 1.3556516419890579, 'evaluation_losses': [6.597169780812517], 'machine_time': 131796.0}}
-			},
-			'epigenomics':{
-				6: {43: {'training_loss': 0.3436043933872046, 'evaluation_losses': [0.6540478855243073], 'machine_time': 432642.0}}, 2: {86: {'training_loss': 0.842371725670535, 'evaluation_losses': [2.9034922609282945], 'machine_time': 149643.0}, 129: {'training_loss': 0.8746506003452068, 'evaluation_losses': [2.9034922609282945], 'machine_time': 149292.0}}, 1: {86: {'training_loss': 0.8496827952283704, 'evaluation_losses': [2.9034922609282945], 'machine_time': 103634.0}, 215: {'training_loss': 4.221550398431407, 'evaluation_losses': [3.6391917989789535], 'machine_time': 186590.0}, 64: {'training_loss': 0.8448430002932866, 'evaluation_losses': [2.9034922609282945], 'machine_time': 100660.0}}, 4: {43: {'training_loss': 0.7654408801264155, 'evaluation_losses': [2.9034922609282945], 'machine_time': 248905.0}, 129: {'training_loss': 0.8384134631218996, 'evaluation_losses': [2.9034922609282945], 'machine_time': 247235.0}, 86: {'training_loss': 0.8121398210494848, 'evaluation_losses': [2.9034922609282945], 'machine_time': 250625.0}, 64: {'training_loss': 0.7740545868824471, 'evaluation_losses': [2.9034922609282945], 'machine_time': 253835.0}}
-			},
-			'montage':{
-				4: {60: {'training_loss': 1.042404000693127, 'evaluation_losses': [5.414914009217057], 'machine_time': 223935.0}}, 2: {90: {'training_loss': 1.5100159409782183, 'evaluation_losses': [5.414914009217057], 'machine_time': 115122.0}, 60: {'training_loss': 1.16876830980846, 'evaluation_losses': [5.414914009217057], 'machine_time': 122082.0}, 180: {'training_loss': 2.5581855193586365, 'evaluation_losses': [7.2004381314558765], 'machine_time': 128187.0}, 120: {'training_loss': 1.5339393285429974, 'evaluation_losses': [5.414914009217057], 'machine_time': 115011.0}}, 1: {90: {'training_loss': 2.2361189220024227, 'evaluation_losses': [5.414914009217057], 'machine_time': 65372.0}, 300: {'training_loss': 11.135932385413405, 'evaluation_losses': [7.2004381314558765], 'machine_time': 159942.0}, 180: {'training_loss': 3.21062176499013, 'evaluation_losses': [7.2004381314558765], 'machine_time': 86320.0}, 60: {'training_loss': 2.1489828358190954, 'evaluation_losses': [5.414914009217057], 'machine_time': 62748.0}, 120: {'training_loss': 2.237736752429197, 'evaluation_losses': [5.414914009217057], 'machine_time': 68586.0}}, 6: {60: {'training_loss': 0.9787821250575043, 'evaluation_losses': [5.414914009217057], 'machine_time': 322147.0}}
-			},
-			'forkjoin':{
-				1: {10: {'training_loss': 0.20179944600710206, 'evaluation_losses': [0.34478562369860893], 'machine_time': 28286.0}, 50: {'training_loss': 1.751346902967587, 'evaluation_losses': [1.8693583670569063], 'machine_time': 53346.0}, 25: {'training_loss': 0.5350494236613352, 'evaluation_losses': [0.589911600321206], 'machine_time': 49680.0}}, 6: {10: {'training_loss': 0.21698338517036947, 'evaluation_losses': [1.8693583670569063], 'machine_time': 118874.0}}
-			},
-			'soykb':{
-				2: {294: {'training_loss': 10.850594245166539, 'evaluation_losses': [9.237366668855547], 'machine_time': 219327.0}, 196: {'training_loss': 11.32155768436896, 'evaluation_losses': [9.237366668855547], 'machine_time': 194604.0}, 147: {'training_loss': 3.1484138207067147, 'evaluation_losses': [9.237366668855547], 'machine_time': 131196.0}, 98: {'training_loss': 1.7106387946713744, 'evaluation_losses': [7.0298754271680695], 'machine_time': 127494.0}}, 1: {490: {'training_loss': 7.321279094053725, 'evaluation_losses': [9.237366668855547], 'machine_time': 247410.0}, 98: {'training_loss': 1.7407239280547988, 'evaluation_losses': [7.0298754271680695], 'machine_time': 88684.0}, 196: {'training_loss': 10.1490861519834, 'evaluation_losses': [9.237366668855547], 'machine_time': 150280.0}}, 4: {294: {'training_loss': 11.063244260562355, 'evaluation_losses': [9.237366668855547], 'machine_time': 336345.0}, 196: {'training_loss': 10.58462952971323, 'evaluation_losses': [9.237366668855547], 'machine_time': 315800.0}}, 6: {98: {'training_loss': 0.7952015009263536, 'evaluation_losses': [7.0298754271680695], 'machine_time': 434364.0}}
-			},
-			'chain':{
-				1: {10: {'training_loss': 0.1063989426543291, 'evaluation_losses': [0.12787283264986246], 'machine_time': 89986.0}}
-			},
-		},
-		600:{
-			'montage':{
-				6: {60: {'training_loss': 0.2894197616766949, 'evaluation_losses': [1.7074221362177266], 'machine_time': 322147.0}}, 2: {90: {'training_loss': 1.3579745955297458, 'evaluation_losses': [5.870513475800328], 'machine_time': 115122.0}, 180: {'training_loss': 1.5034543436924426, 'evaluation_losses': [5.414914009217057], 'machine_time': 128187.0}, 120: {'training_loss': 1.5339393285429974, 'evaluation_losses': [5.414914009217057], 'machine_time': 115011.0}, 60: {'training_loss': 0.2647397829702818, 'evaluation_losses': [1.7074221362177266], 'machine_time': 122082.0}}, 4: {90: {'training_loss': 1.082923567433281, 'evaluation_losses': [5.870513475800328], 'machine_time': 206070.0}, 180: {'training_loss': 1.3914424527980487, 'evaluation_losses': [5.414914009217057], 'machine_time': 208270.0}, 120: {'training_loss': 1.3928587436817232, 'evaluation_losses': [5.414914009217057], 'machine_time': 201880.0}, 60: {'training_loss': 0.20178260129532444, 'evaluation_losses': [1.0688679942821198], 'machine_time': 223935.0}}, 1: {300: {'training_loss': 11.135932385413405, 'evaluation_losses': [7.2004381314558765], 'machine_time': 159942.0}, 120: {'training_loss': 2.237736752429197, 'evaluation_losses': [5.414914009217057], 'machine_time': 68586.0}, 60: {'training_loss': 0.5994910785901307, 'evaluation_losses': [1.7074221362177266], 'machine_time': 62748.0}, 180: {'training_loss': 1.979805362828562, 'evaluation_losses': [5.414914009217057], 'machine_time': 86320.0}, 90: {'training_loss': 0.6571636334062232, 'evaluation_losses': [1.7074221362177266], 'machine_time': 65372.0}}
-			},
-			'epigenomics':{
-				1: {215: {'training_loss': 5.380633555994535, 'evaluation_losses': [7.122815019188812], 'machine_time': 186590.0}, 43: {'training_loss': 0.17273594609894127, 'evaluation_losses': [0.21106717020449622], 'machine_time': 99610.0}, 86: {'training_loss': 0.1673257012591809, 'evaluation_losses': [0.20926343954463913], 'machine_time': 103634.0}, 129: {'training_loss': 0.5611258444089737, 'evaluation_losses': [1.5563108015278229], 'machine_time': 110598.0}, 64: {'training_loss': 0.20231372611567344, 'evaluation_losses': [0.3279749028919215], 'machine_time': 100660.0}}, 6: {43: {'training_loss': 0.18051066726873763, 'evaluation_losses': [1.1340528582834546], 'machine_time': 432642.0}}, 4: {64: {'training_loss': 0.12554156629479005, 'evaluation_losses': [0.2740032620586513], 'machine_time': 253835.0}, 43: {'training_loss': 0.16356785906057789, 'evaluation_losses': [0.45549657632972934], 'machine_time': 248905.0}, 86: {'training_loss': 0.5195269598594147, 'evaluation_losses': [1.4123082009223276], 'machine_time': 250625.0}}, 2: {43: {'training_loss': 0.2725408913945036, 'evaluation_losses': [1.2278771380482276], 'machine_time': 149664.0}, 129: {'training_loss': 0.35537321120115367, 'evaluation_losses': [0.3625171488738078], 'machine_time': 149292.0}}
-			},
-			'genome':{
-				1: {162: {'training_loss': 0.9653500918306256, 'evaluation_losses': [4.619764233253137], 'machine_time': 77852.0}, 270: {'training_loss': 5.166853190948136, 'evaluation_losses': [4.619764233253137], 'machine_time': 156378.0}, 81: {'training_loss': 0.49472262615907486, 'evaluation_losses': [1.370886816415533], 'machine_time': 52088.0}, 108: {'training_loss': 0.48865982867996194, 'evaluation_losses': [1.370886816415533], 'machine_time': 60986.0}}, 6: {54: {'training_loss': 0.37844053211034184, 'evaluation_losses': [0.9638833796538521], 'machine_time': 139300.0}}, 4: {81: {'training_loss': 0.4818951956628756, 'evaluation_losses': [1.370886816415533], 'machine_time': 106005.0}}
-			},
-			'seismology':{
-				1: {515: {'training_loss': 4.123289284614861, 'evaluation_losses': [9.05248615005327], 'machine_time': 228950.0}, 309: {'training_loss': 5.936058601246375, 'evaluation_losses': [9.05248615005327], 'machine_time': 148894.0}, 103: {'training_loss': 1.1301308548116094, 'evaluation_losses': [6.597169780812517], 'machine_time': 54416.0}, 206: {'training_loss': 7.016781175573216, 'evaluation_losses': [9.05248615005327], 'machine_time': 113048.0}, 154: {'training_loss': 0.9881795108224266, 'evaluation_losses': [6.597169780812517], 'machine_time': 67612.0}}, 2: {206: {'training_loss': 9.258014218290112, 'evaluation_losses': [9.05248615005327], 'machine_time': 115980.0}, 309: {'training_loss': 8.28068661160581, 'evaluation_losses': [9.05248615005327], 'machine_time': 143808.0}, 154: {'training_loss': 1.379571273955493, 'evaluation_losses': [6.597169780812517], 'machine_time': 71526.0}, 103: {'training_loss': 1.2776525636120921, 'evaluation_losses': [6.597169780812517], 'machine_time': 65709.0}}, 4: {206: {'training_loss': 10.925082044074479, 'evaluation_losses': [9.05248615005327], 'machine_time': 153390.0}, 309: {'training_loss': 10.902997889695497, 'evaluation_losses': [9.05248615005327], 'machine_time': 166870.0}, 154: {'training_loss': 1.6273204834941164, 'evaluation_losses': [6.597169780812517], 'machine_time': 97175.0}}, 6: {103: {'training_loss': 1.3556516419890579, 'evaluation_losses': [6.597169780812517], 'machine_time': 131796.0}}
-			},
-			'forkjoin':{
-				1: {25: {'training_loss': 0.2680827695381478, 'evaluation_losses': [0.34478562369860893], 'machine_time': 49680.0}, 10: {'training_loss': 0.11717911880876876, 'evaluation_losses': [0.30710368074163846], 'machine_time': 28286.0}}, 2: {10: {'training_loss': 0.11374212548333186, 'evaluation_losses': [0.30710368074163846], 'machine_time': 42318.0}, 25: {'training_loss': 0.26324511322726646, 'evaluation_losses': [0.34478562369860893], 'machine_time': 69687.0}}, 6: {10: {'training_loss': 0.09879769202198133, 'evaluation_losses': [0.2731125966534577], 'machine_time': 118874.0}}
-			},
-			'soykb':{
-				1: {196: {'training_loss': 7.7564855214231665, 'evaluation_losses': [7.0298754271680695], 'machine_time': 150280.0}, 294: {'training_loss': 8.889141377901383, 'evaluation_losses': [9.237366668855547], 'machine_time': 190032.0}, 147: {'training_loss': 1.7924503344180358, 'evaluation_losses': [7.0298754271680695], 'machine_time': 96086.0}, 98: {'training_loss': 0.49495378347769, 'evaluation_losses': [2.203704253012487], 'machine_time': 88684.0}}, 2: {147: {'training_loss': 1.8671994445776197, 'evaluation_losses': [7.0298754271680695], 'machine_time': 131196.0}, 98: {'training_loss': 1.7106387946713744, 'evaluation_losses': [7.0298754271680695], 'machine_time': 127494.0}, 294: {'training_loss': 10.850594245166539, 'evaluation_losses': [9.237366668855547], 'machine_time': 219327.0}, 196: {'training_loss': 8.65831472477575, 'evaluation_losses': [7.0298754271680695], 'machine_time': 194604.0}}, 4: {98: {'training_loss': 1.1261637531682291, 'evaluation_losses': [7.0298754271680695], 'machine_time': 265490.0}, 294: {'training_loss': 11.063244260562355, 'evaluation_losses': [9.237366668855547], 'machine_time': 336345.0}}, 6: {98: {'training_loss': 0.7952015009263536, 'evaluation_losses': [7.0298754271680695], 'machine_time': 434364.0}}
-			},
-			'chain':{
-				1: {10: {'training_loss': 0.1063989426543291, 'evaluation_losses': [0.12787283264986246], 'machine_time': 89986.0}, 50: {'training_loss': 0.133597711329716, 'evaluation_losses': [0.12787283264986246], 'machine_time': 625694.0}}
-			},
-		},
-		1800:{
-			'epigenomics':{
-				2: {64: {'training_loss': 0.13202718560390075, 'evaluation_losses': [0.37433170167504987], 'machine_time': 151443.0}, 86: {'training_loss': 0.1313070093391717, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149643.0}}, 1: {43: {'training_loss': 0.09070107756132814, 'evaluation_losses': [0.37433170167504987], 'machine_time': 99610.0}, 64: {'training_loss': 0.11398647854824129, 'evaluation_losses': [0.37433170167504987], 'machine_time': 100660.0}, 215: {'training_loss': 0.40083278685074675, 'evaluation_losses': [0.37433170167504987], 'machine_time': 186590.0}, 129: {'training_loss': 0.1406526432013121, 'evaluation_losses': [0.37433170167504987], 'machine_time': 110598.0}, 86: {'training_loss': 0.10095110438826074, 'evaluation_losses': [0.37433170167504987], 'machine_time': 103634.0}}, 4: {64: {'training_loss': 0.0962077219202118, 'evaluation_losses': [0.37433170167504987], 'machine_time': 253835.0}}
-			},
-			'soykb':{
-				1: {147: {'training_loss': 0.2672895454283326, 'evaluation_losses': [0.21556294799611517], 'machine_time': 96086.0}, 196: {'training_loss': 7.7564855214231665, 'evaluation_losses': [7.0298754271680695], 'machine_time': 150280.0}, 490: {'training_loss': 7.321279094053725, 'evaluation_losses': [9.237366668855547], 'machine_time': 247410.0}, 294: {'training_loss': 6.74515301232141, 'evaluation_losses': [7.0298754271680695], 'machine_time': 190032.0}, 98: {'training_loss': 0.1721972585585166, 'evaluation_losses': [0.21556294799611517], 'machine_time': 88684.0}}, 2: {147: {'training_loss': 0.19370758972369304, 'evaluation_losses': [0.21556294799611517], 'machine_time': 131196.0}, 98: {'training_loss': 0.1952883765193177, 'evaluation_losses': [0.21556294799611517], 'machine_time': 127494.0}}, 4: {294: {'training_loss': 8.376180790747572, 'evaluation_losses': [7.0298754271680695], 'machine_time': 336345.0}, 196: {'training_loss': 8.014387559136129, 'evaluation_losses': [7.0298754271680695], 'machine_time': 315800.0}, 147: {'training_loss': 0.17053765577728455, 'evaluation_losses': [0.21556294799611517], 'machine_time': 244375.0}}, 6: {98: {'training_loss': 0.1274220251953605, 'evaluation_losses': [1.4039708671428581], 'machine_time': 434364.0}}
-			},
-			'montage':{
-				2: {120: {'training_loss': 0.2613207540547299, 'evaluation_losses': [0.2783170233271332], 'machine_time': 115011.0}, 180: {'training_loss': 0.39703977326389567, 'evaluation_losses': [1.7074221362177266], 'machine_time': 128187.0}, 90: {'training_loss': 0.24502073162177715, 'evaluation_losses': [0.2783170233271332], 'machine_time': 115122.0}}, 4: {60: {'training_loss': 0.20178260129532444, 'evaluation_losses': [1.0688679942821198], 'machine_time': 223935.0}, 90: {'training_loss': 0.28640798547123925, 'evaluation_losses': [0.2783170233271332], 'machine_time': 206070.0}}, 1: {60: {'training_loss': 0.3195483283942305, 'evaluation_losses': [0.2783170233271332], 'machine_time': 62748.0}, 90: {'training_loss': 0.44078161236083735, 'evaluation_losses': [0.2783170233271332], 'machine_time': 65372.0}, 300: {'training_loss': 8.79185468853161, 'evaluation_losses': [5.414914009217057], 'machine_time': 159942.0}, 180: {'training_loss': 0.30680755623456213, 'evaluation_losses': [0.2783170233271332], 'machine_time': 86320.0}}
-			},
-			'genome':{
-				2: {54: {'training_loss': 0.3070269841370887, 'evaluation_losses': [0.533254017511746], 'machine_time': 61227.0}, 81: {'training_loss': 0.26897851794472294, 'evaluation_losses': [0.591587506000315], 'machine_time': 72111.0}, 108: {'training_loss': 0.24563741558669364, 'evaluation_losses': [0.591587506000315], 'machine_time': 78594.0}, 162: {'training_loss': 0.28514111965703215, 'evaluation_losses': [0.9638833796538521], 'machine_time': 97551.0}}, 4: {81: {'training_loss': 0.28018113803075645, 'evaluation_losses': [0.533254017511746], 'machine_time': 106005.0}, 162: {'training_loss': 0.38678119428896773, 'evaluation_losses': [1.370886816415533], 'machine_time': 131275.0}}, 1: {270: {'training_loss': 5.166853190948136, 'evaluation_losses': [4.619764233253137], 'machine_time': 156378.0}, 108: {'training_loss': 0.2702474562031247, 'evaluation_losses': [0.591587506000315], 'machine_time': 60986.0}, 162: {'training_loss': 0.29331319803970796, 'evaluation_losses': [0.9638833796538521], 'machine_time': 77852.0}, 54: {'training_loss': 0.27378105866390506, 'evaluation_losses': [0.533254017511746], 'machine_time': 41674.0}}, 6: {54: {'training_loss': 0.2710659618219356, 'evaluation_losses': [0.533254017511746], 'machine_time': 139300.0}}
-			},
-			'seismology':{
-				2: {154: {'training_loss': 0.40339985561742314, 'evaluation_losses': [2.028701669605716], 'machine_time': 71526.0}, 103: {'training_loss': 0.2416811489082056, 'evaluation_losses': [1.121688130273891], 'machine_time': 65709.0}, 309: {'training_loss': 6.194446347370215, 'evaluation_losses': [6.597169780812517], 'machine_time': 143808.0}, 206: {'training_loss': 2.1238790658099487, 'evaluation_losses': [2.028701669605716], 'machine_time': 115980.0}}, 6: {103: {'training_loss': 0.3945326967495242, 'evaluation_losses': [2.028701669605716], 'machine_time': 131796.0}}, 4: {154: {'training_loss': 0.43748112361761177, 'evaluation_losses': [2.028701669605716], 'machine_time': 97175.0}, 206: {'training_loss': 2.489448467614675, 'evaluation_losses': [2.028701669605716], 'machine_time': 153390.0}, 309: {'training_loss': 8.077854319358789, 'evaluation_losses': [6.597169780812517], 'machine_time': 166870.0}}, 1: {515: {'training_loss': 4.123289284614861, 'evaluation_losses': [9.05248615005327], 'machine_time': 228950.0}, 154: {'training_loss': 0.4292811918258869, 'evaluation_losses': [2.028701669605716], 'machine_time': 67612.0}, 103: {'training_loss': 0.2316287745767216, 'evaluation_losses': [1.121688130273891], 'machine_time': 54416.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.11005274249534278, 'evaluation_losses': [0.11332763231830498], 'machine_time': 625694.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-			'forkjoin':{
-				2: {25: {'training_loss': 0.17068787166327345, 'evaluation_losses': [0.2158668540303725], 'machine_time': 69687.0}}, 1: {50: {'training_loss': 0.252806602119299, 'evaluation_losses': [0.2158668540303725], 'machine_time': 53346.0}, 25: {'training_loss': 0.20596709130712665, 'evaluation_losses': [0.2158668540303725], 'machine_time': 49680.0}, 10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.30320290671009], 'machine_time': 28286.0}}
-			},
-		},
-		3600:{
-			'epigenomics':{
-				2: {64: {'training_loss': 0.13202718560390075, 'evaluation_losses': [0.37433170167504987], 'machine_time': 151443.0}, 86: {'training_loss': 0.1313070093391717, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149643.0}, 43: {'training_loss': 0.10396749593642332, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149664.0}, 129: {'training_loss': 0.19244171588215986, 'evaluation_losses': [0.37433170167504987], 'machine_time': 149292.0}}, 1: {43: {'training_loss': 0.09070107756132814, 'evaluation_losses': [0.37433170167504987], 'machine_time': 99610.0}, 64: {'training_loss': 0.11398647854824129, 'evaluation_losses': [0.37433170167504987], 'machine_time': 100660.0}, 129: {'training_loss': 0.1406526432013121, 'evaluation_losses': [0.37433170167504987], 'machine_time': 110598.0}}, 4: {43: {'training_loss': 0.08850962031386672, 'evaluation_losses': [0.37433170167504987], 'machine_time': 248905.0}, 64: {'training_loss': 0.0962077219202118, 'evaluation_losses': [0.37433170167504987], 'machine_time': 253835.0}}, 6: {43: {'training_loss': 0.13622797903937153, 'evaluation_losses': [0.5638938095262929], 'machine_time': 432642.0}}
-			},
-			'genome':{
-				2: {54: {'training_loss': 0.14973431098506967, 'evaluation_losses': [0.1933353012882317], 'machine_time': 61227.0}, 81: {'training_loss': 0.2485146901692154, 'evaluation_losses': [0.49460787499841596], 'machine_time': 72111.0}, 108: {'training_loss': 0.24563741558669364, 'evaluation_losses': [0.591587506000315], 'machine_time': 78594.0}, 162: {'training_loss': 0.19072152168258688, 'evaluation_losses': [0.591587506000315], 'machine_time': 97551.0}}, 1: {108: {'training_loss': 0.2702474562031247, 'evaluation_losses': [0.591587506000315], 'machine_time': 60986.0}, 81: {'training_loss': 0.2872131611701952, 'evaluation_losses': [0.533254017511746], 'machine_time': 52088.0}, 270: {'training_loss': 0.5011924980278081, 'evaluation_losses': [0.533254017511746], 'machine_time': 156378.0}, 54: {'training_loss': 0.2237226273771125, 'evaluation_losses': [0.1933353012882317], 'machine_time': 41674.0}}, 4: {81: {'training_loss': 0.12322658366759329, 'evaluation_losses': [0.1933353012882317], 'machine_time': 106005.0}, 108: {'training_loss': 0.31757744988765413, 'evaluation_losses': [0.591587506000315], 'machine_time': 108845.0}, 54: {'training_loss': 0.15612102353360527, 'evaluation_losses': [0.1933353012882317], 'machine_time': 95505.0}, 162: {'training_loss': 0.19631203683545498, 'evaluation_losses': [0.591587506000315], 'machine_time': 131275.0}}, 6: {54: {'training_loss': 0.1280020856182821, 'evaluation_losses': [0.1933353012882317], 'machine_time': 139300.0}}
-			},
-			'montage':{
-				2: {90: {'training_loss': 0.24502073162177715, 'evaluation_losses': [0.2783170233271332], 'machine_time': 115122.0}, 120: {'training_loss': 0.2613207540547299, 'evaluation_losses': [0.2783170233271332], 'machine_time': 115011.0}, 60: {'training_loss': 0.1715305285820744, 'evaluation_losses': [0.2421718046329597], 'machine_time': 122082.0}}, 1: {90: {'training_loss': 0.33757074558559874, 'evaluation_losses': [1.0448115800294646], 'machine_time': 65372.0}, 300: {'training_loss': 2.799766007925986, 'evaluation_losses': [1.7074221362177266], 'machine_time': 159942.0}, 180: {'training_loss': 0.30680755623456213, 'evaluation_losses': [0.2783170233271332], 'machine_time': 86320.0}, 60: {'training_loss': 0.3187295715290656, 'evaluation_losses': [1.0448115800294646], 'machine_time': 62748.0}, 120: {'training_loss': 0.28402064461132176, 'evaluation_losses': [0.2783170233271332], 'machine_time': 68586.0}}, 6: {60: {'training_loss': 0.16662643548774878, 'evaluation_losses': [0.2421718046329597], 'machine_time': 322147.0}}, 4: {180: {'training_loss': 0.2585575459284437, 'evaluation_losses': [0.2783170233271332], 'machine_time': 208270.0}, 60: {'training_loss': 0.18579408046796805, 'evaluation_losses': [0.6855457193853068], 'machine_time': 223935.0}, 90: {'training_loss': 0.2323612179639661, 'evaluation_losses': [0.6855457193853068], 'machine_time': 206070.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.10755990205138898, 'evaluation_losses': [0.11915672801048384], 'machine_time': 625694.0}, 10: {'training_loss': 0.10329469888220029, 'evaluation_losses': [0.09358715059655524], 'machine_time': 89986.0}}
-			},
-			'forkjoin':{
-				1: {50: {'training_loss': 0.25110853357773705, 'evaluation_losses': [0.2038533576810249], 'machine_time': 53346.0}, 10: {'training_loss': 0.092124359961626, 'evaluation_losses': [0.30320290671009], 'machine_time': 28286.0}}, 6: {10: {'training_loss': 0.08230592742476078, 'evaluation_losses': [0.37990784407022576], 'machine_time': 118874.0}}, 2: {25: {'training_loss': 0.17068787166327345, 'evaluation_losses': [0.2158668540303725], 'machine_time': 69687.0}, 10: {'training_loss': 0.08946267972762108, 'evaluation_losses': [0.30320290671009], 'machine_time': 42318.0}}
-			},
-			'soykb':{
-				4: {147: {'training_loss': 0.17053765577728455, 'evaluation_losses': [0.21556294799611517], 'machine_time': 244375.0}}, 2: {294: {'training_loss': 1.6176996890774773, 'evaluation_losses': [1.4039708671428581], 'machine_time': 219327.0}}
-			},
-		},
-		7200:{
-		},
-		18000:{
-		},
-		86400:{
-			'seismology':{
-				1: {103: {'training_loss': 0.10540439379326705, 'evaluation_losses': [0.7567774575145696], 'machine_time': 54416.0}, 515: {'training_loss': 0.2955214460305575, 'evaluation_losses': [0.9054028965559352], 'machine_time': 228950.0}, 309: {'training_loss': 0.2703339648160626, 'evaluation_losses': [0.40042278552300903], 'machine_time': 148894.0}, 206: {'training_loss': 0.25208336590921415, 'evaluation_losses': [0.40042278552300903], 'machine_time': 113048.0}, 154: {'training_loss': 0.1770172418242743, 'evaluation_losses': [0.5902106997144231], 'machine_time': 67612.0}}, 2: {103: {'training_loss': 0.15676931703364808, 'evaluation_losses': [0.5742710023275728], 'machine_time': 65709.0}, 206: {'training_loss': 0.19983410449360697, 'evaluation_losses': [0.40042278552300903], 'machine_time': 115980.0}, 309: {'training_loss': 0.25815557366220976, 'evaluation_losses': [0.40042278552300903], 'machine_time': 143808.0}, 154: {'training_loss': 0.1397555560642769, 'evaluation_losses': [0.7143337404164323], 'machine_time': 71526.0}}, 4: {309: {'training_loss': 0.20455262459867282, 'evaluation_losses': [0.24615189400874235], 'machine_time': 166870.0}, 103: {'training_loss': 0.15671328986519606, 'evaluation_losses': [0.8618906062279377], 'machine_time': 87140.0}, 206: {'training_loss': 0.2295700076013099, 'evaluation_losses': [0.40042278552300903], 'machine_time': 153390.0}, 154: {'training_loss': 0.1987053731750589, 'evaluation_losses': [0.4425630364609997], 'machine_time': 97175.0}}
-			},
-			'epigenomics':{
-				1: {129: {'training_loss': 0.14062478266588518, 'evaluation_losses': [0.3742653567136348], 'machine_time': 110598.0}, 215: {'training_loss': 0.1363101502588614, 'evaluation_losses': [0.13291844003851372], 'machine_time': 186590.0}, 64: {'training_loss': 0.11398647854824127, 'evaluation_losses': [0.3742653567136348], 'machine_time': 100660.0}, 86: {'training_loss': 0.10171351655221077, 'evaluation_losses': [0.3742653567136348], 'machine_time': 103634.0}, 43: {'training_loss': 0.09070107756132832, 'evaluation_losses': [0.3742653567136348], 'machine_time': 99610.0}}, 2: {64: {'training_loss': 0.13202718560390014, 'evaluation_losses': [0.3742653567136348], 'machine_time': 151443.0}, 129: {'training_loss': 0.14397880286188183, 'evaluation_losses': [0.17075074723278288], 'machine_time': 149292.0}, 86: {'training_loss': 0.10617910044732254, 'evaluation_losses': [0.2217967110552641], 'machine_time': 149643.0}, 43: {'training_loss': 0.10396749593642324, 'evaluation_losses': [0.3742653567136348], 'machine_time': 149664.0}}, 4: {86: {'training_loss': 0.10345956479522599, 'evaluation_losses': [0.3742653567136348], 'machine_time': 250625.0}, 64: {'training_loss': 0.09620772192021226, 'evaluation_losses': [0.3742653567136348], 'machine_time': 253835.0}, 129: {'training_loss': 0.11884830490965796, 'evaluation_losses': [0.1488988668053248], 'machine_time': 247235.0}, 43: {'training_loss': 0.08850962031386722, 'evaluation_losses': [0.3742653567136348], 'machine_time': 248905.0}}, 6: {43: {'training_loss': 0.10713490662189729, 'evaluation_losses': [0.3987793983139432], 'machine_time': 432642.0}}
-			},
-			'genome':{
-				1: {108: {'training_loss': 0.1737103304909149, 'evaluation_losses': [0.21060720984353043], 'machine_time': 60986.0}, 270: {'training_loss': 0.19613779299745124, 'evaluation_losses': [0.3217051833462672], 'machine_time': 156378.0}, 54: {'training_loss': 0.18545383616885042, 'evaluation_losses': [0.3448052909936255], 'machine_time': 41674.0}, 81: {'training_loss': 0.13692519773187978, 'evaluation_losses': [0.2581458093680142], 'machine_time': 52088.0}}, 6: {54: {'training_loss': 0.12800186938542363, 'evaluation_losses': [0.19315245158043767], 'machine_time': 139300.0}}, 4: {108: {'training_loss': 0.10808947030207221, 'evaluation_losses': [0.14115802854678597], 'machine_time': 108845.0}, 81: {'training_loss': 0.1231470884702346, 'evaluation_losses': [0.19315245158043767], 'machine_time': 106005.0}, 54: {'training_loss': 0.15114457161509512, 'evaluation_losses': [0.17706472687189997], 'machine_time': 95505.0}, 162: {'training_loss': 0.11484333910764884, 'evaluation_losses': [0.21093614076558276], 'machine_time': 131275.0}}, 2: {162: {'training_loss': 0.10835026174748218, 'evaluation_losses': [0.2301559166528914], 'machine_time': 97551.0}, 54: {'training_loss': 0.14973102285926648, 'evaluation_losses': [0.19315245158043767], 'machine_time': 61227.0}, 108: {'training_loss': 0.09323553267186016, 'evaluation_losses': [0.14545251285179955], 'machine_time': 78594.0}, 81: {'training_loss': 0.12970139689446736, 'evaluation_losses': [0.13495271546743812], 'machine_time': 72111.0}}
-			},
-			'montage':{
-				4: {180: {'training_loss': 0.10359732190296267, 'evaluation_losses': [0.1938733798101265], 'machine_time': 208270.0}, 60: {'training_loss': 0.13850444637425524, 'evaluation_losses': [0.2113625949895496], 'machine_time': 223935.0}, 90: {'training_loss': 0.16229724480572982, 'evaluation_losses': [0.3654581804207108], 'machine_time': 206070.0}}, 2: {60: {'training_loss': 0.14129637629509495, 'evaluation_losses': [0.275402461654421], 'machine_time': 122082.0}, 90: {'training_loss': 0.20476138131756474, 'evaluation_losses': [0.21140431412673866], 'machine_time': 115122.0}}, 6: {60: {'training_loss': 0.15002700821260795, 'evaluation_losses': [0.8243069332036415], 'machine_time': 322147.0}}, 1: {300: {'training_loss': 0.23203210284365197, 'evaluation_losses': [0.27051029551682093], 'machine_time': 159942.0}, 120: {'training_loss': 0.18845639777736733, 'evaluation_losses': [0.3448220421127484], 'machine_time': 68586.0}, 180: {'training_loss': 0.251729965554466, 'evaluation_losses': [0.425321246104643], 'machine_time': 86320.0}, 90: {'training_loss': 0.19911779588615855, 'evaluation_losses': [0.425321246104643], 'machine_time': 65372.0}, 60: {'training_loss': 0.1543881209730893, 'evaluation_losses': [0.3355440966058819], 'machine_time': 62748.0}}
-			},
-			'chain':{
-				1: {50: {'training_loss': 0.0711550791810043, 'evaluation_losses': [0.07664420422961352], 'machine_time': 625694.0}, 10: {'training_loss': 0.0816681114086735, 'evaluation_losses': [0.12936948569274817], 'machine_time': 89986.0}}
-			},
-			'soykb':{
-				2: {147: {'training_loss': 0.19370633422170094, 'evaluation_losses': [0.21558374739008238], 'machine_time': 131196.0}, 196: {'training_loss': 0.19512216176026578, 'evaluation_losses': [0.15300556472382457], 'machine_time': 194604.0}, 98: {'training_loss': 0.1952883641479686, 'evaluation_losses': [0.21558374739008238], 'machine_time': 127494.0}, 294: {'training_loss': 0.15799736653079313, 'evaluation_losses': [0.21558374739008238], 'machine_time': 219327.0}}, 4: {294: {'training_loss': 0.13806036341959507, 'evaluation_losses': [0.21558374739008238], 'machine_time': 336345.0}, 147: {'training_loss': 0.17053784054987878, 'evaluation_losses': [0.21558374739008238], 'machine_time': 244375.0}, 196: {'training_loss': 0.18463446602844805, 'evaluation_losses': [0.2424138079051269], 'machine_time': 315800.0}}, 1: {147: {'training_loss': 0.2195971172447061, 'evaluation_losses': [0.24911682874604343], 'machine_time': 96086.0}, 98: {'training_loss': 0.17219723839082293, 'evaluation_losses': [0.21558374739008238], 'machine_time': 88684.0}, 196: {'training_loss': 0.21374367294164162, 'evaluation_losses': [0.24911682874604343], 'machine_time': 150280.0}, 490: {'training_loss': 0.2974492585052919, 'evaluation_losses': [0.24911682874604343], 'machine_time': 247410.0}}, 6: {98: {'training_loss': 0.12078869704212065, 'evaluation_losses': [0.6004280443090525], 'machine_time': 434364.0}}
-			},
-			'forkjoin':{
-				6: {10: {'training_loss': 0.07878155656107085, 'evaluation_losses': [0.566645428317833], 'machine_time': 118874.0}}, 2: {25: {'training_loss': 0.09754979325139003, 'evaluation_losses': [0.06289495546855133], 'machine_time': 69687.0}, 10: {'training_loss': 0.08665845585812648, 'evaluation_losses': [0.4380798465215638], 'machine_time': 42318.0}}, 1: {10: {'training_loss': 0.052045091527041905, 'evaluation_losses': [0.20080998787435955], 'machine_time': 28286.0}, 25: {'training_loss': 0.17004063474953324, 'evaluation_losses': [0.17060884261166656], 'machine_time': 49680.0}}
-			},
-		},
-	},
-}
+"""
+Heatmap data (`data` and `data47`) generated by builddata.py.
+
+The data itself lives in heatmapdata.json.gz and is only loaded the first time
+one of the datasets is accessed, so `from heatmapdata import *` keeps working.
+"""
+import gzip
+import json
+import os
+from functools import lru_cache
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "heatmapdata.json.gz")
+
+__all__ = ["data", "data47"]
+
+
+def _restore_int_keys(obj: dict):
+	# JSON object keys are strings, but time limits, node counts, and task counts are ints
+	return {int(k) if k.isdigit() else k: v for k, v in obj.items()}
+
+
+def read_artifact(path: str = DATA_FILE) -> dict:
+	if not os.path.isfile(path):
+		return {"datasets": {}, "fingerprints": {}}
+	with gzip.open(path, "rt") as f:
+		return json.load(f, object_hook=_restore_int_keys)
+
+
+def write_artifact(artifact: dict, path: str = DATA_FILE):
+	tmp_path = path + ".tmp"
+	# mtime=0 keeps the file byte-identical when the data doesn't change
+	with open(tmp_path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+		f.write(json.dumps(artifact, separators=(',', ':')).encode())
+	os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=None)
+def load(path: str = DATA_FILE) -> dict:
+	return read_artifact(path)["datasets"]
+
+
+def __getattr__(name: str):
+	if name in __all__:
+		return load()[name]
+	raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -45,10 +45,9 @@ def main():
 	
 	result=json.loads(std_out)
 	losses = []
-	with open(sim_args["workflow"]["file"], 'r') as source_json:
-		data = json.load(source_json)
-		real_makespan = float(data["workflow"]["execution"]["makespanInSeconds"])
-		simulated_makespan = float(result["simulated_makespan"])
+	data = load_json(sim_args["workflow"]["file"])
+	real_makespan = float(data["workflow"]["execution"]["makespanInSeconds"])
+	simulated_makespan = float(result["simulated_makespan"])
 	print( abs(real_makespan-simulated_makespan)/real_makespan)
 
 
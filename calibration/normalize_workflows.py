@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Normalizes a directory of raw WfFormat workflow instances in place (what fixRawData.sh used to do):
+migrates 1.4 instances to the 1.5 schema and replaces "coreCount": 0 with "coreCount": 1, in a
+single read/write per file, with a pool of worker processes.
+
+As a by-product, writes <dir>/workflow_index.json, which records for each workflow the content hash
+of its normalized file (files that are unchanged since they were normalized are skipped by the next
+run), and its metadata (the characteristics encoded in its name, its number of tasks and machines,
+and its makespan). Files that can't be normalized (e.g., of an unsupported schema version) are
+reported, and left out of the index.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from multiprocessing import Pool
+
+from WorkflowPack import INDEX_NAME
+
+SCHEMA_VERSION = "1.5"
+
+# Characteristics encoded in workflow file names (see WorkflowSetSpec.update_fields)
+_name_tokens = ["workflow", "num_tasks", "cpu", "fixed", "data", "architecture", "num_nodes", "trial",
+				"timestamp"]
+
+
+def _without_none(d: dict) -> dict:
+	return {k: v for k, v in d.items() if v is not None}
+
+
+def migrate_machine_1_4(machine: dict) -> dict:
+	# 1.4 machines have "cpu": {"count", "speed"}, 1.5 ones "cpu": {"coreCount", "speedInMHz"}
+	cpu = machine.get("cpu", {})
+	return _without_none({
+		"nodeName": machine.get("nodeName"),
+		"system": machine.get("system"),
+		"architecture": machine.get("architecture"),
+		"release": machine.get("release"),
+		"memoryInBytes": machine.get("memoryInBytes", machine.get("memory")),
+		"cpu": _without_none({
+			"coreCount": cpu.get("coreCount", cpu.get("count")),
+			"speedInMHz": cpu.get("speedInMHz", cpu.get("speed")),
+			"vendor": cpu.get("vendor"),
+		}) if cpu else None,
+	})
+
+
+def migrate_1_4(data: dict) -> dict:
+	"""
+	Migrates a 1.4 instance (one list of tasks with their files and execution data) to the 1.5
+	schema (a specification and an execution)
+	"""
+	workflow = data["workflow"]
+	files = {}
+	specification_tasks = []
+	execution_tasks = []
+	for task in workflow.get("tasks", []):
+		task_id = task.get("id", task["name"])
+		input_files = []
+		output_files = []
+		for f in task.get("files", []):
+			file_id = f.get("id", f.get("name"))
+			files[file_id] = {"id": file_id, "sizeInBytes": f.get("sizeInBytes", f.get("size"))}
+			(input_files if f.get("link") == "input" else output_files).append(file_id)
+		specification_tasks.append(_without_none({
+			"name": task["name"],
+			"id": task_id,
+			"category": task.get("category"),
+			"children": task.get("children", []),
+			"inputFiles": input_files,
+			"outputFiles": output_files,
+			"parents": task.get("parents", []),
+		}))
+		execution_tasks.append(_without_none({
+			"id": task_id,
+			"runtimeInSeconds": task.get("runtimeInSeconds", task.get("runtime")),
+			"command": task.get("command"),
+			"coreCount": task.get("cores"),
+			"avgCPU": task.get("avgCPU"),
+			"readBytes": task.get("bytesRead"),
+			"writtenBytes": task.get("bytesWritten"),
+			"memoryInBytes": task.get("memoryInBytes", task.get("memory")),
+			"energy": task.get("energy"),
+			"avgPower": task.get("avgPower"),
+			"priority": task.get("priority"),
+			# The machines (node names) the task ran on: one in 1.4
+			"machines": [task["machine"]] if task.get("machine") is not None else None,
+		}))
+
+	migrated = {k: v for k, v in data.items() if k not in ["wms", "workflow"]}
+	migrated["schemaVersion"] = SCHEMA_VERSION
+	migrated["workflow"] = {
+		"specification": {"tasks": specification_tasks, "files": list(files.values())},
+		"execution": _without_none({
+			"makespanInSeconds": workflow.get("makespanInSeconds", workflow.get("makespan")),
+			"executedAt": workflow.get("executedAt", data.get("executedAt")),
+			"tasks": execution_tasks,
+			"machines": [migrate_machine_1_4(machine) for machine in workflow.get("machines", [])],
+		}),
+	}
+	migrated.pop("executedAt", None)
+	if "wms" in data:
+		migrated["runtimeSystem"] = data["wms"]
+	return migrated
+
+
+def fix_core_counts(obj):
+	# Tasks (and machines) recorded with 0 cores: the simulator needs at least one
+	if isinstance(obj, dict):
+		for k, v in obj.items():
+			if k == "coreCount" and v == 0:
+				obj[k] = 1
+			else:
+				fix_core_counts(v)
+	elif isinstance(obj, list):
+		for v in obj:
+			fix_core_counts(v)
+
+
+def normalize_workflow(data: dict) -> dict:
+	if data.get("schemaVersion") == "1.4":
+		data = migrate_1_4(data)
+	elif data.get("schemaVersion") != SCHEMA_VERSION:
+		raise Exception(f"Unsupported WfFormat schema version: {data.get('schemaVersion')}")
+	fix_core_counts(data)
+	return data
+
+
+def workflow_metadata(name: str, data: dict) -> dict:
+	tokens = os.path.splitext(name)[0].split("-")
+	metadata = {}
+	if len(tokens) == len(_name_tokens):
+		for key, token in zip(_name_tokens, tokens):
+			try:
+				metadata[key] = int(token) if key not in ["workflow", "architecture", "fixed"] else token
+			except ValueError:
+				metadata[key] = token
+	execution = data["workflow"]["execution"]
+	metadata["num_workflow_tasks"] = len(data["workflow"]["specification"]["tasks"])
+	metadata["num_machines"] = len(execution.get("machines", []))
+	metadata["makespan"] = execution.get("makespanInSeconds")
+	return metadata
+
+
+def _normalize_file(job):
+	# Runs in a worker process: returns the file's new index entry (without metadata if it was already
+	# normalized), or the error that it couldn't be normalized with
+	path, known_md5 = job
+	try:
+		return _normalize_file_or_raise(path, known_md5)
+	except Exception as error:
+		return os.path.basename(path), None, f"{type(error).__name__}: {error}"
+
+
+def _normalize_file_or_raise(path: str, known_md5: str | None):
+	with open(path, "rb") as f:
+		content = f.read()
+	md5 = hashlib.md5(content).hexdigest()
+	metadata = None
+	if md5 != known_md5:
+		data = normalize_workflow(json.loads(content))
+		normalized = json.dumps(data, indent=4).encode()
+		if normalized != content:
+			tmp_path = path + ".tmp"
+			with open(tmp_path, "wb") as f:
+				f.write(normalized)
+			os.replace(tmp_path, path)
+			md5 = hashlib.md5(normalized).hexdigest()
+		metadata = workflow_metadata(os.path.basename(path), data)
+	stat = os.stat(path)
+	return os.path.basename(path), {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "md5": md5}, metadata
+
+
+def load_workflow_index(workflow_dir: str) -> dict:
+	index_path = os.path.join(workflow_dir, INDEX_NAME)
+	if not os.path.isfile(index_path):
+		return {}
+	with open(index_path) as f:
+		return json.load(f)
+
+
+def normalize_directory(workflow_dir: str, num_workers: int = 1) -> tuple[int, int, dict[str, str]]:
+	"""
+	Returns the number of workflow files, the number of them that were (re)processed, and the errors of
+	those that couldn't be normalized (by file name), which are left out of the index
+	"""
+	index = load_workflow_index(workflow_dir)
+	names = sorted(f for f in os.listdir(workflow_dir) if f.endswith(".json") and f != INDEX_NAME
+				   and not f.startswith("._"))
+	jobs = []
+	for name in names:
+		path = os.path.join(workflow_dir, name)
+		entry = index.get(name)
+		stat = os.stat(path)
+		if entry is not None and (entry["size"], entry["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+			continue
+		jobs.append((path, entry["md5"] if entry is not None else None))
+
+	new_index = {name: index[name] for name in names if name in index}
+	errors = {}
+	with Pool(num_workers) as pool:
+		for name, entry, metadata in pool.imap_unordered(_normalize_file, jobs, chunksize=4):
+			if entry is None:
+				errors[name] = metadata
+				new_index.pop(name, None)
+				continue
+			if metadata is None:
+				metadata = {k: v for k, v in index[name].items() if k not in entry}
+			new_index[name] = {**entry, **metadata}
+
+	tmp_path = os.path.join(workflow_dir, INDEX_NAME + ".tmp")
+	with open(tmp_path, "w") as f:
+		json.dump(dict(sorted(new_index.items())), f, indent=1)
+	os.replace(tmp_path, os.path.join(workflow_dir, INDEX_NAME))
+	return len(names), len(jobs), errors
+
+
+def main():
+	parser = argparse.ArgumentParser(
+		prog=sys.argv[0],
+		description='Normalize (in place) a directory of raw WfFormat workflow instances, and index them')
+	parser.add_argument('workflow_dir', type=str, help='Directory of workflow JSON files')
+	parser.add_argument('-j', '--num_workers', type=int, default=os.cpu_count(),
+						help='Number of worker processes')
+	args = parser.parse_args()
+
+	num_files, num_processed, errors = normalize_directory(args.workflow_dir, args.num_workers)
+	for name, error in sorted(errors.items()):
+		sys.stderr.write(f"Cannot normalize {name}: {error}\n")
+	sys.stderr.write(f"{num_files} workflows, {num_processed} new or changed ({len(errors)} failed), "
+					 f"index written to {os.path.join(args.workflow_dir, INDEX_NAME)}\n")
+	if errors:
+		sys.exit(1)
+
+
+if __name__ == "__main__":
+	main()
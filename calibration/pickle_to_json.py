@@ -7,6 +7,8 @@ import argparse
 import pickle
 import json
 import os
+import sys
+from multiprocessing import Pool
 
 def pickle_to_json(pickle_path):
 	# Load data from the pickle file
@@ -31,9 +33,13 @@ def recursive_to_dict(data):
     elif isinstance(data, set):
         return [recursive_to_dict(item) for item in data]
     
+    # Handle objects that know their own JSON-compatible form (e.g., WorkflowResult)
+    elif hasattr(data, 'to_dict'):
+        return recursive_to_dict(data.to_dict())
+    
     # Handle custom objects (convert to dict)
-    elif hasattr(data, '__dict__'):
-        return {k: recursive_to_dict(v) for k, v in data.__dict__.items() if not callable(v) and not k.startswith('__')}
+    elif hasattr(data, '__dict__') or hasattr(type(data), '__slots__'):
+        return {k: recursive_to_dict(v) for k, v in attributes(data).items() if not callable(v) and not k.startswith('__')}
     
     # Ignore functions and other callable objects
     elif callable(data):
@@ -44,27 +50,131 @@ def recursive_to_dict(data):
         return data
 
 
+def attributes(obj):
+	# Slotted classes (WorkflowSetSpec, Experiment, ...) have no __dict__ but return their attributes as state
+	if hasattr(obj, '__dict__'):
+		return obj.__dict__
+	return obj.__getstate__()
+
+
+def object_fields(obj, skip=()):
+	# Attributes of a custom object, converted one at a time so that no full copy of the object graph is built
+	for k, v in attributes(obj).items():
+		if k in skip or callable(v) or k.startswith('__'):
+			continue
+		yield k, v
+
+
+def iter_records(experiment_set, fields=None):
+	"""
+	Yields (kind, record) pairs: one "experiment_set" record, then for each experiment one "experiment" record
+	followed by its "workflow_result" records (one per evaluated workflow, from evaluation_makespans).
+	If fields is given, experiment records only contain those fields (workflow results are only
+	produced when 'evaluation_makespans' is one of them).
+	"""
+	yield "experiment_set", {k: recursive_to_dict(v) for k, v in object_fields(experiment_set, skip=("experiments",))}
+	for i, xp in enumerate(experiment_set.experiments):
+		record = {"experiment": i}
+		for k, v in object_fields(xp, skip=("evaluation_makespans",)):
+			if fields is None or k in fields:
+				record[k] = recursive_to_dict(v)
+		yield "experiment", record
+		if fields is not None and "evaluation_makespans" not in fields:
+			continue
+		for j, makespans in enumerate(xp.evaluation_makespans or []):
+			for workflow in makespans:
+				yield "workflow_result", {"experiment": i, "evaluation_set": j, "workflow": workflow,
+										  "result": recursive_to_dict(makespans[workflow])}
+
+
+def write_jsonl(experiment_set, out, fields=None):
+	for kind, record in iter_records(experiment_set, fields):
+		out.write(json.dumps({"type": kind, **record}))
+		out.write("\n")
+
+
+def write_json(experiment_set, out, fields=None):
+	# Same layout as json.dumps(recursive_to_dict(experiment_set)), but written one member at a time
+	out.write("{")
+	for k, v in object_fields(experiment_set, skip=("experiments",)):
+		out.write(f"{json.dumps(k)}: {json.dumps(recursive_to_dict(v))}, ")
+	out.write('"experiments": [')
+	for i, xp in enumerate(experiment_set.experiments):
+		out.write(",\n{" if i else "\n{")
+		members = [f"{json.dumps(k)}: {json.dumps(recursive_to_dict(v))}"
+				   for k, v in object_fields(xp, skip=("evaluation_makespans",)) if fields is None or k in fields]
+		out.write(", ".join(members))
+		if fields is None or "evaluation_makespans" in fields:
+			out.write((", " if members else "") + '"evaluation_makespans": ')
+			if xp.evaluation_makespans is None:
+				out.write("null")
+			else:
+				out.write("[")
+				for j, makespans in enumerate(xp.evaluation_makespans):
+					out.write(", {" if j else "{")
+					for n, workflow in enumerate(makespans):
+						out.write(", " if n else "")
+						out.write(f"{json.dumps(workflow)}: {json.dumps(recursive_to_dict(makespans[workflow]))}")
+					out.write("}")
+				out.write("]")
+		out.write("}")
+	out.write("]}\n")
+
+
+def export_pickle(pickle_path, output_path, output_format, fields=None):
+	with open(pickle_path, 'rb') as f:
+		data = pickle.load(f)
+	writer = write_jsonl if output_format == "jsonl" else write_json
+	if output_path:
+		with open(output_path, 'w') as out:
+			writer(data, out, fields)
+	else:
+		writer(data, sys.stdout, fields)
+	return pickle_path, output_path
+
+
+def _export_pickle_star(args):
+	return export_pickle(*args)
+
+
+def export_directory(input_dir, output_dir, output_format, fields=None, num_workers=1):
+	os.makedirs(output_dir, exist_ok=True)
+	jobs = []
+	for file in sorted(os.listdir(input_dir)):
+		if file.endswith('.pickled') or file.endswith('.pickle'):
+			output_path = os.path.join(output_dir, os.path.splitext(file)[0] + "." + output_format)
+			jobs.append((os.path.join(input_dir, file), output_path, output_format, fields))
+	with Pool(num_workers) as pool:
+		for pickle_path, output_path in pool.imap_unordered(_export_pickle_star, jobs):
+			print(f"Pickle file '{pickle_path}' has been converted to JSON and saved as '{output_path}'.")
+
 
 # Set up command-line argument parsing
 parser = argparse.ArgumentParser(
-	description="Convert a pickle file to a pretty-formatted JSON file.",
+	description="Convert a pickle file (or a directory of pickle files) to JSON, streaming records to the output.",
 	epilog="Example: ./convert_pickle_to_json.py input.pkl output.json"
 )
-parser.add_argument('pickle_input', help="Path to the input pickle file.")
-parser.add_argument('json_output', nargs='?',help="Path to the output JSON file.",default="")
+parser.add_argument('pickle_input', help="Path to the input pickle file, or to a directory of pickle files.")
+parser.add_argument('json_output', nargs='?',help="Path to the output JSON file (or directory).",default="")
+parser.add_argument('-F', '--format', choices=["json", "jsonl"], default="json",
+					help="json: one document; jsonl: one record per line (experiment set, experiments, workflow results)")
+parser.add_argument('-f', '--fields', nargs="+", default=None,
+					help="Only export these experiment fields (e.g., calibration calibration_loss evaluation_losses)")
+parser.add_argument('-j', '--num_workers', type=int, default=os.cpu_count(),
+					help="Number of worker processes when converting a directory")
 
 # If no arguments are passed, print help
 #if len(parser.parse_args()) == 0:
 #	parser.print_help()
 
-args = parser.parse_args()
-
-# Load pickle file
-data=pickle_to_json(args.pickle_input)
-# Write data to a pretty-formatted JSON file
-if args.json_output:
-	with open(args.json_output, 'w') as f:
-		json.dump(data, f, indent=4)
-		print(f"Pickle file '{args.pickle_input}' has been converted to JSON and saved as '{args.json_output}'.")
-else:
-	print(json.dumps(data, indent=4))
\ No newline at end of file
+if __name__ == "__main__":
+	args = parser.parse_args()
+
+	if os.path.isdir(args.pickle_input):
+		if not args.json_output:
+			parser.error("an output directory is required when converting a directory")
+		export_directory(args.pickle_input, args.json_output, args.format, args.fields, args.num_workers)
+	else:
+		export_pickle(args.pickle_input, args.json_output, args.format, args.fields)
+		if args.json_output:
+			print(f"Pickle file '{args.pickle_input}' has been converted to JSON and saved as '{args.json_output}'.")
@@ -1,17 +1,18 @@
 import os
-import pickle
 import sys 
 
+from Util import load_experiment_set_header
+
 def process_pickle_file(file_path):
     try:
-        with open(file_path, 'rb') as f:
-            data = pickle.load(f)
+        # Only the small header is needed here, not the whole pickled object graph
+        data = load_experiment_set_header(file_path)
         
         # Check if the expected structure exists
-        experiments = data.experiments
+        experiments = data["experiments"]
         if len(experiments) > 0:
-            calibration_loss = experiments[0].calibration_loss
-            evaluation_losses = experiments[0].evaluation_losses[0]
+            calibration_loss = experiments[0]["calibration_loss"]
+            evaluation_losses = experiments[0]["evaluation_losses"][0]
             print(f"File: {file_path}, {calibration_loss}, {evaluation_losses}")
         else:
             print(f"File: {file_path} - No experiments found.")
@@ -18,5 +18,4 @@ if __name__ == "__main__":
 	with open(pickle_path, 'rb') as f:
 		data = pickle.load(f)
 	data.compute_all_evaluations()
-	with open(pickle_path, 'wb') as f:
-		pickle.dump(data, f)
\ No newline at end of file
+	save_experiment_set(data, pickle_path)
\ No newline at end of file
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Incremental calibration: refines a previous calibration (a run_single_calibration.py pickle) when new
+ground-truth executions land in a workflow directory, instead of recalibrating from scratch. The
+previous calibration is the start point (see WorkflowSimulatorCalibrator.start_calibration), and
+simulations (of candidate calibrations, and of the evaluation) are cached on disk (see
+SimulationResultStore): old workflows are only simulated again for calibrations that weren't simulated
+on them before, or if their file has changed since. With --watch, the directory is polled and each
+batch of new workflows triggers a refinement.
+
+Each refinement is pickled next to the previous one, with an "-online-<training set hash>" suffix.
+"""
+import argparse
+import pickle
+import re
+import time
+from datetime import timedelta
+
+from Util import *
+from WorkflowPack import INDEX_NAME
+from run_single_calibration import group
+
+CACHE_NAME = "simulation_cache.jsonl"
+# Default bound of the simulation cache, in MB (see SimulationResultStore.max_bytes)
+CACHE_MAX_MB = 1024
+
+
+def new_workflows(workflow_dir: str, pattern: str, known: set, settle_time: float) -> List[str]:
+	# Workflow files not in the training set yet, that haven't been modified for settle_time seconds
+	# (so that files being copied aren't picked up)
+	now = time.time()
+	found = []
+	for workflow in glob(os.path.join(workflow_dir, pattern)):
+		workflow = os.path.abspath(workflow)
+		if os.path.basename(workflow) == INDEX_NAME or workflow in known:
+			continue
+		if now - os.path.getmtime(workflow) >= settle_time:
+			found.append(workflow)
+	return sorted(found)
+
+
+def refine(previous_pickle: str, added_workflows: List[str], args: dict) -> str:
+	with open(previous_pickle, 'rb') as f:
+		previous = pickle.load(f)
+	previous_xp = previous.experiments[0]
+	training = group([w for g in previous_xp.training_set_spec.get_workflow_set() for w in g] + added_workflows)
+	time_limit = args["time_limit"] or previous.time_limit
+	num_threads = args["num_threads"] or previous.num_threads
+	repeat_mode = getattr(previous, "repeat_mode", "all")
+	sys.stderr.write(f"Refining {previous_pickle} with {len(added_workflows)} new workflows "
+					 f"({len(training)} configurations, {time_limit} sec, {num_threads} threads)...\n")
+
+	simulator = previous.simulator
+	store = SimulationResultStore(args["cache"] or os.path.join(args["workflow_dir"], CACHE_NAME),
+								  max_bytes=args["cache_max_mb"] * 2 ** 20)
+	simulator.use_result_store(store)
+	try:
+		calibration, loss = compute_calibration(training,
+												previous.algorithm,
+												simulator,
+												previous.loss_function,
+												previous.loss_aggregator,
+												time_limit,
+												num_threads,
+												repeat_mode,
+												start_calibration=previous_xp.calibration)
+		experiment_set = ExperimentSet(simulator,
+									   previous.algorithm,
+									   previous.loss_function,
+									   previous.loss_aggregator,
+									   time_limit,
+									   num_threads,
+									   repeat_mode)
+		experiment_set.add_experiment(WorkflowSetSpec().set_workflows(training),
+									  [WorkflowSetSpec().set_workflows(training)])
+		xp = experiment_set.experiments[0]
+		xp.calibration = calibration
+		xp.calibration_loss = loss
+		experiment_set.compute_all_evaluations()
+	finally:
+		simulator.use_result_store(None)
+	sys.stderr.write(f"  Loss: {previous_xp.calibration_loss} -> {loss} ({store.num_misses} simulations, "
+					 f"{store.num_hits} cached)\n")
+
+	base = re.sub(r"(-online-[^-]+)?\.pickled$", "", previous_pickle)
+	pickle_file_name = f"{base}-online-{orderinvarient_hash(training, 8)}.pickled"
+	save_experiment_set(experiment_set, pickle_file_name)
+	print(pickle_file_name)
+	return pickle_file_name
+
+
+def parse_command_line_arguments(program_name: str):
+	parser = argparse.ArgumentParser(
+		prog=program_name,
+		description='Refine a calibration with the new workflows of a directory')
+	parser.add_argument('-p', '--previous', type=str, required=True,
+						help='Pickled result of the calibration to refine (of run_single_calibration.py)')
+	parser.add_argument('-wd', '--workflow_dir', type=str, required=True,
+						help='Directory where new workflow instances land')
+	parser.add_argument('-pa', '--pattern', type=str, default="*.json",
+						help='Glob pattern (in the directory) of the workflows to train on')
+	parser.add_argument('-tl', '--time_limit', type=int, default=None,
+						help='Training time limit of each refinement, in seconds (default: that of the previous calibration)')
+	parser.add_argument('-th', '--num_threads', type=int, default=None,
+						help='Number of threads (default: that of the previous calibration)')
+	parser.add_argument('-c', '--cache', type=str, default=None,
+						help=f'Simulation cache file (default: {CACHE_NAME} in the workflow directory)')
+	parser.add_argument('-cm', '--cache_max_mb', type=int, default=CACHE_MAX_MB,
+						help='Size the simulation cache is bounded to, in MB: the least recently used outputs are '
+							 'dropped, and the file is compacted')
+	parser.add_argument('-w', '--watch', action="store_true",
+						help='Keep watching the directory, refining the latest calibration whenever workflows arrive')
+	parser.add_argument('--poll_interval', type=float, default=60, help='Seconds between directory scans')
+	parser.add_argument('--settle_time', type=float, default=30,
+						help='Seconds a new file must be left unmodified before it is used')
+	return vars(parser.parse_args())
+
+
+def main():
+	args = parse_command_line_arguments(sys.argv[0])
+	previous_pickle = args["previous"]
+	while True:
+		with open(previous_pickle, 'rb') as f:
+			training_set_spec = pickle.load(f).experiments[0].training_set_spec
+		known = {os.path.abspath(w) for g in training_set_spec.get_workflow_set() for w in g}
+		added_workflows = new_workflows(args["workflow_dir"], args["pattern"], known, args["settle_time"])
+		if added_workflows:
+			start = time.perf_counter()
+			previous_pickle = refine(previous_pickle, added_workflows, args)
+			sys.stderr.write(f"  Refined in {timedelta(seconds=int(time.perf_counter() - start))}\n")
+		elif not args["watch"]:
+			sys.stderr.write("No new workflows\n")
+		if not args["watch"]:
+			break
+		time.sleep(args["poll_interval"])
+
+
+if __name__ == "__main__":
+	main()
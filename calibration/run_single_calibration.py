@@ -4,6 +4,8 @@ import time
 from glob import glob
 from datetime import timedelta
 from Util import *
+from RepeatTrials import REPEAT_MODES
+from SensitivityAnalysis import fixed_parameters
 from itertools import groupby
 def group(flat):
 	# Use a regular expression to split the string before the last part (repeat number)
@@ -39,7 +41,7 @@ def parse_command_line_arguments(program_name: str):
 		#					help='The computer architecture')
 		parser.add_argument('-al', '--algorithm', type=str,
 							metavar="[grid|random|gradient|skopt.gp|skopt.gbrt|skopt.rf|skopt.et]",
-							choices=['grid', 'random', 'gradient','skopt.gp','skopt.gbrt','skopt.rf','skopt.et'], required=True,
+							choices=['grid', 'random', 'gradient', 'gradient.parallel','skopt.gp','skopt.gbrt','skopt.rf','skopt.et'], required=True,
 							help='The calibration algorithm')
 		parser.add_argument('-tl', '--time_limit', type=int, metavar="<number of second>", required=True,
 							help='A training time limit, in seconds')
@@ -69,6 +71,37 @@ def parse_command_line_arguments(program_name: str):
 							metavar="[one_link|one_and_then_many_links|many_links]",
 							choices=['one_link', 'one_and_then_many_links', 'many_links'], required=True,
 							help='The network topology scheme used by the simulator')
+		parser.add_argument('-rm', '--repeat_mode', type=str,
+							metavar="all, median_makespan, median_tasks, sample",
+							choices=REPEAT_MODES, nargs='?',
+							default="all",
+							help='How calibration uses repeat trials of a configuration: all of them, a '
+								 'representative (median makespan trial, or median task runtimes), or one '
+								 'sampled trial per candidate calibration')
+		parser.add_argument('-am', '--analytic_model', action="store_true",
+							help='Skip simulating candidate calibrations whose analytic makespan bound already makes '
+								 'their loss worse than the best so far, starting from the analytic optimum')
+		parser.add_argument('-as', '--analytic_slack', type=float, default=BOUND_SLACK,
+							help='Factor analytic makespan bounds are scaled by before pruning (lower is safer, '
+								 'but prunes less)')
+		parser.add_argument('-ep', '--estimate_parameters', action="store_true",
+							help='Narrow the ranges of the compute speed, bandwidths and overheads to closed-form '
+								 'estimates from the training workflows, and start from the estimated point')
+		parser.add_argument('-cv', '--cross_validation', type=int, default=None,
+							help='Instead of one calibration, k-fold cross-validation over the training set: k '
+								 'concurrent calibrations, each evaluated on its held-out fold (-es is ignored)')
+		parser.add_argument('--cv_seed', type=int, default=None, help='Seed of the cross-validation folds')
+		parser.add_argument('-et', '--evaluation_tolerance', type=float, default=None,
+							help='Stop evaluating once the 95%% confidence interval of the (average) evaluation loss '
+								 'is narrower than this, simulating workflows in stratified random order')
+		parser.add_argument('-sa', '--sensitivity_analysis', type=str, default=None,
+							help='Output of SensitivityAnalysis.py: parameters it found unimportant are not '
+								 'calibrated, but fixed to their value at the best point it simulated')
+		parser.add_argument('-it', '--importance_threshold', type=float, default=0.05,
+							help='With -sa, the (relative) importance under which parameters are fixed')
+		parser.add_argument('-rg', '--registry', type=str, metavar="<registry file>", default=None,
+							help='SQLite registry of calibrations (see CalibrationRegistry.py): training sets already '
+								 'calibrated in it with the same settings are not recalibrated, and new ones are added')
 		parser.add_argument('-ts', '--training_set',required=True, type=str, nargs="+",
 							help='The list of json files to use for training')
 		parser.add_argument('-es', '--evaluation_set', type=str, nargs="*",default=None, 
@@ -92,6 +125,16 @@ def main(args):
 		evaluation=training
 	else:
 		evaluation=group(args['evaluation_set'])
+	simulator = Simulator(args["compute_service_scheme"],
+						  args["storage_service_scheme"],
+						  args["network_topology_scheme"])
+	fixed_suffix = ""
+	if args["sensitivity_analysis"]:
+		simulator.fix_parameters(fixed_parameters(load_json(args["sensitivity_analysis"]), simulator,
+												  args["importance_threshold"]))
+		sys.stderr.write(f"Fixed parameters: {', '.join(simulator.get_fixed_parameters()) or 'none'}\n")
+		if simulator.get_fixed_parameters():
+			fixed_suffix = "_fixed" + hashlib.md5(json.dumps(simulator.get_fixed_parameters(), sort_keys=True).encode()).hexdigest()[:8]
 	pickle_file_name = f"pickled-one_calibration-" \
 					   f"{orderinvarient_hash(training,8)}-" \
 					   f"{orderinvarient_hash(evaluation,8)}-" \
@@ -103,7 +146,11 @@ def main(args):
 					   f"{args['loss_aggregator']}-" \
 					   f"{args['time_limit']}-" \
 					   f"{args['num_threads']}-" \
-					   f"{args['computer_name']}.pickled"
+					   f"{args['computer_name']}" \
+					   f"{'' if args['repeat_mode'] == 'all' else '_' + args['repeat_mode']}{fixed_suffix}" \
+					   f"{'_estimated' if args['estimate_parameters'] else ''}" \
+					   f"{'' if args['cross_validation'] is None else '_cv' + str(args['cross_validation'])}" \
+					   f"{'' if args['evaluation_tolerance'] is None else '_et' + str(args['evaluation_tolerance'])}.pickled"
 
 	# If the pickled file already exists, then print a warning and move on
 	if os.path.isfile(pickle_file_name):
@@ -112,16 +159,18 @@ def main(args):
 
 	sys.stderr.write(f"repacking expiriments for {pickle_file_name}\n")
 
-	simulator = Simulator(args["compute_service_scheme"],
-						  args["storage_service_scheme"],
-						  args["network_topology_scheme"])
-
 	experiment_set = ExperimentSet(simulator,
 								   args["algorithm"],
 								   args["loss_function"],
 								   args["loss_aggregator"],
 								   args["time_limit"],
-								   args["num_threads"])
+								   args["num_threads"],
+								   args["repeat_mode"],
+								   args["analytic_model"],
+								   args["estimate_parameters"])
+	experiment_set.evaluation_tolerance = args["evaluation_tolerance"]
+	experiment_set.analytic_slack = args["analytic_slack"]
+	experiment_set.registry_path = args["registry"]
 
 	#repackaged_t=[[] for _ in range(6)]
 	#repackaged_e=[[] for _ in range(6)]
@@ -159,11 +208,15 @@ def main(args):
 		
 		
 	
-	experiment_set.add_experiment(
-		WorkflowSetSpec().set_workflows(training),
-		[
-			WorkflowSetSpec().set_workflows(evaluation)
-		])
+	if args["cross_validation"] is not None:
+		experiment_set.add_cross_validation(WorkflowSetSpec().set_workflows(training), args["cross_validation"],
+											args["cv_seed"])
+	else:
+		experiment_set.add_experiment(
+			WorkflowSetSpec().set_workflows(training),
+			[
+				WorkflowSetSpec().set_workflows(evaluation)
+			])
 		
 	sys.stderr.write(f"\nCreated {len(experiment_set)} experiments...\n")
 	#print(experiment_set.experiments[0].training_set_spec.workflows)
@@ -173,6 +226,14 @@ def main(args):
 	experiment_set.run()
 	elapsed = int(time.perf_counter() - start)
 	sys.stderr.write(f"Actually ran in {timedelta(seconds=elapsed)}\n")
+	if experiment_set.cross_validation is not None:
+		cross_validation = experiment_set.cross_validation
+		sys.stderr.write(f"Cross-validation: held-out losses {cross_validation['fold_losses']}, mean "
+						 f"{cross_validation['mean_loss']} (std {cross_validation['std_loss']})\n")
+		if "store_hit_rate" in cross_validation:
+			sys.stderr.write(f"  {cross_validation['num_shared_simulations']} of "
+							 f"{cross_validation['num_shared_simulations'] + cross_validation['num_simulations']} "
+							 f"simulations shared between folds (hit rate {cross_validation['store_hit_rate']:.1%})\n")
 	# except Exception as error:
 	#	sys.stderr.write(str(type(error)))
 	#	sys.stderr.write(f"Error while running experiments: {error}\n")
@@ -180,8 +241,7 @@ def main(args):
 	# dont catch print exit errors.  Just let the error throw its self and python will give a much better print then still exit
 
 	# Pickle it
-	with open(pickle_file_name, 'wb') as f:
-		pickle.dump(experiment_set, f)
+	save_experiment_set(experiment_set, pickle_file_name)
 	#sys.stderr.write(f"Pickled to ./{pickle_file_name}\n")
 	print(pickle_file_name)
 	return pickle_file_name
@@ -142,8 +142,7 @@ def main(args):
 	# dont catch print exit errors.  Just let the error throw its self and python will give a much better print then still exit
 	print(experiment_set.experiments[0].evaluation_losses)
 	# Pickle it
-	with open(pickle_file_name, 'wb') as f:
-		pickle.dump(experiment_set, f)
+	save_experiment_set(experiment_set, pickle_file_name)
 	#sys.stderr.write(f"Pickled to ./{pickle_file_name}\n")
 	print(pickle_file_name)
 	return pickle_file_name
@@ -5,6 +5,7 @@ from glob import glob
 from datetime import timedelta
 
 from Util import *
+from TrainingSetSelection import select_training_set
 
 
 def parse_command_line_arguments(program_name: str):
@@ -29,7 +30,7 @@ def parse_command_line_arguments(program_name: str):
 							help='The computer architecture')
 		parser.add_argument('-al', '--algorithm', type=str,
 							metavar="[grid|random|gradient|skopt.gp|skopt.gbrt|skopt.rf|skopt.et]",
-							choices=['grid', 'random', 'gradient','skopt.gp','skopt.gbrt','skopt.rf','skopt.et'], required=True,
+							choices=['grid', 'random', 'gradient', 'gradient.parallel','skopt.gp','skopt.gbrt','skopt.rf','skopt.et'], required=True,
 							help='The calibration algorithm')
 		parser.add_argument('-tl', '--time_limit', type=int, metavar="<number of second>", required=True,
 							help='A training time limit, in seconds')
@@ -59,6 +60,12 @@ def parse_command_line_arguments(program_name: str):
 							metavar="[one_link|one_and_then_many_links|many_links]",
 							choices=['one_link', 'one_and_then_many_links', 'many_links'], required=True,
 							help='The network topology scheme used by the simulator')
+		parser.add_argument('-cr', '--coverage_radius', type=float, default=None,
+							help='Also calibrate on the smallest set of configurations that covers all of them '
+								 'within this radius (see TrainingSetSelection.py), evaluated on all of them')
+		parser.add_argument('-rg', '--registry', type=str, metavar="<registry file>", default=None,
+							help='SQLite registry of calibrations (see CalibrationRegistry.py): training sets already '
+								 'calibrated in it with the same settings are not recalibrated, and new ones are added')
 
 		return vars(parser.parse_args()), parser, None
 
@@ -84,7 +91,8 @@ def main():
 					   f"{args['algorithm']}-" \
 					   f"{args['time_limit']}-" \
 					   f"{args['num_threads']}-" \
-					   f"{args['computer_name']}.pickled"
+					   f"{args['computer_name']}" \
+					   f"{'' if args['coverage_radius'] is None else '_cr' + str(args['coverage_radius'])}.pickled"
 
 	# If the pickled file already exists, then print a warning and move on
 	if os.path.isfile(pickle_file_name):
@@ -139,6 +147,7 @@ def main():
 								   args["loss_aggregator"],
 								   args["time_limit"],
 								   args["num_threads"])
+	experiment_set.registry_path = args["registry"]
 
 	sys.stderr.write("Creating experiments")
 	# Num task variation experiments
@@ -246,6 +255,17 @@ def main():
 				if added:
 					break
 
+	# Coverage-selected training set, evaluated on all configurations
+	if args["coverage_radius"] is not None:
+		full_set = WorkflowSetSpec().populate(args["workflow_dir"],
+											  args["workflow_name"],
+											  args["architecture"],
+											  num_tasks_values, data_values, cpu_values, num_nodes_values)
+		selected_set = select_training_set(full_set.get_workflow_set(), args["coverage_radius"])
+		sys.stderr.write(f"\nCoverage-selected training set: {len(selected_set.get_workflow_set())}/"
+						 f"{len(full_set.get_workflow_set())} configurations ({selected_set})\n")
+		experiment_set.add_experiment(selected_set, [full_set])
+
 	sys.stderr.write(f"\nCreated {len(experiment_set)} experiments...\n")
 
 	time_estimate_str = timedelta(seconds=experiment_set.estimate_run_time())
@@ -267,8 +287,7 @@ def main():
 	# dont catch print exit errors.  Just let the error throw its self and python will give a much better print then still exit
 
 	# Pickle it
-	with open(pickle_file_name, 'wb') as f:
-		pickle.dump(experiment_set, f)
+	save_experiment_set(experiment_set, pickle_file_name)
 	sys.stderr.write(f"Pickled to ./{pickle_file_name}\n")
 
 
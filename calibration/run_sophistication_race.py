@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Races the simulator versions (all combinations of compute service, storage service and network topology
+schemes) against each other under one core budget, instead of calibrating each of them for the full time
+limit. The time limit is split into rounds: in each round, every surviving version is calibrated for the
+round's time, concurrently, with an equal share of the cores, starting from its best calibration so far.
+After each round (from the third one), a version is dropped if, even improving for the remaining rounds at
+the upper end of the bootstrap confidence interval (over its rounds) of its improvement per round, it
+wouldn't catch up with the best loss so far: its cores go to the survivors. Rounds refine the same
+calibrations, so they aren't independent samples, and this is a heuristic rather than a guarantee.
+
+Each version's best calibration is then evaluated, and pickled as by run_single_calibration.py (so that
+process_sophistication_expiriments.py can plot them), with a "_race" suffix.
+"""
+import argparse
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import product
+
+from Util import *
+from RepeatTrials import REPEAT_MODES
+from run_single_calibration import group
+
+COMPUTE_SERVICE_SCHEMES = ['all_bare_metal', 'htcondor_bare_metal']
+STORAGE_SERVICE_SCHEMES = ['submit_only', 'submit_and_compute_hosts']
+NETWORK_TOPOLOGY_SCHEMES = ['one_link', 'one_and_then_many_links', 'many_links']
+
+
+class Contestant:
+	# One simulator version in the race
+	__slots__ = ("simulator", "best_losses", "best_calibration", "best_loss", "eliminated_after")
+
+	def __init__(self, simulator: Simulator):
+		self.simulator = simulator
+		# Best loss after each round
+		self.best_losses: List[float] = []
+		self.best_calibration = None
+		self.best_loss = float('inf')
+		self.eliminated_after: int | None = None
+
+	def name(self) -> str:
+		return f"{self.simulator.compute_service_scheme}/{self.simulator.storage_service_scheme}/" \
+			   f"{self.simulator.network_topology_scheme}"
+
+	def improvements(self) -> List[float]:
+		return [previous - loss for previous, loss in zip(self.best_losses, self.best_losses[1:])
+				if math.isfinite(previous)]
+
+	def reachable_loss(self, num_rounds: int, confidence: float, rng: np.random.Generator) -> float:
+		# Best loss after num_rounds more rounds that improve at the upper end of the bootstrap interval
+		improvements = self.improvements()
+		if len(improvements) < 2:
+			return -float('inf')
+		return self.best_loss - num_rounds * bootstrap_interval(improvements, confidence, rng)[1]
+
+
+def dominated(contestants: List[Contestant], num_rounds: int, confidence: float,
+			  rng: np.random.Generator) -> List[Contestant]:
+	# Those that can't reach the best loss so far in the remaining rounds
+	leader = min(contestants, key=lambda c: c.best_loss)
+	return [c for c in contestants if c is not leader and
+			c.reachable_loss(num_rounds, confidence, rng) > leader.best_loss]
+
+
+def race(contestants: List[Contestant], workflows: List[List[str]], args: dict) -> List[Contestant]:
+	round_time = args["time_limit"] / args["num_rounds"]
+	survivors = list(contestants)
+	rng = np.random.default_rng(args["seed"])
+	for round_number in range(1, args["num_rounds"] + 1):
+		num_threads = max(1, args["num_cores"] // len(survivors))
+		sys.stderr.write(f"Round {round_number}/{args['num_rounds']}: {len(survivors)} simulator versions, "
+						 f"{num_threads} threads each, {round_time:.0f} sec\n")
+
+		def calibrate(contestant: Contestant):
+			return compute_calibration(workflows,
+									   args["algorithm"],
+									   contestant.simulator,
+									   args["loss_function"],
+									   args["loss_aggregator"],
+									   round_time,
+									   num_threads,
+									   args["repeat_mode"],
+									   start_calibration=contestant.best_calibration)
+
+		with ThreadPoolExecutor(max_workers=len(survivors)) as pool:
+			results = list(pool.map(calibrate, survivors))
+		for contestant, (calibration, loss) in zip(survivors, results):
+			if calibration is not None and loss < contestant.best_loss:
+				contestant.best_calibration, contestant.best_loss = calibration, loss
+			contestant.best_losses.append(contestant.best_loss)
+
+		remaining_rounds = args["num_rounds"] - round_number
+		if remaining_rounds > 0:
+			for contestant in dominated(survivors, remaining_rounds, args["confidence"], rng):
+				contestant.eliminated_after = round_number
+				survivors.remove(contestant)
+		for contestant in sorted(contestants, key=lambda c: c.best_loss):
+			reachable = contestant.reachable_loss(remaining_rounds, args["confidence"], rng)
+			status = "racing" if contestant in survivors else f"dropped after round {contestant.eliminated_after}"
+			sys.stderr.write(f"  {contestant.name():60s} best={contestant.best_loss:.6g} "
+							 f"reachable={reachable:.6g} {status}\n")
+	return survivors
+
+
+def parse_command_line_arguments(program_name: str):
+	parser = argparse.ArgumentParser(
+		prog=program_name,
+		description='Race the calibrations of all simulator versions, dropping the clearly worse ones early')
+	parser.add_argument('-cn', '--computer_name', type=str, metavar="<computer name>", required=True,
+						help='Name of this computer to add to the pickled file names')
+	parser.add_argument('-al', '--algorithm', type=str,
+						choices=['grid', 'random', 'gradient', 'gradient.parallel', 'skopt.gp', 'skopt.gbrt', 'skopt.rf', 'skopt.et'],
+						required=True, help='The calibration algorithm')
+	parser.add_argument('-tl', '--time_limit', type=int, required=True,
+						help='Training time limit (of the whole race), in seconds')
+	parser.add_argument('-nc', '--num_cores', type=int, default=os.cpu_count(),
+						help='Number of threads shared by all calibrations')
+	parser.add_argument('-nr', '--num_rounds', type=int, default=6,
+						help='Number of rounds the time limit is split into')
+	parser.add_argument('-cl', '--confidence', type=float, default=0.95,
+						help='Confidence level of the bootstrap intervals of the improvements per round')
+	parser.add_argument('--seed', type=int, default=None, help='Seed of the bootstrap resampling')
+	parser.add_argument('-lf', '--loss_function', type=str,
+						choices=['makespan', 'average_runtimes', 'max_runtimes'], default="makespan",
+						help='The loss function to evaluate a calibration')
+	parser.add_argument('-la', '--loss_aggregator', type=str,
+						choices=['average_error', 'max_error'], default="average_error",
+						help='The loss aggregator to evaluate a calibration')
+	parser.add_argument('-rm', '--repeat_mode', type=str, choices=REPEAT_MODES, default="all",
+						help='How calibration uses repeat trials of a configuration (see RepeatTrials.py)')
+	parser.add_argument('-ts', '--training_set', required=True, type=str, nargs="+",
+						help='The list of json files to use for training')
+	parser.add_argument('-es', '--evaluation_set', type=str, nargs="*", default=None,
+						help='The list of json files to use for evaluation')
+	return vars(parser.parse_args())
+
+
+def main():
+	args = parse_command_line_arguments(sys.argv[0])
+	training = group(args['training_set'])
+	evaluation = training if args['evaluation_set'] is None else group(args['evaluation_set'])
+
+	contestants = [Contestant(Simulator(cs, ss, ns)) for cs, ss, ns in
+				   product(COMPUTE_SERVICE_SCHEMES, STORAGE_SERVICE_SCHEMES, NETWORK_TOPOLOGY_SCHEMES)]
+	start = time.perf_counter()
+	survivors = race(contestants, training, args)
+	sys.stderr.write(f"Raced in {timedelta(seconds=int(time.perf_counter() - start))}, "
+					 f"{len(survivors)} simulator versions left: {', '.join(c.name() for c in survivors)}\n")
+
+	for contestant in contestants:
+		if contestant.best_calibration is None:
+			continue
+		simulator = contestant.simulator
+		pickle_file_name = f"pickled-one_calibration-" \
+						   f"{orderinvarient_hash(training, 8)}-" \
+						   f"{orderinvarient_hash(evaluation, 8)}-" \
+						   f"{simulator.compute_service_scheme}-" \
+						   f"{simulator.storage_service_scheme}-" \
+						   f"{simulator.network_topology_scheme}-" \
+						   f"{args['algorithm']}-" \
+						   f"{args['loss_function']}-" \
+						   f"{args['loss_aggregator']}-" \
+						   f"{args['time_limit']}-" \
+						   f"{args['num_cores']}-" \
+						   f"{args['computer_name']}" \
+						   f"{'' if args['repeat_mode'] == 'all' else '_' + args['repeat_mode']}_race.pickled"
+		experiment_set = ExperimentSet(simulator,
+									   args["algorithm"],
+									   args["loss_function"],
+									   args["loss_aggregator"],
+									   args["time_limit"],
+									   args["num_cores"],
+									   args["repeat_mode"])
+		experiment_set.add_experiment(WorkflowSetSpec().set_workflows(training),
+									  [WorkflowSetSpec().set_workflows(evaluation)])
+		xp = experiment_set.experiments[0]
+		xp.calibration = contestant.best_calibration
+		xp.calibration_loss = contestant.best_loss
+		experiment_set.compute_all_evaluations()
+		save_experiment_set(experiment_set, pickle_file_name)
+		print(pickle_file_name)
+
+
+if __name__ == "__main__":
+	main()
@@ -61,6 +61,9 @@ def parse_command_line_arguments(program_name: str):
 							metavar="[one_link|one_and_then_many_links|many_links]",
 							choices=['one_link', 'one_and_then_many_links', 'many_links'], required=True,
 							help='The network topology scheme used by the simulator')
+		parser.add_argument('-rg', '--registry', type=str, metavar="<registry file>", default=None,
+							help='SQLite registry of calibrations (see CalibrationRegistry.py): training sets already '
+								 'calibrated in it with the same settings are not recalibrated, and new ones are added')
 
 		return vars(parser.parse_args()), parser, None
 
@@ -142,6 +145,7 @@ def main():
 								   args["loss_aggregator"],
 								   args["time_limit"],
 								   args["num_threads"])
+	experiment_set.registry_path = args["registry"]
 
 	sys.stderr.write("Creating experiments")
 	# Num task variation experiments
@@ -177,8 +181,7 @@ def main():
 		sys.exit(1)
 
 	# Pickle it
-	with open(pickle_file_name, 'wb') as f:
-		pickle.dump(experiment_set, f)
+	save_experiment_set(experiment_set, pickle_file_name)
 	sys.stderr.write(f"Pickled to ./{pickle_file_name}\n")
 
 
@@ -2,7 +2,6 @@
 import argparse
 import sys
 from glob import glob
-import pickle 
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import gridspec
@@ -10,24 +9,12 @@ from matplotlib.colors import Normalize
 from matplotlib import cm
 from Util import *
 from collections import defaultdict
+from ResultsDatabase import group_pickles, parse_pickle_arguments
 path_translation={"NEW_RUNS":"/home/jamcdonald/workflow/","JSONS":"/home/jamcdonald/workflow/","ALL_RUNS":"/home/jamcdonald/workflow/","LIMITED_RUNS":"/home/jamcdonald/workflow/","SYNTHETIC_LIMITED":"/home/jamcdonald/workflow/"}
-def load_and_group_pickles(file_paths):
-
-	grouped_data = defaultdict(list)
-	
-	for file_path in file_paths:
-		with open(file_path, 'rb') as file:
-			data = pickle.load(file)
-			tokens=data.experiments[0].training_set_spec.workflows[0][0].split("/")[-1].split("-")
-			key = tokens[0]+data.algorithm
-			grouped_data[key].append(data)
-			data.experiments[0].training_set_spec.update_fields()
-			file_token=file_path.split("/")[-1].split("-")
-			#try:
-			#	print("mv","\""+file_path+"\"",f"\"{"\\".join(file_path.split("/")[0:-1])}-one_workflow-{tokens[0]}-{max(data.experiments[0].training_set_spec.num_nodes_values)}-{max(data.experiments[0].training_set_spec.num_tasks_values)}-{file_token[-6]}.pickled\"")
-			#except:
-			#	pass
-	return dict(grouped_data)
+def load_and_group_pickles(file_paths, db_path):
+	# The experiments of the pickled files, grouped by workflow and algorithm, from the results database
+	# (see ResultsDatabase.py), which only unpickles the files that are new or changed since the last run
+	return group_pickles(db_path, file_paths, ["workflow", "algorithm"])
 
 def build_label(workflow_sec_spec: WorkflowSetSpec):
 	label = ""
@@ -44,16 +31,17 @@ def build_label(workflow_sec_spec: WorkflowSetSpec):
 	return label
 
 
-def process_experiment_group(experiment_group: [ExperimentSet]):
-	name=[experiment_group[0][0].training_set_spec.workflows[0][0].split("/")[-1].split("-")[0],#actual workflow name
-		  #experiment_group[0].get_architecture(),
-		  #experiment_group[0].simulator.compute_service_scheme,
-		  #experiment_group[0].simulator.storage_service_scheme,
-		  #experiment_group[0].simulator.network_topology_scheme,
-		  experiment_group[0].algorithm,
-		  #experiment_group[0].loss_function,
-		  #experiment_group[0].time_limit,
-		  #experiment_group[0].num_threads
+def process_experiment_group(experiment_group: List[dict]):
+	# Experiments as results database rows (see ResultsDatabase.query)
+	name=[experiment_group[0]["workflow"],#actual workflow name
+		  #experiment_group[0]["architecture"],
+		  #experiment_group[0]["compute_service_scheme"],
+		  #experiment_group[0]["storage_service_scheme"],
+		  #experiment_group[0]["network_topology_scheme"],
+		  experiment_group[0]["algorithm"],
+		  #experiment_group[0]["loss_function"],
+		  #experiment_group[0]["time_limit"],
+		  #experiment_group[0]["num_threads"]
 		  ]
 	name = [str(x) for x in name]
 	task_counts = set()
@@ -69,43 +57,40 @@ def process_experiment_group(experiment_group: [ExperimentSet]):
 
 	to_plot = defaultdict(dict)
 	largest_value = 0
-	for experiment_set in experiment_group:
-		for result in experiment_set.experiments:
-			training_loss = result.calibration_loss
-			result.training_set_spec.update_fields()
-			training_spec = result.training_set_spec
-			#print(experiment_set)
-			#print(result.training_set_spec.num_nodes_values)
-			#print(result.training_set_spec.num_tasks_values)
-			
-			
-			
-			#for json file in  expiriment.training_set_spec.workflows.flatten()
-			#path is unreliable, translate to local machine path by focusing on ALL_RUNS and NEW_RUNS and LIMITED_RUNS and JSONS in path name 
-			#open json file
-			#get workflow.execution.makespanInSeconds for makespan
-			#nodes can be collected from file path #6 or or len(workflow.execution.machines)
-			total_machinetime=0
-			for raw_path in flatten(training_spec.workflows):
-				for key in path_translation.keys():
-					if key in raw_path:
-						local_path=path_translation[key]+raw_path[raw_path.find(key):]
-						JSONfile=load_json(local_path)
-						makespan=float(JSONfile["workflow"]["execution"]["makespanInSeconds"])
-						nodes=len(JSONfile["workflow"]["execution"]["machines"])
-						total_machinetime+=makespan*nodes
-						break
-				else:
-					print(raw_path)
-					raise
-			#print(total_machinetime)
-			to_plot[max(result.training_set_spec.num_nodes_values)]\
-			       [max(result.training_set_spec.num_tasks_values)]\
-				   =({"training_loss":training_loss,
-				      "evaluation_losses": result.evaluation_losses,"machine_time":total_machinetime})
-					  
-			task_counts.add(max(result.training_set_spec.num_tasks_values))
-			node_counts.add(max(result.training_set_spec.num_nodes_values))
+	for result in experiment_group:
+		training_loss = result["calibration_loss"]
+		#print(experiment_set)
+		#print(result.training_set_spec.num_nodes_values)
+		#print(result.training_set_spec.num_tasks_values)
+		
+		
+		
+		#for json file in  expiriment.training_set_spec.workflows.flatten()
+		#path is unreliable, translate to local machine path by focusing on ALL_RUNS and NEW_RUNS and LIMITED_RUNS and JSONS in path name 
+		#open json file
+		#get workflow.execution.makespanInSeconds for makespan
+		#nodes can be collected from file path #6 or or len(workflow.execution.machines)
+		total_machinetime=0
+		for raw_path in flatten(result["training_set"]):
+			for key in path_translation.keys():
+				if key in raw_path:
+					local_path=path_translation[key]+raw_path[raw_path.find(key):]
+					JSONfile=load_json(local_path)
+					makespan=float(JSONfile["workflow"]["execution"]["makespanInSeconds"])
+					nodes=len(JSONfile["workflow"]["execution"]["machines"])
+					total_machinetime+=makespan*nodes
+					break
+			else:
+				print(raw_path)
+				raise
+		#print(total_machinetime)
+		to_plot[result["max_num_nodes"]]\
+		       [result["max_num_tasks"]]\
+			   =({"training_loss":training_loss,
+			      "evaluation_losses": result["evaluation_losses"],"machine_time":total_machinetime})
+				  
+		task_counts.add(result["max_num_tasks"])
+		node_counts.add(result["max_num_nodes"])
 	#to_plot = dict(sorted(to_plot.items()))
 	data=dict(to_plot)
 	#print(data)
@@ -193,14 +178,9 @@ def process_experiment_group(experiment_group: [ExperimentSet]):
 	return name[0],data
 
 def main():
-	pickle_files = []
-	for arg in sys.argv[1:]:
-		if '*' in arg:
-			pickle_files+=glob(arg)
-		else:
-			pickle_files.append(arg)
-	data=load_and_group_pickles(pickle_files)
-	sys.stderr.write(f"Found {len(pickle_files)} pickled files to process...\n")
+	args = parse_pickle_arguments(sys.argv[0], 'Heatmaps of the losses of single-workflow experiments')
+	data=load_and_group_pickles(args["pickle_files"], args["database"])
+	sys.stderr.write(f"Found {sum(map(len, data.values()))} experiments to process...\n")
 	dv={}
 	for group in data.values():
 		a,b=process_experiment_group(group)
@@ -0,0 +1,180 @@
+import json
+import os
+import random
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+import AnalyticModel
+from AnalyticModel import AnalyticWorkflow
+from WorkflowPack import load_workflow_json
+
+SIMULATOR = os.environ.get("WORKFLOW_SIMULATOR", shutil.which("workflow-simulator-for-calibration"))
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+# Real (WfFormat 1.5) workflows: the others in data/ are older WfFormat instances
+SAMPLE_WORKFLOWS = [os.path.join(DATA_DIR, "sample_workflow.json")]
+
+
+def make_workflow(parents: dict[str, list], runtimes: dict[str, float], avg_cpus: dict[str, float] | None = None,
+				  cores: dict[str, int] | None = None, file_sizes: dict[str, tuple] | None = None,
+				  num_machines: int = 1, makespan: float = 1.0) -> dict:
+	# A minimal WfFormat 1.5 workflow; file_sizes maps a task to its (input bytes, output bytes)
+	avg_cpus = avg_cpus or {}
+	cores = cores or {}
+	file_sizes = file_sizes or {}
+	files = []
+	tasks = []
+	executions = []
+	for task in parents:
+		input_bytes, output_bytes = file_sizes.get(task, (0, 0))
+		files += [{"id": f"{task}.in", "sizeInBytes": input_bytes}, {"id": f"{task}.out", "sizeInBytes": output_bytes}]
+		tasks.append({"name": task, "id": task, "parents": parents[task],
+					  "inputFiles": [f"{task}.in"], "outputFiles": [f"{task}.out"]})
+		execution = {"id": task, "runtimeInSeconds": runtimes[task], "coreCount": cores.get(task, 1)}
+		if task in avg_cpus:
+			execution["avgCPU"] = avg_cpus[task]
+		executions.append(execution)
+	return {"name": "test", "schemaVersion": "1.5",
+			"workflow": {"specification": {"tasks": tasks, "files": files},
+						 "execution": {"makespanInSeconds": makespan, "tasks": executions,
+									   "machines": [{"nodeName": f"node{i}"} for i in range(num_machines)]}}}
+
+
+def parameters(**overrides) -> dict:
+	# Tasks take their runtime, with no overheads and free transfers
+	values = {"reference_flops": 1e9, "compute_speed": 1e9, "num_cores": 1, "thread_startup_overhead": 0,
+			  "scheduling_overhead": 0, "read_bandwidth": np.inf, "write_bandwidth": np.inf,
+			  "network_bandwidth": np.inf}
+	values.update(overrides)
+	return values
+
+
+def random_dag(rng: random.Random, num_tasks: int) -> dict[str, list]:
+	# Parents among the tasks before, with tasks listed in a shuffled order
+	names = [f"t{i}" for i in range(num_tasks)]
+	parents = {name: [names[j] for j in range(i) if rng.random() < 0.3] for i, name in enumerate(names)}
+	shuffled = list(names)
+	rng.shuffle(shuffled)
+	return {name: parents[name] for name in shuffled}
+
+
+def model_order(parents: dict[str, list]) -> list[str]:
+	# The order AnalyticWorkflow puts tasks in: by level (longest distance from an entry task), stably
+	level = {}
+
+	def level_of(task):
+		if task not in level:
+			level[task] = max((level_of(p) + 1 for p in parents[task]), default=0)
+		return level[task]
+	return sorted(parents, key=level_of)
+
+
+def brute_force_longest_path(parents: dict[str, list], weights: dict[str, float]) -> float:
+	# Enumerates all the paths that end at each task
+	def longest_to(task):
+		return weights[task] + max((longest_to(p) for p in parents[task]), default=0)
+	return max(longest_to(task) for task in parents)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_critical_path_matches_brute_force(seed):
+	rng = random.Random(seed)
+	parents = random_dag(rng, rng.randint(1, 12))
+	workflow = AnalyticWorkflow(make_workflow(parents, {t: 1.0 for t in parents}))
+	order = model_order(parents)
+	num_candidates = 5
+	weights = {t: [rng.random() for _ in range(num_candidates)] for t in parents}
+	matrix = np.array([weights[t] for t in order])
+
+	expected = [brute_force_longest_path(parents, {t: weights[t][k] for t in parents}) for k in range(num_candidates)]
+	assert workflow.critical_path(matrix) == pytest.approx(expected)
+
+	path = workflow.critical_path_tasks(matrix[:, 0])
+	assert matrix[path, 0].sum() == pytest.approx(expected[0])
+	assert parents[order[path[0]]] == []
+	for parent, child in zip(path, path[1:]):
+		assert order[parent] in parents[order[child]]
+
+
+def test_chain_bound_is_the_sum_of_runtimes():
+	workflow = AnalyticWorkflow(make_workflow({"a": [], "b": ["a"], "c": ["b"]}, {"a": 10, "b": 20, "c": 30}))
+	assert workflow.makespan_lower_bound(parameters())[0] == pytest.approx(60)
+	# Twice as fast hosts, and overheads per task
+	bound = workflow.makespan_lower_bound(parameters(compute_speed=2e9, scheduling_overhead=1,
+													 thread_startup_overhead=0.5))
+	assert bound[0] == pytest.approx(30 + 3 * 1.5)
+
+
+def test_fork_bound_is_the_total_compute_over_all_cores():
+	parents = {"root": [], "x": ["root"], "y": ["root"], "z": ["root"], "w": ["root"]}
+	runtimes = {"root": 1, "x": 10, "y": 10, "z": 10, "w": 10}
+	workflow = AnalyticWorkflow(make_workflow(parents, runtimes, num_machines=1))
+	# The critical path (11) with enough cores, all the compute time over 2 cores otherwise
+	assert workflow.makespan_lower_bound(parameters(num_cores=8))[0] == pytest.approx(11)
+	assert workflow.makespan_lower_bound(parameters(num_cores=2))[0] == pytest.approx(41 / 2)
+
+
+def test_bound_scales_task_flops_by_avg_cpu():
+	# The parser gives a task that used its core half the time half the flops of its runtime
+	workflow = AnalyticWorkflow(make_workflow({"a": [], "b": ["a"]}, {"a": 10, "b": 10}, avg_cpus={"a": 50, "b": 100}))
+	assert workflow.makespan_lower_bound(parameters())[0] == pytest.approx(15)
+
+
+def test_bound_transfers_at_the_slowest_bandwidth():
+	workflow = AnalyticWorkflow(make_workflow({"a": []}, {"a": 0}, file_sizes={"a": (100, 50)}))
+	bound = workflow.makespan_lower_bound(parameters(read_bandwidth=10, write_bandwidth=5, network_bandwidth=20))
+	assert bound[0] == pytest.approx(100 / 10 + 50 / 5)
+
+
+def test_bound_is_vectorized_over_candidates():
+	workflow = AnalyticWorkflow(make_workflow({"a": [], "b": ["a"]}, {"a": 10, "b": 30}))
+	bounds = workflow.makespan_lower_bound(parameters(compute_speed=np.array([1e9, 2e9, 4e9])))
+	assert bounds == pytest.approx([40, 20, 10])
+
+
+def test_makespan_error_lower_bounds(tmp_path):
+	path = tmp_path / "chain.json"
+	path.write_text(json.dumps(make_workflow({"a": [], "b": ["a"]}, {"a": 10, "b": 10}, makespan=10)))
+	json_input = {"compute_service_scheme": "all_bare_metal", "storage_service_scheme": "submit_only",
+				  "network_topology_scheme": "one_link", "scheduling_overhead": "0s",
+				  "workflow": {"reference_flops": "1Gf"},
+				  "compute_service_scheme_parameters": {"all_bare_metal": {
+					  "compute_hosts": {"speed": "1Gf", "num_cores": "1"},
+					  "properties": {"BareMetalComputeServiceProperty::THREAD_STARTUP_OVERHEAD": "0s"}}},
+				  "storage_service_scheme_parameters": {"submit_only": {
+					  "bandwidth_submit_disk_read": "1GBps", "bandwidth_submit_disk_write": "1GBps"}},
+				  "network_topology_scheme_parameters": {"one_link": {"bandwidth": "1GBps"}}}
+	# The bound (20s, scaled by the slack) is above the real makespan
+	[error] = AnalyticModel.makespan_error_lower_bounds([str(path)], [json_input])
+	assert error == pytest.approx((20 * AnalyticModel.BOUND_SLACK - 10) / 10)
+	assert AnalyticModel.makespan_error_lower_bounds([str(path)], [json_input], slack=1.0) == pytest.approx([1.0])
+	# Slower hosts only make it larger, and a real makespan above the bound gives no error
+	json_input["compute_service_scheme_parameters"]["all_bare_metal"]["compute_hosts"]["speed"] = "500Mf"
+	assert AnalyticModel.makespan_error_lower_bounds([str(path)], [json_input])[0] > error
+	path.write_text(json.dumps(make_workflow({"a": [], "b": ["a"]}, {"a": 10, "b": 10}, makespan=100)))
+	AnalyticModel.load_analytic_workflow.cache_clear()
+	assert AnalyticModel.makespan_error_lower_bounds([str(path)], [json_input]) == [0.0]
+
+
+@pytest.mark.skipif(SIMULATOR is None, reason="the simulator isn't installed")
+@pytest.mark.parametrize("schemes", [("all_bare_metal", "submit_only", "one_link"),
+									 ("htcondor_bare_metal", "submit_and_compute_hosts", "many_links")])
+@pytest.mark.parametrize("workflow", SAMPLE_WORKFLOWS)
+def test_scaled_bound_is_below_simulated_makespans(workflow, schemes):
+	# What BOUND_SLACK is for: pruning with it never skips a calibration the simulator would do better with
+	pytest.importorskip("simcal")
+	import Simulator
+	from WorkflowSimulatorCalibrator import calibration_input, calibration_parameters
+	simulator = Simulator.Simulator(*schemes, in_process=False)
+	parameter_specs = calibration_parameters(simulator)
+	rng = random.Random(0)
+	analytic_workflow = AnalyticWorkflow(load_workflow_json(workflow))
+	for _ in range(20):
+		calibration = calibration_input(simulator, parameter_specs, [rng.random() for _ in parameter_specs])
+		json_input = simulator.make_json_input(os.path.abspath(workflow), calibration, {"output_level": "makespan"})
+		std_out = subprocess.run([SIMULATOR, "--wrench-commport-pool-size=10000", json.dumps(json_input)],
+								 capture_output=True, text=True, check=True).stdout
+		bound = analytic_workflow.makespan_lower_bound(AnalyticModel.model_parameters(json_input))[0]
+		assert bound * AnalyticModel.BOUND_SLACK <= json.loads(std_out)["simulated_makespan"]
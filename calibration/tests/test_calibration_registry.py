@@ -0,0 +1,34 @@
+import sqlite3
+
+import pytest
+
+from CalibrationRegistry import CalibrationRegistry
+
+
+def test_lookup_and_record(tmp_path):
+	path = str(tmp_path / "registry.sqlite")
+	registry = CalibrationRegistry(path)
+	settings = {"algorithm": "random", "time_limit": 10}
+	assert registry.lookup("abc", settings) is None
+	registry.record("abc", settings, {"compute_hosts_speed": "100f", "link_lat": "0.1s"}, 0.5)
+	# Settings are keyed whatever their order, and other settings or training sets don't match
+	assert CalibrationRegistry(path).lookup("abc", {"time_limit": 10, "algorithm": "random"}) == \
+		({"compute_hosts_speed": "100f", "link_lat": "0.1s"}, 0.5)
+	assert registry.lookup("abc", {**settings, "time_limit": 20}) is None
+	assert registry.lookup("abd", settings) is None
+	# Calibrations are stored as plain JSON
+	connection = sqlite3.connect(path)
+	assert connection.execute("SELECT named_values FROM named_calibrations").fetchone()[0] == \
+		'{"compute_hosts_speed": "100f", "link_lat": "0.1s"}'
+	connection.close()
+
+
+def test_named_values_round_trip():
+	pytest.importorskip("simcal")
+	import Simulator
+	import WorkflowSimulatorCalibrator as wsc
+	simulator = Simulator.Simulator("htcondor_bare_metal", "submit_and_compute_hosts", "many_links")
+	parameter_specs = wsc.calibration_parameters(simulator)
+	calibration = wsc.calibration_input(simulator, parameter_specs, [0.3] * len(parameter_specs))
+	values = wsc.named_values(simulator, calibration)
+	assert wsc.calibration_from_named_values(simulator, values) == calibration
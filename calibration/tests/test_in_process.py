@@ -0,0 +1,52 @@
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Smoke test of the in-process backend (run by ctest when the module is built, see CMakeLists.txt)
+pytest.importorskip("simcal")
+pytest.importorskip("workflow_simulator_for_calibration")
+import simcal as sc
+import Simulator
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+
+
+@pytest.fixture
+def sample():
+	with open(os.path.join(DATA_DIR, "sample_input.json")) as f:
+		json_input = json.load(f)
+	json_input["output_level"] = "makespan"
+	return os.path.abspath(os.path.join(DATA_DIR, "sample_workflow.json")), json_input
+
+
+def test_simulates_like_the_executable(sample):
+	workflow, calibration = sample
+	simulator = Simulator.Simulator("all_bare_metal", "submit_only", "one_link", in_process=True)
+	with sc.Environment() as env:
+		output = simulator.simulate(env, workflow, calibration)
+	assert output["simulated_makespan"] > 0
+	assert output["real_makespan"] > 0
+
+	executable = os.environ.get("WORKFLOW_SIMULATOR", shutil.which("workflow-simulator-for-calibration"))
+	if executable is not None:
+		json_input = simulator.make_json_input(workflow, calibration)
+		std_out = subprocess.run([executable, "--wrench-commport-pool-size=10000", json.dumps(json_input)],
+								 capture_output=True, text=True, check=True).stdout
+		assert json.loads(std_out)["simulated_makespan"] == pytest.approx(output["simulated_makespan"])
+
+
+def test_concurrent_simulations(sample):
+	# From several threads (as calibrations run them), and as a batch
+	workflow, calibration = sample
+	simulator = Simulator.Simulator("all_bare_metal", "submit_only", "one_link", in_process=True)
+	with sc.Environment() as env:
+		expected = simulator.simulate(env, workflow, calibration)["simulated_makespan"]
+		with ThreadPoolExecutor(4) as pool:
+			outputs = list(pool.map(lambda _: simulator.simulate(env, workflow, calibration), range(8)))
+		batch = simulator.run_batch(env, workflow, [calibration] * 3)
+	assert [output["simulated_makespan"] for output in outputs] == pytest.approx([expected] * 8)
+	assert [json.loads(line)["simulated_makespan"] for line in batch] == pytest.approx([expected] * 3)
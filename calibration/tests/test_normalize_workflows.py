@@ -0,0 +1,74 @@
+import json
+import os
+
+import pytest
+
+import normalize_workflows
+from WorkflowPack import INDEX_NAME
+
+WORKFLOW_1_4 = {
+	"name": "chain",
+	"schemaVersion": "1.4",
+	"wms": {"name": "Pegasus", "version": "5.0.1"},
+	"workflow": {
+		"makespanInSeconds": 30,
+		"executedAt": "20230101T000000+0000",
+		"machines": [{"nodeName": "node1", "system": "linux", "memoryInBytes": 1024,
+					  "cpu": {"count": 0, "speed": 2400, "vendor": "Intel"}}],
+		"tasks": [
+			{"name": "a", "id": "a", "parents": [], "children": ["b"], "runtimeInSeconds": 10, "cores": 0,
+			 "avgCPU": 90.5, "machine": "node1",
+			 "files": [{"link": "input", "name": "in", "sizeInBytes": 100},
+					   {"link": "output", "name": "mid", "sizeInBytes": 50}]},
+			{"name": "b", "id": "b", "parents": ["a"], "children": [], "runtimeInSeconds": 20, "cores": 2,
+			 "files": [{"link": "input", "name": "mid", "sizeInBytes": 50}]},
+		],
+	},
+}
+
+
+def test_migrate_1_4():
+	data = normalize_workflows.normalize_workflow(json.loads(json.dumps(WORKFLOW_1_4)))
+	assert data["schemaVersion"] == "1.5"
+	assert data["runtimeSystem"] == {"name": "Pegasus", "version": "5.0.1"}
+	specification = data["workflow"]["specification"]
+	assert [t["inputFiles"] for t in specification["tasks"]] == [["in"], ["mid"]]
+	assert [t["outputFiles"] for t in specification["tasks"]] == [["mid"], []]
+	assert {f["id"]: f["sizeInBytes"] for f in specification["files"]} == {"in": 100, "mid": 50}
+
+	execution = data["workflow"]["execution"]
+	assert execution["makespanInSeconds"] == 30
+	a, b = execution["tasks"]
+	assert a == {"id": "a", "runtimeInSeconds": 10, "coreCount": 1, "avgCPU": 90.5, "machines": ["node1"]}
+	assert "machines" not in b and b["coreCount"] == 2
+	# Machines get the 1.5 CPU fields, and 0-core machines are fixed too
+	assert execution["machines"] == [{"nodeName": "node1", "system": "linux", "memoryInBytes": 1024,
+									  "cpu": {"coreCount": 1, "speedInMHz": 2400, "vendor": "Intel"}}]
+
+
+def test_migrated_1_4_is_valid_wfformat_1_5(tmp_path, monkeypatch):
+	# Against the upstream WfFormat schema and semantic checks (those of WfCommons, which loads the schema
+	# from WFFORMAT_SCHEMA, or fetches it into the working directory)
+	pytest.importorskip("jsonschema")
+	schema = pytest.importorskip("wfcommons.wfinstances.schema")
+	monkeypatch.chdir(tmp_path)
+	try:
+		validator = schema.SchemaValidator(os.environ.get("WFFORMAT_SCHEMA"))
+	except Exception as error:
+		pytest.skip(f"WfFormat schema not available: {error}")
+	data = normalize_workflows.normalize_workflow(json.loads(json.dumps(WORKFLOW_1_4)))
+	validator.validate_instance(data)
+
+
+def test_normalize_directory_reports_bad_files(tmp_path):
+	(tmp_path / "good.json").write_text(json.dumps(WORKFLOW_1_4))
+	(tmp_path / "old.json").write_text(json.dumps({"schemaVersion": "1.2", "workflow": {}}))
+	(tmp_path / "broken.json").write_text("{")
+	num_files, num_processed, errors = normalize_workflows.normalize_directory(str(tmp_path))
+	assert (num_files, num_processed) == (3, 3)
+	assert sorted(errors) == ["broken.json", "old.json"]
+	index = json.loads((tmp_path / INDEX_NAME).read_text())
+	assert list(index) == ["good.json"]
+	assert index["good.json"]["num_workflow_tasks"] == 2
+	# Normalized files aren't processed again, bad ones are
+	assert normalize_workflows.normalize_directory(str(tmp_path))[1] == 2
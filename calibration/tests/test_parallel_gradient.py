@@ -0,0 +1,67 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from ParallelGradient import ParallelGradientDescent
+
+
+def quadratic(optimum, scales):
+	optimum, scales = np.array(optimum), np.array(scales)
+	return lambda point: float(np.sum(scales * (np.array(point) - optimum) ** 2))
+
+
+def test_step_multipliers():
+	assert ParallelGradientDescent(1).step_multipliers(6) == [1, 2, 0.5, 4, 0.25, 8]
+
+
+@pytest.mark.parametrize("num_threads", [1, 3, 8])
+def test_minimizes_a_quadratic(num_threads):
+	# With more threads than parameters, steps along the previous direction are tried too
+	evaluated = []
+
+	def evaluate(point):
+		evaluated.append(point)
+		return quadratic([0.2, 0.7, 0.9], [1, 5, 0.5])(point)
+	engine = ParallelGradientDescent(num_threads)
+	position, loss = engine.calibrate(evaluate, 3, time_limit=60)
+	assert position == pytest.approx([0.2, 0.7, 0.9], abs=0.03)
+	assert loss == min(map(quadratic([0.2, 0.7, 0.9], [1, 5, 0.5]), evaluated)) < 1e-3
+	assert engine.num_evaluations == len(evaluated)
+
+
+def test_stays_within_the_parameter_ranges():
+	evaluated = []
+
+	def evaluate(point):
+		evaluated.append(point)
+		return quadratic([1.5, -0.5], [1, 1])(point)
+	position, loss = ParallelGradientDescent(4).calibrate(evaluate, 2, time_limit=60, start=[0.9, 0.1])
+	assert position == pytest.approx([1, 0], abs=0.02)
+	assert all(0 <= coordinate <= 1 for point in evaluated for coordinate in point)
+
+
+def test_starts_from_the_given_position():
+	engine = ParallelGradientDescent(2)
+	position, loss = engine.calibrate(quadratic([0.3, 0.6], [1, 1]), 2, time_limit=60, start=[0.3, 0.6])
+	# Nothing improves on the optimum: only the step size shrinks
+	assert position == [0.3, 0.6] and loss == 0
+	assert engine.num_iterations == 4
+
+
+def test_evaluates_concurrently():
+	lock = threading.Lock()
+	running = [0]
+	max_running = [0]
+
+	def evaluate(point):
+		with lock:
+			running[0] += 1
+			max_running[0] = max(max_running[0], running[0])
+		time.sleep(0.01)
+		with lock:
+			running[0] -= 1
+		return quadratic([0.2] * 4, [1] * 4)(point)
+	ParallelGradientDescent(4).calibrate(evaluate, 4, time_limit=1)
+	assert max_running[0] == 4
@@ -0,0 +1,47 @@
+import json
+import random
+
+import pytest
+
+# ParameterEstimator imports the simulator module, which needs simcal
+pytest.importorskip("simcal")
+import ParameterEstimator
+from test_analytic_model import make_workflow
+
+
+def synthetic_workflows(directory, num_workflows: int, seed: int = 0) -> list[str]:
+	# Chains whose makespans follow the regression (2 Gflop/s, 100 MB/s, 3 s per task), with some noise
+	rng = random.Random(seed)
+	paths = []
+	for i in range(num_workflows):
+		num_tasks = rng.randint(2, 10)
+		parents = {f"t{k}": [f"t{k - 1}"] if k else [] for k in range(num_tasks)}
+		runtimes = {task: rng.uniform(1, 50) for task in parents}
+		file_sizes = {task: (rng.uniform(0, 1e9), 0) for task in parents}
+		makespan = sum(runtimes.values()) * 1e9 / 2e9 + sum(s for s, _ in file_sizes.values()) / 1e8 + num_tasks * 3
+		path = directory / f"w{i}.json"
+		path.write_text(json.dumps(make_workflow(parents, runtimes, file_sizes=file_sizes,
+												 makespan=makespan * rng.uniform(0.9, 1.1))))
+		paths.append(str(path))
+	return paths
+
+
+@pytest.mark.parametrize("num_workflows", [6, 8, 12])
+def test_intervals_contain_the_estimates(tmp_path, num_workflows):
+	workflows = synthetic_workflows(tmp_path, 30)
+	for seed in range(4):
+		sample = random.Random(seed).sample(workflows, num_workflows)
+		for interval in ParameterEstimator.estimate(sample, 1e9, seed=seed).values():
+			if interval is not None:
+				assert interval["low"] <= interval["estimate"] <= interval["high"]
+
+
+def test_estimates_with_enough_workflows(tmp_path):
+	estimates = ParameterEstimator.estimate(synthetic_workflows(tmp_path, 30), 1e9, seed=0)
+	assert estimates["compute_speed"]["low"] <= 2e9 <= estimates["compute_speed"]["high"]
+	assert estimates["bandwidth"]["low"] <= 1e8 <= estimates["bandwidth"]["high"]
+
+
+def test_no_estimates_from_too_few_workflows(tmp_path):
+	workflows = synthetic_workflows(tmp_path, ParameterEstimator.MIN_WORKFLOWS - 1)
+	assert ParameterEstimator.estimate(workflows, 1e9, seed=0) == {name: None for name in ParameterEstimator.FEATURES}
@@ -0,0 +1,79 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# The store lives in the simulator module, which needs simcal
+pytest.importorskip("simcal")
+from Simulator import SimulationResultStore
+
+
+def test_bounded_store_compacts_its_file(tmp_path):
+	path = str(tmp_path / "cache.jsonl")
+	store = SimulationResultStore(path, max_bytes=100)
+	for i in range(50):
+		assert store.get_or_run(f"k{i}", lambda: "x" * 20) == "x" * 20
+	# The 5 most recent outputs are kept, and the file never gets much larger than twice the bound
+	assert list(store.outputs) == [f"k{i}" for i in range(45, 50)]
+	lines = (tmp_path / "cache.jsonl").read_text().splitlines()
+	assert len(lines) < 20 and store.file_bytes == sum(len(line) + 1 for line in lines)
+
+	reloaded = SimulationResultStore(path, max_bytes=100)
+	assert list(reloaded.outputs) == [f"k{i}" for i in range(45, 50)]
+	# A smaller bound drops the least recently used outputs, and compacts the file right away
+	smaller = SimulationResultStore(path, max_bytes=40)
+	assert list(smaller.outputs) == ["k48", "k49"]
+	assert [json.loads(line)["key"] for line in (tmp_path / "cache.jsonl").read_text().splitlines()] == ["k48", "k49"]
+
+
+def test_unbounded_store_keeps_appending(tmp_path):
+	path = str(tmp_path / "cache.jsonl")
+	store = SimulationResultStore(path)
+	for i in range(10):
+		store.get_or_run(f"k{i}", lambda: "out")
+	with open(path, "a") as f:
+		f.write('{"key":"trunc')
+	assert len(SimulationResultStore(path).outputs) == 10
+
+
+def run_concurrently(store, key, run, num_threads: int) -> list:
+	barrier = threading.Barrier(num_threads)
+
+	def get(_):
+		barrier.wait()
+		return store.get_or_run(key, run)
+	with ThreadPoolExecutor(num_threads) as pool:
+		return list(pool.map(get, range(num_threads)))
+
+
+def test_concurrent_requests_run_once(tmp_path):
+	store = SimulationResultStore(str(tmp_path / "cache.jsonl"))
+	runs = []
+
+	def run():
+		runs.append(None)
+		# Long enough for the other threads to wait for this simulation
+		time.sleep(0.2)
+		return "out"
+	assert run_concurrently(store, "k", run, 8) == ["out"] * 8
+	assert len(runs) == 1 and (store.num_misses, store.num_hits) == (1, 7)
+	assert not store.in_flight
+
+
+def test_failed_runs_are_not_stored(tmp_path):
+	path = str(tmp_path / "cache.jsonl")
+	store = SimulationResultStore(path)
+	outputs = iter(["", "out"])
+
+	def run():
+		time.sleep(0.2)
+		return next(outputs)
+	# The waiting threads retry after the first simulation fails, and one of them runs it again
+	assert sorted(run_concurrently(store, "k", run, 8)) == [""] + ["out"] * 7
+	assert store.num_misses == 2
+	assert [json.loads(line)["key"] for line in open(path)] == ["k"]
+
+	assert store.get_or_run("failed", lambda: "") == ""
+	assert "failed" not in store.outputs and "failed" not in SimulationResultStore(path).outputs
@@ -0,0 +1,111 @@
+import copy
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+# The simulator module needs simcal
+pytest.importorskip("simcal")
+import Simulator
+from Util import WorkflowResult
+
+
+def test_read_task_output(tmp_path):
+	# Real durations, then simulated ones, as native float64s
+	path = tmp_path / "out.tasks"
+	real, simulated = [1.5, 2.0, 1e-9], [3.25, 0.0, 1e12]
+	path.write_bytes(np.array(real + simulated, dtype=np.float64).tobytes())
+	real_durations, simulated_durations = Simulator.read_task_output(str(path), 3)
+	assert real_durations.tolist() == real and simulated_durations.tolist() == simulated
+
+	result = WorkflowResult.from_arrays({"real_makespan": 10, "simulated_makespan": 12}, ("a", "b", "c"),
+										real_durations, simulated_durations)
+	assert result["tasks"]["c"] == {"real_duration": 1e-9, "simulated_duration": 1e12}
+	assert result.to_dict()["tasks"]["a"] == {"real_duration": 1.5, "simulated_duration": 3.25}
+
+
+@pytest.mark.parametrize("num_bytes", [0, 8 * 5, 8 * 7, 8 * 6 + 4])
+def test_read_task_output_of_the_wrong_size(tmp_path, num_bytes):
+	path = tmp_path / "out.tasks"
+	path.write_bytes(bytes(num_bytes))
+	with pytest.raises(Exception, match="Expected 3 task durations"):
+		Simulator.read_task_output(str(path), 3)
+
+
+def test_run_batch_passes_the_batch_on_stdin(monkeypatch):
+	simulator = Simulator.Simulator("all_bare_metal", "submit_only", "one_link", in_process=False)
+	calibrations = []
+	for latency in ["1us", "2us", "3us"]:
+		calibration = copy.deepcopy(Simulator.template_json_input)
+		calibration["network_topology_scheme_parameters"]["one_link"]["link_lat"] = latency
+		calibrations.append(calibration)
+	calls = []
+
+	def run_simulator(env, cmdargs, std_in=None, batch=False):
+		calls.append((cmdargs, std_in, batch))
+		# The second simulation failed
+		return '{"simulated_makespan":1}\nnull\n{"simulated_makespan":3}\n'
+	monkeypatch.setattr(simulator, "_run_simulator", run_simulator)
+
+	outputs = simulator.run_batch(None, "/data/w.json", calibrations, {"output_level": "makespan"})
+	assert outputs == ['{"simulated_makespan":1}\n', "", '{"simulated_makespan":3}\n']
+	[(cmdargs, std_in, batch)] = calls
+	assert cmdargs[-1] == "-" and batch
+	# The workflow is given once, and each element is the rest of a JSON input
+	batch_input = json.loads(std_in)
+	assert batch_input["workflow"]["file"] == "/data/w.json"
+	assert [element["network_topology_scheme_parameters"]["one_link"]["link_lat"]
+			for element in batch_input["batch"]] == ["1us", "2us", "3us"]
+	assert all("workflow" not in element and element["output_level"] == "makespan"
+			   for element in batch_input["batch"])
+	with pytest.raises(Simulator.SimulationFailed):
+		Simulator.Simulator.parse_output("/data/w.json", outputs[1])
+
+
+def run_concurrently(function, num_threads: int) -> list:
+	# Calls function(i) from threads that start together
+	barrier = threading.Barrier(num_threads)
+
+	def call(i):
+		barrier.wait()
+		return function(i)
+	with ThreadPoolExecutor(num_threads) as pool:
+		return list(pool.map(call, range(num_threads)))
+
+
+def test_batcher_groups_concurrent_requests(monkeypatch):
+	simulator = Simulator.Simulator("all_bare_metal", "submit_only", "one_link", in_process=False)
+	batches = []
+
+	def run_batch(env, workflow, calibrations, output_options=None):
+		batches.append((workflow, list(calibrations)))
+		return [f"{workflow}:{calibration['i']}\n" for calibration in calibrations]
+	monkeypatch.setattr(simulator, "run_batch", run_batch)
+	batcher = Simulator.SimulationBatcher(simulator, max_batch_size=4, max_wait=5)
+
+	outputs = run_concurrently(lambda i: batcher.run(f"w{i % 2}.json", {"i": i}), 8)
+	# Each thread gets the output of its calibration, from full batches (one per workflow and 4 requests)
+	assert outputs == [f"w{i % 2}.json:{i}\n" for i in range(8)]
+	assert sorted((workflow, len(calibrations)) for workflow, calibrations in batches) == \
+		[("w0.json", 4), ("w1.json", 4)]
+	assert not batcher.pending
+
+
+def test_batcher_reports_failed_batches_to_all_requests(monkeypatch):
+	simulator = Simulator.Simulator("all_bare_metal", "submit_only", "one_link", in_process=False)
+
+	def run_batch(env, workflow, calibrations, output_options=None):
+		raise RuntimeError("simulator crashed")
+	monkeypatch.setattr(simulator, "run_batch", run_batch)
+	batcher = Simulator.SimulationBatcher(simulator, max_batch_size=3, max_wait=5)
+
+	def run(i):
+		try:
+			return batcher.run("w.json", {"i": i})
+		except Exception as error:
+			return str(error)
+	outputs = run_concurrently(run, 3)
+	# The thread that ran the batch gets its error, the others a failed batch
+	assert sorted(outputs) == ["Batched simulation of w.json failed"] * 2 + ["simulator crashed"]
@@ -0,0 +1,147 @@
+import gc
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+# Util imports the simulator and calibrator modules, which need simcal
+pytest.importorskip("simcal")
+import Util
+from Simulator import Simulator
+
+
+def make_experiment_set() -> Util.ExperimentSet:
+	return Util.ExperimentSet(Simulator("all_bare_metal", "submit_only", "one_link"), "grid", "makespan",
+							  "average_error", 10, 1)
+
+
+def test_workflow_catalog_is_scoped_to_the_experiment_set():
+	workflows = [[f"/w/{i}-{j}.json" for j in range(2)] for i in range(4)]
+	experiment_set = make_experiment_set()
+	experiment_set.add_experiment(Util.WorkflowSetSpec().set_workflows(workflows[:2]),
+								  [Util.WorkflowSetSpec().set_workflows(workflows)])
+	experiment_set.add_experiment(Util.WorkflowSetSpec().set_workflows(workflows[2:]),
+								  [Util.WorkflowSetSpec().set_workflows(workflows)])
+	specs = [spec for xp in experiment_set.experiments for spec in [xp.training_set_spec, *xp.evaluation_set_specs]]
+	assert all(spec.catalog is experiment_set.catalog for spec in specs)
+	assert len(experiment_set.catalog) == 8
+	# Paths are shared by the specs, and the specs' workflows survive pickling
+	assert specs[0].workflows[0][0] is specs[1].workflows[0][0]
+	for xp in experiment_set.experiments:
+		xp.evaluation_makespans = [{workflows[0][0]: Util.WorkflowResult(10, 11, ["a", "b"], [1, 2], [3, 4])}]
+	unpickled = pickle.loads(pickle.dumps(experiment_set))
+	assert [xp.training_set_spec.workflows for xp in unpickled.experiments] == [workflows[:2], workflows[2:]]
+	assert all(spec.catalog is unpickled.catalog
+			   for xp in unpickled.experiments for spec in [xp.training_set_spec, *xp.evaluation_set_specs])
+	# Results for the same workflow share their task IDs
+	a, b = unpickled.experiments
+	assert a.evaluation_makespans[0][workflows[0][0]].task_ids is b.evaluation_makespans[0][workflows[0][0]].task_ids
+
+	# Nothing process-wide keeps the set's catalog alive
+	del experiment_set, unpickled, specs, a, b, xp
+	gc.collect()
+	assert not any(isinstance(obj, Util.WorkflowCatalog) and len(obj) == 8 for obj in gc.get_objects())
+
+
+def configuration_groups(num_configurations: int) -> list:
+	# Repeat trials of configurations that differ in their number of nodes
+	return [[f"/w/chain-100-10-1.0-1000-cascadelake-{n}-{trial}-0.json" for trial in range(2)]
+			for n in range(num_configurations)]
+
+
+def test_make_folds():
+	groups = configuration_groups(7)
+	folds = Util.make_folds(groups, 3, seed=1)
+	# Folds are balanced, disjoint and cover all configurations, whose trials stay together
+	assert sorted(len(fold) for fold in folds) == [2, 2, 3]
+	assert sorted(group for fold in folds for group in fold) == groups
+	# The same folds for the same seed, whatever the order of the configurations
+	assert Util.make_folds(groups[::-1], 3, seed=1) == folds
+	assert any(Util.make_folds(groups, 3, seed=seed) != folds for seed in range(2, 10))
+	for num_folds in [1, 8]:
+		with pytest.raises(Exception, match=f"Cannot make {num_folds} folds"):
+			Util.make_folds(groups, num_folds)
+
+
+def test_add_cross_validation():
+	groups = configuration_groups(5)
+	experiment_set = make_experiment_set()
+	experiment_set.add_cross_validation(Util.WorkflowSetSpec().set_workflows(groups), 3, seed=4)
+	folds = Util.make_folds(groups, 3, seed=4)
+	# One experiment per fold, evaluated on the fold and calibrated on the others
+	assert len(experiment_set.experiments) == 3 and experiment_set.num_parallel_calibrations == 3
+	for xp, fold in zip(experiment_set.experiments, folds):
+		[evaluation_set_spec] = xp.evaluation_set_specs
+		assert evaluation_set_spec.workflows == fold
+		assert sorted(xp.training_set_spec.workflows + fold) == groups
+		assert sorted(xp.training_set_spec.num_nodes_values + evaluation_set_spec.num_nodes_values) == list(range(5))
+	assert experiment_set.cross_validation["folds"] == [[w for group in fold for w in group] for fold in folds]
+
+	for i, xp in enumerate(experiment_set.experiments):
+		xp.calibration_loss = 0.1 * i
+		xp.evaluation_losses = [[0.2, 0.4, 0.9][i]]
+	experiment_set.summarize_cross_validation()
+	summary = experiment_set.cross_validation
+	assert summary["fold_losses"] == [0.2, 0.4, 0.9] and summary["max_loss"] == 0.9
+	assert summary["mean_loss"] == pytest.approx(0.5) and summary["std_loss"] == pytest.approx(0.2943920288775949)
+
+
+def test_stratified_order():
+	# 3 strata (numbers of nodes) of 4 trials
+	workflows = [f"/w/chain-100-10-1.0-1000-cascadelake-{n}-{trial}-0.json" for n in range(3) for trial in range(4)]
+	order = Util.stratified_order(workflows, random.Random(3))
+	assert sorted(order) == workflows and Util.stratified_order(workflows, random.Random(3)) == order
+	# Every round covers each stratum once
+	for i in range(0, len(order), 3):
+		assert sorted(w.split("-")[6] for w in order[i:i + 3]) == ["0", "1", "2"]
+
+
+def test_bootstrap_interval():
+	rng = np.random.default_rng(0)
+	assert Util.bootstrap_interval([0.3] * 10, 0.95, rng) == pytest.approx((0.3, 0.3))
+	losses = rng.uniform(0, 1, 400)
+	low, high = Util.bootstrap_interval(losses[:20], 0.95, rng)
+	assert low < losses[:20].mean() < high
+	# More samples, a narrower interval
+	narrower_low, narrower_high = Util.bootstrap_interval(losses, 0.95, rng)
+	assert narrower_low < losses.mean() < narrower_high and narrower_high - narrower_low < (high - low) / 2
+
+
+def sequential_evaluation(monkeypatch, workflow_losses: dict, loss_aggregator: str = "average_error", **kwargs):
+	simulator = Simulator("all_bare_metal", "submit_only", "one_link")
+	simulated = []
+
+	def simulate(env, workflow, calibration, output_options=None):
+		simulated.append(workflow)
+		return Util.WorkflowResult(10, 10 * (1 + workflow_losses[workflow]))
+	monkeypatch.setattr(simulator, "simulate", simulate)
+	estimate, interval = Util.sequential_evaluation([[w] for w in workflow_losses], simulator, {}, "makespan",
+													loss_aggregator, seed=5, **kwargs)
+	assert interval["workflows"] == simulated and interval["num_simulated"] == len(simulated)
+	assert interval["num_workflows"] == len(workflow_losses)
+	return estimate, interval
+
+
+def test_sequential_evaluation_stops_when_the_interval_is_narrow(monkeypatch):
+	workflows = [f"/w/chain-100-10-1.0-1000-cascadelake-{n}-{trial}-0.json" for n in range(4) for trial in range(50)]
+	# The same loss for all workflows: the minimum number of simulations is enough
+	estimate, interval = sequential_evaluation(monkeypatch, {w: 0.25 for w in workflows}, tolerance=0.01)
+	assert estimate == pytest.approx(0.25) and interval["num_simulated"] == 10
+	assert interval["high"] - interval["low"] <= 0.01
+	# Spread out losses take more simulations, but not all of them
+	spread = {w: i % 2 for i, w in enumerate(workflows)}
+	estimate, interval = sequential_evaluation(monkeypatch, spread, tolerance=0.3)
+	assert 20 < interval["num_simulated"] < len(workflows) and interval["high"] - interval["low"] <= 0.3
+	assert interval["low"] <= estimate <= interval["high"]
+
+
+def test_sequential_evaluation_of_all_workflows_is_exact(monkeypatch):
+	workflow_losses = {f"/w/chain-100-10-1.0-1000-cascadelake-{n}-0-0.json": n / 10 for n in range(30)}
+	# A tolerance that can't be met
+	estimate, interval = sequential_evaluation(monkeypatch, workflow_losses, tolerance=1e-6)
+	assert interval["num_simulated"] == 30 and estimate == pytest.approx(1.45)
+	assert interval["low"] == interval["high"] == estimate
+	# Max-aggregated losses are never estimated from a sample
+	estimate, interval = sequential_evaluation(monkeypatch, workflow_losses, "max_error", tolerance=1)
+	assert interval["num_simulated"] == 30 and estimate == pytest.approx(2.9)
@@ -0,0 +1,60 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+import WorkflowPack
+
+
+def test_invalid_pack_falls_back_to_the_json_file(tmp_path):
+	(tmp_path / "a.json").write_text(json.dumps({"name": "a"}))
+	pack = tmp_path / WorkflowPack.PACK_NAME
+	for content in [b"WFPACK 2 2\n{}", b"WFPACK 1 40\n{\"compression\":", b"garbage\n"]:
+		pack.write_bytes(content)
+		assert WorkflowPack.find_in_pack(str(tmp_path / "a.json")) is None
+		assert WorkflowPack.load_workflow_json(str(tmp_path / "a.json")) == {"name": "a"}
+
+
+def make_workflow(name: str, runtime: float, command: str) -> dict:
+	task = {"id": "t1", "runtimeInSeconds": runtime, "coreCount": 1, "command": {"program": command}}
+	return {"name": name, "description": "dropped", "schemaVersion": "1.5",
+			"workflow": {"execution": {"makespanInSeconds": runtime, "tasks": [task], "machines": []}}}
+
+
+@pytest.mark.parametrize("compression_level", [None, 3])
+def test_pack_round_trip(tmp_path, compression_level):
+	if compression_level is not None:
+		pytest.importorskip("zstandard")
+	workflows = {"a.json": make_workflow("w", 10, "x"), "b.json": make_workflow("w", 10, "y"),
+				 "c.json": make_workflow("c", 20, "z")}
+	for name, workflow in workflows.items():
+		(tmp_path / name).write_text(json.dumps(workflow))
+	pack_path = WorkflowPack.write_pack(str(tmp_path), compression_level=compression_level)
+	assert pack_path == str(tmp_path / WorkflowPack.PACK_NAME)
+
+	# Workflows read as their compacted content, from the pack
+	for name, workflow in workflows.items():
+		path = str(tmp_path / name)
+		assert WorkflowPack.find_in_pack(path) == (pack_path, name)
+		assert WorkflowPack.load_workflow_json(path) == WorkflowPack.compact_workflow(workflow)
+		assert "command" not in WorkflowPack.load_workflow_json(path)["workflow"]["execution"]["tasks"][0]
+	# a and b only differ in dropped fields: they are stored once, and read the same
+	members = WorkflowPack.read_index(pack_path)[0]["members"]
+	assert members["a.json"]["offset"] == members["b.json"]["offset"]
+	content = json.dumps(WorkflowPack.compact_workflow(workflows["a.json"]), separators=(',', ':')).encode()
+	assert WorkflowPack.workflow_fingerprint(str(tmp_path / "b.json")) == hashlib.md5(content).hexdigest()
+	assert sorted(WorkflowPack.packed_workflows(str(tmp_path / "[ab].json"))) == \
+		[str(tmp_path / "a.json"), str(tmp_path / "b.json")]
+
+	# Deleted files are still read from the pack, explicitly or not
+	(tmp_path / "a.json").unlink()
+	assert WorkflowPack.load_workflow_json(str(tmp_path / "a.json"))["name"] == "w"
+	assert WorkflowPack.load_workflow_json(pack_path + "#a.json")["name"] == "w"
+	# Changed files are read from the JSON file, unless the pack member is asked for
+	(tmp_path / "c.json").write_text(json.dumps(make_workflow("c2", 20, "z")))
+	assert WorkflowPack.find_in_pack(str(tmp_path / "c.json")) is None
+	assert WorkflowPack.load_workflow_json(str(tmp_path / "c.json"))["name"] == "c2"
+	assert WorkflowPack.load_workflow_json(pack_path + "#c.json")["name"] == "c"
+	stat = os.stat(tmp_path / "c.json")
+	assert WorkflowPack.workflow_fingerprint(str(tmp_path / "c.json")) == f"{stat.st_size}-{stat.st_mtime_ns}"
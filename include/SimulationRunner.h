@@ -0,0 +1,51 @@
+#ifndef WORKFLOW_SIMULATOR_FOR_CALIBRATION_SIMULATIONRUNNER_H
+#define WORKFLOW_SIMULATOR_FOR_CALIBRATION_SIMULATIONRUNNER_H
+
+#include <functional>
+#include <set>
+#include <string>
+#include <vector>
+#include <wrench-dev.h>
+#include <boost/json.hpp>
+
+/**
+ * All implemented schemes as ugly globals
+ */
+extern std::set<std::string> implemented_compute_service_schemes;
+extern std::set<std::string> implemented_storage_service_schemes;
+extern std::set<std::string> implemented_network_topology_schemes;
+extern std::set<std::string> implemented_error_computation_schemes;
+
+/**
+ * @brief A workflow, read and parsed once, along with what the output needs from its JSON file
+ */
+struct WorkflowInput {
+    std::string json_string;
+    std::string reference_flops;
+    std::shared_ptr<wrench::Workflow> workflow;
+    boost::json::object json_workflow;
+    double observed_real_makespan;
+    unsigned long num_compute_hosts;
+};
+
+std::string readStringFromFile(const std::string& filepath);
+
+boost::json::object readJSONFromFile(const std::string& filepath);
+
+WorkflowInput read_workflow(boost::json::object &json_input);
+
+void create_workflow(WorkflowInput &workflow_input);
+
+boost::json::object create_output(boost::json::object &json_input, WorkflowInput &workflow_input);
+
+bool simulate(std::shared_ptr<wrench::Simulation> simulation,
+              boost::json::object &json_input,
+              WorkflowInput &workflow_input,
+              boost::json::object &json_output);
+
+std::vector<std::string> simulate_forked(const std::function<std::shared_ptr<wrench::Simulation>()> &get_simulation,
+                                         std::vector<boost::json::object> &json_inputs,
+                                         WorkflowInput &workflow_input,
+                                         unsigned int max_processes = 0);
+
+#endif //WORKFLOW_SIMULATOR_FOR_CALIBRATION_SIMULATIONRUNNER_H
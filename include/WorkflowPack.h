@@ -0,0 +1,26 @@
+#ifndef WORKFLOW_SIMULATOR_FOR_CALIBRATION_WORKFLOWPACK_H
+#define WORKFLOW_SIMULATOR_FOR_CALIBRATION_WORKFLOWPACK_H
+
+#include <string>
+
+/**
+ * Reading workflows from the compact workflow packs written by calibration/WorkflowPack.py
+ * (see that file for the format)
+ */
+
+/**
+ * @brief Name of the pack that readers look for in a workflow's directory
+ */
+extern const std::string workflow_pack_name;
+
+/**
+ * @brief Read a workflow from a pack, if it should be read from one
+ * @param filepath: a "<pack>.wfpack#member" path (which must be readable: the simulator exits otherwise), or the
+ *        path of a workflow JSON file (which is read from the pack of its directory, if there is a valid one that
+ *        has it and the file hasn't changed since it was packed)
+ * @param content: set to the workflow's (JSON) content if it was read from a pack
+ * @return true if the workflow was read from a pack, false if it should be read from the file
+ */
+bool readWorkflowFromPack(const std::string &filepath, std::string &content);
+
+#endif //WORKFLOW_SIMULATOR_FOR_CALIBRATION_WORKFLOWPACK_H
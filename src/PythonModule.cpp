@@ -0,0 +1,168 @@
+/**
+ ** Python extension module that runs simulations in-process (see calibration/Simulator.py),
+ ** rather than in a new simulator process that reads its input and writes its output as JSON text.
+ ** SimGrid cannot be initialized twice in a process, so each simulation still runs in a forked
+ ** copy of the calling process, but workflows are read and parsed once per calling process.
+ **
+ ** Only call it from a single-threaded interpreter (calibration/Simulator.py calls it from a pool of
+ ** spawned worker processes): a forked child only has the thread that forked, and any lock another
+ ** thread held at that time (in the allocator, in a library, ...) stays locked in the child, which
+ ** then deadlocks when it initializes SimGrid and simulates.
+ **/
+
+#include <map>
+#include <mutex>
+#include <sys/stat.h>
+#include <pybind11/pybind11.h>
+#include <wrench-dev.h>
+
+#include "SimulationRunner.h"
+#include <boost/json.hpp>
+
+namespace py = pybind11;
+
+/**
+ * Parsed workflows, by workflow file and reference flops, along with the file's modification time
+ */
+static std::map<std::pair<std::string, std::string>, std::pair<long long, std::shared_ptr<WorkflowInput>>> workflow_cache;
+static std::mutex workflow_cache_mutex;
+
+static boost::json::value to_json(py::handle obj) {
+    if (obj.is_none()) {
+        return nullptr;
+    } else if (py::isinstance<py::bool_>(obj)) {
+        return obj.cast<bool>();
+    } else if (py::isinstance<py::int_>(obj)) {
+        return obj.cast<std::int64_t>();
+    } else if (py::isinstance<py::float_>(obj)) {
+        return obj.cast<double>();
+    } else if (py::isinstance<py::dict>(obj)) {
+        boost::json::object json_object;
+        for (auto item : obj.cast<py::dict>()) {
+            json_object[py::str(item.first).cast<std::string>()] = to_json(item.second);
+        }
+        return json_object;
+    } else if (py::isinstance<py::list>(obj) or py::isinstance<py::tuple>(obj)) {
+        boost::json::array json_array;
+        for (auto item : obj) {
+            json_array.push_back(to_json(item));
+        }
+        return json_array;
+    }
+    // Strings, and anything else (e.g., simcal parameter values) as its string representation
+    return boost::json::string(py::str(obj).cast<std::string>());
+}
+
+static py::object from_json(const boost::json::value &value) {
+    switch (value.kind()) {
+        case boost::json::kind::null:
+            return py::none();
+        case boost::json::kind::bool_:
+            return py::bool_(value.get_bool());
+        case boost::json::kind::int64:
+            return py::int_(value.get_int64());
+        case boost::json::kind::uint64:
+            return py::int_(value.get_uint64());
+        case boost::json::kind::double_:
+            return py::float_(value.get_double());
+        case boost::json::kind::string:
+            return py::str(std::string(value.get_string().c_str()));
+        case boost::json::kind::array: {
+            py::list list;
+            for (auto const &item : value.get_array()) {
+                list.append(from_json(item));
+            }
+            return list;
+        }
+        case boost::json::kind::object: {
+            py::dict dict;
+            for (auto const &item : value.get_object()) {
+                dict[py::str(std::string(item.key()))] = from_json(item.value());
+            }
+            return dict;
+        }
+    }
+    return py::none();
+}
+
+/**
+ * @brief Get the (cached) parsed workflow of a JSON input
+ */
+static std::shared_ptr<WorkflowInput> get_workflow(boost::json::object &json_input) {
+    auto workflow_spec = json_input["workflow"].as_object();
+    auto key = std::make_pair(boost::json::value_to<std::string>(workflow_spec["file"]),
+                              boost::json::value_to<std::string>(workflow_spec["reference_flops"]));
+    struct stat file_stat{};
+    long long mtime = 0;
+    if (stat(key.first.c_str(), &file_stat) == 0) {
+        mtime = static_cast<long long>(file_stat.st_mtim.tv_sec) * 1000000000LL + file_stat.st_mtim.tv_nsec;
+    }
+    std::lock_guard<std::mutex> lock(workflow_cache_mutex);
+    auto it = workflow_cache.find(key);
+    if (it != workflow_cache.end() and it->second.first == mtime) {
+        return it->second.second;
+    }
+    auto workflow_input = std::make_shared<WorkflowInput>(read_workflow(json_input));
+    workflow_cache[key] = std::make_pair(mtime, workflow_input);
+    return workflow_input;
+}
+
+/**
+ * @brief Called in each forked process: SimGrid is only ever initialized there
+ */
+static std::shared_ptr<wrench::Simulation> create_initialized_simulation() {
+    // Same arguments as calibration/Simulator.py gives the simulator
+    char arg0[] = "workflow-simulator-for-calibration";
+    char arg1[] = "--wrench-commport-pool-size=10000";
+    char *argv[] = {arg0, arg1, nullptr};
+    int argc = 2;
+    auto simulation = wrench::Simulation::createSimulation();
+    simulation->init(&argc, argv);
+    return simulation;
+}
+
+/**
+ * @brief Simulate one workflow for each JSON input (all with the same workflow spec)
+ */
+static py::list simulate_batch(const py::list &json_input_list, unsigned int max_processes) {
+    std::vector<boost::json::object> json_inputs;
+    for (auto json_input : json_input_list) {
+        json_inputs.push_back(to_json(json_input).as_object());
+    }
+    std::vector<std::string> outputs;
+    if (not json_inputs.empty()) {
+        // Other Python threads can run while we wait for the forked processes (but shouldn't exist when
+        // we fork, see above)
+        py::gil_scoped_release release;
+        auto workflow_input = get_workflow(json_inputs[0]);
+        outputs = simulate_forked(create_initialized_simulation, json_inputs, *workflow_input, max_processes);
+    }
+    py::list results;
+    for (auto const &output : outputs) {
+        results.append(from_json(boost::json::parse(output)));
+    }
+    return results;
+}
+
+static py::object simulate(const py::dict &json_input) {
+    py::list json_inputs;
+    json_inputs.append(json_input);
+    return simulate_batch(json_inputs, 1)[0];
+}
+
+static void clear_workflow_cache() {
+    std::lock_guard<std::mutex> lock(workflow_cache_mutex);
+    workflow_cache.clear();
+}
+
+PYBIND11_MODULE(workflow_simulator_for_calibration, m) {
+    m.doc() = "In-process backend of the workflow simulator for calibration";
+    m.def("simulate", &simulate, py::arg("json_input"),
+          "Simulate a workflow given a JSON input (as a dict); returns the JSON output (as a dict), "
+          "or None if the simulation failed");
+    m.def("simulate_batch", &simulate_batch, py::arg("json_inputs"), py::arg("max_processes") = 0,
+          "Simulate a workflow for each of the JSON inputs, which all have the same workflow spec, with up "
+          "to max_processes simulations at a time (0 for the number of hardware threads); returns their "
+          "JSON outputs (None for failed simulations)");
+    m.def("clear_workflow_cache", &clear_workflow_cache, "Forget all parsed workflows");
+}
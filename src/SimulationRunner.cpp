@@ -0,0 +1,624 @@
+/**
+ ** The simulation logic of the simulator: reading the workflow, creating the platform and
+ ** services, running the simulation, and creating the output. Used by the simulator's main
+ ** function and by the (optional) Python extension module.
+ **/
+
+#include <algorithm>
+#include <iostream>
+#include <sstream>
+#include <cerrno>
+#include <cmath>
+#include <limits>
+#include <thread>
+#include <poll.h>
+#include <sys/wait.h>
+#include <unistd.h>
+#include <wrench-dev.h>
+
+#include "UnitParser.h"
+#include "Controller.h"
+#include "SimulationRunner.h"
+#include "WorkflowPack.h"
+#include <boost/json.hpp>
+#include <PlatformCreator.h>
+
+#define NETWORK_TIMEOUT 100000000.0
+
+/**
+ * All implemented schemes as ugly globals
+ */
+std::set<std::string> implemented_compute_service_schemes = {"all_bare_metal", "htcondor_bare_metal"};
+std::set<std::string> implemented_storage_service_schemes = {"submit_only","submit_and_compute_hosts"};
+std::set<std::string> implemented_network_topology_schemes = {"one_link","one_and_then_many_links","many_links"};
+// Error computation schemes: relative makespan error, average/max relative task duration error
+std::set<std::string> implemented_error_computation_schemes = {"makespan", "average_runtimes", "max_runtimes"};
+
+
+
+/**
+ * @brief Helper function to read a whole file into a string (from a workflow pack, if
+ *        the file is packed: see WorkflowPack.h)
+ * @param filepath: the file path
+ * @return the file's content
+ */
+std::string readStringFromFile(const std::string& filepath) {
+
+    std::string packed_content;
+    if (readWorkflowFromPack(filepath, packed_content)) {
+        return packed_content;
+    }
+
+    // Open the file using ifstream
+    ifstream file(filepath);
+
+    // Check if the file was opened successfully
+    if (!file.is_open()) {
+	std::cerr << "Failed to open file: " << filepath << endl;
+        exit(1);
+    }
+
+    // Read the whole file into a string
+    std::string json_string((istreambuf_iterator<char>(file)),
+                       istreambuf_iterator<char>());
+    file.close();
+    return json_string;
+}
+
+/**
+ * @brief Helper function to read a JSON object from a file
+ * @param filepath: the file path
+ * @return a boost::json::object object
+ */
+boost::json::object readJSONFromFile(const std::string& filepath) {
+    // Parse string into an object
+    auto json_object = boost::json::parse(readStringFromFile(filepath)).as_object();
+    return json_object;
+}
+
+
+void determine_all_schemes(boost::json::object &json_input,
+                           std::string &compute_service_scheme,
+                           std::string &storage_service_scheme,
+                           std::string &network_topology_scheme) {
+    try {
+        compute_service_scheme = boost::json::value_to<std::string>(json_input["compute_service_scheme"]);
+    } catch (std::exception &e) {
+        throw std::invalid_argument("Invalid or missing compute_service_scheme specification in JSON input (" + std::string(e.what()) + ")");
+    }
+    if (implemented_compute_service_schemes.find(compute_service_scheme) == implemented_compute_service_schemes.end()) {
+        throw std::invalid_argument("unknown or unimplemented compute service scheme " + compute_service_scheme);
+    }
+    try {
+        storage_service_scheme = boost::json::value_to<std::string>(json_input["storage_service_scheme"]);
+    } catch (std::exception &e) {
+        throw std::invalid_argument("Invalid or missing storage_service_scheme specification in JSON input (" + std::string(e.what()) +")");
+    }
+    if (implemented_storage_service_schemes.find(storage_service_scheme) == implemented_storage_service_schemes.end()) {
+        throw std::invalid_argument("unknown or unimplemented storage service scheme " + storage_service_scheme + ")");
+    }
+    try {
+        network_topology_scheme = boost::json::value_to<std::string>(json_input["network_topology_scheme"]);
+    } catch (std::exception &e) {
+        throw std::invalid_argument("Invalid or missing network_topology_scheme specification in JSON input (" + std::string(e.what()) + ")");
+    }
+    if (implemented_network_topology_schemes.find(network_topology_scheme) == implemented_network_topology_schemes.end()) {
+        throw std::invalid_argument("unknown or unimplemented network topology scheme " + network_topology_scheme);
+    }
+}
+
+
+
+/**
+ * @brief Read and parse the workflow file specified in the JSON input (without creating any WRENCH object)
+ *
+ * @param json_input: the JSON input
+ * @return the workflow input, whose WRENCH workflow is created by create_workflow()
+ */
+WorkflowInput read_workflow(boost::json::object &json_input) {
+    std::string workflow_file;
+    std::string reference_flops;
+    try {
+        workflow_file = boost::json::value_to<std::string>(json_input["workflow"].as_object()["file"]);
+        reference_flops = boost::json::value_to<std::string>(json_input["workflow"].as_object()["reference_flops"]);
+    } catch (std::exception &e) {
+        throw std::invalid_argument("Invalid or missing workflow file or reference_flops specification in JSON input (" +
+                                    std::string(e.what()) + ")");
+    }
+    // Parse the workflow's JSON file to find the real observed makespan
+    WorkflowInput workflow_input;
+    workflow_input.reference_flops = reference_flops;
+    workflow_input.json_string = readStringFromFile(workflow_file);
+    try {
+        workflow_input.json_workflow = boost::json::parse(workflow_input.json_string).as_object();
+        workflow_input.observed_real_makespan = boost::json::value_to<double>(
+                workflow_input.json_workflow["workflow"].as_object()["execution"].as_object()["makespanInSeconds"]);
+        workflow_input.num_compute_hosts = workflow_input.json_workflow["workflow"].as_object()["execution"].as_object()["machines"].as_array().size();
+    } catch (std::exception &e) {
+        throw;
+    }
+    return workflow_input;
+}
+
+/**
+ * @brief Create the WRENCH workflow of a workflow input
+ *
+ * @param workflow_input: the workflow input
+ */
+void create_workflow(WorkflowInput &workflow_input) {
+    // Build the WRENCH workflow from the content we've already read, rather than reading the file again
+    workflow_input.workflow = wrench::WfCommonsWorkflowParser::createWorkflowFromJSONString(
+            workflow_input.json_string, workflow_input.reference_flops);
+}
+
+
+
+void process_hostnames(std::string &submit_host_name,
+                       std::vector<std::string> &compute_host_names) {
+    // Gather all relevant hostnames and perform sanity checks
+    for (const auto &h : simgrid::s4u::Engine::get_instance()->get_all_hosts()) {
+        if (std::string(h->get_property("type")) == "submit") {
+            if (not submit_host_name.empty()) {
+                throw std::invalid_argument("More than one host of type 'submit' in the platform description");
+            } else {
+                submit_host_name = h->get_cname();
+            }
+        }
+        if (std::string(h->get_property("type")) == "compute") {
+            compute_host_names.emplace_back(h->get_cname());
+        }
+    }
+    if (compute_host_names.empty()) {
+        throw std::invalid_argument("There should be a host of type 'submit' in the platform description");
+    }
+    if (compute_host_names.empty()) {
+        throw std::invalid_argument("There should be at least one host of type 'slurm_compute' in the platform description");
+    }
+
+}
+
+wrench::WRENCH_PROPERTY_COLLECTION_TYPE get_properties(boost::json::object &json_input,
+                                                       std::string scheme_category,
+                                                       std::string scheme,
+                                                       std::string properties_key) {
+
+    wrench::WRENCH_PROPERTY_COLLECTION_TYPE property_list;
+    auto specs = json_input[scheme_category].as_object()[scheme].as_object();
+
+    if (specs.contains(properties_key)) {
+        for (const auto &prop : specs[properties_key].as_object()) {
+#if (BOOST_VERSION >= 108000)
+            auto property = wrench::ServiceProperty::translateString(prop.key());
+#else
+            auto property = wrench::ServiceProperty::translateString(prop.key().to_string());
+#endif
+            std::string property_value = boost::json::value_to<std::string>(prop.value());
+            property_list[property] = property_value;
+        }
+    }
+    return property_list;
+}
+
+wrench::WRENCH_MESSAGE_PAYLOAD_COLLECTION_TYPE get_payloads(boost::json::object &json_input,
+                                                           std::string scheme_category,
+                                                           std::string scheme,
+                                                           std::string payloads_key) {
+
+
+    wrench::WRENCH_MESSAGE_PAYLOAD_COLLECTION_TYPE payload_list;
+    auto specs = json_input[scheme_category].as_object()[scheme].as_object();
+
+    if (specs.contains(payloads_key)) {
+        for (const auto &pl : specs[payloads_key].as_object()) {
+#if (BOOST_VERSION >= 108000)
+            auto payload = wrench::ServiceMessagePayload::translateString(pl.key());
+#else
+
+            auto payload = wrench::ServiceMessagePayload::translateString(pl.key().to_string());
+#endif
+            double payload_value =  std::strtod(boost::json::value_to<std::string>(pl.value()).c_str(), nullptr);
+            payload_list[payload] = payload_value;
+        }
+    }
+    return payload_list;
+}
+
+/**
+ * @brief Build the output of a completed simulation
+ *
+ * @param json_input: the JSON input
+ * @param workflow_input: the simulated workflow
+ * @return the JSON output: real and simulated makespans, the error for the JSON input's
+ *         error_computation_scheme (if any), and task durations unless the JSON input's
+ *         output_level is "makespan". With the "binary" output level, task durations are instead
+ *         written to the JSON input's task_output_file as two packed arrays of doubles (real, then
+ *         simulated durations) in the order of the tasks in the workflow file
+ */
+boost::json::object create_output(boost::json::object &json_input, WorkflowInput &workflow_input) {
+    auto workflow = workflow_input.workflow;
+    double simulated_makespan = workflow->getCompletionDate();
+
+    std::string output_level = "tasks";
+    if (json_input.contains("output_level")) {
+        try {
+            output_level = boost::json::value_to<std::string>(json_input["output_level"]);
+        } catch (std::exception &e) {
+            throw std::invalid_argument("Invalid output_level specification in JSON input (" + std::string(e.what()) + ")");
+        }
+        if (output_level != "makespan" and output_level != "tasks" and output_level != "binary") {
+            throw std::invalid_argument("unknown output level " + output_level + " (should be 'makespan', 'tasks', or 'binary')");
+        }
+    }
+    std::string task_output_file;
+    if (output_level == "binary") {
+        try {
+            task_output_file = boost::json::value_to<std::string>(json_input["task_output_file"]);
+        } catch (std::exception &e) {
+            throw std::invalid_argument("Invalid or missing task_output_file specification in JSON input (" + std::string(e.what()) + ")");
+        }
+    }
+    std::string error_computation_scheme;
+    if (json_input.contains("error_computation_scheme")) {
+        try {
+            error_computation_scheme = boost::json::value_to<std::string>(json_input["error_computation_scheme"]);
+        } catch (std::exception &e) {
+            throw std::invalid_argument("Invalid error_computation_scheme specification in JSON input (" + std::string(e.what()) + ")");
+        }
+        if (implemented_error_computation_schemes.find(error_computation_scheme) == implemented_error_computation_schemes.end()) {
+            throw std::invalid_argument("unknown or unimplemented error computation scheme " + error_computation_scheme);
+        }
+    }
+
+    // Create output json
+    boost::json::object json_output;
+    json_output["real_makespan"] = workflow_input.observed_real_makespan;
+    json_output["simulated_makespan"] = simulated_makespan;
+    double makespan_error = std::abs(workflow_input.observed_real_makespan - simulated_makespan) / workflow_input.observed_real_makespan;
+    json_output["makespan_error"] = makespan_error;
+
+    bool output_tasks = (output_level == "tasks");
+    bool output_binary = (output_level == "binary");
+    bool task_error = (error_computation_scheme == "average_runtimes" or error_computation_scheme == "max_runtimes");
+    if (not output_tasks and not output_binary and not task_error) {
+        if (not error_computation_scheme.empty()) {
+            json_output["error_computation_scheme"] = error_computation_scheme;
+            json_output["error"] = makespan_error;
+        }
+        return json_output;
+    }
+
+    boost::json::object json_tasks;
+    std::vector<double> real_task_durations, simulated_task_durations;
+    double sum_task_error = 0.0;
+    double max_task_error = 0.0;
+    unsigned long num_tasks = 0;
+    for (auto const &task_spec : workflow_input.json_workflow["workflow"].as_object()["execution"].as_object()["tasks"].as_array()) {
+        auto real_task_id = std::string(task_spec.as_object().at("id").as_string().c_str());
+        double real_task_duration;
+        if (task_spec.as_object().contains("syntheticRuntimeInSecond")) {
+            if (task_spec.as_object().at("syntheticRuntimeInSecond").is_double()) {
+                real_task_duration = task_spec.as_object().at("syntheticRuntimeInSecond").as_double();
+            } else if (task_spec.as_object().at("syntheticRuntimeInSecond").is_int64()) {
+                real_task_duration = static_cast<double>(task_spec.as_object().at("syntheticRuntimeInSecond").as_int64());
+            } else {
+                throw std::runtime_error("In WfFormat, syntheticRuntimeInSecond is not a valid number");
+            }
+        } else {
+            if (task_spec.as_object().at("runtimeInSeconds").is_double()) {
+                real_task_duration = task_spec.as_object().at("runtimeInSeconds").as_double();
+            } else if (task_spec.as_object().at("runtimeInSeconds").is_int64()) {
+                real_task_duration = static_cast<double>(task_spec.as_object().at("runtimeInSeconds").as_int64());
+            } else {
+                throw std::runtime_error("In WfFormat, runtimeInSeconds is not a valid number");
+            }
+        }
+        auto task = workflow->getTaskByID(real_task_id);
+        double simulated_task_duration = task->getExecutionHistory().top().task_end - task->getExecutionHistory().top().task_start;
+        double relative_error = std::abs(real_task_duration - simulated_task_duration) / real_task_duration;
+        sum_task_error += relative_error;
+        max_task_error = std::max(max_task_error, relative_error);
+        num_tasks++;
+        if (output_tasks) {
+            json_tasks[real_task_id] = {{"real_duration", real_task_duration},
+                                        {"simulated_duration", simulated_task_duration}};
+        } else if (output_binary) {
+            real_task_durations.push_back(real_task_duration);
+            simulated_task_durations.push_back(simulated_task_duration);
+        }
+    }
+    if (output_tasks) {
+        json_output["tasks"] = json_tasks;
+    } else if (output_binary) {
+        std::ofstream file(task_output_file, std::ios::binary | std::ios::trunc);
+        file.write(reinterpret_cast<const char *>(real_task_durations.data()), num_tasks * sizeof(double));
+        file.write(reinterpret_cast<const char *>(simulated_task_durations.data()), num_tasks * sizeof(double));
+        file.close();
+        if (file.fail()) {
+            throw std::runtime_error("Cannot write task durations to " + task_output_file);
+        }
+        json_output["num_tasks"] = num_tasks;
+    }
+
+    if (not error_computation_scheme.empty()) {
+        json_output["error_computation_scheme"] = error_computation_scheme;
+        if (error_computation_scheme == "makespan") {
+            json_output["error"] = makespan_error;
+        } else if (num_tasks == 0) {
+            json_output["error"] = std::numeric_limits<double>::infinity();
+        } else if (error_computation_scheme == "average_runtimes") {
+            json_output["error"] = sum_task_error / static_cast<double>(num_tasks);
+        } else {
+            json_output["error"] = max_task_error;
+        }
+    }
+    return json_output;
+}
+
+/**
+ * @brief Run one simulation of a workflow (can only be called once per process)
+ *
+ * @param simulation: the initialized simulation
+ * @param json_input: the JSON input
+ * @param workflow_input: the workflow
+ * @param json_output: set to the JSON output
+ * @return false if the simulation failed, true otherwise
+ */
+bool simulate(std::shared_ptr<wrench::Simulation> simulation,
+              boost::json::object &json_input,
+              WorkflowInput &workflow_input,
+              boost::json::object &json_output) {
+    auto workflow = workflow_input.workflow;
+    std::string compute_service_scheme, storage_service_scheme, network_topology_scheme;
+    std::string submit_host_name;
+    std::vector<std::string> compute_host_names;
+
+    if (workflow_input.num_compute_hosts <= 0) {
+        throw std::invalid_argument("The Workflow JSON does not specify 'machines', and thus we can't determine "
+                                    "the number of compute hosts used");
+    }
+    // Determine schemes in use
+    determine_all_schemes(json_input, compute_service_scheme, storage_service_scheme, network_topology_scheme);
+    // Create the platform
+    PlatformCreator platform_creator(json_input, workflow_input.num_compute_hosts);
+    simulation->instantiatePlatform(platform_creator);
+    // Gather all relevant hostnames and perform sanity checks
+    process_hostnames(submit_host_name, compute_host_names);
+
+    // Create relevant storage services
+
+    // There is always a storage service on the submit_node
+    auto submit_node_storage_service =
+            simulation->add(wrench::SimpleStorageService::createSimpleStorageService(
+                    submit_host_name,
+                    {{"/"}},
+                    get_properties(json_input,
+                                   "storage_service_scheme_parameters",
+                                   storage_service_scheme,
+                                   "submit_properties"),
+                    get_payloads(json_input,
+                                 "storage_service_scheme_parameters",
+                                 storage_service_scheme,
+                                 "submit_payloads")));
+    submit_node_storage_service->setNetworkTimeoutValue(NETWORK_TIMEOUT);
+
+    // Create relevant compute services
+    std::set<std::shared_ptr<wrench::ComputeService>> compute_services;
+
+    if (compute_service_scheme == "all_bare_metal") {
+        std::string scratch_mount_point;
+        if (storage_service_scheme == "submit_and_compute_hosts") {
+            scratch_mount_point = "/scratch";
+        } else {
+            scratch_mount_point = "";
+        }
+
+
+        // Create one bare-metal service on all compute nodes
+        for (auto const &host : compute_host_names) {
+            auto cs = simulation->add(
+                    new wrench::BareMetalComputeService(
+                            host,
+                            {host},
+                            scratch_mount_point,
+                            get_properties(json_input,
+                                           "compute_service_scheme_parameters",
+                                           compute_service_scheme,
+                                           "properties"),
+                            get_payloads(json_input,
+                                         "compute_service_scheme_parameters",
+                                         compute_service_scheme,
+                                         "payloads")));
+            cs->setNetworkTimeoutValue(NETWORK_TIMEOUT);
+            compute_services.insert(cs);
+        }
+
+    } else if (compute_service_scheme == "htcondor_bare_metal") {
+        // Create one bare-metal service on all compute nodes
+
+        std::set<std::shared_ptr<wrench::ComputeService>> bare_metal_services;
+        std::string scratch_mount_point;
+        if (storage_service_scheme == "submit_and_compute_hosts") {
+            scratch_mount_point = "/scratch";
+        } else {
+            scratch_mount_point = "";
+        }
+        for (auto const &host : compute_host_names) {
+            auto cs = simulation->add(
+                    new wrench::BareMetalComputeService(
+                            host,
+                            {host},
+                            scratch_mount_point,
+                            get_properties(json_input,
+                                           "compute_service_scheme_parameters",
+                                           compute_service_scheme,
+                                           "bare_metal_properties"),
+                            get_payloads(json_input,
+                                         "compute_service_scheme_parameters",
+                                         compute_service_scheme,
+                                         "bare_metal_payloads")));
+            cs->setNetworkTimeoutValue(NETWORK_TIMEOUT);
+            bare_metal_services.insert(cs);
+        }
+
+        // Create a top-level HTCondor compute service
+        auto htcondor_cs = simulation->add(
+                new wrench::HTCondorComputeService(
+                        submit_host_name,
+                        bare_metal_services,
+                        get_properties(json_input,
+                                       "compute_service_scheme_parameters",
+                                       compute_service_scheme,
+                                       "htcondor_properties"),
+                        get_payloads(json_input,
+                                     "compute_service_scheme_parameters",
+                                     compute_service_scheme,
+                                     "htcondor_payloads")));
+        htcondor_cs->setNetworkTimeoutValue(NETWORK_TIMEOUT);
+        compute_services.insert(htcondor_cs);
+
+    }
+
+
+    // Instantiate a Controller on the submit_host
+    double scheduling_overhead;
+    try {
+        scheduling_overhead = UnitParser::parse_time(boost::json::value_to<std::string>(json_input["scheduling_overhead"]));
+    } catch (std::exception &e) {
+        throw std::invalid_argument("Invalid or missing scheduling_overhead specification in JSON input (" + std::string(e.what()) + ")");
+    }
+
+    auto wms = new wrench::Controller(workflow,
+                                      compute_service_scheme,
+                                      storage_service_scheme,
+                                      compute_services,
+                                      submit_node_storage_service,
+                                      scheduling_overhead,
+                                      submit_host_name);
+    wms->setNetworkTimeoutValue(NETWORK_TIMEOUT);
+    simulation->add(wms);
+
+    // Create each file ab-initio on the storage service (no file registry service)
+    for (auto const &f: workflow->getInputFiles()) {
+        submit_node_storage_service->createFile(f);
+    }
+
+    // Launch the simulation
+    try {
+        simulation->launch();
+    } catch (std::runtime_error &e) {
+        std::cerr << "Exception: " << e.what() << std::endl;
+        return false;
+    }
+
+    json_output = create_output(json_input, workflow_input);
+    return true;
+}
+
+/**
+ * @brief Run simulations of a workflow, each in a forked copy of this process, so that every
+ *        simulation starts from the same (not yet used) simulation and the same (not yet executed)
+ *        workflow, with up to max_processes simulations running concurrently
+ *
+ * @param get_simulation: called in each forked process to get an initialized simulation
+ * @param json_inputs: the JSON inputs, one per simulation
+ * @param workflow_input: the workflow (its WRENCH workflow is created in each forked process if needed)
+ * @param max_processes: the maximum number of forked processes at a time (0 for the number of hardware threads)
+ * @return the JSON output of each simulation ("null" for failed simulations, including those whose
+ *         process failed)
+ */
+std::vector<std::string> simulate_forked(const std::function<std::shared_ptr<wrench::Simulation>()> &get_simulation,
+                                         std::vector<boost::json::object> &json_inputs,
+                                         WorkflowInput &workflow_input,
+                                         unsigned int max_processes) {
+    if (max_processes == 0) {
+        max_processes = std::max(1U, std::thread::hardware_concurrency());
+    }
+    std::vector<std::string> outputs(json_inputs.size());
+    // The running processes: their pipes, pids, and the indices of their inputs
+    std::vector<struct pollfd> poll_fds;
+    std::vector<pid_t> pids;
+    std::vector<size_t> indices;
+    size_t next = 0;
+    char buffer[65536];
+
+    std::cout.flush();
+    std::cerr.flush();
+    while (next < json_inputs.size() or not poll_fds.empty()) {
+        // Fork new processes as running ones finish
+        while (next < json_inputs.size() and poll_fds.size() < max_processes) {
+            int pipe_fds[2];
+            if (pipe(pipe_fds) != 0) {
+                throw std::runtime_error("Cannot create pipe for simulation");
+            }
+            pid_t pid = fork();
+            if (pid < 0) {
+                throw std::runtime_error("Cannot fork simulation");
+            }
+            if (pid == 0) {
+                close(pipe_fds[0]);
+                for (auto const &poll_fd : poll_fds) {
+                    close(poll_fd.fd);
+                }
+                std::string output = "null";
+                try {
+                    auto simulation = get_simulation();
+                    if (not workflow_input.workflow) {
+                        create_workflow(workflow_input);
+                    }
+                    boost::json::object json_output;
+                    if (simulate(simulation, json_inputs[next], workflow_input, json_output)) {
+                        output = boost::json::serialize(json_output);
+                    }
+                } catch (std::exception &e) {
+                    std::cerr << "Error: " << e.what() << std::endl;
+                    _exit(1);
+                }
+                const char *data = output.c_str();
+                size_t remaining = output.size();
+                while (remaining > 0) {
+                    ssize_t written = write(pipe_fds[1], data, remaining);
+                    if (written <= 0) {
+                        _exit(1);
+                    }
+                    data += written;
+                    remaining -= written;
+                }
+                close(pipe_fds[1]);
+                std::cerr.flush();
+                _exit(0);
+            }
+            close(pipe_fds[1]);
+            poll_fds.push_back({pipe_fds[0], POLLIN, 0});
+            pids.push_back(pid);
+            indices.push_back(next++);
+        }
+
+        // Drain the pipes concurrently (outputs can be larger than a pipe's buffer), and reap the
+        // processes whose output is complete
+        if (poll(poll_fds.data(), poll_fds.size(), -1) < 0) {
+            if (errno == EINTR) continue;
+            throw std::runtime_error("Cannot poll simulations");
+        }
+        for (size_t i = poll_fds.size(); i-- > 0;) {
+            if (poll_fds[i].revents == 0) continue;
+            ssize_t count = read(poll_fds[i].fd, buffer, sizeof(buffer));
+            if (count > 0) {
+                outputs[indices[i]].append(buffer, count);
+            } else if (count == 0 or errno != EINTR) {
+                close(poll_fds[i].fd);
+                int status;
+                while (waitpid(pids[i], &status, 0) < 0 and errno == EINTR) {
+                }
+                // A process that failed (invalid input, crash, ...) only fails its own simulation
+                if (not WIFEXITED(status) or WEXITSTATUS(status) != 0) {
+                    outputs[indices[i]] = "null";
+                }
+                poll_fds.erase(poll_fds.begin() + i);
+                pids.erase(pids.begin() + i);
+                indices.erase(indices.begin() + i);
+            }
+        }
+    }
+
+    return outputs;
+}
@@ -0,0 +1,161 @@
+/**
+ ** Reading workflows from the compact workflow packs written by calibration/WorkflowPack.py
+ **/
+
+#include <fstream>
+#include <iostream>
+#include <sstream>
+#include <sys/stat.h>
+#include <boost/json.hpp>
+
+#ifdef HAVE_ZSTD
+#include <zstd.h>
+#endif
+
+#include "WorkflowPack.h"
+
+const std::string workflow_pack_name = "workflows.wfpack";
+
+#define WORKFLOW_PACK_VERSION 1
+
+/**
+ * @brief Read the index of a pack
+ * @param pack: the pack, opened at its beginning
+ * @param index: set to the pack's index
+ * @param members_offset: set to the offset of the members in the pack
+ * @return true on success, false if the file isn't a pack (of this version), or its index is corrupt
+ */
+static bool readPackIndex(std::ifstream &pack, boost::json::object &index, std::streamoff &members_offset) {
+    std::string header;
+    if (not std::getline(pack, header)) {
+        return false;
+    }
+    std::istringstream tokens(header);
+    std::string magic;
+    int version;
+    std::streamoff index_length;
+    if (not (tokens >> magic >> version >> index_length) or magic != "WFPACK" or version != WORKFLOW_PACK_VERSION or
+        index_length < 0) {
+        return false;
+    }
+    std::string index_string(index_length, '\0');
+    if (not pack.read(&index_string[0], index_length)) {
+        return false;
+    }
+    boost::system::error_code error;
+    auto value = boost::json::parse(index_string, error);
+    if (error or not value.is_object() or not value.as_object().contains("members") or
+        not value.as_object()["members"].is_object() or not value.as_object().contains("compression") or
+        not value.as_object()["compression"].is_string()) {
+        return false;
+    }
+    index = value.as_object();
+    members_offset = static_cast<std::streamoff>(header.size()) + 1 + index_length;
+    return true;
+}
+
+/**
+ * @brief Read a member of a pack
+ * @param content: set to the member's content
+ * @param error: set to what went wrong, on failure
+ * @return true on success
+ */
+static bool readPackMember(std::ifstream &pack, boost::json::object &index, std::streamoff members_offset,
+                           const std::string &name, std::string &content, std::string &error) {
+    std::streamoff offset;
+    size_t length, size;
+    try {
+        auto member = index["members"].as_object()[name].as_object();
+        offset = member["offset"].to_number<std::streamoff>();
+        length = member["length"].to_number<size_t>();
+        size = member["size"].to_number<size_t>();
+    } catch (const std::exception &e) {
+        error = "Corrupt entry for " + name;
+        return false;
+    }
+
+    std::string blob(length, '\0');
+    pack.seekg(members_offset + offset);
+    if (not pack.read(&blob[0], static_cast<std::streamsize>(length))) {
+        error = "Failed to read " + name;
+        return false;
+    }
+    if (index["compression"].as_string() == "none") {
+        content = std::move(blob);
+        return true;
+    }
+#ifdef HAVE_ZSTD
+    if (index["compression"].as_string() == "zstd") {
+        content.assign(size, '\0');
+        auto result = ZSTD_decompress(&content[0], size, blob.data(), length);
+        if (ZSTD_isError(result) or result != size) {
+            error = "Failed to decompress " + name;
+            return false;
+        }
+        return true;
+    }
+#endif
+    error = "Unsupported compression (" + std::string(index["compression"].as_string().c_str()) + ")";
+    return false;
+}
+
+bool readWorkflowFromPack(const std::string &filepath, std::string &content) {
+    std::string pack_path, name;
+    bool explicit_member = false;
+    auto hash = filepath.find(".wfpack#");
+    if (hash != std::string::npos) {
+        pack_path = filepath.substr(0, hash + 7);
+        name = filepath.substr(hash + 8);
+        explicit_member = true;
+    } else {
+        auto slash = filepath.rfind('/');
+        pack_path = (slash == std::string::npos ? "" : filepath.substr(0, slash + 1)) + workflow_pack_name;
+        name = (slash == std::string::npos ? filepath : filepath.substr(slash + 1));
+    }
+
+    // A pack that can't be used is only an error for an explicit member: a workflow JSON file is then
+    // read as is (quietly, as anything on stderr makes the calibration scripts abort)
+    auto unusable = [&](const std::string &message) {
+        if (explicit_member) {
+            std::cerr << message << std::endl;
+            exit(1);
+        }
+        return false;
+    };
+
+    std::ifstream pack(pack_path, std::ios::binary);
+    if (not pack.is_open()) {
+        return unusable("Failed to open workflow pack: " + pack_path);
+    }
+    boost::json::object index;
+    std::streamoff members_offset;
+    if (not readPackIndex(pack, index, members_offset)) {
+        return unusable("Not a (valid) version " + std::to_string(WORKFLOW_PACK_VERSION) + " workflow pack: " +
+                        pack_path);
+    }
+    auto &members = index["members"].as_object();
+    if (not members.contains(name) or not members[name].is_object()) {
+        return unusable("No " + name + " in workflow pack " + pack_path);
+    }
+
+    // The JSON file (if still there) wins if it has changed since it was packed
+    struct stat file_stat{};
+    if (not explicit_member and stat(filepath.c_str(), &file_stat) == 0) {
+        auto &member = members[name].as_object();
+        auto mtime_ns = static_cast<long long>(file_stat.st_mtim.tv_sec) * 1000000000LL + file_stat.st_mtim.tv_nsec;
+        auto *source_size = member.if_contains("source_size");
+        auto *source_mtime_ns = member.if_contains("source_mtime_ns");
+        if (not source_size or not source_mtime_ns or not source_size->is_number() or
+            not source_mtime_ns->is_number() or
+            source_size->to_number<long long>() != static_cast<long long>(file_stat.st_size) or
+            source_mtime_ns->to_number<long long>() != mtime_ns) {
+            return false;
+        }
+    }
+
+    std::string error;
+    if (not readPackMember(pack, index, members_offset, name, content, error)) {
+        return unusable(error + " from workflow pack " + pack_path);
+    }
+    return true;
+}